@@ -380,6 +380,37 @@ async def get_realtime_metrics():
         ) from error
 
 
+@router.get("/usage")
+async def get_usage(flush: bool = False):
+    """
+    토큰/비용 사용량 조회 (인증 필요)
+
+    라우트 × 모델별 토큰/비용과 라우트 × 단계별 지연 시간을 반환합니다.
+    worker는 이 워커의 누적값, shared는 모든 워커가 공유 저장소에 합산한 값입니다.
+
+    Args:
+        flush: True면 조회 전에 이 워커의 미전송 카운터를 먼저 플러시
+    """
+    usage_accountant = modules.get("usage_accountant")
+    if usage_accountant is None:
+        raise HTTPException(status_code=503, detail="Usage accounting not available")
+    try:
+        if flush:
+            await usage_accountant.flush()
+        report: dict[str, Any] = await usage_accountant.get_report()
+        return {**report, "timestamp": datetime.now().isoformat()}
+    except Exception as error:
+        logger.error(
+            "사용량 조회 실패",
+            extra={
+                "error": str(error),
+                "error_type": type(error).__name__
+            },
+            exc_info=True
+        )
+        raise HTTPException(status_code=500, detail="Failed to retrieve usage") from error
+
+
 @router.post("/cache/clear")
 async def clear_cache():
     """캐시 클리어 (인증 필요)"""
@@ -748,6 +779,9 @@ async def delete_document(document_id: str):
         if not document_details:
             raise HTTPException(status_code=404, detail=f"Document {document_id} not found")
         await retrieval_module.delete_document(document_id)
+        answer_cache = modules.get("answer_cache")
+        if answer_cache is not None:
+            answer_cache.invalidate_sources({document_id})
         logger.info(
             "문서 삭제 완료",
             extra={"document_id": document_id}
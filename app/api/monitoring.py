@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from ..lib.auth import get_api_key
+from ..lib.http_transport import http_transport
 from ..lib.logger import get_logger
 
 # 순환 임포트 방지: 타입 힌트용으로만 임포트
@@ -84,6 +85,30 @@ async def get_costs():
         return MonitoringResponse(success=False, data={}, message=f"비용 조회 실패: {str(e)}")
 
 
+@router.get("/monitoring/prompt-cache", response_model=MonitoringResponse)
+async def get_prompt_cache_stats():
+    """
+    프롬프트 조회 캐시 통계
+
+    Returns:
+        적중률, 무효화 횟수, 마지막 버전 확인 후 경과 시간(staleness), write-behind 상태
+    """
+    try:
+        container = _get_container()
+        stats = container.prompt_manager().get_cache_stats()
+
+        return MonitoringResponse(
+            success=True,
+            data=stats,
+            message=f"{stats['entries']}개 캐시, 적중률 {stats['hit_ratio']:.1%}",
+        )
+    except Exception as e:
+        logger.error(f"프롬프트 캐시 통계 조회 실패: {e}")
+        return MonitoringResponse(
+            success=False, data={}, message=f"프롬프트 캐시 통계 조회 실패: {str(e)}"
+        )
+
+
 @router.get("/monitoring/circuit-breakers", response_model=MonitoringResponse)
 async def get_circuit_breakers():
     """
@@ -121,6 +146,32 @@ async def get_circuit_breakers():
         )
 
 
+@router.get("/monitoring/http-transport", response_model=MonitoringResponse)
+async def get_http_transport_stats():
+    """
+    외부 HTTP 커넥션 풀 통계 조회
+
+    Returns:
+        호스트별 요청 수, 새 커넥션 수, TLS 핸드셰이크 수, 커넥션 재사용률
+    """
+    try:
+        stats = http_transport.get_stats()
+        totals = stats["totals"]
+
+        return MonitoringResponse(
+            success=True,
+            data=stats,
+            message=(
+                f"{len(stats['hosts'])}개 호스트, 재사용률 {totals['reuse_ratio']:.1%}"
+            ),
+        )
+    except Exception as e:
+        logger.error(f"HTTP 전송 통계 조회 실패: {e}")
+        return MonitoringResponse(
+            success=False, data={}, message=f"HTTP 전송 통계 조회 실패: {str(e)}"
+        )
+
+
 @router.get("/monitoring/health", response_model=MonitoringResponse)
 async def health_check():
     """
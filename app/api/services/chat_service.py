@@ -23,6 +23,8 @@ from ...lib.errors import ErrorCode, SessionError
 from ...lib.logger import get_logger
 from ...lib.metrics import PerformanceMetrics
 from ...lib.types import RAGResultDict, SessionInfoDict, SessionResult, StatsDict
+from ...lib.usage_accounting import UsageRecord
+from ...modules.core.generation.answer_cache import AnswerCacheLookup
 from .rag_pipeline import RAGPipeline
 
 # LangSmith 트레이싱 import
@@ -93,6 +95,8 @@ class ChatService:
             sql_search_service=modules.get(
                 "sql_search_service"
             ),  # ✅ SQL Search Service 주입 (Phase 3)
+            answer_cache=modules.get("answer_cache"),  # 반복 질문 답변 캐시
+            usage_accountant=modules.get("usage_accountant"),  # 토큰/비용/단계 지연 집계
         )
 
         logger.info("ChatService 초기화 완료 (RAGPipeline + Self-RAG + SQL Search 포함)")
@@ -296,8 +300,12 @@ class ChatService:
             self.stats["error_rate"] = (self.stats["errors"] / self.stats["total_chats"]) * 100
 
     def get_stats(self) -> StatsDict:
-        """현재 통계 반환"""
-        return self.stats.copy()  # type: ignore[return-value]
+        """현재 통계 반환 (답변 캐시가 있으면 적중 통계 포함)"""
+        stats: dict[str, Any] = self.stats.copy()
+        answer_cache = self.modules.get("answer_cache")
+        if answer_cache is not None:
+            stats["answer_cache"] = answer_cache.get_stats()
+        return stats  # type: ignore[return-value]
 
     async def get_session_info(self, session_id: str) -> SessionInfoDict:
         """
@@ -375,6 +383,8 @@ class ChatService:
         start_time = time.time()
         chunk_index = 0
         final_session_id = session_id
+        stage_latencies: dict[str, float] = {}  # 단계별 지연 시간 (ms, 사용량 집계용)
+        usage_records: list[UsageRecord] = []
 
         try:
             # 1. 세션 처리 (비스트리밍)
@@ -407,6 +417,7 @@ class ChatService:
             # 3. 문서 검색 (비스트리밍)
             retrieval_module = self.modules.get("retrieval")
             search_results = []
+            stage_start = time.time()
 
             if retrieval_module:
                 try:
@@ -417,10 +428,23 @@ class ChatService:
                     logger.debug(f"스트리밍: 검색 완료 - {len(search_results)}개 문서")
                 except Exception as e:
                     logger.warning(f"스트리밍: 검색 실패 - {e}")
+            stage_latencies["retrieve_documents"] = (time.time() - stage_start) * 1000
+
+            # 답변 캐시 조회 (적중 시 리랭킹/생성 없이 캐시 답변을 청크로 재생)
+            cache_lookup = await self._lookup_answer_cache(
+                message, search_results, session_context, options
+            )
+            if cache_lookup is not None and cache_lookup.hit:
+                async for event in self._replay_cached_answer(
+                    cache_lookup, final_session_id, len(search_results), start_time
+                ):
+                    yield event
+                return
 
             # 4. 리랭킹 (비스트리밍)
             reranked_documents = search_results  # 기본값: 원본 검색 결과
             reranking_applied = False
+            stage_start = time.time()
 
             if search_results:
                 reranking_config = self.config.get("reranking", {})
@@ -461,6 +485,7 @@ class ChatService:
                         logger.debug("스트리밍: 리랭킹 모듈 없음, 원본 사용")
                 else:
                     logger.debug("스트리밍: 리랭킹 비활성화, 원본 사용")
+            stage_latencies["rerank_documents"] = (time.time() - stage_start) * 1000
 
             # 5. 메타데이터 이벤트 전송
             metadata_event = {
@@ -487,9 +512,13 @@ class ChatService:
                 generation_options = {
                     **options,
                     "session_context": session_context,
+                    "usage_route": "chat_stream",
+                    "on_usage": usage_records.append,
                 }
 
                 # 스트리밍 호출
+                answer_parts: list[str] = []
+                stage_start = time.time()
                 try:
                     async for text_chunk in generation_module.stream_answer(
                         query=message,
@@ -503,6 +532,7 @@ class ChatService:
                         }
                         yield chunk_event
                         chunk_index += 1
+                        answer_parts.append(text_chunk)
 
                 except Exception as e:
                     logger.error(f"스트리밍 답변 생성 실패: {e}", exc_info=True)
@@ -512,6 +542,12 @@ class ChatService:
                         "message": "답변 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
                     }
                     return
+                stage_latencies["generate_answer"] = (time.time() - stage_start) * 1000
+
+                if cache_lookup is not None:
+                    await self._store_streamed_answer(
+                        cache_lookup, "".join(answer_parts), reranked_documents, options
+                    )
             else:
                 # 생성 모듈이 없거나 스트리밍을 지원하지 않는 경우
                 logger.warning("스트리밍: 생성 모듈 없음 또는 스트리밍 미지원")
@@ -524,15 +560,21 @@ class ChatService:
 
             # 7. 완료 이벤트 전송
             processing_time = time.time() - start_time
+            usage_accountant = self.modules.get("usage_accountant")
+            if usage_accountant is not None:
+                usage_accountant.record_stages("chat_stream", stage_latencies)
             done_event = {
                 "event": "done",
                 "data": {
                     "session_id": final_session_id,
                     "total_chunks": chunk_index,
                     "processing_time": processing_time,
-                    "tokens_used": 0,  # 스트리밍에서는 정확한 토큰 계산 어려움
+                    # 제공자 usage(stream_options.include_usage) 기준, 미보고 시 추정치
+                    "tokens_used": sum(record.total_tokens for record in usage_records),
                 },
             }
+            if usage_records:
+                done_event["data"]["tokens_estimated"] = any(r.estimated for r in usage_records)
             yield done_event
 
             logger.info(
@@ -548,3 +590,112 @@ class ChatService:
                 "error_code": ErrorCode.GENERAL_004.value,
                 "message": "스트리밍 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
             }
+
+    async def _lookup_answer_cache(
+        self,
+        message: str,
+        documents: list[Any],
+        session_context: str | None,
+        options: dict[str, Any],
+    ) -> AnswerCacheLookup | None:
+        """스트리밍 경로 답변 캐시 조회 (사용할 수 없는 요청이면 None)"""
+        answer_cache = self.modules.get("answer_cache")
+        generation_module = self.modules.get("generation")
+        if answer_cache is None or not answer_cache.enabled or generation_module is None:
+            return None
+
+        reason = answer_cache.bypass_reason(documents, session_context)
+        if reason is not None:
+            answer_cache.record_bypass(reason)
+            return None
+
+        try:
+            prompt_version = await generation_module.get_prompt_version(options)
+            lookup: AnswerCacheLookup = await answer_cache.lookup(
+                message, documents, prompt_version
+            )
+            return lookup
+        except Exception as e:
+            logger.warning(f"스트리밍: 답변 캐시 조회 실패 - {e}")
+            return None
+
+    async def _replay_cached_answer(
+        self,
+        lookup: AnswerCacheLookup,
+        session_id: str | None,
+        search_count: int,
+        start_time: float,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """캐시된 답변을 metadata → chunk → done 이벤트로 재생"""
+        assert lookup.entry is not None
+        answer_cache = self.modules["answer_cache"]
+        cache_info = lookup.describe()
+
+        yield {
+            "event": "metadata",
+            "data": {
+                "session_id": session_id,
+                "search_results": search_count,
+                "ranked_results": lookup.entry.payload.get("ranked_results", 0),
+                "reranking_applied": False,
+                "answer_cache": cache_info,
+                "message_id": str(uuid.uuid4()),
+                "timestamp": datetime.now().isoformat(),
+            },
+        }
+
+        chunk_index = 0
+        async for text_chunk in answer_cache.replay(lookup.entry.answer):
+            yield {"event": "chunk", "data": text_chunk, "chunk_index": chunk_index}
+            chunk_index += 1
+
+        processing_time = time.time() - start_time
+        yield {
+            "event": "done",
+            "data": {
+                "session_id": session_id,
+                "total_chunks": chunk_index,
+                "processing_time": processing_time,
+                "tokens_used": 0,
+                "answer_cache": cache_info,
+            },
+        }
+        logger.info(
+            f"스트리밍 완료 (답변 캐시): session_id={session_id}, "
+            f"chunks={chunk_index}, time={processing_time:.2f}s"
+        )
+
+    async def _store_streamed_answer(
+        self,
+        lookup: AnswerCacheLookup,
+        answer: str,
+        documents: list[Any],
+        options: dict[str, Any],
+    ) -> None:
+        """스트리밍으로 생성한 답변 저장 (/chat 응답과 같은 형식으로 출처/마스킹 적용)"""
+        answer_cache = self.modules.get("answer_cache")
+        generation_module = self.modules.get("generation")
+        if answer_cache is None or not answer.strip():
+            return
+
+        try:
+            if self.rag_pipeline.privacy_masker:
+                answer = self.rag_pipeline.privacy_masker.mask_text(answer)
+            await answer_cache.store(
+                lookup,
+                answer,
+                {
+                    "sources": self.rag_pipeline.format_sources(documents).sources,
+                    "topic": self.extract_topic(lookup.normalized_query),
+                    "ranked_results": len(documents),
+                    "model_info": {
+                        "provider": getattr(generation_module, "provider", "unknown"),
+                        "model": options.get("model")
+                        or getattr(generation_module, "default_model", "unknown"),
+                    },
+                    "tokens_used": 0,
+                },
+                origin="stream",
+            )
+        except Exception as e:
+            logger.warning(f"스트리밍: 답변 캐시 저장 실패 - {e}")
@@ -33,8 +33,10 @@ from ...lib.metrics import PerformanceMetrics
 from ...lib.prompt_sanitizer import contains_output_leakage, validate_document
 from ...lib.score_normalizer import RRFScoreNormalizer  # RRF 점수 정규화
 from ...lib.types import RAGResultDict
+from ...lib.usage_accounting import UsageAccountant
 from ...modules.core.agent.interfaces import AgentResult
 from ...modules.core.agent.orchestrator import AgentOrchestrator
+from ...modules.core.generation.answer_cache import AnswerCache, AnswerCacheLookup
 from ...modules.core.generation.generator import GenerationResult
 from ...modules.core.privacy.masker import PrivacyMasker
 from ...modules.core.retrieval.interfaces import IMultiQueryRetriever, SearchResult
@@ -341,6 +343,8 @@ class RAGPipeline:
         performance_metrics: PerformanceMetrics,
         sql_search_service: SQLSearchService | None = None,
         agent_orchestrator: AgentOrchestrator | None = None,
+        answer_cache: AnswerCache | None = None,
+        usage_accountant: UsageAccountant | None = None,
     ):
         """
         RAGPipeline 초기화 (의존성 주입)
@@ -359,6 +363,8 @@ class RAGPipeline:
             performance_metrics: 성능 메트릭 (필수)
             sql_search_service: SQL 검색 서비스 (선택적, Phase 3)
             agent_orchestrator: Agent 오케스트레이터 (선택적, Agentic RAG)
+            answer_cache: 최종 답변 캐시 (선택적, cache.yaml의 answer_cache)
+            usage_accountant: 사용량 집계기 (선택적, 단계별 지연 시간 기록)
         """
         self.config = config
         self.query_router = query_router
@@ -373,6 +379,8 @@ class RAGPipeline:
         self.performance_metrics = performance_metrics
         self.sql_search_service = sql_search_service  # SQL 검색 서비스 (Phase 3)
         self.agent_orchestrator = agent_orchestrator  # Agent 오케스트레이터 (Agentic RAG)
+        self.answer_cache = answer_cache  # 반복 질문 최종 답변 캐시
+        self.usage_accountant = usage_accountant  # 라우트별 토큰/비용/단계 지연 집계
 
         # YAML 설정에서 retrieval 파라미터 로드
         rag_config = config.get("rag", {})
@@ -650,6 +658,15 @@ class RAGPipeline:
         self._track_debug_documents(enable_debug_trace, debug_trace_data, retrieval_results.documents)
         self._update_retrieval_metrics(tracker, prepared_context, sql_search_result)
 
+        # 답변 캐시: 같은 문서/프롬프트로 만든 답변이 있으면 리랭킹·생성·검증 생략
+        answer_cache_lookup = await self._lookup_answer_cache(
+            message, prepared_context, retrieval_results, sql_search_result, options
+        )
+        if answer_cache_lookup is not None and answer_cache_lookup.hit:
+            return self._build_cached_result(
+                answer_cache_lookup, retrieval_results, route_decision, start_time, tracker
+            )
+
         tracker.start_stage("rerank_documents")
         rerank_results = await self.rerank_documents(
             prepared_context.expanded_query, retrieval_results.documents, options
@@ -663,7 +680,7 @@ class RAGPipeline:
                     debug_trace_data["retrieved_documents"][i]["rerank_score"] = rerank_score
 
         tracker.start_stage("generate_answer")
-        generation_options = {**options}
+        generation_options = {**options, "usage_route": "chat"}
         if sql_search_result and sql_search_result.used:
             generation_options["sql_context"] = sql_search_result.formatted_context
             logger.debug(
@@ -707,12 +724,132 @@ class RAGPipeline:
         performance_metrics = tracker.get_metrics()
         tracker.log_summary()
         result["performance_metrics"] = performance_metrics
+        self._record_stage_latencies(performance_metrics)
+        if answer_cache_lookup is not None:
+            await self._store_answer_cache(answer_cache_lookup, generation_result, result)
         logger.info(
             "RAG Pipeline 완료",
             extra={"processing_time": result['processing_time']}
         )
         return result
 
+    async def _lookup_answer_cache(
+        self,
+        message: str,
+        prepared_context: PreparedContext,
+        retrieval_results: RetrievalResults,
+        sql_search_result: SQLSearchResult | None,
+        options: dict[str, Any],
+    ) -> AnswerCacheLookup | None:
+        """
+        답변 캐시 조회 (캐시를 사용할 수 없는 요청이면 None)
+
+        디버그 추적, SQL 검색 결과(실시간 데이터), 대화 기록에 의존하는 요청은 우회합니다.
+        Self-RAG가 켜져 있으면 /chat/stream이 저장한(검증되지 않은) 답변은 사용하지 않습니다.
+        """
+        if not self.answer_cache or not self.answer_cache.enabled:
+            return None
+
+        reason = self.answer_cache.bypass_reason(
+            retrieval_results.documents, prepared_context.session_context
+        )
+        if reason is None and options.get("enable_debug_trace"):
+            reason = "debug_trace"
+        if reason is None and sql_search_result and sql_search_result.used:
+            reason = "sql_context"
+        if reason is not None:
+            self.answer_cache.record_bypass(reason)
+            return None
+
+        try:
+            prompt_version = await self.generation_module.get_prompt_version(options)
+        except Exception as e:
+            logger.warning("프롬프트 버전 조회 실패, 답변 캐시 우회", extra={"error": str(e)})
+            self.answer_cache.record_bypass("prompt_version_unavailable")
+            return None
+
+        # 스트리밍 답변은 Self-RAG 검증을 거치지 않으므로 검증이 켜져 있으면 받지 않음
+        exclude_origins = (
+            ("stream",) if self.config.get("self_rag", {}).get("enabled", False) else ()
+        )
+        return await self.answer_cache.lookup(
+            message, retrieval_results.documents, prompt_version, exclude_origins
+        )
+
+    def _build_cached_result(
+        self,
+        lookup: AnswerCacheLookup,
+        retrieval_results: RetrievalResults,
+        route_decision: RouteDecision,
+        start_time: float,
+        tracker: PipelineTracker,
+    ) -> RAGResultDict:
+        """캐시된 답변으로 응답 구성 (토큰 사용 0)"""
+        assert lookup.entry is not None
+        payload = lookup.entry.payload
+        tracker.end_pipeline()
+
+        result: dict[str, Any] = {
+            "answer": lookup.entry.answer,
+            "sources": payload.get("sources", []),
+            "tokens_used": 0,
+            "topic": payload.get("topic", "general"),
+            "processing_time": time.time() - start_time,
+            "search_results": retrieval_results.count,
+            "ranked_results": payload.get("ranked_results", 0),
+            "model_info": dict(payload.get("model_info") or {}),
+            "answer_cache": lookup.describe(),
+            "performance_metrics": tracker.get_metrics(),
+        }
+        self._record_stage_latencies(result["performance_metrics"])
+        if route_decision.metadata:
+            result["routing_metadata"] = route_decision.metadata
+
+        logger.info(
+            "RAG Pipeline 완료 (답변 캐시)",
+            extra={"processing_time": result["processing_time"], "match": lookup.match}
+        )
+        return cast(RAGResultDict, result)
+
+    def _record_stage_latencies(self, performance_metrics: dict[str, Any]) -> None:
+        """PipelineTracker 단계별 지연 시간을 사용량 집계에 누적 (라우트: chat)"""
+        if self.usage_accountant is None:
+            return
+        self.usage_accountant.record_stages(
+            "chat",
+            {
+                stage: data["duration_ms"]
+                for stage, data in performance_metrics.get("stages", {}).items()
+            },
+        )
+
+    async def _store_answer_cache(
+        self,
+        lookup: AnswerCacheLookup,
+        generation_result: GenerationResult,
+        result: RAGResultDict,
+    ) -> None:
+        """정상 생성된 답변만 저장 (Fallback/품질 거부 답변은 저장하지 않음)"""
+        if not self.answer_cache:
+            return
+        if generation_result.refusal_reason or generation_result.provider in ("fallback", "none"):
+            return
+        try:
+            await self.answer_cache.store(
+                lookup,
+                result["answer"],
+                {
+                    "sources": result.get("sources", []),
+                    "topic": result.get("topic", "general"),
+                    "ranked_results": result.get("ranked_results", 0),
+                    "model_info": result.get("model_info", {}),
+                    "tokens_used": result.get("tokens_used", 0),
+                },
+                origin="chat",
+            )
+        except Exception as e:
+            logger.warning("답변 캐시 저장 실패 (무시)", extra={"error": str(e)})
+
     async def route_query(self, message: str, session_id: str, start_time: float) -> RouteDecision:
         """
         1단계: 쿼리 라우팅 (규칙 기반 + LLM 폴백)
@@ -1286,11 +1423,13 @@ class RAGPipeline:
 
             # 타입 가드: GenerationResult 또는 dict 처리
             # GenerationResult 객체인지 확인 (hasattr로도 체크하여 더 안전하게)
+            cached_tokens = 0
             if isinstance(generation_result, GenerationResult):
                 tokens = generation_result.tokens_used
                 provider = generation_result.provider
                 answer = generation_result.answer
                 model_info = generation_result.model_info
+                cached_tokens = generation_result.cached_tokens
             elif isinstance(generation_result, dict):
                 # fallback이 dict를 반환한 경우 (Circuit Breaker 내부 fallback)
                 tokens = generation_result.get("tokens_used", 0)
@@ -1305,8 +1444,12 @@ class RAGPipeline:
                 answer = "답변 생성 중 오류가 발생했습니다."
                 model_info = {"provider": "error", "model": "unknown"}
 
+            # OpenRouter 경유 응답은 모델 접두사(anthropic/..., google/...)로 제공자 판별
+            if provider not in ["google", "openai", "anthropic"]:
+                provider = str(model_info.get("model", "")).split("/", 1)[0]
             if tokens > 0 and provider in ["google", "openai", "anthropic"]:
                 self.cost_tracker.track_usage(provider, tokens, is_input=False)
+                self.cost_tracker.track_cached_tokens(provider, cached_tokens)
 
             if contains_output_leakage(answer):
                 logger.error(
@@ -1331,6 +1474,7 @@ class RAGPipeline:
                 model_used=model_info.get("model", "unknown"),
                 provider=model_info.get("provider", "unknown"),
                 generation_time=latency_ms / 1000,
+                cached_tokens=cached_tokens,
             )
         except CircuitBreakerOpenError:
             # Circuit Breaker 에러 → 일시적 장애, Fallback 사용
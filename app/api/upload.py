@@ -222,6 +222,17 @@ def validate_file(file: UploadFile) -> dict[str, Any]:
     return {"valid": True, "file_type": file_type}
 
 
+def _invalidate_cached_answers(source_keys: set[str]) -> None:
+    """재적재/삭제된 문서를 근거로 만든 캐시 답변 제거"""
+    answer_cache = modules.get("answer_cache")
+    if answer_cache is None:
+        return
+    try:
+        answer_cache.invalidate_sources(source_keys)
+    except Exception as e:
+        logger.warning(f"Answer cache invalidation failed: {e}")
+
+
 async def process_document_background(job_id: str, file_path: Path, filename: str, file_type: str):
     """백그라운드 문서 처리"""
     try:
@@ -270,6 +281,7 @@ async def process_document_background(job_id: str, file_path: Path, filename: st
         )
         save_upload_jobs(upload_jobs)
         await retrieval_module.add_documents(embedded_chunks)
+        _invalidate_cached_answers({masked_filename, filename})
         try:
             os.unlink(file_path)
         except Exception as e:
@@ -541,6 +553,7 @@ async def delete_document(document_id: str):
                 },
             )
         await retrieval_module.delete_document(document_id)
+        _invalidate_cached_answers({document_id})
         logger.info(f"Document deleted: {document_id}")
         return {
             "message": "Document deleted successfully",
@@ -592,6 +605,7 @@ async def bulk_delete_documents(request: BulkDeleteRequest):
                     failed_ids.append(document_id)
                     continue
                 await retrieval_module.delete_document(document_id)
+                _invalidate_cached_answers({document_id})
                 deleted_count += 1
                 logger.info(f"Successfully deleted document: {document_id}")
             except Exception as delete_error:
@@ -19,6 +19,7 @@ import httpx
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from playwright.async_api import async_playwright
 
+from app.lib.http_transport import get_http_client
 from app.lib.logger import get_logger
 
 logger = get_logger(__name__)
@@ -95,6 +96,8 @@ class ExternalCrawler:
     - 텍스트 추출 및 청킹
     """
 
+    HTTP_TIMEOUT = 60.0  # Weaviate REST 요청 타임아웃 (초)
+
     def __init__(
         self,
         chunk_size: int = 1400,
@@ -119,20 +122,15 @@ class ExternalCrawler:
             chunk_overlap=chunk_overlap,
             separators=["\n\n", "\n", ". ", " ", ""],
         )
-        self._http_client: httpx.AsyncClient | None = None
 
         logger.info("✅ ExternalCrawler 초기화 완료")
 
     async def _get_http_client(self) -> httpx.AsyncClient:
-        """HTTP 클라이언트 지연 초기화"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=60.0)
-        return self._http_client
+        """Weaviate 호스트용 공유 클라이언트 (호스트별 커넥션 풀, 타임아웃은 요청별 전달)"""
+        return get_http_client(self.weaviate_url)
 
     async def close(self) -> None:
-        """리소스 정리"""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
+        """리소스 정리 (공유 커넥션 풀은 애플리케이션 종료 시 닫힘)"""
 
     async def crawl_source(self, config: ExternalSourceConfig) -> CrawlResult:
         """
@@ -462,6 +460,7 @@ class ExternalCrawler:
             count_response = await client.post(
                 f"{self.weaviate_url}/v1/graphql",
                 json=count_query,
+                timeout=self.HTTP_TIMEOUT,
             )
             count_data = count_response.json()
             existing_count = (
@@ -496,6 +495,7 @@ class ExternalCrawler:
                 "DELETE",
                 f"{self.weaviate_url}/v1/batch/objects",
                 json=delete_payload,
+                timeout=self.HTTP_TIMEOUT,
             )
 
             if response.status_code in (200, 204):
@@ -535,6 +535,7 @@ class ExternalCrawler:
                 response = await client.post(
                     f"{self.weaviate_url}/v1/batch/objects",
                     json={"objects": objects},
+                    timeout=self.HTTP_TIMEOUT,
                 )
 
                 if response.status_code == 200:
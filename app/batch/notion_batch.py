@@ -22,6 +22,7 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.batch.notion_client import NotionAPIClient, NotionPage
 from app.lib.config_loader import load_config
+from app.lib.http_transport import get_http_client
 from app.lib.logger import get_logger
 
 logger = get_logger(__name__)
@@ -115,6 +116,8 @@ class NotionBatchProcessor:
         ...     print(f"{result.category}: {result.total_chunks}개 청크")
     """
 
+    HTTP_TIMEOUT = 60.0  # Weaviate REST 요청 타임아웃 (초)
+
     def __init__(self, config: NotionBatchConfig | None = None):
         """
         프로세서 초기화
@@ -129,7 +132,6 @@ class NotionBatchProcessor:
             chunk_overlap=self.config.chunk_overlap,
             separators=["\n\n", "\n", ". ", " ", ""],
         )
-        self._http_client: httpx.AsyncClient | None = None
 
         logger.info(
             "NotionBatchProcessor 초기화 완료",
@@ -201,17 +203,13 @@ class NotionBatchProcessor:
         return cfg
 
     async def _get_http_client(self) -> httpx.AsyncClient:
-        """HTTP 클라이언트 지연 초기화"""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=60.0)
-        return self._http_client
+        """Weaviate 호스트용 공유 클라이언트 (호스트별 커넥션 풀, 타임아웃은 요청별 전달)"""
+        return get_http_client(self.config.weaviate_url)
 
     async def close(self) -> None:
         """리소스 정리"""
         if self.notion_client:
             await self.notion_client.close()
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.aclose()
         logger.debug("NotionBatchProcessor 리소스 정리 완료")
 
     # ========================================================================
@@ -598,6 +596,7 @@ class NotionBatchProcessor:
             count_response = await client.post(
                 f"{self.config.weaviate_url}/v1/graphql",
                 json=count_query,
+                timeout=self.HTTP_TIMEOUT,
             )
             count_data = count_response.json()
             existing_count = (
@@ -643,6 +642,7 @@ class NotionBatchProcessor:
                 "DELETE",
                 f"{self.config.weaviate_url}/v1/batch/objects",
                 json=delete_payload,
+                timeout=self.HTTP_TIMEOUT,
             )
 
             if response.status_code in (200, 204):
@@ -713,6 +713,7 @@ class NotionBatchProcessor:
                 response = await client.post(
                     f"{self.config.weaviate_url}/v1/batch/objects",
                     json=payload,
+                    timeout=self.HTTP_TIMEOUT,
                 )
 
                 if response.status_code == 200:
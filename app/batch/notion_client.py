@@ -18,6 +18,7 @@ from typing import Any
 
 import httpx
 
+from app.lib.http_transport import get_http_client
 from app.lib.logger import get_logger
 
 logger = get_logger(__name__)
@@ -141,27 +142,20 @@ class NotionAPIClient:
             "Content-Type": "application/json",
         }
 
-        # httpx 비동기 클라이언트
-        self._client: httpx.AsyncClient | None = None
-
         logger.info("✅ NotionAPIClient 초기화 완료")
 
     async def _get_client(self) -> httpx.AsyncClient:
         """
-        httpx 클라이언트 지연 초기화 (Lazy Initialization)
+        Notion API 호스트용 공유 클라이언트 (호스트별 커넥션 풀)
 
         Returns:
-            httpx.AsyncClient 인스턴스
+            httpx.AsyncClient 인스턴스 (헤더/타임아웃은 요청별로 전달)
         """
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(headers=self.headers, timeout=self.DEFAULT_TIMEOUT)
-        return self._client
+        return get_http_client(self.BASE_URL)
 
     async def close(self) -> None:
-        """HTTP 클라이언트 종료"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            logger.debug("🔌 NotionAPIClient HTTP 클라이언트 종료")
+        """HTTP 클라이언트 종료 (공유 커넥션 풀은 애플리케이션 종료 시 닫힘)"""
+        logger.debug("🔌 NotionAPIClient 종료")
 
     async def _request_with_backoff(
         self, method: str, url: str, json_data: dict | None = None
@@ -186,17 +180,21 @@ class NotionAPIClient:
             NotionAPIError: 기타 API 에러
         """
         client = await self._get_client()
+        request_options: dict[str, Any] = {
+            "headers": self.headers,
+            "timeout": self.DEFAULT_TIMEOUT,
+        }
 
         for attempt in range(self.MAX_RETRIES):
             try:
                 if method.upper() == "GET":
-                    response = await client.get(url)
+                    response = await client.get(url, **request_options)
                 elif method.upper() == "POST":
-                    response = await client.post(url, json=json_data or {})
+                    response = await client.post(url, json=json_data or {}, **request_options)
                 elif method.upper() == "PATCH":
-                    response = await client.patch(url, json=json_data or {})
+                    response = await client.patch(url, json=json_data or {}, **request_options)
                 elif method.upper() == "DELETE":
-                    response = await client.delete(url)
+                    response = await client.delete(url, **request_options)
                 else:
                     raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
 
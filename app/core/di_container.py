@@ -13,6 +13,7 @@ Provider 타입:
 
 import asyncio
 import os
+from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 from dependency_injector import containers, providers
@@ -40,6 +41,7 @@ from app.lib.config_validator import get_env_int, get_env_url
 from app.lib.llm_client import LLMClientFactory, get_llm_factory, initialize_llm_factory
 from app.lib.logger import get_logger
 from app.lib.metrics import CostTracker, PerformanceMetrics
+from app.lib.usage_accounting import UsageAccountant, UsageAccountingConfig
 from app.lib.weaviate_client import WeaviateClient
 
 # Phase 5: Agent 모듈 (Agentic RAG Orchestrator)
@@ -48,6 +50,7 @@ from app.modules.core.documents.document_processing import DocumentProcessor
 
 # Phase 9: 평가 시스템 모듈 (Evaluation System)
 from app.modules.core.evaluation import EvaluatorFactory
+from app.modules.core.generation.answer_cache import AnswerCache, AnswerCacheConfig
 from app.modules.core.generation.generator import GenerationModule
 from app.modules.core.generation.prompt_manager import PromptManager
 
@@ -119,6 +122,9 @@ from app.modules.ingestion.service import IngestionService
 
 logger = get_logger(__name__)
 
+# Provider 밖에서 생성되어 컨테이너가 추적하지 않는 클라이언트의 종료 콜백 (cleanup_resources에서 호출)
+_shutdown_callbacks: list[Callable[[], Awaitable[None]]] = []
+
 # TypeVar for generic type parameters
 T = TypeVar("T")
 
@@ -995,10 +1001,14 @@ async def create_knowledge_graph_builder_instance(
         return None
 
     try:
+        build_config = graph_rag_config.get("build", {})
         builder = KnowledgeGraphBuilder(
             graph_store=graph_store,
             entity_extractor=entity_extractor,
             relation_extractor=relation_extractor,
+            max_concurrency=build_config.get("max_concurrency", 8),
+            write_batch_size=build_config.get("write_batch_size", 64),
+            extraction_cache=_create_extraction_cache(build_config.get("extraction_cache", {})),
         )
         logger.info("KnowledgeGraphBuilder 초기화 성공")
         return builder
@@ -1012,6 +1022,122 @@ async def create_knowledge_graph_builder_instance(
         return None
 
 
+def _create_answer_cache(config: dict, embedder: Any | None = None) -> AnswerCache:
+    """
+    반복 질문 최종 답변 캐시 생성
+
+    GenerationModule, RAGPipeline, ChatService, IngestionService가 같은 인스턴스를
+    공유합니다. 시맨틱 매칭이 꺼져 있으면 임베더를 연결하지 않습니다.
+
+    Args:
+        config: 설정 딕셔너리
+        embedder: 질문 임베딩용 임베더 (시맨틱 매칭 시에만 사용)
+
+    Returns:
+        AnswerCache 인스턴스
+    """
+    cache_config = AnswerCacheConfig.from_dict(config.get("answer_cache"))
+    return AnswerCache(
+        cache_config,
+        embedder=embedder if cache_config.semantic_enabled else None,
+    )
+
+
+def _create_usage_store(config: dict):
+    """
+    토큰/비용 사용량 공유 저장소 생성
+
+    generation.usage_accounting.backend가 redis이고 REDIS_URL이 있으면 Redis에
+    워커별 카운터를 주기적으로 합산합니다. 그 외에는 None (워커 로컬 집계만).
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        RedisUsageStore 인스턴스 또는 None
+    """
+    usage_config = config.get("generation", {}).get("usage_accounting", {})
+    redis_url = os.getenv("REDIS_URL")
+    if usage_config.get("backend", "memory") != "redis" or not redis_url:
+        return None
+
+    try:
+        from redis.asyncio import Redis
+
+        from app.lib.usage_accounting import RedisUsageStore
+    except ImportError:
+        logger.warning(
+            "Redis 패키지 미설치, 사용량은 워커 로컬로만 집계",
+            extra={"required_package": "redis"}
+        )
+        return None
+
+    logger.info("사용량 집계 공유 저장소: Redis")
+    return RedisUsageStore(
+        Redis.from_url(redis_url, decode_responses=True),
+        key_prefix=usage_config.get("key_prefix", "rag:usage:"),
+    )
+
+
+def _create_usage_accountant(config: dict) -> UsageAccountant:
+    """
+    토큰/비용 사용량 집계기 생성
+
+    GenerationModule, RAGPipeline, ChatService, 관리자 API가 같은 인스턴스를 공유합니다.
+    플러시 루프는 GenerationModule.initialize()/destroy()에서 시작/중지됩니다.
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        UsageAccountant 인스턴스
+    """
+    return UsageAccountant(
+        UsageAccountingConfig.from_dict(
+            config.get("generation", {}).get("usage_accounting")
+        ),
+        store=_create_usage_store(config),
+    )
+
+
+def _create_extraction_cache(cache_config: dict):
+    """
+    지식 그래프 추출 결과 캐시 생성
+
+    backend가 redis이고 REDIS_URL이 있으면 Redis, 그 외에는 디스크 캐시를 사용합니다.
+
+    Args:
+        cache_config: graph_rag.build.extraction_cache 설정
+
+    Returns:
+        FileExtractionCache / RedisExtractionCache 인스턴스 또는 None (비활성화 시)
+    """
+    if not cache_config.get("enabled", False):
+        return None
+
+    from app.modules.core.graph.extraction_cache import (
+        FileExtractionCache,
+        RedisExtractionCache,
+    )
+
+    redis_url = os.getenv("REDIS_URL")
+    if cache_config.get("backend", "file") == "redis" and redis_url:
+        from redis.asyncio import Redis
+
+        logger.info("그래프 추출 캐시: Redis")
+        cache = RedisExtractionCache(
+            Redis.from_url(redis_url, decode_responses=True),
+            key_prefix=cache_config.get("key_prefix", "graph:extraction:"),
+            ttl_seconds=cache_config.get("ttl_seconds"),
+        )
+        _shutdown_callbacks.append(cache.close)
+        return cache
+
+    directory = cache_config.get("directory", "data/graph_extraction_cache")
+    logger.info("그래프 추출 캐시: 디스크", extra={"directory": directory})
+    return FileExtractionCache(directory)
+
+
 def _create_graph_llm_client(llm_factory: LLMClientFactory, model: str):
     """
     GraphRAG용 LLM 클라이언트 래퍼 생성
@@ -1455,7 +1581,12 @@ class AppContainer(containers.DeclarativeContainer):
 
     # PromptManager (Hybrid Mode: PostgreSQL + JSON Fallback)
     prompt_manager = providers.Singleton(
-        PromptManager, repository=prompt_repository, use_database=config.prompts.use_database
+        PromptManager,
+        repository=prompt_repository,
+        use_database=config.prompts.use_database,
+        cache_enabled=config.prompts.cache_enabled,
+        version_poll_interval=config.prompts.version_poll_interval,
+        write_behind_delay=config.prompts.write_behind_delay,
     )
 
     cost_tracker = providers.Singleton(CostTracker)
@@ -1491,16 +1622,6 @@ class AppContainer(containers.DeclarativeContainer):
     # Ingestion Connector Factory
     connector_factory = providers.Singleton(IngestionConnectorFactory)
 
-    # Ingestion Service
-    ingestion_service = providers.Factory(
-        IngestionService,
-        vector_store=vector_store,
-        metadata_store=metadata_store,
-        config=config,
-        notion_client=notion_client,
-        # chunker는 내부 기본값 사용
-    )
-
     # ========================================
     # 3. Async Singletons (Phase 3 - 병렬 초기화)
     # ========================================
@@ -1591,11 +1712,34 @@ class AppContainer(containers.DeclarativeContainer):
         name_mask_char=config.privacy.characters.name,
     )
 
+    # 반복 질문 답변 캐시 (생성/파이프라인/적재 서비스가 공유, 적재 시 무효화)
+    answer_cache = providers.Singleton(
+        _create_answer_cache,
+        config=config,
+        embedder=document_processor.provided.embedder,  # 답변 캐시 시맨틱 매칭용
+    )
+
+    # 토큰/비용/단계 지연 사용량 집계 (생성/파이프라인/관리자 API가 공유)
+    usage_accountant = providers.Singleton(_create_usage_accountant, config=config)
+
     generation = providers.Singleton(
         GenerationModule,
         config=config,
         prompt_manager=prompt_manager,
         privacy_masker=privacy_masker,  # Phase 2: 개인정보 마스킹
+        answer_cache=answer_cache,
+        usage_accountant=usage_accountant,
+    )
+
+    # Ingestion Service (재적재한 원본의 캐시 답변 무효화를 위해 answer_cache 이후 정의)
+    ingestion_service = providers.Factory(
+        IngestionService,
+        vector_store=vector_store,
+        metadata_store=metadata_store,
+        config=config,
+        notion_client=notion_client,
+        answer_cache=answer_cache,
+        # chunker는 내부 기본값 사용
     )
 
     evaluation = providers.Singleton(EvaluationDataManager, config=config.evaluation)
@@ -1937,6 +2081,8 @@ class AppContainer(containers.DeclarativeContainer):
         performance_metrics=performance_metrics,  # ✅ 성능 메트릭 주입
         sql_search_service=sql_search_service,  # ✅ SQL Search Service 주입 (Phase 3)
         agent_orchestrator=agent_orchestrator,  # ✅ Agent Orchestrator 주입 (Phase 5)
+        answer_cache=answer_cache,  # 반복 질문 답변 캐시
+        usage_accountant=usage_accountant,  # 토큰/비용/단계 지연 집계
     )
 
     # ChatService Factory
@@ -1954,6 +2100,8 @@ class AppContainer(containers.DeclarativeContainer):
             # ip_geolocation=ip_geolocation,  # 비활성화: 세션 생성 타임아웃 원인
             retrieval_orchestrator=retrieval_orchestrator,
             self_rag=self_rag,
+            answer_cache=answer_cache,
+            usage_accountant=usage_accountant,
         ),
         config=config,
     )
@@ -2241,7 +2389,10 @@ async def cleanup_resources(container: AppContainer) -> None:
     5. Retrieval Orchestrator - 캐시 및 검색 리소스 정리
     6. Vector Store (Weaviate) - 벡터 DB 연결 종료
     7. Metadata Store (PostgreSQL) - 메타데이터 DB 연결 종료
-    8. 싱글톤 클라이언트 (Weaviate, MongoDB) - main.py에서 별도 처리
+    8. Prompt Manager - 대기 중인 JSON 저장 기록
+    9. Generation Module - LLM 클라이언트 정리
+    10. 등록된 부가 클라이언트 (그래프 추출 캐시 Redis 등)
+    11. 싱글톤 클라이언트 (Weaviate, MongoDB) - main.py에서 별도 처리
     """
     logger.info("애플리케이션 리소스 정리 시작")
     cleanup_errors: list[str] = []
@@ -2336,7 +2487,20 @@ async def cleanup_resources(container: AppContainer) -> None:
             exc_info=True
         )
 
-    # 7. Generation Module (LLM 클라이언트 정리)
+    # 7. Prompt Manager (대기 중인 JSON 저장 기록, 실패 시 정리 오류로 보고)
+    try:
+        prompt_manager = container.prompt_manager()
+        if prompt_manager and hasattr(prompt_manager, "flush"):
+            await prompt_manager.flush()
+    except Exception as e:
+        cleanup_errors.append(f"Prompt Manager: {e}")
+        logger.error(
+            "프롬프트 저장 실패 (종료 시 변경 사항 미기록)",
+            extra={"error": str(e)},
+            exc_info=True
+        )
+
+    # 8. Generation Module (LLM 클라이언트 정리)
     try:
         generation = container.generation()
         if generation and hasattr(generation, "destroy"):
@@ -2351,6 +2515,19 @@ async def cleanup_resources(container: AppContainer) -> None:
             exc_info=True
         )
 
+    # 9. 등록된 부가 클라이언트 (추출 캐시 Redis 등)
+    while _shutdown_callbacks:
+        callback = _shutdown_callbacks.pop()
+        try:
+            await callback()
+        except Exception as e:
+            cleanup_errors.append(f"{getattr(callback, '__qualname__', callback)}: {e}")
+            logger.error(
+                "부가 클라이언트 종료 실패",
+                extra={"error": str(e)},
+                exc_info=True
+            )
+
     # 정리 결과 요약
     if cleanup_errors:
         logger.warning(
@@ -4,6 +4,7 @@ Storage Interfaces
 시스템의 데이터 저장소 추상화 인터페이스 정의.
 이 인터페이스를 통해 비즈니스 로직은 구체적인 DB 구현체(Postgres, Weaviate 등)로부터 분리됩니다.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -43,6 +44,15 @@ class IVectorStore(ABC):
         """벡터 유사도 검색"""
         pass
 
+    async def search_many(self, collection: str, query_vectors: list[list[float]], top_k: int, filters: dict[str, Any] | None = None) -> list[list[dict[str, Any]]]:
+        """
+        다중 쿼리 벡터 일괄 검색 (입력 순서대로 결과 리스트 반환)
+
+        기본 구현은 search()를 병렬 호출합니다.
+        멀티 벡터 요청을 지원하는 백엔드는 1회 왕복으로 처리하도록 오버라이드합니다.
+        """
+        return list(await asyncio.gather(*(self.search(collection, vector, top_k, filters) for vector in query_vectors)))
+
     @abstractmethod
     async def delete(self, collection: str, filters: dict[str, Any]) -> int:
         """조건에 맞는 벡터 삭제"""
@@ -16,7 +16,7 @@ import builtins
 import uuid
 from typing import Any
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, func, select
 from sqlalchemy.exc import IntegrityError
 
 from app.lib.logger import get_logger
@@ -322,6 +322,24 @@ class PromptRepository:
 
             return True
 
+    async def get_version(self) -> str:
+        """
+        프롬프트 테이블 버전 스탬프 조회
+
+        행 수와 최신 updated_at을 조합한 값으로, 생성/수정/삭제가 있으면 바뀝니다.
+        워커별 프롬프트 캐시가 주기적으로 비교하여 다른 워커의 변경을 감지합니다.
+
+        Returns:
+            버전 스탬프 문자열 (예: "12:2025-11-28T10:00:00+00:00")
+        """
+        async with self.db_manager.get_session() as session:
+            result = await session.execute(
+                select(func.count(PromptModel.id), func.max(PromptModel.updated_at))
+            )
+            count, last_updated = result.one()
+            stamp = last_updated.isoformat() if last_updated else "-"
+            return f"{count}:{stamp}"
+
     async def get_active_prompts(
         self, category: str | None = None
     ) -> builtins.list[PromptResponse]:
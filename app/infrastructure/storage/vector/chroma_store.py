@@ -14,6 +14,7 @@ Chroma는 경량 벡터 DB로, 로컬 개발과 테스트에 최적화되어 있
 """
 
 import asyncio
+import inspect
 from collections.abc import Sequence
 from typing import Any
 
@@ -22,9 +23,18 @@ from chromadb.config import Settings
 
 from app.core.interfaces.storage import IVectorStore
 from app.lib.logger import get_logger
+from app.lib.metadata_filter import (
+    RESERVED_FILTER_KEYS,
+    parse_filters,
+    split_id_filter,
+    to_mongo_query,
+)
 
 logger = get_logger(__name__)
 
+# Collection.query()가 ids 인자(문서 ID 제한 검색)를 지원하는지 (구버전 chromadb는 미지원)
+_QUERY_SUPPORTS_IDS = "ids" in inspect.signature(chromadb.Collection.query).parameters
+
 
 class ChromaVectorStore(IVectorStore):
     """
@@ -188,65 +198,166 @@ class ChromaVectorStore(IVectorStore):
                 # 컬렉션이 없으면 빈 리스트 반환
                 return []
 
-            # Chroma where 절 구성
-            where_clause: dict[str, Any] | None = None
-            if filters:
-                where_clause = self._build_where_clause(filters)
-
-            # 검색 실행
+            # 검색 실행 (where 절 + 문서 ID 제한)
             query_embedding: Sequence[float] = query_vector
-            results = col.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k,
-                where=where_clause,
-            )
-
-            # 결과 변환
-            output: list[dict[str, Any]] = []
+            return self._query(col, [query_embedding], top_k, filters)[0]
 
-            if not results or not results.get("ids") or not results["ids"][0]:
-                return output
-
-            ids = results["ids"][0]
-            distances_result = results.get("distances")
-            metadatas_result = results.get("metadatas")
-
-            # 타입 안전하게 추출
-            distances: list[float] = []
-            if distances_result and len(distances_result) > 0:
-                distances = list(distances_result[0]) if distances_result[0] else []
+        try:
+            results = await asyncio.to_thread(_search_sync)
+            logger.debug(
+                f"ChromaVectorStore: {len(results)}개 결과 검색 완료 "
+                f"(collection={collection}, top_k={top_k})"
+            )
+            return results
+        except Exception as e:
+            logger.error(f"ChromaVectorStore: 검색 실패 - {e}")
+            return []
 
-            metadatas: list[dict[str, Any]] = []
-            if metadatas_result and len(metadatas_result) > 0:
-                raw_metadatas = metadatas_result[0]
-                if raw_metadatas:
-                    metadatas = [dict(m) if m else {} for m in raw_metadatas]
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        다중 쿼리 벡터 일괄 검색 (col.query 1회 호출).
 
-            for i, doc_id in enumerate(ids):
-                item: dict[str, Any] = {}
+        Chroma는 query_embeddings에 여러 벡터를 받아 한 번에 검색합니다.
 
-                # 메타데이터 복사
-                if i < len(metadatas) and metadatas[i]:
-                    item.update(metadatas[i])
+        Args:
+            collection: 컬렉션 이름
+            query_vectors: 검색 쿼리 벡터 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터 (모든 쿼리에 공통 적용)
 
-                # 표준 필드 추가
-                item["_id"] = doc_id
-                item["_distance"] = distances[i] if i < len(distances) else 0.0
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+        """
+        if not query_vectors:
+            return []
 
-                output.append(item)
+        def _search_many_sync() -> list[list[dict[str, Any]]]:
+            try:
+                col = self._client.get_collection(name=collection)
+            except Exception:
+                return [[] for _ in query_vectors]
 
-            return output
+            query_embeddings: list[Sequence[float]] = list(query_vectors)
+            return self._query(col, query_embeddings, top_k, filters)
 
         try:
-            results = await asyncio.to_thread(_search_sync)
+            results = await asyncio.to_thread(_search_many_sync)
             logger.debug(
-                f"ChromaVectorStore: {len(results)}개 결과 검색 완료 "
+                f"ChromaVectorStore: {len(query_vectors)}개 쿼리 일괄 검색 완료 "
                 f"(collection={collection}, top_k={top_k})"
             )
             return results
         except Exception as e:
-            logger.error(f"ChromaVectorStore: 검색 실패 - {e}")
-            return []
+            logger.error(f"ChromaVectorStore: 일괄 검색 실패 - {e}")
+            return [[] for _ in query_vectors]
+
+    def _query(
+        self,
+        col: Any,
+        query_embeddings: list[Sequence[float]],
+        top_k: int,
+        filters: dict[str, Any] | None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        col.query() 실행 후 쿼리별 결과 변환.
+
+        id, ids 필터는 메타데이터가 아닌 문서 ID 조건이므로 where 절에서 제외하고
+        query(ids=...)로 적용합니다. ids 인자를 지원하지 않는 chromadb에서는
+        컬렉션 전체를 후보로 가져온 뒤 반환된 ID로 후처리합니다.
+
+        Args:
+            col: Chroma 컬렉션
+            query_embeddings: 검색 쿼리 벡터 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터 (id, ids 포함 가능)
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+        """
+        doc_ids, metadata_filters = split_id_filter(filters)
+        if doc_ids is not None and not doc_ids:
+            return [[] for _ in query_embeddings]
+
+        query_kwargs: dict[str, Any] = {
+            "query_embeddings": query_embeddings,
+            "n_results": top_k,
+            "where": (
+                self._build_where_clause(metadata_filters, RESERVED_FILTER_KEYS)
+                if metadata_filters
+                else None
+            ),
+        }
+        if doc_ids is not None:
+            if _QUERY_SUPPORTS_IDS:
+                query_kwargs["ids"] = doc_ids
+            else:
+                query_kwargs["n_results"] = max(top_k, col.count())
+
+        results = col.query(**query_kwargs)
+        converted = [
+            self._convert_query_results(results, row) for row in range(len(query_embeddings))
+        ]
+        if doc_ids is None:
+            return converted
+
+        allowed = set(doc_ids)
+        return [[item for item in rows if item["_id"] in allowed][:top_k] for rows in converted]
+
+    @staticmethod
+    def _convert_query_results(results: Any, row: int) -> list[dict[str, Any]]:
+        """
+        col.query() 결과의 row번째 쿼리 결과를 표준 형식으로 변환.
+
+        Args:
+            results: Chroma QueryResult (ids/distances/metadatas가 쿼리별 2차원 리스트)
+            row: 변환할 쿼리 인덱스
+
+        Returns:
+            {"_id": str, "_distance": float, ...metadata} 형식의 결과 리스트
+        """
+        output: list[dict[str, Any]] = []
+
+        if not results or not results.get("ids") or len(results["ids"]) <= row:
+            return output
+
+        ids = results["ids"][row]
+        if not ids:
+            return output
+
+        distances_result = results.get("distances")
+        metadatas_result = results.get("metadatas")
+
+        # 타입 안전하게 추출
+        distances: list[float] = []
+        if distances_result and len(distances_result) > row:
+            distances = list(distances_result[row]) if distances_result[row] else []
+
+        metadatas: list[dict[str, Any]] = []
+        if metadatas_result and len(metadatas_result) > row:
+            raw_metadatas = metadatas_result[row]
+            if raw_metadatas:
+                metadatas = [dict(m) if m else {} for m in raw_metadatas]
+
+        for i, doc_id in enumerate(ids):
+            item: dict[str, Any] = {}
+
+            # 메타데이터 복사
+            if i < len(metadatas) and metadatas[i]:
+                item.update(metadatas[i])
+
+            # 표준 필드 추가
+            item["_id"] = doc_id
+            item["_distance"] = distances[i] if i < len(distances) else 0.0
+
+            output.append(item)
+
+        return output
 
     async def delete(
         self, collection: str, filters: dict[str, Any]
@@ -301,8 +412,8 @@ class ChromaVectorStore(IVectorStore):
                 except Exception:
                     return 0
 
-            # 메타데이터 필터 기반 삭제
-            where_clause = self._build_where_clause(filters)
+            # 메타데이터 필터 기반 삭제 (id, ids는 위에서 처리)
+            where_clause = self._build_where_clause(filters, RESERVED_FILTER_KEYS)
             if where_clause:
                 try:
                     # 먼저 조건에 맞는 문서 조회
@@ -333,16 +444,18 @@ class ChromaVectorStore(IVectorStore):
             ) from e
 
     def _build_where_clause(
-        self, filters: dict[str, Any]
+        self, filters: dict[str, Any], reserved_keys: frozenset[str] = frozenset()
     ) -> dict[str, Any] | None:
         """
         필터 딕셔너리를 Chroma where 절로 변환.
 
-        단순 키-값 필터만 지원합니다.
-        복잡한 쿼리(and, or, 범위 등)는 Chroma 문서를 참조하세요.
+        공통 필터 AST(parse_filters)를 거쳐 Chroma 연산자 문법으로 변환합니다.
+        단순 키-값, 리스트($in), 범위($gt/$gte/$lt/$lte), $and/$or를 지원하며
+        Chroma는 where 절을 HNSW 탐색 중에 적용(pre-filter)합니다.
 
         Args:
             filters: 메타데이터 필터 딕셔너리
+            reserved_keys: where 절에서 제외할 키 (삭제 경로의 id, ids)
 
         Returns:
             Chroma where 절 딕셔너리 또는 None
@@ -350,20 +463,11 @@ class ChromaVectorStore(IVectorStore):
         if not filters:
             return None
 
-        # id, ids는 where 절이 아닌 별도 처리
-        where_filters = {k: v for k, v in filters.items() if k not in ("id", "ids")}
-
-        if not where_filters:
+        expr = parse_filters(filters, reserved_keys)
+        if expr is None:
             return None
 
-        # 단일 필터면 그대로 반환
-        if len(where_filters) == 1:
-            key, value = next(iter(where_filters.items()))
-            return {key: value}
-
-        # 여러 필터면 $and로 결합
-        conditions = [{k: v} for k, v in where_filters.items()]
-        return {"$and": conditions}
+        return to_mongo_query(expr)
 
     def close(self) -> None:
         """
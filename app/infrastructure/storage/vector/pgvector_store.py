@@ -24,6 +24,19 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from app.lib.logger import get_logger
+from app.lib.metadata_filter import (
+    RANGE_OPS,
+    RESERVED_FILTER_KEYS,
+    And,
+    CardinalityCache,
+    Condition,
+    FilterExpr,
+    FilterOp,
+    FilterPlanner,
+    FilterStrategy,
+    parse_filters,
+    split_id_filter,
+)
 
 logger = get_logger(__name__)
 
@@ -124,6 +137,10 @@ class PgVectorStore(IVectorStore):
         # 연결 초기화 (지연 로딩 또는 Mock)
         self._connection: Any = _connection
 
+        # 필터 pushdown: 매칭 문서가 적으면 인덱스 대신 부분집합 전수 탐색
+        self._filter_planner = FilterPlanner()
+        self._cardinality_cache = CardinalityCache()
+
         # 통계
         self._stats = {
             "documents_added": 0,
@@ -242,6 +259,7 @@ class PgVectorStore(IVectorStore):
                 conn.commit()
 
             self._stats["documents_added"] += added_count
+            self._cardinality_cache.clear()
 
             logger.info(f"pgvector에 {added_count}개 문서 저장 완료")
             return added_count
@@ -291,52 +309,43 @@ class PgVectorStore(IVectorStore):
 
         try:
             # 필터 조건 구성
-            filter_clause = ""
-            filter_params: list[Any] = []
-            if filters:
-                filter_conditions = []
-                for key, value in filters.items():
-                    if key == "ids":
-                        continue  # ID 필터는 별도 처리
-                    filter_conditions.append(f"metadata->>'{key}' = %s")
-                    filter_params.append(str(value))
-                if filter_conditions:
-                    filter_clause = "WHERE " + " AND ".join(filter_conditions)
-
-            # 유사도 검색 쿼리 (코사인 거리 사용)
-            query = f"""
-                SELECT id, content, 1 - (embedding <=> %s::vector) as score, metadata
-                FROM {self.table_name}
-                {filter_clause}
-                ORDER BY embedding <=> %s::vector
-                LIMIT %s
-            """
+            filter_clause, filter_params = self._build_filter_clause(filters)
+            exact_scan = self._use_exact_scan(conn, filter_clause, filter_params, top_k)
+
+            if exact_scan:
+                # 매칭 문서가 적음 → 필터 부분집합을 먼저 구체화한 뒤 전수 거리 계산
+                # (IVFFlat 탐색 후 필터로 결과가 top_k보다 적게 잘리는 문제 방지)
+                query = f"""
+                    WITH candidates AS MATERIALIZED (
+                        SELECT id, content, embedding, metadata
+                        FROM {self.table_name}
+                        {filter_clause}
+                    )
+                    SELECT id, content, 1 - (embedding <=> %s::vector) as score, metadata
+                    FROM candidates
+                    ORDER BY embedding <=> %s::vector
+                    LIMIT %s
+                """
+                params = filter_params + [str(query_vector), str(query_vector), top_k]
+            else:
+                # 유사도 검색 쿼리 (코사인 거리 사용)
+                query = f"""
+                    SELECT id, content, 1 - (embedding <=> %s::vector) as score, metadata
+                    FROM {self.table_name}
+                    {filter_clause}
+                    ORDER BY embedding <=> %s::vector
+                    LIMIT %s
+                """
+                params = [str(query_vector)] + filter_params + [str(query_vector), top_k]
 
             with conn.cursor() as cursor:
-                cursor.execute(
-                    query,
-                    [str(query_vector)] + filter_params + [str(query_vector), top_k],
-                )
+                cursor.execute(query, params)
                 results = cursor.fetchall()
 
             self._stats["searches"] += 1
 
             # 결과 변환
-            converted_results = []
-            for row in results:
-                doc_id, content, score, metadata = row
-                result: dict[str, Any] = {
-                    "_id": str(doc_id),
-                    "_score": float(score),
-                    "content": content,
-                }
-                # 메타데이터 병합
-                if metadata:
-                    if isinstance(metadata, str):
-                        metadata = json.loads(metadata)
-                    result.update(metadata)
-
-                converted_results.append(result)
+            converted_results = [self._convert_row(row) for row in results]
 
             logger.debug(f"pgvector 검색 완료: {len(converted_results)}개 결과")
             return converted_results
@@ -348,6 +357,224 @@ class PgVectorStore(IVectorStore):
                 "해결 방법: 1) PostgreSQL 서버 상태 확인 2) 쿼리 벡터 차원 확인"
             ) from e
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        다중 쿼리 벡터 일괄 검색 (SQL 1회 실행)
+
+        쿼리 벡터 배열을 unnest한 뒤 LATERAL 서브쿼리로 벡터별 Top-K를 구해
+        한 번의 왕복으로 모든 쿼리 결과를 가져옵니다.
+
+        Args:
+            collection: 테이블 이름 (또는 참조용 컬렉션 이름)
+            query_vectors: 쿼리 임베딩 벡터 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터 조건 (모든 쿼리에 공통 적용)
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+
+        Raises:
+            ImportError: psycopg 미설치 시
+            RuntimeError: 검색 실패 시
+        """
+        if not query_vectors:
+            return []
+
+        conn = self._ensure_connection()
+
+        try:
+            filter_clause, filter_params = self._build_filter_clause(filters)
+            vectors_param = [str(vector) for vector in query_vectors]
+
+            if self._use_exact_scan(conn, filter_clause, filter_params, top_k):
+                cte = f"""
+                    WITH candidates AS MATERIALIZED (
+                        SELECT id, content, embedding, metadata
+                        FROM {self.table_name}
+                        {filter_clause}
+                    )
+                """
+                source, where = "candidates", ""
+                params = filter_params + [vectors_param, top_k]
+            else:
+                cte, source, where = "", self.table_name, filter_clause
+                params = [vectors_param] + filter_params + [top_k]
+
+            query = f"""
+                {cte}
+                SELECT q.ord, d.id, d.content, d.score, d.metadata
+                FROM unnest(%s::text[]) WITH ORDINALITY AS q(vec, ord)
+                CROSS JOIN LATERAL (
+                    SELECT id, content, 1 - (embedding <=> q.vec::vector) as score, metadata
+                    FROM {source}
+                    {where}
+                    ORDER BY embedding <=> q.vec::vector
+                    LIMIT %s
+                ) AS d
+                ORDER BY q.ord, d.score DESC
+            """
+
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+
+            self._stats["searches"] += len(query_vectors)
+
+            # ord(1-based)별로 결과 분배
+            grouped: list[list[dict[str, Any]]] = [[] for _ in query_vectors]
+            for ord_, *row in rows:
+                grouped[int(ord_) - 1].append(self._convert_row(tuple(row)))
+
+            logger.debug(f"pgvector 일괄 검색 완료: {len(query_vectors)}개 쿼리")
+            return grouped
+
+        except Exception as e:
+            logger.error(f"pgvector 일괄 검색 실패: {e}")
+            raise RuntimeError(
+                f"pgvector 일괄 검색 중 오류가 발생했습니다: {e}. "
+                "해결 방법: 1) PostgreSQL 서버 상태 확인 2) 쿼리 벡터 차원 확인"
+            ) from e
+
+    @classmethod
+    def _build_filter_clause(cls, filters: dict[str, Any] | None) -> tuple[str, list[Any]]:
+        """
+        메타데이터 필터를 WHERE 절과 파라미터로 변환
+
+        공통 필터 AST(parse_filters)를 JSONB 조건식으로 변환합니다.
+        id, ids 조건은 id 컬럼의 ANY 조건으로 변환합니다.
+        필드 이름은 AST에서 검증되며, 값은 모두 바인딩 파라미터로 전달됩니다.
+
+        Args:
+            filters: 메타데이터 필터 조건
+
+        Returns:
+            (WHERE 절 문자열, 바인딩 파라미터 리스트)
+        """
+        doc_ids, metadata_filters = split_id_filter(filters)
+        expr = parse_filters(metadata_filters, RESERVED_FILTER_KEYS)
+
+        conditions: list[str] = []
+        filter_params: list[Any] = []
+        if doc_ids is not None:
+            # id, ids는 메타데이터가 아닌 id 컬럼 조건
+            conditions.append("id = ANY(%s)")
+            filter_params.append(doc_ids)
+        if expr is not None:
+            conditions.append(cls._to_sql(expr, filter_params))
+
+        if not conditions:
+            return "", []
+        return "WHERE " + " AND ".join(conditions), filter_params
+
+    @classmethod
+    def _to_sql(cls, expr: FilterExpr, params: list[Any]) -> str:
+        """필터 AST 노드를 SQL 조건식으로 변환 (재귀, params에 바인딩 값 추가)"""
+        if isinstance(expr, Condition):
+            return cls._condition_to_sql(expr, params)
+
+        joiner = " AND " if isinstance(expr, And) else " OR "
+        return "(" + joiner.join(cls._to_sql(child, params) for child in expr.children) + ")"
+
+    @staticmethod
+    def _condition_to_sql(condition: Condition, params: list[Any]) -> str:
+        """리프 조건을 metadata->>'field' 비교식으로 변환"""
+
+        def as_text(value: Any) -> str:
+            # ->> 연산자는 JSON 불리언을 'true'/'false' 텍스트로 반환
+            return json.dumps(value) if isinstance(value, bool) else str(value)
+
+        field = f"metadata->>'{condition.field}'"
+        op = condition.op
+
+        if op is FilterOp.EXISTS:
+            # JSONB 키 존재 여부 (값이 null이어도 키가 있으면 존재)
+            params.append(condition.field)
+            return "metadata ? %s" if condition.value else "NOT (metadata ? %s)"
+
+        if op in RANGE_OPS:
+            sql_op = {FilterOp.GT: ">", FilterOp.GTE: ">=", FilterOp.LT: "<", FilterOp.LTE: "<="}[op]
+            if isinstance(condition.value, int | float) and not isinstance(condition.value, bool):
+                params.append(condition.value)
+                return f"({field})::numeric {sql_op} %s"
+            params.append(as_text(condition.value))
+            return f"{field} {sql_op} %s"
+
+        if op is FilterOp.EQ:
+            params.append(as_text(condition.value))
+            return f"{field} = %s"
+        if op is FilterOp.NE:
+            params.append(as_text(condition.value))
+            return f"{field} IS DISTINCT FROM %s"
+
+        params.append([as_text(value) for value in condition.value])
+        if op is FilterOp.IN:
+            return f"{field} = ANY(%s)"
+        return f"({field} IS NULL OR NOT ({field} = ANY(%s)))"
+
+    def _use_exact_scan(
+        self, conn: Any, filter_clause: str, filter_params: list[Any], top_k: int
+    ) -> bool:
+        """
+        필터 매칭 문서 수를 추정해 전수 탐색(EXACT_SCAN) 여부 결정
+
+        매칭 수는 exact_scan_threshold+1에서 끊어 세므로 큰 테이블에서도 비용이 제한되며,
+        결과는 CardinalityCache에 캐시됩니다. 추정 실패 시 기존 인덱스 경로를 사용합니다.
+        """
+        if not filter_clause:
+            return False
+
+        cache_key = (filter_clause, repr(filter_params))
+        matching = self._cardinality_cache.get(cache_key)
+        if matching is None:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        f"SELECT count(*) FROM (SELECT 1 FROM {self.table_name} "
+                        f"{filter_clause} LIMIT %s) AS matched",
+                        filter_params + [self._filter_planner.exact_scan_threshold + 1],
+                    )
+                    row = cursor.fetchone()
+                matching = int(row[0]) if row else None
+            except Exception as e:
+                logger.debug(f"pgvector 필터 카디널리티 추정 실패: {e}")
+                return False
+            if matching is None:
+                return False
+            self._cardinality_cache.set(cache_key, matching)
+
+        plan = self._filter_planner.plan(top_k, matching=matching, supports_prefilter=True)
+        return plan.strategy is FilterStrategy.EXACT_SCAN
+
+    @staticmethod
+    def _convert_row(row: tuple[Any, ...]) -> dict[str, Any]:
+        """
+        (id, content, score, metadata) 행을 표준 결과 형식으로 변환
+
+        Args:
+            row: 검색 결과 행
+
+        Returns:
+            {"_id": str, "_score": float, "content": str, ...metadata} 형식의 결과
+        """
+        doc_id, content, score, metadata = row
+        result: dict[str, Any] = {
+            "_id": str(doc_id),
+            "_score": float(score),
+            "content": content,
+        }
+        # 메타데이터 병합
+        if metadata:
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+            result.update(metadata)
+        return result
+
     async def delete(self, collection: str, filters: dict[str, Any]) -> int:
         """
         조건에 맞는 문서 삭제
@@ -383,6 +610,7 @@ class PgVectorStore(IVectorStore):
                 conn.commit()
 
             self._stats["deletions"] += deleted_count
+            self._cardinality_cache.clear()
 
             logger.info(f"pgvector에서 {deleted_count}개 문서 삭제 완료")
             return deleted_count
@@ -24,6 +24,7 @@ from pinecone import Pinecone
 
 from app.core.interfaces.storage import IVectorStore
 from app.lib.logger import get_logger
+from app.lib.metadata_filter import parse_filters, to_mongo_query
 
 logger = get_logger(__name__)
 
@@ -195,9 +196,10 @@ class PineconeVectorStore(IVectorStore):
                 "include_metadata": True,
             }
 
-            # 메타데이터 필터
-            if filters:
-                query_params["filter"] = filters
+            # 메타데이터 필터 (공통 AST → Pinecone filter 문법, 네이티브 pre-filter)
+            filter_expr = parse_filters(filters)
+            if filter_expr is not None:
+                query_params["filter"] = to_mongo_query(filter_expr)
 
             # Sparse Vector (하이브리드 검색)
             if sparse_vector:
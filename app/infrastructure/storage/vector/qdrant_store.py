@@ -25,6 +25,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from app.lib.logger import get_logger
+from app.lib.metadata_filter import And, Condition, FilterExpr, FilterOp, Or, parse_filters
 
 logger = get_logger(__name__)
 
@@ -304,17 +305,7 @@ class QdrantVectorStore(IVectorStore):
             self._stats["searches"] += 1
 
             # 결과 변환
-            converted_results = []
-            for hit in results:
-                result = {
-                    "_id": str(hit.id),
-                    "_score": hit.score,
-                }
-                # 페이로드 병합
-                if hit.payload:
-                    result.update(hit.payload)
-
-                converted_results.append(result)
+            converted_results = self._convert_hits(results)
 
             logger.debug(f"Qdrant 검색 완료: {len(converted_results)}개 결과")
             return converted_results
@@ -326,6 +317,105 @@ class QdrantVectorStore(IVectorStore):
                 "해결 방법: 1) Qdrant 서버 상태 확인 2) 쿼리 벡터 차원 확인"
             ) from e
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        다중 쿼리 벡터 일괄 검색 (query_batch_points 1회 호출)
+
+        query_batch_points/QueryRequest는 qdrant-client 1.10+에서 제공됩니다.
+        구버전 클라이언트에서는 기본 구현(search() 병렬 호출)으로 처리합니다.
+
+        Args:
+            collection: 검색할 컬렉션 이름
+            query_vectors: 쿼리 임베딩 벡터 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터 조건 (모든 쿼리에 공통 적용)
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+
+        Raises:
+            ImportError: qdrant-client 미설치 시
+            RuntimeError: 검색 실패 시
+        """
+        if not query_vectors:
+            return []
+
+        client = self._ensure_client()
+
+        try:
+            from qdrant_client.models import QueryRequest
+        except ImportError:
+            QueryRequest = None  # noqa: N806
+
+        if QueryRequest is None or not hasattr(client, "query_batch_points"):
+            return list(
+                await asyncio.gather(
+                    *(self.search(collection, vector, top_k, filters) for vector in query_vectors)
+                )
+            )
+
+        try:
+            qdrant_filter = self._convert_filters(filters) if filters else None
+            requests = [
+                QueryRequest(
+                    query=vector,
+                    limit=top_k,
+                    filter=qdrant_filter,
+                    with_payload=True,
+                )
+                for vector in query_vectors
+            ]
+
+            batch_results = await asyncio.to_thread(
+                client.query_batch_points,
+                collection_name=collection,
+                requests=requests,
+            )
+
+            self._stats["searches"] += len(query_vectors)
+
+            converted = [self._convert_hits(response.points) for response in batch_results]
+            logger.debug(f"Qdrant 일괄 검색 완료: {len(query_vectors)}개 쿼리")
+            return converted
+
+        except Exception as e:
+            logger.error(f"Qdrant 일괄 검색 실패: {e}")
+            raise RuntimeError(
+                f"Qdrant 일괄 검색 중 오류가 발생했습니다: {e}. "
+                "해결 방법: 1) Qdrant 서버 상태 확인 2) 쿼리 벡터 차원 확인"
+            ) from e
+
+    @staticmethod
+    def _convert_hits(hits: Any) -> list[dict[str, Any]]:
+        """
+        Qdrant ScoredPoint 리스트를 표준 결과 형식으로 변환
+
+        Args:
+            hits: client.search() / search_batch() 결과 (ScoredPoint 리스트)
+
+        Returns:
+            {"_id": str, "_score": float, ...payload} 형식의 결과 리스트
+        """
+        converted_results = []
+        for hit in hits:
+            result = {
+                "_id": str(hit.id),
+                "_score": hit.score,
+            }
+            # 페이로드 병합
+            if hit.payload:
+                result.update(hit.payload)
+
+            converted_results.append(result)
+
+        return converted_results
+
     async def delete(self, collection: str, filters: dict[str, Any]) -> int:
         """
         조건에 맞는 문서 삭제
@@ -378,6 +468,15 @@ class QdrantVectorStore(IVectorStore):
         """
         딕셔너리 필터를 Qdrant 필터 형식으로 변환
 
+        공통 필터 AST(parse_filters)를 Qdrant Filter로 변환합니다.
+        Qdrant는 payload 인덱스를 사용해 HNSW 탐색 중 필터를 적용(pre-filter)하므로
+        선택도가 높은 필터에서도 top_k가 잘리지 않습니다.
+
+        변환 규칙:
+            Eq → MatchValue, In → MatchAny, Ne/Nin → must_not,
+            범위 → Range, Exists → IsEmptyCondition (True면 must_not),
+            And → must, Or → should
+
         Args:
             filters: 필터 딕셔너리 (예: {"file_type": "PDF"})
 
@@ -385,21 +484,65 @@ class QdrantVectorStore(IVectorStore):
             Qdrant Filter 객체
         """
         try:
-            from qdrant_client.models import FieldCondition, Filter, MatchValue
-
-            conditions = []
-            for key, value in filters.items():
-                if key == "ids":
-                    continue  # ID 필터는 별도 처리
-                conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-
-            return Filter(must=conditions) if conditions else None
+            # ids는 payload 필드가 아닌 포인트 ID 조건이므로 제외 (delete()에서 별도 처리)
+            expr = parse_filters(filters, frozenset({"ids"}))
+            if expr is None:
+                return None
+            return self._to_qdrant_filter(expr)
 
         except ImportError:
             return None
 
+    @classmethod
+    def _to_qdrant_filter(cls, expr: FilterExpr) -> Any:
+        """필터 AST 노드를 Qdrant Filter로 변환 (재귀)"""
+        from qdrant_client.models import Filter
+
+        if isinstance(expr, Or):
+            return Filter(should=[cls._to_qdrant_filter(child) for child in expr.children])
+
+        children = expr.children if isinstance(expr, And) else (expr,)
+        must: list[Any] = []
+        must_not: list[Any] = []
+        for child in children:
+            if isinstance(child, Condition):
+                condition, negated = cls._to_qdrant_condition(child)
+                (must_not if negated else must).append(condition)
+            else:
+                must.append(cls._to_qdrant_filter(child))
+
+        return Filter(must=must or None, must_not=must_not or None)
+
+    @staticmethod
+    def _to_qdrant_condition(condition: Condition) -> tuple[Any, bool]:
+        """
+        리프 조건을 Qdrant FieldCondition으로 변환
+
+        Returns:
+            (FieldCondition, 부정 여부) - Ne/Nin/Exists(True)는 must_not에 넣어야 하므로 True
+        """
+        from qdrant_client.models import (
+            FieldCondition,
+            IsEmptyCondition,
+            MatchAny,
+            MatchValue,
+            PayloadField,
+            Range,
+        )
+
+        op = condition.op
+        if op is FilterOp.EXISTS:
+            return IsEmptyCondition(is_empty=PayloadField(key=condition.field)), condition.value
+        if op in (FilterOp.EQ, FilterOp.NE):
+            match: Any = MatchValue(value=condition.value)
+            return FieldCondition(key=condition.field, match=match), op is FilterOp.NE
+        if op in (FilterOp.IN, FilterOp.NIN):
+            match = MatchAny(any=list(condition.value))
+            return FieldCondition(key=condition.field, match=match), op is FilterOp.NIN
+
+        range_kwargs = {op.value.lstrip("$"): condition.value}
+        return FieldCondition(key=condition.field, range=Range(**range_kwargs)), False
+
     @property
     def stats(self) -> dict[str, int]:
         """통계 정보 반환"""
@@ -14,10 +14,8 @@ FastAPI 애플리케이션을 위한 간단하고 효과적인 API Key 인증 
 
     auth = APIKeyAuth()
 
-    # 미들웨어로 전역 적용
-    @app.middleware("http")
-    async def auth_middleware(request: Request, call_next):
-        return await auth.authenticate_request(request, call_next)
+    # 미들웨어로 전역 적용 (순수 ASGI)
+    app.add_middleware(APIKeyAuthMiddleware, auth=auth)
 
     # OpenAPI 스키마 수정
     app.openapi = auth.get_custom_openapi_func(app)
@@ -25,12 +23,14 @@ FastAPI 애플리케이션을 위한 간단하고 효과적인 API Key 인증 
 
 import os
 import secrets
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .logger import get_logger
 
@@ -157,7 +157,34 @@ class APIKeyAuth:
 
     async def authenticate_request(self, request: Request, call_next: Callable[..., Any]) -> Any:
         """
-        HTTP 요청 인증 미들웨어
+        HTTP 요청 인증 (call_next 방식 미들웨어용)
+
+        Args:
+            request: FastAPI Request 객체
+            call_next: 다음 미들웨어/핸들러
+
+        Returns:
+            Response 객체
+        """
+        denied = self.check_request(
+            path=request.url.path,
+            method=request.method,
+            headers=request.headers,
+            client_ip=request.client.host if request.client else None,
+        )
+        if denied is not None:
+            return denied
+        return await call_next(request)
+
+    def check_request(
+        self,
+        path: str,
+        method: str,
+        headers: Mapping[str, str],
+        client_ip: str | None = None,
+    ) -> JSONResponse | None:
+        """
+        HTTP 요청 인증 판정
 
         동작:
         1. 공개 경로는 인증 없이 통과
@@ -166,22 +193,22 @@ class APIKeyAuth:
         4. API Key가 없거나 틀리면 401 에러
 
         Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어/핸들러
+            path: 요청 경로
+            method: HTTP 메서드
+            headers: 요청 헤더 (X-API-Key는 보호 경로에서만 조회)
+            client_ip: 클라이언트 IP (로그용)
 
         Returns:
-            Response 객체
+            통과 시 None, 거부 시 401 JSONResponse
         """
-        path = request.url.path
-
         # 1. 공개 경로는 인증 불필요
         if self.is_public_path(path):
-            return await call_next(request)
+            return None
 
         # 2. CORS preflight (OPTIONS) 요청은 인증 제외
         # 브라우저가 실제 요청 전에 보내는 사전 확인 요청이므로 인증 불필요
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        if method == "OPTIONS":
+            return None
 
         # 2. API Key가 설정되지 않았으면 인증 스킵 (개발 환경만 허용)
         if not self.api_key:
@@ -224,21 +251,20 @@ class APIKeyAuth:
                     "suggestion": "개발 환경에서만 허용되는 동작입니다. 프로덕션에서는 차단됩니다.",
                 },
             )
-            return await call_next(request)
+            return None
 
         # 3. 보호 경로는 API Key 검증
         if self.is_protected_path(path):
             # 헤더에서 API Key 추출
-            api_key = request.headers.get("X-API-Key")
+            api_key = headers.get("X-API-Key")
 
             # API Key 검증
             if not api_key:
-                client_ip = request.client.host if request.client else "unknown"
                 logger.warning(
                     "API Key 누락",
                     extra={
                         "path": path,
-                        "client_ip": client_ip,
+                        "client_ip": client_ip or "unknown",
                         "suggestion": (
                             "X-API-Key 헤더에 API Key를 포함하세요. "
                             "Swagger UI에서 테스트 시: 우측 상단 'Authorize' 버튼 클릭 후 키 입력"
@@ -263,12 +289,11 @@ class APIKeyAuth:
 
             # 타이밍 공격 방지: secrets.compare_digest 사용
             if not secrets.compare_digest(api_key, self.api_key):
-                client_ip = request.client.host if request.client else "unknown"
                 logger.warning(
                     "잘못된 API Key",
                     extra={
                         "path": path,
-                        "client_ip": client_ip,
+                        "client_ip": client_ip or "unknown",
                         "suggestion": (
                             ".env 파일의 FASTAPI_AUTH_KEY 값과 일치하는지 확인하세요. "
                             "공백이나 줄바꿈 문자가 포함되지 않았는지 확인하세요."
@@ -294,8 +319,8 @@ class APIKeyAuth:
             # 인증 성공
             logger.debug(f"✅ API Key 인증 성공: {path}")
 
-        # 4. 요청 처리
-        return await call_next(request)
+        # 4. 통과
+        return None
 
     def get_custom_openapi_func(self, app: FastAPI) -> Callable[[], Any]:
         """
@@ -357,6 +382,36 @@ class APIKeyAuth:
         return custom_openapi
 
 
+class APIKeyAuthMiddleware:
+    """
+    API Key 인증 미들웨어 (순수 ASGI)
+
+    BaseHTTPMiddleware와 달리 요청/응답 스트림을 감싸지 않고, 인증 실패 시에만
+    401 응답을 직접 보낸다. SSE 등 스트리밍 응답은 그대로 통과한다.
+    """
+
+    def __init__(self, app: ASGIApp, auth: APIKeyAuth) -> None:
+        self.app = app
+        self.auth = auth
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        denied = self.auth.check_request(
+            path=scope["path"],
+            method=scope["method"],
+            headers=Headers(scope=scope),
+            client_ip=client[0] if client else None,
+        )
+        if denied is not None:
+            await denied(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
 # 전역 인스턴스 (싱글톤 패턴)
 _auth_instance = None
 
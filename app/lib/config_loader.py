@@ -11,11 +11,22 @@ v3.3.1 개선사항:
 - 환경별 설정 분리 (development, test, production)
 - environment.py 기반 다층 환경 감지 통합
 - config_validator.py Pydantic 검증 강화 통합
+
+설정 스냅샷:
+- get_config(): 프로세스 전역 불변 스냅샷 (핫 패스 읽기용, 1회 로드)
+- reload_config() / ConfigWatcher / SIGHUP: 변경 시 스냅샷 원자적 교체 + 구독자 통지
 """
 
+import asyncio
 import os
 import re
+import signal
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
@@ -353,3 +364,243 @@ def load_config(
         raise_on_validation_error=raise_on_validation_error,
         enable_enhanced_validation=enable_enhanced_validation,
     )
+
+
+# ========================================
+# 프로세스 전역 설정 스냅샷 (핫 패스 읽기 전용)
+# ========================================
+# load_config()는 호출마다 YAML 파싱/병합/검증을 반복하므로 요청 경로에서
+# 읽기만 하는 호출자는 get_config()로 불변 스냅샷을 공유한다.
+# 변경 시에는 새 스냅샷을 만들어 참조를 통째로 교체한다 (읽기 경로는 락 없음).
+
+ConfigSubscriber = Callable[[Mapping[str, Any], Mapping[str, Any]], None]
+
+_CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+def freeze_config(value: Any) -> Any:
+    """dict → MappingProxyType, list → tuple 로 재귀 변환 (읽기 전용 뷰)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze_config(v) for k, v in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """freeze_config의 역변환 (수정 가능한 복사본이 필요한 호출자용)"""
+    if isinstance(value, Mapping):
+        return {k: thaw_config(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """불변 설정 스냅샷"""
+
+    data: Mapping[str, Any]
+    version: int
+    loaded_at: float
+    # 로드 시점의 설정 파일 (경로, mtime) 목록 - 변경 감지용
+    source_mtimes: tuple[tuple[str, float], ...] = ()
+
+
+_snapshot: ConfigSnapshot | None = None
+_snapshot_lock = threading.Lock()  # 로드/리로드 직렬화 (읽기는 락 없이 참조만)
+_subscribers: list[ConfigSubscriber] = []
+
+
+def _source_mtimes() -> tuple[tuple[str, float], ...]:
+    """설정 디렉토리의 YAML 파일 mtime 지문"""
+    mtimes = []
+    for path in sorted(_CONFIG_DIR.rglob("*.yaml")):
+        try:
+            mtimes.append((str(path), path.stat().st_mtime))
+        except OSError:
+            continue
+    return tuple(mtimes)
+
+
+def _load_snapshot_source() -> dict[str, Any]:
+    """스냅샷 원본 로드 (테스트에서 교체 가능)"""
+    return load_config()
+
+
+def _build_snapshot(version: int, mtimes: tuple[tuple[str, float], ...]) -> ConfigSnapshot:
+    return ConfigSnapshot(
+        data=freeze_config(_load_snapshot_source()),
+        version=version,
+        loaded_at=time.time(),
+        source_mtimes=mtimes,
+    )
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """현재 설정 스냅샷 반환 (최초 호출 시 1회 로드)"""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None:
+        return snapshot
+    with _snapshot_lock:
+        if _snapshot is None:
+            _snapshot = _build_snapshot(version=1, mtimes=_source_mtimes())
+        return _snapshot
+
+
+def get_config() -> Mapping[str, Any]:
+    """
+    프로세스 전역 읽기 전용 설정 반환
+
+    load_config()와 달리 매 호출마다 파일을 읽지 않는다. 반환값은 수정할 수 없으며
+    (MappingProxyType / tuple), 수정 가능한 dict가 필요하면 thaw_config()를 사용한다.
+    """
+    return get_config_snapshot().data
+
+
+def reload_config(force: bool = False) -> bool:
+    """
+    설정 파일을 다시 읽어 스냅샷 교체
+
+    Args:
+        force: True면 파일 mtime이 그대로여도 다시 로드 (SIGHUP 등 수동 요청)
+
+    Returns:
+        새 스냅샷으로 교체되었는지 여부. 로드/검증 실패 시 기존 스냅샷을 유지한다.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        current = _snapshot
+        mtimes = _source_mtimes()
+        if current is not None and not force and mtimes == current.source_mtimes:
+            return False
+
+        version = current.version + 1 if current is not None else 1
+        try:
+            candidate = _build_snapshot(version=version, mtimes=mtimes)
+        except Exception as e:
+            logger.error(
+                "설정 리로드 실패 - 기존 스냅샷 유지",
+                extra={"error": str(e), "version": current.version if current else None},
+            )
+            if current is not None:
+                # 같은 파일 상태로 매 주기 재시도하지 않도록 지문만 갱신
+                _snapshot = replace(current, source_mtimes=mtimes)
+            return False
+
+        if current is not None and candidate.data == current.data:
+            _snapshot = replace(current, source_mtimes=mtimes)
+            return False
+
+        _snapshot = candidate
+        subscribers = list(_subscribers)
+
+    logger.info(
+        "설정 스냅샷 교체",
+        extra={
+            "version": candidate.version,
+            "changed_sections": changed_sections(current.data, candidate.data) if current else [],
+        },
+    )
+    if current is not None:
+        for callback in subscribers:
+            try:
+                callback(current.data, candidate.data)
+            except Exception as e:
+                logger.error(
+                    "설정 변경 구독자 실행 실패",
+                    extra={
+                        "callback": getattr(callback, "__name__", repr(callback)),
+                        "error": str(e),
+                    },
+                )
+    return True
+
+
+def subscribe_config(callback: ConfigSubscriber) -> Callable[[], None]:
+    """
+    설정 변경 구독 등록
+
+    스냅샷이 교체될 때 callback(old, new)가 리로드를 수행한 스레드에서 호출된다.
+
+    Returns:
+        구독 해제 함수
+    """
+    with _snapshot_lock:
+        _subscribers.append(callback)
+
+    def unsubscribe() -> None:
+        with _snapshot_lock:
+            if callback in _subscribers:
+                _subscribers.remove(callback)
+
+    return unsubscribe
+
+
+def changed_sections(old: Mapping[str, Any], new: Mapping[str, Any]) -> list[str]:
+    """두 스냅샷 사이에 값이 달라진 최상위 섹션 이름"""
+    keys = set(old) | set(new)
+    return sorted(key for key in keys if old.get(key) != new.get(key))
+
+
+class ConfigWatcher:
+    """
+    설정 파일 mtime 폴링 감시자
+
+    데몬 스레드에서 interval마다 reload_config()를 호출한다.
+    (파일 시스템 이벤트 라이브러리 의존 없이 stat만 사용)
+    """
+
+    def __init__(self, interval_seconds: float = 10.0) -> None:
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running or self.interval_seconds <= 0:
+            return
+        get_config_snapshot()  # 기준 스냅샷 확보
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        logger.info("설정 파일 감시 시작", extra={"interval_seconds": self.interval_seconds})
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                reload_config()
+            except Exception as e:
+                logger.error("설정 파일 감시 오류", extra={"error": str(e)})
+
+
+def install_reload_signal_handler(loop: asyncio.AbstractEventLoop) -> bool:
+    """
+    SIGHUP 수신 시 설정 강제 리로드 (파일 로드는 스레드 풀에서 수행)
+
+    Returns:
+        핸들러 등록 여부 (SIGHUP이 없는 플랫폼에서는 False)
+    """
+    sighup = getattr(signal, "SIGHUP", None)
+    if sighup is None:
+        return False
+
+    def _on_sighup() -> None:
+        logger.info("SIGHUP 수신 - 설정 리로드")
+        loop.run_in_executor(None, reload_config, True)
+
+    try:
+        loop.add_signal_handler(sighup, _on_sighup)
+    except (NotImplementedError, RuntimeError, ValueError):
+        return False
+    return True
@@ -30,6 +30,7 @@ class CostTracker:
                 "input_tokens": 0,
                 "output_tokens": 0,
                 "total_tokens": 0,
+                "cached_tokens": 0,
             }
 
         if is_input:
@@ -39,6 +40,22 @@ class CostTracker:
 
         self.usage_stats[provider]["total_tokens"] += tokens
 
+    def track_cached_tokens(self, provider: str, cached_tokens: int) -> None:
+        """
+        프롬프트 캐시 적중 토큰 추적
+
+        Args:
+            provider: LLM 제공자
+            cached_tokens: 캐시에서 읽은 입력 토큰 수
+        """
+        if cached_tokens <= 0:
+            return
+        stats = self.usage_stats.setdefault(
+            provider,
+            {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "cached_tokens": 0},
+        )
+        stats["cached_tokens"] = stats.get("cached_tokens", 0) + cached_tokens
+
     def get_stats(self) -> dict[str, Any]:
         """현재 사용 통계 반환"""
         return {
@@ -0,0 +1,309 @@
+"""
+Hedged Requests + 지연 시간 기반 라우팅
+
+LLM 폴백 체인은 앞 모델이 실패하거나 타임아웃될 때까지 다음 모델을 시작하지 않으므로,
+느린 제공자 하나가 타임아웃 전체만큼 p99 지연을 늘립니다.
+
+이 모듈은 두 가지를 제공합니다.
+- LatencyTracker: 후보(모델/제공자)별 최근 지연 시간/실패를 롤링 윈도우로 기록하고,
+  최근 상태(에러율, 지연 시간)에 따라 폴백 순서를 재정렬
+- hedged_call: 현재 후보가 관측 p90 안에 응답하지 않으면 다음 후보를 병렬로 시작하고
+  먼저 성공한 결과를 사용 (나머지는 취소). 실패 시에는 기존처럼 즉시 다음 후보로 진행
+
+헤지 발사/승패는 모두 로그와 통계로 남겨 추가 비용을 측정할 수 있습니다.
+
+사용 예시:
+    tracker = LatencyTracker()
+    policy = HedgingPolicy.from_dict(config.get("hedging"))
+
+    result, model = await hedged_call(
+        tracker.order(models), lambda m: call_model(m), tracker, policy, operation="generation"
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, fields
+from typing import Any, TypeVar
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgingPolicy:
+    """헤지 요청 정책"""
+
+    enabled: bool = False  # 진 쪽 동기 SDK 호출은 취소해도 계속 진행되므로 명시적으로 켤 때만 사용
+    percentile: float = 0.9  # 이 백분위 지연 시간이 지나면 다음 후보 발사
+    min_samples: int = 5  # 백분위 계산에 필요한 최소 성공 샘플 수
+    default_delay: float = 10.0  # 샘플이 부족할 때 헤지 대기 시간 (초)
+    min_delay: float = 0.5  # 헤지 대기 시간 하한 (초)
+    max_delay: float = 30.0  # 헤지 대기 시간 상한 (초)
+    max_parallel: int = 2  # 동시에 진행할 수 있는 최대 후보 수
+    window: int = 100  # 후보별 롤링 윈도우 크기
+    unhealthy_error_rate: float = 0.5  # 최근 에러율이 이 이상이면 순서를 뒤로 보냄
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> HedgingPolicy:
+        """설정 딕셔너리 → HedgingPolicy (알 수 없는 키는 무시)"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known and v is not None})
+
+
+@dataclass
+class _CandidateStats:
+    """후보별 롤링 통계"""
+
+    latencies: deque[float]
+    outcomes: deque[bool]  # True=성공, False=실패
+    hedges_fired: int = 0  # 이 후보가 헤지로 시작된 횟수
+    hedge_wins: int = 0  # 헤지로 시작되어 먼저 성공한 횟수
+    hedge_losses: int = 0  # 헤지로 시작되었지만 다른 후보가 먼저 성공한 횟수
+
+
+class LatencyTracker:
+    """
+    후보별 롤링 지연 시간 / 에러율 추적기
+
+    성공한 호출의 지연 시간만 백분위 계산에 사용합니다
+    (헤지에서 져서 취소된 호출은 실제 지연 시간을 알 수 없으므로 기록하지 않음).
+    """
+
+    def __init__(self, policy: HedgingPolicy | None = None) -> None:
+        self.policy = policy or HedgingPolicy()
+        self._stats: dict[str, _CandidateStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> _CandidateStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            window = max(1, self.policy.window)
+            stats = _CandidateStats(latencies=deque(maxlen=window), outcomes=deque(maxlen=window))
+            self._stats[key] = stats
+        return stats
+
+    def record_success(self, key: str, latency: float) -> None:
+        with self._lock:
+            stats = self._get(key)
+            stats.latencies.append(latency)
+            stats.outcomes.append(True)
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            self._get(key).outcomes.append(False)
+
+    def record_hedge(self, key: str, won: bool | None = None) -> None:
+        """헤지 발사(won=None) 또는 헤지 결과 기록"""
+        with self._lock:
+            stats = self._get(key)
+            if won is None:
+                stats.hedges_fired += 1
+            elif won:
+                stats.hedge_wins += 1
+            else:
+                stats.hedge_losses += 1
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """성공 지연 시간의 q 백분위 (샘플 부족 시 None)"""
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None or len(stats.latencies) < max(1, self.policy.min_samples):
+                return None
+            ordered = sorted(stats.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def error_rate(self, key: str) -> float:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None or not stats.outcomes:
+                return 0.0
+            return 1 - sum(stats.outcomes) / len(stats.outcomes)
+
+    def is_unhealthy(self, key: str) -> bool:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None or len(stats.outcomes) < max(1, self.policy.min_samples):
+                return False
+        return self.error_rate(key) >= self.policy.unhealthy_error_rate
+
+    def hedge_delay(self, key: str) -> float:
+        """다음 후보를 발사하기 전까지 기다릴 시간 (관측 백분위, 상/하한 적용)"""
+        observed = self.percentile(key, self.policy.percentile)
+        if observed is None:
+            return self.policy.default_delay
+        return min(self.policy.max_delay, max(self.policy.min_delay, observed))
+
+    def order(self, keys: list[str], pin_first: bool = False) -> list[str]:
+        """
+        최근 상태 기준 후보 순서
+
+        건강한 후보 → 비정상(에러율 초과) 후보 순이며, 같은 그룹 안에서는
+        p50 지연 시간이 짧은 순 (샘플이 부족한 후보는 설정 순서를 유지한 채 뒤에 배치).
+
+        Args:
+            keys: 설정된 후보 순서
+            pin_first: True면 첫 후보(명시적으로 요청된 모델/제공자)는 고정
+        """
+        head, rest = (keys[:1], keys[1:]) if pin_first else ([], keys)
+
+        def sort_key(key: str) -> tuple[bool, float]:
+            p50 = self.percentile(key, 0.5)
+            return (self.is_unhealthy(key), p50 if p50 is not None else math.inf)
+
+        return head + sorted(rest, key=sort_key)
+
+    def get_stats(self) -> dict[str, Any]:
+        """후보별 지연 시간 / 에러율 / 헤지 통계"""
+        result: dict[str, Any] = {}
+        for key in list(self._stats):
+            stats = self._stats[key]
+            p50 = self.percentile(key, 0.5)
+            p90 = self.percentile(key, self.policy.percentile)
+            result[key] = {
+                "samples": len(stats.latencies),
+                "p50_seconds": round(p50, 3) if p50 is not None else None,
+                "hedge_after_seconds": round(self.hedge_delay(key), 3),
+                "observed_p90_seconds": round(p90, 3) if p90 is not None else None,
+                "error_rate": round(self.error_rate(key), 4),
+                "hedges_fired": stats.hedges_fired,
+                "hedge_wins": stats.hedge_wins,
+                "hedge_losses": stats.hedge_losses,
+            }
+        return result
+
+
+class AllCandidatesFailedError(RuntimeError):
+    """모든 후보 실패 (last_error: 마지막 후보의 예외)"""
+
+    def __init__(self, last_error: BaseException | None) -> None:
+        super().__init__(str(last_error))
+        self.last_error = last_error
+
+
+async def hedged_call(
+    candidates: list[str],
+    call: Callable[[str], Awaitable[T]],
+    tracker: LatencyTracker,
+    policy: HedgingPolicy | None = None,
+    operation: str = "llm",
+) -> tuple[T, str]:
+    """
+    헤지를 적용한 폴백 호출
+
+    - 현재 후보가 hedge_delay 안에 끝나지 않으면 다음 후보를 병렬로 시작 (max_parallel까지)
+    - 후보가 실패하면 다음 후보를 즉시 시작 (기존 순차 폴백과 동일)
+    - 먼저 성공한 결과를 반환하고 진행 중인 나머지 후보는 취소
+
+    Args:
+        candidates: 시도 순서대로 정렬된 후보 (모델 ID 또는 제공자 이름)
+        call: 후보 → 코루틴
+        tracker: 지연 시간 추적기 (성공/실패/헤지 결과 기록)
+        policy: 헤지 정책 (None이면 tracker.policy)
+        operation: 로그 구분용 작업 이름
+
+    Returns:
+        (결과, 성공한 후보)
+
+    Raises:
+        AllCandidatesFailedError: 모든 후보 실패
+    """
+    policy = policy or tracker.policy
+    max_parallel = max(1, policy.max_parallel) if policy.enabled else 1
+    pending_candidates = list(candidates)
+    in_flight: dict[asyncio.Future[T], tuple[str, float, bool]] = {}
+    last_error: BaseException | None = None
+
+    def launch(hedged: bool) -> None:
+        key = pending_candidates.pop(0)
+        task = asyncio.ensure_future(call(key))
+        in_flight[task] = (key, time.perf_counter(), hedged)
+        if hedged:
+            tracker.record_hedge(key)
+            logger.info(
+                "헤지 요청 발사",
+                operation=operation,
+                candidate=key,
+                waiting_on=[k for k, _, _ in in_flight.values() if k != key],
+            )
+
+    try:
+        if pending_candidates:
+            launch(hedged=False)
+
+        while in_flight:
+            # 가장 최근에 시작한 후보의 관측 p90만큼 대기 후 헤지
+            newest_key = max(in_flight.values(), key=lambda v: v[1])[0]
+            can_hedge = bool(pending_candidates) and len(in_flight) < max_parallel
+            timeout = tracker.hedge_delay(newest_key) if can_hedge else None
+
+            done, _ = await asyncio.wait(
+                in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                launch(hedged=True)
+                continue
+
+            for task in done:
+                key, started, hedged = in_flight.pop(task)
+                error = task.exception()
+                if error is None:
+                    tracker.record_success(key, time.perf_counter() - started)
+                    _record_hedge_outcome(tracker, operation, key, hedged, in_flight)
+                    return task.result(), key
+
+                tracker.record_failure(key)
+                last_error = error
+                logger.warning(
+                    "후보 실패, 다음 후보 진행",
+                    operation=operation,
+                    candidate=key,
+                    error=str(error),
+                    error_type=type(error).__name__,
+                )
+
+            # 진행 중인 후보가 모두 실패했으면 다음 후보 즉시 시작
+            if not in_flight and pending_candidates:
+                launch(hedged=False)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    raise AllCandidatesFailedError(last_error)
+
+
+def _record_hedge_outcome(
+    tracker: LatencyTracker,
+    operation: str,
+    winner: str,
+    winner_hedged: bool,
+    losers: dict[asyncio.Future[Any], tuple[str, float, bool]],
+) -> None:
+    """헤지가 있었던 요청의 승패 기록 (헤지 없이 끝난 요청은 기록하지 않음)"""
+    hedged_losers = [key for key, _, hedged in losers.values() if hedged]
+    if not winner_hedged and not hedged_losers:
+        return
+    if winner_hedged:
+        tracker.record_hedge(winner, won=True)
+    for key in hedged_losers:
+        tracker.record_hedge(key, won=False)
+    logger.info(
+        "헤지 요청 결과",
+        operation=operation,
+        winner=winner,
+        hedge_won=winner_hedged,
+        cancelled=[key for key, _, _ in losers.values()],
+    )
@@ -0,0 +1,307 @@
+"""
+공유 HTTP 전송 계층 (호스트별 커넥션 풀)
+
+외부 제공자(리랭커, 웹 검색, IP 위치, Notion, 크롤러 등) 호출이 요청마다
+httpx.AsyncClient를 새로 만들면 매번 TCP/TLS 핸드셰이크 비용을 지불합니다.
+이 모듈은 호스트(origin)별로 하나의 AsyncClient를 공유하여 keep-alive 커넥션을
+재사용하고, h2 패키지가 설치되어 있으면 HTTP/2 멀티플렉싱을 사용합니다.
+
+특징:
+- 호스트별 풀: scheme://host:port 단위로 클라이언트 1개 (이벤트 루프별 분리)
+- 설정 기반: 풀 크기, keep-alive 만료, 타임아웃, 재시도 (http_transport 설정 섹션)
+- HTTP/2: h2 미설치 시 HTTP/1.1로 자동 대체 (pip install "httpx[http2]")
+- 관측성: 호스트별 요청 수, 새 커넥션 수(TCP 연결), TLS 핸드셰이크 수, 재사용률
+
+사용 예시:
+    from app.lib.http_transport import get_http_client
+
+    client = get_http_client("https://api.jina.ai/v1/rerank")
+    response = await client.post("https://api.jina.ai/v1/rerank", json=payload)
+
+주의: 공유 클라이언트이므로 호출자가 닫거나 `async with`로 감싸면 안 됩니다.
+요청별 헤더/타임아웃은 요청 인자로 전달합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+import httpx
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_http2_available() -> bool:
+    """h2 패키지 설치 여부 (httpx HTTP/2 지원에 필요)"""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HTTPTransportSettings:
+    """공유 HTTP 전송 설정"""
+
+    http2: bool = True  # h2 미설치 시 HTTP/1.1로 대체
+    max_connections: int = 100  # 호스트별 최대 동시 커넥션
+    max_keepalive_connections: int = 20  # 호스트별 유휴 커넥션 보관 수
+    keepalive_expiry: float = 30.0  # 유휴 커넥션 유지 시간 (초)
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 5.0  # 풀에서 커넥션을 기다리는 최대 시간
+    retries: int = 0  # 연결 실패 시 재시도 횟수 (httpcore 레벨)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> HTTPTransportSettings:
+        """설정 딕셔너리 → HTTPTransportSettings (알 수 없는 키는 무시)"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known and v is not None})
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass
+class HostTransportStats:
+    """호스트별 전송 통계"""
+
+    requests: int = 0  # 전송 계층까지 도달한 요청 수
+    connections_opened: int = 0  # 새 TCP 커넥션 수
+    tls_handshakes: int = 0  # 완료된 TLS 핸드셰이크 수
+    connect_failures: int = 0
+    http2_responses: int = 0
+    clients_created: int = 0  # 이 호스트용 AsyncClient 생성 수
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        # 새 커넥션 없이 처리된 요청 = 기존 커넥션 재사용 (HTTP/2는 스트림 다중화 포함)
+        reused = max(0, self.requests - self.connections_opened)
+        data["reused_requests"] = reused
+        data["reuse_ratio"] = round(reused / self.requests, 4) if self.requests else 0.0
+        return data
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    AsyncHTTPTransport 래퍼
+
+    httpcore trace 확장으로 커넥션 생성/TLS 핸드셰이크 이벤트를 집계합니다.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, stats: HostTransportStats) -> None:
+        self._inner = inner
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._stats.requests += 1
+        upstream_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                self._stats.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                self._stats.tls_handshakes += 1
+            elif event_name == "connection.connect_tcp.failed":
+                self._stats.connect_failures += 1
+            if upstream_trace is not None:
+                await upstream_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        response = await self._inner.handle_async_request(request)
+        if response.extensions.get("http_version") == b"HTTP/2":
+            self._stats.http2_responses += 1
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def _origin(url: str | httpx.URL) -> str:
+    """URL → origin 키 (scheme://host:port)"""
+    parsed = httpx.URL(url)
+    if not parsed.host:
+        raise ValueError(f"호스트가 없는 URL입니다: {url!s}")
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class HTTPTransportRegistry:
+    """
+    호스트별 공유 AsyncClient 레지스트리
+
+    커넥션 풀은 이벤트 루프에 묶이므로 클라이언트를 루프별로 보관합니다
+    (워커당 루프 1개인 운영 환경에서는 호스트당 1개). 루프가 사라지면 해당 루프의
+    클라이언트 목록도 WeakKeyDictionary에서 함께 제거됩니다.
+    """
+
+    def __init__(self, settings: HTTPTransportSettings | None = None) -> None:
+        self._settings = settings or HTTPTransportSettings()
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._loopless_clients: dict[str, httpx.AsyncClient] = {}  # 루프 밖에서 만든 클라이언트
+        self._stats: dict[str, HostTransportStats] = {}
+        self._lock = threading.Lock()
+        self._http2_warning_logged = False
+
+    @property
+    def settings(self) -> HTTPTransportSettings:
+        return self._settings
+
+    def configure(self, settings: HTTPTransportSettings | dict[str, Any] | None) -> None:
+        """
+        설정 적용
+
+        이미 만들어진 클라이언트는 유지되고, 이후 새로 만드는 클라이언트부터 적용됩니다.
+        애플리케이션 시작 시 외부 호출 전에 한 번 호출합니다.
+        """
+        if not isinstance(settings, HTTPTransportSettings):
+            settings = HTTPTransportSettings.from_dict(settings)
+        self._settings = settings
+        logger.info(
+            "HTTP 전송 설정 적용",
+            extra={
+                "http2": self._use_http2(),
+                "max_connections": settings.max_connections,
+                "max_keepalive_connections": settings.max_keepalive_connections,
+                "keepalive_expiry": settings.keepalive_expiry,
+            },
+        )
+
+    def _use_http2(self) -> bool:
+        if not self._settings.http2:
+            return False
+        if is_http2_available():
+            return True
+        if not self._http2_warning_logged:
+            self._http2_warning_logged = True
+            logger.info('h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install "httpx[http2]")')
+        return False
+
+    def get_client(self, url: str | httpx.URL) -> httpx.AsyncClient:
+        """
+        URL의 호스트에 해당하는 공유 AsyncClient 반환
+
+        Args:
+            url: 요청 URL 또는 base URL (호스트 판별용)
+
+        Returns:
+            호스트별 공유 httpx.AsyncClient (닫지 말 것)
+        """
+        key = _origin(url)
+        loop = _running_loop()
+        with self._lock:
+            if loop is None:
+                clients = self._loopless_clients
+            else:
+                clients = self._clients.setdefault(loop, {})
+            existing = clients.get(key)
+            if existing is not None and not existing.is_closed:
+                return existing
+
+            stats = self._stats.setdefault(key, HostTransportStats())
+            stats.clients_created += 1
+            settings = self._settings
+            inner = httpx.AsyncHTTPTransport(
+                http2=self._use_http2(),
+                limits=settings.limits(),
+                retries=settings.retries,
+            )
+            client = httpx.AsyncClient(
+                transport=_InstrumentedTransport(inner, stats),
+                timeout=settings.timeout(),
+            )
+            clients[key] = client
+            return client
+
+    def _all_clients(self) -> list[tuple[asyncio.AbstractEventLoop | None, httpx.AsyncClient]]:
+        loop_clients = [
+            (loop, client)
+            for loop, clients in list(self._clients.items())
+            for client in clients.values()
+        ]
+        return loop_clients + [(None, client) for client in self._loopless_clients.values()]
+
+    def get_stats(self) -> dict[str, Any]:
+        """호스트별 요청/커넥션/핸드셰이크 통계"""
+        hosts = {key: stats.to_dict() for key, stats in self._stats.items()}
+        totals = HostTransportStats(
+            **{
+                f.name: sum(getattr(s, f.name) for s in self._stats.values())
+                for f in fields(HostTransportStats)
+            }
+        )
+        return {
+            "http2_enabled": self._settings.http2 and is_http2_available(),
+            "active_clients": sum(1 for _, c in self._all_clients() if not c.is_closed),
+            "totals": totals.to_dict(),
+            "hosts": hosts,
+        }
+
+    def reset_stats(self) -> None:
+        """통계 초기화 (클라이언트와 커넥션은 유지)"""
+        for stats in self._stats.values():
+            for f in fields(HostTransportStats):
+                setattr(stats, f.name, 0)
+
+    async def aclose(self) -> None:
+        """
+        모든 공유 클라이언트 종료
+
+        현재 루프(또는 루프 밖에서 만든) 클라이언트는 직접 닫고, 아직 실행 중인 다른 루프의
+        클라이언트는 그 루프에 종료를 예약합니다. 이미 종료된 루프의 클라이언트는 닫을 수
+        없으므로 목록에서만 제거합니다.
+        """
+        loop = _running_loop()
+        with self._lock:
+            entries = self._all_clients()
+            self._clients.clear()
+            self._loopless_clients.clear()
+        for owner, client in entries:
+            if owner is not None and owner is not loop:
+                if owner.is_running() and not owner.is_closed():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), owner)
+                continue
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"HTTP 클라이언트 종료 실패: {e}")
+
+
+# 싱글톤 인스턴스 생성
+http_transport = HTTPTransportRegistry()
+
+
+def get_http_client(url: str | httpx.URL) -> httpx.AsyncClient:
+    """공유 레지스트리에서 URL 호스트용 AsyncClient 반환"""
+    return http_transport.get_client(url)
+
+
+def configure_http_transport(settings: HTTPTransportSettings | dict[str, Any] | None) -> None:
+    """공유 레지스트리 설정 (애플리케이션 시작 시 호출)"""
+    http_transport.configure(settings)
@@ -11,6 +11,7 @@ from typing import Any, cast
 
 import httpx
 
+from .http_transport import get_http_client
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -135,10 +136,10 @@ class IPGeolocationModule:
             self.stats["api_calls"] += 1
             url = self.api_url.format(ip=ip)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(url)
+            response = await client.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
 
             # 안전한 float 변환 함수 (nil 문자열 처리)
             def safe_float(value: Any) -> float | None:
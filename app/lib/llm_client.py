@@ -6,14 +6,16 @@ LLM Client Factory - 통합 LLM 클라이언트 관리
 import asyncio
 import os
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from typing import Any, Literal
 
 import google.generativeai as genai
 from anthropic import Anthropic
 from openai import OpenAI
 
+from .hedging import AllCandidatesFailedError, HedgingPolicy, LatencyTracker, hedged_call
 from .logger import get_logger
+from .stream_bridge import iterate_in_thread
 
 logger = get_logger(__name__)
 
@@ -135,6 +137,7 @@ class GoogleLLMClient(BaseLLMClient):
 
         Google Gemini API의 stream=True 옵션을 사용하여
         응답을 청크 단위로 yield합니다.
+        동기 SDK 스트림은 전용 스레드에서 소비하므로 이벤트 루프를 막지 않습니다.
 
         Args:
             prompt: 사용자 프롬프트
@@ -150,17 +153,20 @@ class GoogleLLMClient(BaseLLMClient):
                 system_instruction=system_prompt if system_prompt else None,
             )
 
-            # stream=True로 스트리밍 응답 요청
-            response = model.generate_content(
-                prompt,
-                generation_config=self.generation_config,  # type: ignore[arg-type]
-                stream=True,
-            )
+            def chunks() -> Iterator[str]:
+                # stream=True로 스트리밍 응답 요청 (스레드에서 실행)
+                response = model.generate_content(
+                    prompt,
+                    generation_config=self.generation_config,  # type: ignore[arg-type]
+                    stream=True,
+                )
+                # 청크 단위로 yield (빈 텍스트는 건너뜀)
+                for chunk in response:
+                    if chunk.text:
+                        yield chunk.text
 
-            # 청크 단위로 yield (빈 텍스트는 건너뜀)
-            for chunk in response:
-                if chunk.text:
-                    yield chunk.text
+            async for text in iterate_in_thread(chunks):
+                yield text
 
         except Exception as e:
             logger.error(
@@ -368,6 +374,7 @@ class OpenAILLMClient(BaseLLMClient):
         OpenAI 스트리밍 텍스트 생성
 
         stream=True 옵션을 사용하여 응답을 청크 단위로 yield합니다.
+        동기 SDK 스트림은 전용 스레드에서 소비하므로 이벤트 루프를 막지 않습니다.
 
         Args:
             prompt: 사용자 프롬프트
@@ -400,13 +407,10 @@ class OpenAILLMClient(BaseLLMClient):
                 api_params["max_tokens"] = self.max_tokens
                 api_params["temperature"] = self.temperature
 
-            # stream=True로 스트리밍 응답 요청
-            response = self.client.chat.completions.create(**api_params)  # type: ignore[arg-type]
-
-            # 청크 단위로 yield (빈 콘텐츠는 건너뜀)
-            for chunk in response:  # type: ignore[union-attr]
-                if chunk.choices and chunk.choices[0].delta.content:  # type: ignore[union-attr]
-                    yield chunk.choices[0].delta.content  # type: ignore[union-attr]
+            async for text in iterate_in_thread(
+                lambda: _iter_chat_completion_stream(self.client, api_params)
+            ):
+                yield text
 
         except Exception as e:
             logger.error(
@@ -462,6 +466,7 @@ class AnthropicLLMClient(BaseLLMClient):
 
         messages.stream() API를 사용하여 응답을 청크 단위로 yield합니다.
         content_block_delta 이벤트만 처리하여 텍스트를 추출합니다.
+        동기 SDK 스트림은 전용 스레드에서 소비하므로 이벤트 루프를 막지 않습니다.
 
         Args:
             prompt: 사용자 프롬프트
@@ -471,8 +476,9 @@ class AnthropicLLMClient(BaseLLMClient):
         Yields:
             str: 생성된 텍스트 청크
         """
-        try:
-            # Anthropic 스트리밍 API 사용 (with 문으로 리소스 관리)
+
+        def chunks() -> Iterator[str]:
+            # Anthropic 스트리밍 API 사용 (with 문으로 리소스 관리, 중단 시에도 닫힘)
             with self.client.messages.stream(
                 model=self.model,
                 max_tokens=self.max_tokens,
@@ -485,6 +491,10 @@ class AnthropicLLMClient(BaseLLMClient):
                     if event.type == "content_block_delta":
                         yield event.delta.text  # type: ignore[union-attr]
 
+        try:
+            async for text in iterate_in_thread(chunks):
+                yield text
+
         except Exception as e:
             logger.error(
                 "Anthropic LLM 스트리밍 실패",
@@ -625,15 +635,68 @@ class OpenRouterLLMClient(BaseLLMClient):
         self, prompt: str, system_prompt: str | None = None, **kwargs: Any
     ) -> AsyncGenerator[str, None]:
         """
-        OpenRouter 스트리밍 텍스트 생성 (향후 구현 예정)
+        OpenRouter 스트리밍 텍스트 생성
 
-        현재는 NotImplementedError를 발생시킵니다.
+        OpenAI 호환 stream=True 응답을 청크 단위로 yield합니다.
+        동기 SDK 스트림은 전용 스레드에서 소비하므로 이벤트 루프를 막지 않습니다.
+
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택적)
+            **kwargs: 추가 파라미터
+
+        Yields:
+            str: 생성된 텍스트 청크
         """
-        raise NotImplementedError(
-            "OpenRouterLLMClient.stream_text()는 아직 구현되지 않았습니다. "
-            "GoogleLLMClient를 사용하거나 향후 업데이트를 기다려주세요."
-        )
-        yield  # AsyncGenerator 타입 힌트를 위해 필요
+        try:
+            messages: list[dict[str, str]] = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            # generate_text와 동일한 reasoning 모델 분기
+            is_reasoning_model = "o1" in self.model.lower() or "gpt-5" in self.model.lower()
+
+            api_params: dict[str, Any] = {
+                "model": self.model,
+                "messages": messages,
+                "stream": True,
+            }
+            if is_reasoning_model:
+                api_params["max_completion_tokens"] = self.max_tokens
+            else:
+                api_params["max_tokens"] = self.max_tokens
+                api_params["temperature"] = self.temperature
+
+            async for text in iterate_in_thread(
+                lambda: _iter_chat_completion_stream(self.client, api_params)
+            ):
+                yield text
+
+        except Exception as e:
+            logger.error(
+                "OpenRouter LLM 스트리밍 실패",
+                extra={"error": str(e), "error_type": type(e).__name__},
+                exc_info=True,
+            )
+            raise
+
+
+def _iter_chat_completion_stream(client: OpenAI, api_params: dict[str, Any]) -> Iterator[str]:
+    """
+    OpenAI 호환 Chat Completions 스트림의 텍스트 청크 (스레드에서 실행)
+
+    빈 콘텐츠 청크는 건너뛰고, 종료/중단 시 HTTP 스트림을 닫습니다.
+    """
+    response = client.chat.completions.create(**api_params)
+    try:
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        close = getattr(response, "close", None)
+        if callable(close):
+            close()
 
 
 class LLMClientFactory:
@@ -666,6 +729,9 @@ class LLMClientFactory:
         """
         self.config = config
         self._clients: dict[str, BaseLLMClient] = {}
+        # 헤지 요청 + 제공자별 롤링 지연 시간 (fallback_order 재정렬)
+        self.hedging = HedgingPolicy.from_dict(config.get("llm", {}).get("hedging"))
+        self.latency_tracker = LatencyTracker(self.hedging)
         self._initialize_clients()
 
     def _initialize_clients(self) -> None:
@@ -765,6 +831,9 @@ class LLMClientFactory:
         """
         폴백 지원 텍스트 생성
 
+        fallback_order는 최근 에러율/지연 시간 순으로 재정렬되며(선호 제공자는 고정),
+        현재 제공자가 관측 p90 안에 응답하지 않으면 다음 제공자를 병렬로 시작합니다.
+
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트 (선택적)
@@ -777,46 +846,46 @@ class LLMClientFactory:
         fallback_enabled = llm_config.get("auto_fallback", True)
         fallback_order = llm_config.get("fallback_order", ["google", "openai", "anthropic"])
 
-        # 선호 제공자를 첫 번째로
+        # 선호 제공자를 첫 번째로 (고정), 나머지는 최근 상태 순
         if preferred_provider:
             providers_to_try = [preferred_provider] + [
                 p for p in fallback_order if p != preferred_provider
             ]
         else:
-            providers_to_try = fallback_order
+            providers_to_try = list(fallback_order)
+        providers_to_try = [p for p in providers_to_try if p in self._clients]
+        providers_to_try = self.latency_tracker.order(
+            providers_to_try, pin_first=bool(preferred_provider)
+        )
 
         # 폴백 비활성화 시 첫 번째만 시도
         if not fallback_enabled:
             providers_to_try = providers_to_try[:1]
 
-        last_error = None
-        for provider in providers_to_try:
-            if provider not in self._clients:
-                continue
+        async def attempt(provider: str) -> str:
+            return await self._clients[provider].generate_text(
+                prompt=prompt, system_prompt=system_prompt, **kwargs
+            )
 
-            try:
-                client = self._clients[provider]
-                text = await client.generate_text(
-                    prompt=prompt, system_prompt=system_prompt, **kwargs
-                )
-                logger.info(
-                    "LLM 생성 성공",
-                    extra={"provider": provider}
-                )
-                return text, provider
-            except Exception as e:
-                logger.warning(
-                    "LLM 실패, 폴백 진행",
-                    extra={
-                        "provider": provider,
-                        "error": str(e),
-                        "error_type": type(e).__name__
-                    }
-                )
-                last_error = e
-                continue
+        try:
+            text, provider = await hedged_call(
+                providers_to_try, attempt, self.latency_tracker, operation="llm_factory"
+            )
+        except AllCandidatesFailedError as e:
+            raise RuntimeError(f"모든 LLM 제공자 실패. 마지막 에러: {e.last_error}") from e
 
-        raise RuntimeError(f"모든 LLM 제공자 실패. 마지막 에러: {last_error}")
+        logger.info(
+            "LLM 생성 성공",
+            extra={"provider": provider}
+        )
+        return text, provider
+
+    def get_latency_stats(self) -> dict[str, Any]:
+        """제공자별 지연 시간 / 에러율 / 헤지 통계"""
+        return {
+            "hedging_enabled": self.hedging.enabled,
+            "providers": self.latency_tracker.get_stats(),
+        }
 
 
 # 전역 팩토리 인스턴스 (main.py에서 초기화)
@@ -0,0 +1,404 @@
+"""
+메타데이터 필터 AST 및 Pushdown Planner
+
+백엔드마다 제각각이던 필터 처리(Chroma where 절, Qdrant Filter, MongoDB $match,
+pgvector SQL)를 공통 AST로 통일하고, 카디널리티 추정치로 필터 적용 전략을 고릅니다.
+
+필터 문법 (기존 dict 필터와 호환):
+    {"file_type": "PDF"}                        → Eq
+    {"file_type": ["PDF", "DOCX"]}              → In
+    {"year": {"$gte": 2023, "$lt": 2025}}       → And(Gte, Lt)
+    {"$or": [{"category": "A"}, {"category": "B"}]}
+    {"tag": {"$exists": True}}                  → Exists
+    {"$and": [...]}
+    "id", "ids" 키는 메타데이터가 아닌 문서 ID 조건이므로 AST에서 제외하고
+    (reserved_keys=RESERVED_FILTER_KEYS), 검색 경로는 split_id_filter()로 분리해
+    백엔드 네이티브 ID 필터로 적용합니다.
+
+적용 전략 (FilterPlanner):
+    - PRE_FILTER: ANN 탐색 중 필터 적용 (백엔드가 네이티브 필터를 지원할 때)
+    - POST_FILTER: ANN 후 필터 적용, 선택도 기반 적응형 over-fetch
+    - EXACT_SCAN: 매칭 문서가 매우 적을 때 부분집합 전수 탐색
+
+백엔드별 변환:
+    - Chroma / Pinecone / MongoDB: to_mongo_query() (동일한 $연산자 문법)
+    - Qdrant: QdrantVectorStore._convert_filters()
+    - pgvector: PgVectorStore._build_filter_clause()
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+# 문서 ID 조건 키 (메타데이터 필드가 아니므로 백엔드가 AST 외부에서 처리)
+RESERVED_FILTER_KEYS = frozenset({"id", "ids"})
+
+# 필드 이름 허용 패턴 (SQL/쿼리 인젝션 방지)
+# 유니코드 문자/숫자/_ (한글 메타데이터 키 허용) + 경로 구분자 '.'와 '-', 따옴표/공백은 불가
+_FIELD_PATTERN = re.compile(r"\w[\w.\-]*", re.UNICODE)
+
+
+class FilterOp(StrEnum):
+    """필드 비교 연산자"""
+
+    EQ = "$eq"
+    NE = "$ne"
+    IN = "$in"
+    NIN = "$nin"
+    GT = "$gt"
+    GTE = "$gte"
+    LT = "$lt"
+    LTE = "$lte"
+    EXISTS = "$exists"
+
+
+RANGE_OPS = frozenset({FilterOp.GT, FilterOp.GTE, FilterOp.LT, FilterOp.LTE})
+
+
+@dataclass(frozen=True)
+class Condition:
+    """단일 필드 조건 (리프 노드)"""
+
+    field: str
+    op: FilterOp
+    value: Any
+
+    def __post_init__(self) -> None:
+        if not _FIELD_PATTERN.fullmatch(self.field):
+            raise ValueError(f"허용되지 않는 필터 필드 이름: {self.field!r}")
+        if self.op in (FilterOp.IN, FilterOp.NIN) and not isinstance(self.value, tuple):
+            raise ValueError(f"{self.op.value} 조건 값은 tuple이어야 합니다: {self.field}")
+        if self.op is FilterOp.EXISTS and not isinstance(self.value, bool):
+            raise ValueError(f"$exists 조건 값은 bool이어야 합니다: {self.field}")
+
+
+@dataclass(frozen=True)
+class And:
+    """모든 하위 조건 만족"""
+
+    children: tuple[FilterExpr, ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    """하나 이상의 하위 조건 만족"""
+
+    children: tuple[FilterExpr, ...]
+
+
+FilterExpr = Condition | And | Or
+
+
+def parse_filters(
+    filters: dict[str, Any] | FilterExpr | None,
+    reserved_keys: frozenset[str] = frozenset(),
+) -> FilterExpr | None:
+    """
+    dict 필터를 AST로 변환 (이미 AST면 그대로 반환)
+
+    Args:
+        filters: 메타데이터 필터 딕셔너리 또는 FilterExpr
+        reserved_keys: AST에서 제외할 최상위 키 (ID 삭제 경로는 RESERVED_FILTER_KEYS)
+
+    Returns:
+        FilterExpr (조건이 없으면 None)
+
+    Raises:
+        ValueError: 지원하지 않는 연산자 또는 잘못된 필드 이름
+    """
+    if filters is None or isinstance(filters, Condition | And | Or):
+        return filters
+
+    children: list[FilterExpr] = []
+    for key, value in filters.items():
+        if key in reserved_keys:
+            continue
+        if key in ("$and", "$or"):
+            parsed = [
+                expr
+                for expr in (parse_filters(item, reserved_keys) for item in value)
+                if expr is not None
+            ]
+            combined = _combine(parsed, And if key == "$and" else Or)
+            if combined is not None:
+                children.append(combined)
+        elif key.startswith("$"):
+            raise ValueError(f"지원하지 않는 필터 연산자: {key}")
+        elif isinstance(value, dict):
+            children.extend(_parse_operators(key, value))
+        elif isinstance(value, list | tuple | set | frozenset):
+            children.append(Condition(key, FilterOp.IN, tuple(value)))
+        else:
+            children.append(Condition(key, FilterOp.EQ, value))
+
+    return _combine(children, And)
+
+
+def split_id_filter(
+    filters: dict[str, Any] | None,
+) -> tuple[list[str] | None, dict[str, Any] | None]:
+    """
+    최상위 "id", "ids" 조건을 문서 ID 목록으로 분리
+
+    둘 다 있으면 교집합을 사용합니다 (두 조건을 모두 만족해야 하므로).
+
+    Args:
+        filters: 메타데이터 필터 딕셔너리
+
+    Returns:
+        (문서 ID 목록 또는 None, ID 조건을 제외한 나머지 필터 또는 None)
+    """
+    if not filters:
+        return None, filters
+
+    doc_ids: list[str] | None = None
+    if "id" in filters:
+        doc_ids = [str(filters["id"])]
+    if "ids" in filters:
+        ids = [str(doc_id) for doc_id in filters["ids"]]
+        doc_ids = ids if doc_ids is None else [doc_id for doc_id in doc_ids if doc_id in ids]
+
+    rest = {k: v for k, v in filters.items() if k not in RESERVED_FILTER_KEYS}
+    return doc_ids, rest or None
+
+
+def _parse_operators(field: str, operators: dict[str, Any]) -> list[FilterExpr]:
+    """{"$gte": 1, "$lt": 5} 형태의 연산자 딕셔너리 변환"""
+    conditions: list[FilterExpr] = []
+    for op_name, value in operators.items():
+        try:
+            op = FilterOp(op_name)
+        except ValueError:
+            raise ValueError(f"지원하지 않는 필터 연산자: {op_name} (field={field})") from None
+        if op in (FilterOp.IN, FilterOp.NIN):
+            value = tuple(value)
+        conditions.append(Condition(field, op, value))
+    return conditions
+
+
+def _combine(children: list[FilterExpr], node: type[And] | type[Or]) -> FilterExpr | None:
+    """하위 조건이 0개면 None, 1개면 그대로, 2개 이상이면 And/Or 노드 생성"""
+    if not children:
+        return None
+    if len(children) == 1:
+        return children[0]
+    return node(tuple(children))
+
+
+def filter_fields(expr: FilterExpr) -> set[str]:
+    """AST에 등장하는 모든 필드 이름"""
+    if isinstance(expr, Condition):
+        return {expr.field}
+    fields: set[str] = set()
+    for child in expr.children:
+        fields |= filter_fields(child)
+    return fields
+
+
+def filter_ops(expr: FilterExpr) -> set[FilterOp]:
+    """AST에 등장하는 모든 비교 연산자"""
+    if isinstance(expr, Condition):
+        return {expr.op}
+    ops: set[FilterOp] = set()
+    for child in expr.children:
+        ops |= filter_ops(child)
+    return ops
+
+
+def to_mongo_query(expr: FilterExpr, field_prefix: str = "") -> dict[str, Any]:
+    """
+    AST를 MongoDB 스타일 쿼리로 변환
+
+    Chroma where 절, Pinecone filter, MongoDB $match/$vectorSearch.filter가
+    모두 같은 연산자 문법을 사용하므로 공통으로 사용합니다.
+    Eq 조건은 {"field": value} 단축형으로 출력합니다 (기존 필터와 동일한 형태).
+
+    Args:
+        expr: 필터 AST
+        field_prefix: 필드 경로 접두사 (예: "metadata.metadata.")
+
+    Returns:
+        쿼리 딕셔너리
+    """
+    if isinstance(expr, Condition):
+        field = f"{field_prefix}{expr.field}"
+        value = list(expr.value) if isinstance(expr.value, tuple) else expr.value
+        if expr.op is FilterOp.EQ:
+            return {field: value}
+        return {field: {expr.op.value: value}}
+
+    key = "$and" if isinstance(expr, And) else "$or"
+    return {key: [to_mongo_query(child, field_prefix) for child in expr.children]}
+
+
+# ========== Pushdown Planner ==========
+
+
+class FilterStrategy(StrEnum):
+    """필터 적용 전략"""
+
+    PRE_FILTER = "pre_filter"
+    POST_FILTER = "post_filter"
+    EXACT_SCAN = "exact_scan"
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """
+    필터 실행 계획
+
+    Attributes:
+        strategy: 필터 적용 전략
+        fetch_k: ANN 단계에서 가져올 후보 수 (POST_FILTER면 over-fetch 포함)
+        selectivity: 추정 선택도 (매칭 문서 / 전체 문서, 모르면 None)
+    """
+
+    strategy: FilterStrategy
+    fetch_k: int
+    selectivity: float | None = None
+
+
+class FilterPlanner:
+    """
+    카디널리티 추정 기반 필터 전략 선택기
+
+    결정 규칙:
+    1. 매칭 문서 수 ≤ exact_scan_threshold 이고 네이티브 필터 지원 → EXACT_SCAN
+    2. 네이티브 필터 지원 → PRE_FILTER (top_k 그대로)
+    3. 그 외 → POST_FILTER, fetch_k = top_k × ceil(safety_factor / 선택도)
+       (min_overfetch ~ max_overfetch 범위, 선택도를 모르면 default_overfetch)
+
+    사용 예시:
+        planner = FilterPlanner()
+        plan = planner.plan(top_k=10, matching=120, total=50_000, supports_prefilter=False)
+        # → POST_FILTER, fetch_k=10 × 20 (선택도 0.24% → 최대 over-fetch)
+    """
+
+    def __init__(
+        self,
+        exact_scan_threshold: int = 1000,
+        min_overfetch: int = 2,
+        max_overfetch: int = 20,
+        default_overfetch: int = 4,
+        safety_factor: float = 1.5,
+        max_fetch_k: int = 10_000,
+    ) -> None:
+        """
+        Args:
+            exact_scan_threshold: 전수 탐색으로 전환할 매칭 문서 수 상한
+            min_overfetch: POST_FILTER 최소 over-fetch 배수
+            max_overfetch: POST_FILTER 최대 over-fetch 배수
+            default_overfetch: 선택도를 모를 때 over-fetch 배수
+            safety_factor: 선택도 역수에 곱하는 여유 계수
+            max_fetch_k: fetch_k 절대 상한 (백엔드 제한 대응)
+        """
+        self.exact_scan_threshold = exact_scan_threshold
+        self.min_overfetch = min_overfetch
+        self.max_overfetch = max_overfetch
+        self.default_overfetch = default_overfetch
+        self.safety_factor = safety_factor
+        self.max_fetch_k = max_fetch_k
+
+    def plan(
+        self,
+        top_k: int,
+        matching: int | None = None,
+        total: int | None = None,
+        supports_prefilter: bool = True,
+    ) -> FilterPlan:
+        """
+        필터 실행 계획 수립
+
+        Args:
+            top_k: 최종 반환할 결과 수
+            matching: 필터에 매칭되는 문서 수 추정치 (모르면 None)
+            total: 전체 문서 수 추정치 (모르면 None)
+            supports_prefilter: 백엔드가 ANN 중 필터(네이티브 pre-filter)를 지원하는지
+
+        Returns:
+            FilterPlan
+        """
+        selectivity = None
+        if matching is not None and total:
+            selectivity = min(1.0, matching / total)
+
+        if supports_prefilter:
+            if matching is not None and matching <= self.exact_scan_threshold:
+                return FilterPlan(FilterStrategy.EXACT_SCAN, top_k, selectivity)
+            return FilterPlan(FilterStrategy.PRE_FILTER, top_k, selectivity)
+
+        if selectivity is None:
+            factor = self.default_overfetch
+        elif selectivity <= 0:
+            factor = self.max_overfetch
+        else:
+            factor = math.ceil(self.safety_factor / selectivity)
+        factor = max(self.min_overfetch, min(self.max_overfetch, factor))
+
+        return FilterPlan(
+            FilterStrategy.POST_FILTER,
+            min(top_k * factor, self.max_fetch_k),
+            selectivity,
+        )
+
+
+class CardinalityCache:
+    """
+    필터별 매칭 문서 수 추정치 캐시 (TTL + LRU)
+
+    카디널리티 조회(count 쿼리)는 검색보다 비싸지 않지만 매 요청마다 반복할
+    필요는 없으므로, 필터 AST를 키로 일정 시간 재사용합니다.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self._entries: OrderedDict[Any, tuple[float, int]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+
+    def get(self, key: Any) -> int | None:
+        """캐시된 추정치 반환 (없거나 만료되면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, count = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return count
+
+    def set(self, key: Any, count: int) -> None:
+        """추정치 저장"""
+        self._entries[key] = (time.monotonic() + self._ttl, count)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 무효화 (문서 추가/삭제 후 호출)"""
+        self._entries.clear()
+
+
+__all__ = [
+    "RESERVED_FILTER_KEYS",
+    "And",
+    "CardinalityCache",
+    "Condition",
+    "FilterExpr",
+    "FilterOp",
+    "FilterPlan",
+    "FilterPlanner",
+    "FilterStrategy",
+    "Or",
+    "filter_fields",
+    "filter_ops",
+    "parse_filters",
+    "split_id_filter",
+    "to_mongo_query",
+]
@@ -39,6 +39,13 @@ class CostTracker:
         },
     }
 
+    # 캐시 적중 입력 토큰 단가 비율 (일반 입력 단가 대비)
+    CACHED_INPUT_PRICE_RATIO = {
+        "google": 0.25,  # Gemini 암시적/명시적 캐시 75% 할인
+        "openai": 0.5,  # GPT-4o 자동 프롬프트 캐시 50% 할인
+        "anthropic": 0.1,  # Claude 캐시 읽기 90% 할인
+    }
+
     # 누적 토큰 사용량
     total_tokens: dict[str, int] = field(
         default_factory=lambda: {"google": 0, "openai": 0, "anthropic": 0}
@@ -54,6 +61,16 @@ class CostTracker:
         default_factory=lambda: {"google": 0, "openai": 0, "anthropic": 0}
     )
 
+    # 프롬프트 캐시에서 읽은 입력 토큰 수
+    cached_tokens: dict[str, int] = field(
+        default_factory=lambda: {"google": 0, "openai": 0, "anthropic": 0}
+    )
+
+    # 캐시 적중으로 절감된 비용 (USD)
+    cache_savings: dict[str, float] = field(
+        default_factory=lambda: {"google": 0.0, "openai": 0.0, "anthropic": 0.0}
+    )
+
     # 시작 시간
     start_time: datetime = field(default_factory=datetime.now)
 
@@ -89,6 +106,34 @@ class CostTracker:
                 f"💰 비용 추적: {provider} {token_type} " f"{tokens_used} tokens = ${cost:.4f}"
             )
 
+    def track_cached_tokens(self, provider: str, cached_tokens: int) -> None:
+        """
+        프롬프트 캐시 적중 토큰 기록
+
+        캐시 적중분은 일반 입력 단가 대신 할인 단가로 과금되므로 절감액을 함께 누적합니다.
+
+        Args:
+            provider: LLM 제공자 (google, openai, anthropic)
+            cached_tokens: 캐시에서 읽은 입력 토큰 수
+        """
+        if cached_tokens <= 0:
+            return
+        with self._lock:
+            if provider not in self.cached_tokens:
+                logger.warning(f"알 수 없는 제공자: {provider}")
+                return
+
+            input_cost = self.COST_PER_MILLION_TOKENS[provider]["input"]
+            ratio = self.CACHED_INPUT_PRICE_RATIO[provider]
+            savings = (cached_tokens / 1_000_000) * input_cost * (1 - ratio)
+
+            self.cached_tokens[provider] += cached_tokens
+            self.cache_savings[provider] += savings
+
+            logger.debug(
+                f"💰 프롬프트 캐시 적중: {provider} {cached_tokens} tokens (절감 ${savings:.4f})"
+            )
+
     def get_summary(self) -> dict[str, Any]:
         """비용 요약 정보 반환"""
         with self._lock:
@@ -102,6 +147,8 @@ class CostTracker:
                 "total_cost_usd": round(total_cost_all, 4),
                 "total_tokens": total_tokens_all,
                 "total_requests": total_requests_all,
+                "total_cached_tokens": sum(self.cached_tokens.values()),
+                "cache_savings_usd": round(sum(self.cache_savings.values()), 4),
                 "elapsed_hours": round(elapsed_hours, 2),
                 "cost_per_hour": (
                     round(total_cost_all / elapsed_hours, 4) if elapsed_hours > 0 else 0
@@ -111,6 +158,8 @@ class CostTracker:
                         "tokens": self.total_tokens[provider],
                         "cost_usd": round(self.total_cost[provider], 4),
                         "requests": self.request_count[provider],
+                        "cached_tokens": self.cached_tokens[provider],
+                        "cache_savings_usd": round(self.cache_savings[provider], 4),
                     }
                     for provider in ["google", "openai", "anthropic"]
                 },
@@ -123,6 +172,8 @@ class CostTracker:
             self.total_tokens = dict.fromkeys(self.total_tokens, 0)
             self.total_cost = dict.fromkeys(self.total_cost, 0.0)
             self.request_count = dict.fromkeys(self.request_count, 0)
+            self.cached_tokens = dict.fromkeys(self.cached_tokens, 0)
+            self.cache_savings = dict.fromkeys(self.cache_savings, 0.0)
             self.start_time = datetime.now()
             logger.info("🔄 비용 추적 통계 리셋")
 
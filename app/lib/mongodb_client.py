@@ -15,6 +15,9 @@ MongoDB Atlas 연결 및 관리 모듈
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any
+
 from pymongo import MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
@@ -24,7 +27,7 @@ from pymongo.errors import (
     ServerSelectionTimeoutError,
 )
 
-from app.lib.config_loader import load_config
+from app.lib.config_loader import get_config
 from app.lib.logger import get_logger
 
 # 로거 설정
@@ -48,7 +51,7 @@ class MongoDBClient:
     _instance: MongoDBClient | None = None
     _client: MongoClient | None = None
     _db: Database | None = None
-    _config: dict | None = None
+    _config: Mapping[str, Any] | None = None
 
     def __new__(cls) -> MongoDBClient:
         """싱글톤 패턴 구현 - 하나의 인스턴스만 생성"""
@@ -64,7 +67,7 @@ class MongoDBClient:
 
         try:
             # 설정 로드
-            config = load_config()
+            config = get_config()
             self._config = config.get("mongodb", {})
 
             if not self._config or not self._config.get("uri"):
@@ -182,6 +185,16 @@ class MongoDBClient:
         """
         return self._db
 
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """
+        mongodb 설정 섹션 반환
+
+        Returns:
+            설정 매핑 (설정이 없으면 빈 딕셔너리)
+        """
+        return self._config or {}
+
     def get_collection(self, collection_name: str) -> Collection | None:
         """
         지정된 이름의 컬렉션 반환
@@ -17,6 +17,8 @@ RRF 점수 특성:
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from app.lib.logger import get_logger
 
 logger = get_logger(__name__)
@@ -147,6 +149,40 @@ class RRFScoreNormalizer:
         """
         return [self.normalize(score, weight_sum) for score in rrf_scores]
 
+    def normalize_array(
+        self,
+        rrf_scores: np.ndarray,
+        weight_sum: float | None = None,
+    ) -> np.ndarray:
+        """
+        NumPy 배열 일괄 정규화 (벡터화 버전)
+
+        normalize()와 같은 공식/클램핑/반올림을 배열 단위로 적용합니다.
+        fusion.convex_fuse()의 normalizer로 그대로 전달할 수 있습니다.
+
+        Args:
+            rrf_scores: RRF 점수 배열
+            weight_sum: 쿼리 가중치 합
+
+        Returns:
+            정규화된 점수 배열 (float64)
+        """
+        scores = np.asarray(rrf_scores, dtype=np.float64)
+        if not self.config.enabled:
+            return scores.copy()
+
+        max_theoretical = self._calculate_max_score(weight_sum or self.config.default_weight_sum)
+        if max_theoretical <= 0:
+            return np.full_like(scores, self.config.min_score)
+
+        normalized = np.where(
+            scores < 0,
+            self.config.min_score,
+            scores / max_theoretical * self.config.max_score,
+        )
+        normalized = np.clip(normalized, self.config.min_score, self.config.max_score)
+        return np.round(normalized, self.config.decimal_places)
+
     @classmethod
     def from_config(cls, config_dict: dict) -> "RRFScoreNormalizer":
         """
@@ -0,0 +1,168 @@
+"""
+동기 스트림 → 비동기 이터레이터 브리지
+
+동기 SDK(google-generativeai, anthropic/openai 동기 클라이언트)의 스트리밍 응답을
+전용 스레드에서 소비하고, 청크를 제한된 크기의 asyncio.Queue로 이벤트 루프에 전달합니다.
+토큰 대기는 스레드에서 일어나므로 스트리밍 중에도 다른 연결이 멈추지 않습니다.
+
+특징:
+- 제한된 버퍼(max_buffer): 소비자가 느리면 생산 스레드가 대기 (메모리 상한)
+- 소비자가 중단하면(클라이언트 연결 종료 등) 생산 스레드도 중단하고 스트림을 닫음
+- 스트림 전용 스레드 풀: 장시간 스트림이 asyncio.to_thread 기본 풀을 점유하지 않음
+
+사용 예시:
+    def chunks():
+        with client.messages.stream(...) as stream:
+            for event in stream:
+                yield event.delta.text
+
+    async for text in iterate_in_thread(chunks):
+        ...
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, TypeVar
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 동시 스트림 수 상한 (스트림 1개 = 스레드 1개 점유)
+DEFAULT_MAX_STREAM_THREADS = 256
+DEFAULT_MAX_BUFFER = 64
+
+# 소비자 중단 여부를 확인하는 주기 (버퍼가 가득 찬 동안, 초)
+_CANCEL_POLL_SECONDS = 0.1
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_stream_executor() -> ThreadPoolExecutor:
+    """스트림 전용 스레드 풀 (LLM_STREAM_MAX_THREADS 환경 변수로 크기 조정)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(
+                    os.getenv("LLM_STREAM_MAX_THREADS", str(DEFAULT_MAX_STREAM_THREADS))
+                )
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="llm-stream"
+                )
+    return _executor
+
+
+async def run_in_stream_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    블로킹 호출을 스트림 전용 스레드 풀에서 실행
+
+    스트림 열기(첫 토큰까지 대기)처럼 오래 걸리는 동기 호출에 사용합니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_stream_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+class _End:
+    """스트림 종료 표시 (error가 있으면 소비자에서 다시 발생)"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException | None = None) -> None:
+        self.error = error
+
+
+async def iterate_in_thread(
+    make_iterable: Callable[[], Iterable[T]],
+    max_buffer: int = DEFAULT_MAX_BUFFER,
+) -> AsyncIterator[T]:
+    """
+    동기 이터러블을 스레드에서 소비하는 비동기 이터레이터
+
+    Args:
+        make_iterable: 동기 이터러블을 만드는 함수 (스트림 열기도 스레드에서 실행됨)
+        max_buffer: 이벤트 루프로 넘기기 전 대기할 수 있는 최대 청크 수
+
+    Yields:
+        이터러블의 각 항목 (순서 유지)
+
+    Raises:
+        스트림 열기/소비 중 발생한 예외를 그대로 다시 발생
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, max_buffer))
+    cancelled = threading.Event()
+
+    def put(item: Any) -> bool:
+        """큐에 넣기 (버퍼가 가득 차면 대기). 소비자가 중단했으면 False"""
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=_CANCEL_POLL_SECONDS)
+                return True
+            except FutureTimeoutError:
+                if cancelled.is_set() or loop.is_closed():
+                    future.cancel()
+                    return False
+
+    def produce() -> None:
+        iterator = None
+        try:
+            iterator = iter(make_iterable())
+            for item in iterator:
+                if cancelled.is_set() or not put(item):
+                    return
+        except BaseException as e:  # noqa: BLE001 - 소비자에게 전달
+            if not cancelled.is_set():
+                put(_End(e))
+            return
+        finally:
+            # 중단 시 제너레이터의 finally/with 블록(HTTP 스트림 닫기) 실행
+            close = getattr(iterator, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"스트림 닫기 실패: {e}")
+        put(_End())
+
+    producer = loop.run_in_executor(get_stream_executor(), produce)
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _End):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        cancelled.set()
+        # 생산 스레드가 버퍼 대기 중이면 풀어 줌
+        while not queue.empty():
+            queue.get_nowait()
+        if producer.done() and not producer.cancelled():
+            producer.exception()  # 미회수 예외 경고 방지
+
+
+async def aiterate(stream: Any, max_buffer: int = DEFAULT_MAX_BUFFER) -> AsyncIterator[Any]:
+    """
+    비동기/동기 스트림을 모두 비동기로 순회
+
+    비동기 이터러블이면 그대로, 동기 이터러블이면 iterate_in_thread로 순회합니다.
+    """
+    if hasattr(stream, "__aiter__"):
+        async for item in stream:
+            yield item
+        return
+    async for item in iterate_in_thread(lambda: stream, max_buffer=max_buffer):
+        yield item
@@ -48,6 +48,7 @@ class StatsDict(TypedDict, total=False):
     average_latency: float
     error_rate: float
     errors: int
+    answer_cache: dict[str, Any]  # 답변 캐시 통계 (활성화 시에만)
 
 
 class SessionInfoDict(TypedDict, total=False):
@@ -74,6 +75,7 @@ class RAGResultDict(TypedDict, total=False):
     model_info: dict[str, Any]
     routing_metadata: dict[str, Any] | None
     performance_metrics: dict[str, Any] | None
+    answer_cache: dict[str, Any]  # 답변 캐시 적중 정보 (적중 시에만)
 
 
 class HealthCheckDict(TypedDict, total=False):
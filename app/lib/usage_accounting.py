@@ -0,0 +1,492 @@
+"""
+LLM 토큰/비용 사용량 집계
+
+요청마다 제공자가 보고한 usage를 라우트(chat, chat_stream 등) × 모델 단위로,
+파이프라인 단계별 지연 시간을 라우트 × 단계 단위로 누적합니다.
+스트리밍 응답은 stream_options.include_usage로 받은 마지막 청크의 usage를 사용하고,
+제공자가 usage를 보내지 않으면 추정치로 기록하고 estimated_requests로 구분합니다.
+
+동시성:
+- 카운터는 이벤트 루프 스레드에서만 갱신되므로(갱신 중 await 없음) 락을 쓰지 않습니다.
+- 플러시는 미전송 델타 딕셔너리를 새 딕셔너리로 교체한 뒤 저장소에 더하므로
+  플러시 도중 들어온 기록은 다음 플러시로 넘어갑니다.
+- 델타마다 배치 ID를 붙여 저장소가 같은 배치를 한 번만 반영하므로, 적용 후 응답만
+  유실되어 재시도해도 이중 집계되지 않습니다.
+
+저장소 (워커별 델타를 주기적으로 합산):
+- MemoryUsageStore: 프로세스 내부 (단일 워커, 테스트)
+- RedisUsageStore: Redis 해시 (멀티 워커 합산, 재시작 후에도 유지)
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+from .logger import get_logger
+from .metrics import CostTracker
+
+logger = get_logger(__name__)
+
+_BATCH_TTL_SECONDS = 86400  # 반영한 배치 ID 보관 시간 (이 안의 재시도는 중복 반영 안 함)
+
+# (route, model) → 필드별 누적값
+MODEL_FIELDS = (
+    "requests",
+    "prompt_tokens",
+    "completion_tokens",
+    "cached_tokens",
+    "estimated_requests",
+    "latency_ms",
+    "cost_usd",
+)
+
+Counters = dict[tuple[str, str], dict[str, float]]
+
+_MODEL_PROVIDER_PREFIXES = (
+    ("google/", "google"),
+    ("gemini", "google"),
+    ("anthropic/", "anthropic"),
+    ("claude", "anthropic"),
+    ("openai/", "openai"),
+    ("gpt", "openai"),
+    ("o1", "openai"),
+)
+
+
+def provider_for_model(model: str, provider: str | None = None) -> str | None:
+    """모델 ID(OpenRouter 접두사 포함)로 과금 제공자 판별 (단가표에 없으면 None)"""
+    lowered = model.lower()
+    for prefix, name in _MODEL_PROVIDER_PREFIXES:
+        if lowered.startswith(prefix):
+            return name
+    if provider in CostTracker.COST_PER_MILLION_TOKENS:
+        return provider
+    return None
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0,
+    provider: str | None = None,
+) -> float:
+    """
+    토큰 수 → 비용 (USD)
+
+    CostTracker 단가표를 사용하며, 캐시 적중 입력 토큰은 할인 단가로 계산합니다.
+    """
+    billing_provider = provider_for_model(model, provider)
+    if billing_provider is None:
+        return 0.0
+    prices = CostTracker.COST_PER_MILLION_TOKENS[billing_provider]
+    ratio = CostTracker.CACHED_INPUT_PRICE_RATIO.get(billing_provider, 1.0)
+    cached = min(cached_tokens, prompt_tokens)
+    input_cost = (prompt_tokens - cached) * prices["input"] + cached * prices["input"] * ratio
+    output_cost = completion_tokens * prices["output"]
+    return (input_cost + output_cost) / 1_000_000
+
+
+@dataclass
+class UsageAccountingConfig:
+    """사용량 집계 설정 (generation.usage_accounting)"""
+
+    enabled: bool = True
+    stream_include_usage: bool = True  # 스트리밍 요청에 stream_options.include_usage 추가
+    flush_interval_seconds: float = 30.0
+    backend: str = "memory"  # memory | redis
+    key_prefix: str = "rag:usage:"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "UsageAccountingConfig":
+        data = data or {}
+        return cls(
+            enabled=bool(data.get("enabled", True)),
+            stream_include_usage=bool(data.get("stream_include_usage", True)),
+            flush_interval_seconds=float(data.get("flush_interval_seconds", 30.0)),
+            backend=str(data.get("backend", "memory")),
+            key_prefix=str(data.get("key_prefix", "rag:usage:")),
+        )
+
+
+@dataclass
+class UsageRecord:
+    """LLM 호출 1회의 사용량"""
+
+    model: str
+    route: str = "generation"
+    provider: str | None = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    latency_ms: float = 0.0
+    estimated: bool = False  # 제공자 usage 없이 추정한 값
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+@runtime_checkable
+class UsageStore(Protocol):
+    """
+    워커 간 공유 사용량 저장소 인터페이스
+
+    구현 예시:
+    - MemoryUsageStore: 프로세스 내부
+    - RedisUsageStore: Redis
+    """
+
+    async def merge(
+        self, worker_id: str, models: Counters, stages: Counters, batch_id: str
+    ) -> None:
+        """워커의 델타를 누적값에 더함 (같은 batch_id는 한 번만 반영)"""
+        ...
+
+    async def load(self) -> tuple[Counters, Counters, dict[str, float]]:
+        """(모델 누적값, 단계 누적값, 워커별 마지막 플러시 시각)"""
+        ...
+
+
+def _add(target: Counters, key: tuple[str, str], values: dict[str, float]) -> None:
+    bucket = target.get(key)
+    if bucket is None:
+        bucket = target[key] = {}
+    for name, value in values.items():
+        bucket[name] = bucket.get(name, 0.0) + value
+
+
+class MemoryUsageStore:
+    """프로세스 내부 사용량 저장소 (단일 워커 / 테스트용)"""
+
+    def __init__(self) -> None:
+        self.models: Counters = {}
+        self.stages: Counters = {}
+        self.workers: dict[str, float] = {}
+        self.batches: set[str] = set()
+
+    async def merge(
+        self, worker_id: str, models: Counters, stages: Counters, batch_id: str
+    ) -> None:
+        if batch_id in self.batches:
+            return
+        self.batches.add(batch_id)
+        for key, values in models.items():
+            _add(self.models, key, values)
+        for key, values in stages.items():
+            _add(self.stages, key, values)
+        self.workers[worker_id] = time.time()
+
+    async def load(self) -> tuple[Counters, Counters, dict[str, float]]:
+        return (
+            {key: dict(values) for key, values in self.models.items()},
+            {key: dict(values) for key, values in self.stages.items()},
+            dict(self.workers),
+        )
+
+
+class RedisUsageStore:
+    """
+    Redis 해시 기반 사용량 저장소
+
+    필드 이름은 "route|model|field" 형식이며 HINCRBYFLOAT로 더하므로
+    여러 워커가 동시에 플러시해도 값이 유실되지 않습니다.
+    배치 표시 키를 WATCH한 MULTI/EXEC로 증분과 함께 기록하므로 델타는 전부 반영되거나
+    전혀 반영되지 않고, 이미 반영된 배치를 재시도하면 건너뜁니다.
+    """
+
+    def __init__(self, redis_client: Any, key_prefix: str = "rag:usage:") -> None:
+        """
+        Args:
+            redis_client: redis.asyncio.Redis 클라이언트 (decode_responses=True)
+            key_prefix: 키 접두사 (네임스페이스 분리)
+        """
+        self._redis = redis_client
+        self._models_key = f"{key_prefix}models"
+        self._stages_key = f"{key_prefix}stages"
+        self._workers_key = f"{key_prefix}workers"
+        self._batch_prefix = f"{key_prefix}batch:"
+
+    async def merge(
+        self, worker_id: str, models: Counters, stages: Counters, batch_id: str
+    ) -> None:
+        from redis.exceptions import WatchError
+
+        batch_key = self._batch_prefix + batch_id
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(batch_key)
+                    if await pipe.exists(batch_key):
+                        return  # 이전 시도가 반영된 뒤 응답만 유실된 경우
+                    pipe.multi()
+                    pipe.set(batch_key, worker_id, ex=_BATCH_TTL_SECONDS)
+                    for redis_key, counters in (
+                        (self._models_key, models),
+                        (self._stages_key, stages),
+                    ):
+                        for (route, name), values in counters.items():
+                            for field_name, value in values.items():
+                                if value:
+                                    pipe.hincrbyfloat(
+                                        redis_key, f"{route}|{name}|{field_name}", value
+                                    )
+                    pipe.hset(self._workers_key, worker_id, time.time())
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    async def load(self) -> tuple[Counters, Counters, dict[str, float]]:
+        models = self._parse(await self._redis.hgetall(self._models_key))
+        stages = self._parse(await self._redis.hgetall(self._stages_key))
+        workers = await self._redis.hgetall(self._workers_key)
+        return models, stages, {str(k): float(v) for k, v in workers.items()}
+
+    @staticmethod
+    def _parse(raw: dict[Any, Any]) -> Counters:
+        counters: Counters = {}
+        for field_key, value in raw.items():
+            parts = str(field_key).rsplit("|", 1)
+            head = parts[0].split("|", 1)
+            if len(parts) != 2 or len(head) != 2:
+                continue
+            _add(counters, (head[0], head[1]), {parts[1]: float(value)})
+        return counters
+
+
+def _format_models(counters: Counters) -> dict[str, Any]:
+    """(route, model) 카운터 → {route: {model: {...}}} + 전체 합계"""
+    by_route: dict[str, dict[str, Any]] = {}
+    totals = dict.fromkeys(MODEL_FIELDS, 0.0)
+    for (route, model), values in sorted(counters.items()):
+        entry = {name: values.get(name, 0.0) for name in MODEL_FIELDS}
+        for name in MODEL_FIELDS:
+            totals[name] += entry[name]
+        by_route.setdefault(route, {})[model] = _round_entry(entry)
+    return {"by_route": by_route, "totals": _round_entry(totals)}
+
+
+def _round_entry(entry: dict[str, float]) -> dict[str, Any]:
+    requests = entry.get("requests", 0.0)
+    result: dict[str, Any] = {
+        name: int(value) for name, value in entry.items() if name not in ("latency_ms", "cost_usd")
+    }
+    result["cost_usd"] = round(entry.get("cost_usd", 0.0), 6)
+    result["avg_latency_ms"] = (
+        round(entry.get("latency_ms", 0.0) / requests, 1) if requests else 0.0
+    )
+    return result
+
+
+def _format_stages(counters: Counters) -> dict[str, Any]:
+    """(route, stage) 카운터 → {route: {stage: {count, total_latency_ms, avg_latency_ms}}}"""
+    by_route: dict[str, dict[str, Any]] = {}
+    for (route, stage), values in sorted(counters.items()):
+        count = values.get("count", 0.0)
+        latency = values.get("latency_ms", 0.0)
+        by_route.setdefault(route, {})[stage] = {
+            "count": int(count),
+            "total_latency_ms": round(latency, 1),
+            "avg_latency_ms": round(latency / count, 1) if count else 0.0,
+        }
+    return by_route
+
+
+class UsageAccountant:
+    """
+    워커별 사용량 카운터 + 공유 저장소 주기적 플러시
+
+    사용법:
+        accountant = UsageAccountant(config, store=RedisUsageStore(redis))
+        accountant.start()                       # 앱 시작 시 (플러시 루프)
+        accountant.record(UsageRecord(model="google/gemini-2.5-flash", route="chat", ...))
+        accountant.record_stages("chat", {"retrieve_documents": 120.5})
+        report = await accountant.get_report()   # 워커 로컬 + 공유 저장소 합계
+        await accountant.stop()                  # 앱 종료 시 (마지막 플러시)
+    """
+
+    def __init__(
+        self,
+        config: UsageAccountingConfig | None = None,
+        store: UsageStore | None = None,
+        worker_id: str | None = None,
+    ) -> None:
+        """
+        Args:
+            config: 집계 설정
+            store: 공유 저장소 (None이면 워커 로컬 집계만)
+            worker_id: 워커 식별자 (기본: 호스트명:PID)
+        """
+        self.config = config or UsageAccountingConfig()
+        self.store = store
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+        # 워커 시작 이후 누적값 / 마지막 플러시 이후 델타
+        self._models: Counters = {}
+        self._stages: Counters = {}
+        self._pending_models: Counters = {}
+        self._pending_stages: Counters = {}
+        # 저장소 반영이 확인되지 않은 배치 (같은 ID로 재시도)
+        self._inflight: tuple[str, Counters, Counters] | None = None
+
+        self._flush_task: asyncio.Task[None] | None = None
+        self._started_at = time.time()
+        self._flush_stats = {"flushes": 0, "errors": 0, "last_flush_at": 0.0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def record(self, record: UsageRecord) -> UsageRecord:
+        """LLM 호출 1회 사용량 기록 (비용을 계산해 record.cost_usd에 채움)"""
+        record.cost_usd = estimate_cost(
+            record.model,
+            record.prompt_tokens,
+            record.completion_tokens,
+            record.cached_tokens,
+            provider=record.provider,
+        )
+        if not self.enabled:
+            return record
+
+        values = {
+            "requests": 1.0,
+            "prompt_tokens": float(record.prompt_tokens),
+            "completion_tokens": float(record.completion_tokens),
+            "cached_tokens": float(record.cached_tokens),
+            "estimated_requests": 1.0 if record.estimated else 0.0,
+            "latency_ms": record.latency_ms,
+            "cost_usd": record.cost_usd,
+        }
+        key = (record.route, record.model)
+        _add(self._models, key, values)
+        _add(self._pending_models, key, values)
+        return record
+
+    def record_stages(self, route: str, stages: dict[str, float]) -> None:
+        """
+        파이프라인 단계별 지연 시간 기록
+
+        Args:
+            route: 라우트 이름 (chat, chat_stream 등)
+            stages: 단계 이름 → 지연 시간 (밀리초)
+        """
+        if not self.enabled:
+            return
+        for stage, latency_ms in stages.items():
+            values = {"count": 1.0, "latency_ms": float(latency_ms)}
+            _add(self._stages, (route, stage), values)
+            _add(self._pending_stages, (route, stage), values)
+
+    def snapshot(self) -> dict[str, Any]:
+        """워커 로컬 누적값 (시작 이후)"""
+        return {
+            "models": _format_models(self._models),
+            "stages": _format_stages(self._stages),
+            "since": self._started_at,
+        }
+
+    async def flush(self) -> bool:
+        """
+        미전송 델타를 공유 저장소에 더함
+
+        Returns:
+            저장소에 기록했으면 True (저장소 없음/델타 없음/실패 시 False)
+        """
+        if self.store is None:
+            return False
+
+        flushed = False
+        # 실패했던 배치를 같은 ID로 먼저 재시도한 뒤 새 델타를 보냄
+        for _ in range(2):
+            if self._inflight is None:
+                if not (self._pending_models or self._pending_stages):
+                    break
+                self._inflight = (uuid.uuid4().hex, self._pending_models, self._pending_stages)
+                self._pending_models, self._pending_stages = {}, {}
+
+            batch_id, models, stages = self._inflight
+            try:
+                await self.store.merge(self.worker_id, models, stages, batch_id)
+            except Exception as e:
+                # 반영 여부를 알 수 없으므로 델타를 합치지 않고 같은 배치로 재시도
+                self._flush_stats["errors"] += 1
+                logger.warning("사용량 플러시 실패", error=str(e), worker_id=self.worker_id)
+                return False
+
+            self._inflight = None
+            self._flush_stats["flushes"] += 1
+            self._flush_stats["last_flush_at"] = time.time()
+            flushed = True
+        return flushed
+
+    def start(self) -> None:
+        """주기적 플러시 루프 시작 (저장소가 없거나 간격이 0이면 무시)"""
+        if (
+            self.store is None
+            or not self.enabled
+            or self.config.flush_interval_seconds <= 0
+            or self._flush_task is not None
+        ):
+            return
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "사용량 플러시 루프 시작",
+            worker_id=self.worker_id,
+            interval=self.config.flush_interval_seconds,
+        )
+
+    async def stop(self) -> None:
+        """플러시 루프 중지 + 남은 델타 플러시"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.flush_interval_seconds)
+            await self.flush()
+
+    async def get_report(self) -> dict[str, Any]:
+        """
+        사용량 리포트
+
+        Returns:
+            worker: 이 워커의 누적값
+            shared: 공유 저장소 합계 (저장소가 없거나 조회 실패 시 None)
+        """
+        shared: dict[str, Any] | None = None
+        if self.store is not None:
+            try:
+                models, stages, workers = await self.store.load()
+                shared = {
+                    "models": _format_models(models),
+                    "stages": _format_stages(stages),
+                    "workers": workers,
+                }
+            except Exception as e:
+                logger.warning("공유 사용량 조회 실패", error=str(e))
+
+        return {
+            "enabled": self.enabled,
+            "worker_id": self.worker_id,
+            "backend": type(self.store).__name__ if self.store is not None else None,
+            "flush": {
+                **self._flush_stats,
+                "interval_seconds": self.config.flush_interval_seconds,
+                "pending": bool(self._inflight or self._pending_models or self._pending_stages),
+            },
+            "worker": self.snapshot(),
+            "shared": shared,
+        }
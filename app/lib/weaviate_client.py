@@ -15,13 +15,16 @@ Weaviate 연결 및 관리 모듈
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any
+
 import weaviate
 from weaviate.client import WeaviateClient as WeaviateClientSDK
 from weaviate.collections.collection import Collection
 from weaviate.connect import ConnectionParams
 from weaviate.exceptions import WeaviateConnectionError
 
-from app.lib.config_loader import load_config
+from app.lib.config_loader import get_config
 from app.lib.logger import get_logger
 
 # 로거 설정
@@ -43,7 +46,7 @@ class WeaviateClient:
 
     _instance: WeaviateClient | None = None
     _client: WeaviateClientSDK | None = None
-    _config: dict | None = None
+    _config: Mapping[str, Any] | None = None
 
     def __new__(cls) -> WeaviateClient:
         """싱글톤 패턴 구현 - 하나의 인스턴스만 생성"""
@@ -59,7 +62,7 @@ class WeaviateClient:
 
         try:
             # 설정 로드
-            config = load_config()
+            config = get_config()
             self._config = config.get("weaviate", {})
 
             if not self._config or not self._config.get("url"):
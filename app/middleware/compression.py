@@ -0,0 +1,42 @@
+"""
+GZip Compression Middleware for FastAPI
+
+Starlette GZipMiddleware는 스트리밍 응답도 압축하는데, gzip 스트림을 청크마다 flush하지 않아
+SSE 이벤트가 압축 버퍼에 머물다 응답이 끝날 때 한꺼번에 전달됩니다.
+text/event-stream 응답은 압축하지 않고 그대로 보내 첫 이벤트가 즉시 도착하도록 합니다.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+# 압축하지 않을 응답 Content-Type (prefix 매칭)
+UNCOMPRESSED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class StreamingSafeGZipMiddleware(GZipMiddleware):
+    """SSE 응답을 제외하고 GZip 압축을 적용하는 미들웨어"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        async def app_with_sse_bypass(scope: Scope, receive: Receive, gzip_send: Send) -> None:
+            # Content-Type은 http.response.start에서야 알 수 있으므로 응답마다 경로를 고른다:
+            # SSE는 원래 send로 직접 보내고, 그 외는 GZipResponder의 압축 send로 넘긴다
+            passthrough = False
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal passthrough
+                if message["type"] == "http.response.start":
+                    content_type = Headers(raw=message["headers"]).get("content-type", "")
+                    passthrough = content_type.startswith(UNCOMPRESSED_CONTENT_TYPES)
+                await (send if passthrough else gzip_send)(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        responder = GZipResponder(
+            app_with_sse_bypass, self.minimum_size, compresslevel=self.compresslevel
+        )
+        await responder(scope, receive, send)
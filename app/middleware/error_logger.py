@@ -16,8 +16,7 @@ Error Logging Middleware for FastAPI
 import traceback
 from time import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.lib.errors import RAGException
 from app.lib.logger import get_logger
@@ -25,12 +24,13 @@ from app.lib.logger import get_logger
 logger = get_logger(__name__)
 
 
-class ErrorLoggingMiddleware(BaseHTTPMiddleware):
+class ErrorLoggingMiddleware:
     """
-    에러 로깅 미들웨어
+    에러 로깅 미들웨어 (순수 ASGI)
 
     모든 HTTP 요청에서 발생하는 에러를 일관된 형식으로 로깅하고,
     에러를 상위(FastAPI 에러 핸들러)로 전파합니다.
+    요청/응답 메시지는 감싸지 않고 그대로 전달합니다 (스트리밍 응답 영향 없음).
 
     Features:
     - RAGException: 구조화된 에러 정보 전체 로깅
@@ -44,26 +44,25 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
     - 서비스 중단 방지 보장
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         요청 인터셉션 및 에러 로깅
 
-        Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 라우트 핸들러
-
-        Returns:
-            Response: FastAPI Response 객체
-
         Raises:
             Exception: 원본 예외를 그대로 상위로 전파
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time()
 
         try:
             # 정상 요청 처리
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
 
         except RAGException as e:
             # RAGException: 구조화된 정보 모두 로깅
@@ -75,8 +74,8 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
                     error_code=e.error_code.value,
                     message=e.message,
                     context=e.context,
-                    path=request.url.path,
-                    method=request.method,
+                    path=scope["path"],
+                    method=scope["method"],
                     duration_ms=f"{duration * 1000:.2f}",
                 )
             except Exception as logging_error:
@@ -104,8 +103,8 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
                     error=str(e),
                     error_type=type(e).__name__,
                     traceback=traceback.format_exc(),
-                    path=request.url.path,
-                    method=request.method,
+                    path=scope["path"],
+                    method=scope["method"],
                     duration_ms=f"{duration * 1000:.2f}",
                 )
             except Exception as logging_error:
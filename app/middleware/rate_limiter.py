@@ -4,30 +4,132 @@ Rate Limiting Middleware for FastAPI
 IP 기반과 Session 기반 Rate Limiting을 제공합니다.
 - IP 기반: 분당 30개 요청
 - Session 기반: 분당 10개 요청 (IP를 알 수 없을 때 fallback)
+
+GCRA(Generic Cell Rate Algorithm):
+- 키마다 "이론적 도착 시각"(TAT) float 하나만 저장 → 요청당 O(1)
+- 로컬 저장소는 OrderedDict LRU (최대 추적 키 초과 시 O(1) 제거)
+- Redis 백엔드는 Lua 스크립트 1회 호출로 판정/갱신 (전체 워커 공유 한도)
+- Redis 오류 시 잠시 로컬 판정으로 대체
 """
 
 import asyncio
+import math
+import os
+import re
 import time
-from collections import defaultdict
-from collections.abc import Callable
-from typing import cast
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, cast
+from urllib.parse import parse_qsl
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.lib.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# KEYS[1]: 한도 키, ARGV[1]: 배출 간격(초), ARGV[2]: 윈도우(초)
+# 반환: {허용 여부(1/0), 새 TAT 또는 재시도 대기(초)} - 소수점 보존을 위해 문자열
+GCRA_LUA_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if now < allow_at then
+  return {0, tostring(allow_at - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat - now)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Rate Limit 판정 결과"""
+
+    allowed: bool
+    limit_type: str  # "ip" | "session" | "none"
+    limit: int
+    remaining: int
+    retry_after: float = 0.0  # 거부 시 다음 요청 허용까지 대기 시간 (초)
+
+
+def gcra(tat: float | None, now: float, interval: float, window: float) -> tuple[bool, float]:
+    """
+    GCRA 판정 (GCRA_LUA_SCRIPT와 동일한 계산)
+
+    Args:
+        tat: 저장된 이론적 도착 시각 (없으면 None)
+        now: 현재 시각
+        interval: 요청 간 배출 간격 (window / limit)
+        window: 윈도우 크기 (버스트 허용량 = limit)
+
+    Returns:
+        (허용 여부, 허용 시 새 TAT / 거부 시 재시도 대기 시간)
+    """
+    base = now if tat is None or tat < now else tat
+    new_tat = base + interval
+    allow_at = new_tat - window
+    if now < allow_at:
+        return False, allow_at - now
+    return True, new_tat
+
+
+def _remaining(backlog: float, interval: float, window: float) -> int:
+    """TAT가 현재보다 backlog초 앞서 있을 때 남은 요청 수"""
+    return max(0, int((window - backlog) / interval + 1e-9))
+
+
+class LocalGCRAStore:
+    """
+    프로세스 로컬 TAT 저장소 (LRU)
+
+    접근 시 move_to_end, 최대 키 초과 시 가장 오래 접근하지 않은 키를 popitem으로 제거.
+    asyncio 단일 스레드에서 await 없이 판정/갱신하므로 락이 필요 없다.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._tat: OrderedDict[str, float] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+    def check(self, key: str, now: float, interval: float, window: float) -> tuple[bool, float]:
+        allowed, value = gcra(self._tat.get(key), now, interval, window)
+        if allowed:
+            self._tat[key] = value
+            self._tat.move_to_end(key)
+            if len(self._tat) > self.max_keys:
+                self._tat.popitem(last=False)
+                self.evictions += 1
+        return allowed, value
+
+    def purge_expired(self, now: float) -> int:
+        """TAT가 지난 (= 처음 요청과 동일한 상태인) 키 제거"""
+        expired = [key for key, tat in self._tat.items() if tat <= now]
+        for key in expired:
+            del self._tat[key]
+        return len(expired)
+
+
 class RateLimiter:
     """
     Rate Limiting 로직을 담당하는 클래스
 
-    시간 윈도우 기반 Rate Limiting 구현:
-    - 각 IP/Session에 대해 (timestamp, count) 리스트 유지
-    - 현재 시간 기준 60초 이내의 요청만 카운트
+    GCRA 기반 Rate Limiting 구현:
+    - limit개 요청을 window_seconds 안에 버스트로 허용하고, 이후 window/limit 간격으로 회복
+    - redis_client가 있으면 모든 워커가 같은 한도를 공유 (Lua 스크립트로 원자적 판정)
     """
 
     def __init__(
@@ -35,23 +137,30 @@ class RateLimiter:
         ip_limit: int = 30,  # IP 기반: 분당 30개
         session_limit: int = 10,  # Session 기반: 분당 10개
         window_seconds: int = 60,  # 시간 윈도우: 60초
+        redis_client: Any | None = None,
+        key_prefix: str = "ratelimit:",
+        redis_retry_seconds: float = 5.0,
     ):
         self.ip_limit = ip_limit
         self.session_limit = session_limit
         self.window_seconds = window_seconds
 
-        # IP별 요청 기록: {ip: [(timestamp, count), ...]}
-        self.ip_requests: dict[str, list] = defaultdict(list)
-
-        # Session별 요청 기록: {session_id: [(timestamp, count), ...]}
-        self.session_requests: dict[str, list] = defaultdict(list)
-
         # 🛡️ 메모리 보호: 최대 추적 IP/Session 제한 (DDoS 방어)
         self.max_tracked_ips = 10000  # 최대 1만 IP 추적
         self.max_tracked_sessions = 50000  # 최대 5만 세션 추적
 
-        # Asyncio Lock (FastAPI는 async 기반이므로 asyncio.Lock 사용)
-        self.lock = asyncio.Lock()
+        # IP/Session별 TAT (LRU)
+        self.ip_store = LocalGCRAStore(self.max_tracked_ips)
+        self.session_store = LocalGCRAStore(self.max_tracked_sessions)
+
+        # Redis 백엔드 (선택)
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.redis_retry_seconds = redis_retry_seconds
+        self._redis_script = redis_client.register_script(GCRA_LUA_SCRIPT) if redis_client else None
+        self._redis_disabled_until = 0.0
+        self.redis_errors = 0
+        self.local_fallbacks = 0
 
         # 🔄 Background Cleanup Task (24시간 주기)
         self._cleanup_task: asyncio.Task | None = None
@@ -60,34 +169,89 @@ class RateLimiter:
 
         logger.info(
             f"RateLimiter 초기화: IP={ip_limit}/min, Session={session_limit}/min, Window={window_seconds}s, "
-            f"Cleanup={self._cleanup_interval}s"
+            f"Backend={'redis' if redis_client else 'memory'}, Cleanup={self._cleanup_interval}s"
         )
 
-    def _clean_old_requests(self, request_list: list, current_time: float) -> None:
+    async def check(
+        self, ip: str | None = None, session_id: str | None = None
+    ) -> RateLimitDecision:
         """
-        현재 시간 기준으로 window_seconds 이전의 요청 제거
+        Rate Limit 판정
 
-        Args:
-            request_list: [(timestamp, count), ...] 형태의 요청 기록 리스트
-            current_time: 현재 시간 (Unix timestamp)
+        우선순위:
+        1. IP가 있으면 IP 기반 체크 (30 req/min)
+        2. IP가 없으면 Session 기반 체크 (10 req/min)
         """
-        cutoff_time = current_time - self.window_seconds
+        if ip:
+            limit_type, key, limit, store = "ip", ip, self.ip_limit, self.ip_store
+        elif session_id:
+            limit_type, key, limit, store = (
+                "session",
+                session_id,
+                self.session_limit,
+                self.session_store,
+            )
+        else:
+            # IP와 Session 모두 없으면 통과 (안전을 위해)
+            logger.warning("Rate Limit 체크 실패: IP와 Session ID 모두 없음")
+            return RateLimitDecision(allowed=True, limit_type="none", limit=0, remaining=-1)
 
-        # 오래된 요청 제거 (in-place modification)
-        while request_list and request_list[0][0] < cutoff_time:
-            request_list.pop(0)
+        window = float(self.window_seconds)
+        interval = window / limit
 
-    def _get_request_count(self, request_list: list) -> int:
-        """
-        현재 윈도우 내의 총 요청 수 계산
+        result = await self._check_redis(limit_type, key, interval, window)
+        if result is None:
+            now = time.time()
+            allowed, value = store.check(key, now, interval, window)
+            backlog = value - now if allowed else 0.0
+        else:
+            allowed, backlog = result
+            value = backlog
 
-        Args:
-            request_list: [(timestamp, count), ...] 형태의 요청 기록 리스트
+        if not allowed:
+            logger.warning(
+                f"Rate Limit 초과 ({limit_type}): key={key}, limit={limit}/{self.window_seconds}s"
+            )
+            return RateLimitDecision(
+                allowed=False, limit_type=limit_type, limit=limit, remaining=0, retry_after=value
+            )
+        return RateLimitDecision(
+            allowed=True,
+            limit_type=limit_type,
+            limit=limit,
+            remaining=_remaining(backlog, interval, window),
+        )
+
+    async def _check_redis(
+        self, limit_type: str, key: str, interval: float, window: float
+    ) -> tuple[bool, float] | None:
+        """
+        Redis Lua 스크립트로 판정
 
         Returns:
-            int: 현재 윈도우 내의 총 요청 수
+            (허용 여부, 허용 시 TAT 백로그 / 거부 시 재시도 대기) 또는
+            None (Redis 미사용 / 장애로 로컬 판정 필요)
         """
-        return sum(count for _, count in request_list)
+        if self._redis_script is None:
+            return None
+        if time.monotonic() < self._redis_disabled_until:
+            self.local_fallbacks += 1
+            return None
+        try:
+            allowed, value = await self._redis_script(
+                keys=[f"{self.key_prefix}{limit_type}:{key}"], args=[interval, window]
+            )
+            return bool(int(allowed)), float(value)
+        except Exception as e:
+            # 장애 중 요청마다 타임아웃을 기다리지 않도록 일정 시간 로컬 판정
+            self.redis_errors += 1
+            self.local_fallbacks += 1
+            self._redis_disabled_until = time.monotonic() + self.redis_retry_seconds
+            logger.warning(
+                "Rate Limit Redis 오류, 로컬 판정으로 대체",
+                extra={"error": str(e), "retry_seconds": self.redis_retry_seconds},
+            )
+            return None
 
     async def check_rate_limit(
         self, ip: str | None = None, session_id: str | None = None
@@ -95,10 +259,6 @@ class RateLimiter:
         """
         Rate Limit 체크
 
-        우선순위:
-        1. IP가 있으면 IP 기반 체크 (30 req/min)
-        2. IP가 없으면 Session 기반 체크 (10 req/min)
-
         Args:
             ip: 클라이언트 IP 주소
             session_id: 세션 ID
@@ -109,105 +269,33 @@ class RateLimiter:
                 - str: 제한 타입 ("ip" or "session")
                 - int: 남은 요청 수
         """
-        current_time = time.time()
-
-        async with self.lock:
-            # 🛡️ 메모리 보호: IP 개수 제한 (LRU 방식 제거)
-            if ip and len(self.ip_requests) >= self.max_tracked_ips:
-                if ip not in self.ip_requests:
-                    # 가장 오래된 IP 제거 (LRU 전략)
-                    oldest_ip = min(
-                        self.ip_requests.keys(),
-                        key=lambda k: (
-                            self.ip_requests[k][0][0] if self.ip_requests[k] else float("inf")
-                        ),
-                    )
-                    del self.ip_requests[oldest_ip]
-                    logger.info(f"🛡️ 메모리 보호: 오래된 IP 제거 (총 {len(self.ip_requests)}개)")
-
-            # IP 기반 Rate Limiting (우선순위 1)
-            if ip:
-                request_list = self.ip_requests[ip]
-                self._clean_old_requests(request_list, current_time)
-
-                current_count = self._get_request_count(request_list)
-
-                if current_count >= self.ip_limit:
-                    remaining = 0
-                    logger.warning(
-                        f"Rate Limit 초과 (IP): ip={ip}, count={current_count}/{self.ip_limit}"
-                    )
-                    return False, "ip", remaining
-
-                # 요청 기록 추가
-                request_list.append((current_time, 1))
-                remaining = self.ip_limit - (current_count + 1)
-
-                return True, "ip", remaining
-
-            # 🛡️ 메모리 보호: Session 개수 제한 (LRU 방식 제거)
-            if session_id and len(self.session_requests) >= self.max_tracked_sessions:
-                if session_id not in self.session_requests:
-                    # 가장 오래된 세션 제거 (LRU 전략)
-                    oldest_session = min(
-                        self.session_requests.keys(),
-                        key=lambda k: (
-                            self.session_requests[k][0][0]
-                            if self.session_requests[k]
-                            else float("inf")
-                        ),
-                    )
-                    del self.session_requests[oldest_session]
-                    logger.info(
-                        f"🛡️ 메모리 보호: 오래된 세션 제거 (총 {len(self.session_requests)}개)"
-                    )
-
-            # Session 기반 Rate Limiting (fallback)
-            elif session_id:
-                request_list = self.session_requests[session_id]
-                self._clean_old_requests(request_list, current_time)
-
-                current_count = self._get_request_count(request_list)
-
-                if current_count >= self.session_limit:
-                    remaining = 0
-                    logger.warning(
-                        f"Rate Limit 초과 (Session): session_id={session_id}, count={current_count}/{self.session_limit}"
-                    )
-                    return False, "session", remaining
-
-                # 요청 기록 추가
-                request_list.append((current_time, 1))
-                remaining = self.session_limit - (current_count + 1)
-
-                return True, "session", remaining
+        decision = await self.check(ip=ip, session_id=session_id)
+        return decision.allowed, decision.limit_type, decision.remaining
 
-            # IP와 Session 모두 없으면 통과 (안전을 위해)
-            else:
-                logger.warning("Rate Limit 체크 실패: IP와 Session ID 모두 없음")
-                return True, "none", -1
-
-    async def get_stats(self) -> dict[str, int]:
+    async def get_stats(self) -> dict[str, Any]:
         """
         현재 Rate Limiter 상태 통계
 
         Returns:
-            Dict[str, int]: 통계 정보
+            Dict[str, Any]: 통계 정보 (로컬 추적 키 수, 백엔드 상태)
         """
-        async with self.lock:
-            return {
-                "active_ips": len(self.ip_requests),
-                "active_sessions": len(self.session_requests),
-                "total_active": len(self.ip_requests) + len(self.session_requests),
-            }
+        return {
+            "active_ips": len(self.ip_store),
+            "active_sessions": len(self.session_store),
+            "total_active": len(self.ip_store) + len(self.session_store),
+            "evictions": self.ip_store.evictions + self.session_store.evictions,
+            "backend": "redis" if self.redis_client else "memory",
+            "redis_errors": self.redis_errors,
+            "local_fallbacks": self.local_fallbacks,
+        }
 
     async def periodic_cleanup(self):
         """
-        24시간 주기로 오래된 IP/Session 엔트리 제거
+        24시간 주기로 만료된 IP/Session 엔트리 제거
 
-        목적: 메모리 누수 방지
-        - 트래픽 없는 IP/Session의 dict 엔트리가 무한정 누적되는 것 방지
-        - window_seconds + grace_period 이전의 모든 요청 기록 제거
+        목적: 메모리 회수
+        - TAT가 grace_period 이전에 지난 키는 새 요청과 상태가 같으므로 제거
+        - 최대 추적 키 수는 LRU가 요청 경로에서 보장
 
         실행 주기: 24시간 (86400초)
         안전 마진: 60초 추가 (grace_period)
@@ -222,55 +310,19 @@ class RateLimiter:
                 # 24시간 대기
                 await asyncio.sleep(self._cleanup_interval)
 
-                current_time = time.time()
-                cutoff_time = current_time - (self.window_seconds + self._grace_period)
+                cutoff_time = time.time() - self._grace_period
 
                 logger.info("🧹 Starting periodic memory cleanup...")
 
-                async with self.lock:
-                    # IP 엔트리 정리 전 통계
-                    initial_ip_count = len(self.ip_requests)
-                    initial_session_count = len(self.session_requests)
-
-                    # IP 엔트리 정리: 모든 요청이 cutoff_time 이전이면 제거
-                    ips_to_remove = [
-                        ip
-                        for ip, requests in self.ip_requests.items()
-                        if all(timestamp < cutoff_time for timestamp, _ in requests)
-                    ]
-
-                    for ip in ips_to_remove:
-                        del self.ip_requests[ip]
-
-                    # Session 엔트리 정리: 모든 요청이 cutoff_time 이전이면 제거
-                    sessions_to_remove = [
-                        session_id
-                        for session_id, requests in self.session_requests.items()
-                        if all(timestamp < cutoff_time for timestamp, _ in requests)
-                    ]
-
-                    for session_id in sessions_to_remove:
-                        del self.session_requests[session_id]
-
-                    # 정리 후 통계
-                    final_ip_count = len(self.ip_requests)
-                    final_session_count = len(self.session_requests)
-
-                    removed_ips = initial_ip_count - final_ip_count
-                    removed_sessions = initial_session_count - final_session_count
+                removed_ips = self.ip_store.purge_expired(cutoff_time)
+                removed_sessions = self.session_store.purge_expired(cutoff_time)
 
                 logger.info(
                     f"✅ Cleanup completed: "
-                    f"IPs {initial_ip_count}→{final_ip_count} (-{removed_ips}), "
-                    f"Sessions {initial_session_count}→{final_session_count} (-{removed_sessions})"
+                    f"IPs {len(self.ip_store)} (-{removed_ips}), "
+                    f"Sessions {len(self.session_store)} (-{removed_sessions})"
                 )
 
-                if removed_ips > 0 or removed_sessions > 0:
-                    logger.debug(
-                        f"Removed IPs: {ips_to_remove[:10]}{'...' if len(ips_to_remove) > 10 else ''}, "
-                        f"Removed Sessions: {sessions_to_remove[:10]}{'...' if len(sessions_to_remove) > 10 else ''}"
-                    )
-
             except asyncio.CancelledError:
                 logger.info("🛑 Cleanup task cancelled")
                 break
@@ -306,172 +358,215 @@ class RateLimiter:
         else:
             logger.debug("Cleanup task not running or already stopped")
 
+    async def close(self) -> None:
+        """Redis 연결 종료 (lifespan shutdown에서 호출)"""
+        if self.redis_client is not None and hasattr(self.redis_client, "aclose"):
+            await self.redis_client.aclose()
+
+
+def create_rate_limit_redis() -> Any | None:
+    """
+    Rate Limit 공유 저장소용 Redis 클라이언트 생성
+
+    RATE_LIMIT_BACKEND=redis이고 REDIS_URL이 있으면 redis.asyncio 클라이언트를
+    반환합니다 (연결은 첫 요청 시 수립). 그 외에는 None (워커 로컬 한도).
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if os.getenv("RATE_LIMIT_BACKEND", "memory").lower() != "redis" or not redis_url:
+        return None
+
+    try:
+        from redis.asyncio import Redis
+    except ImportError:
+        logger.warning(
+            "Redis 패키지 미설치, Rate Limit은 워커 로컬로 적용",
+            extra={"required_package": "redis"},
+        )
+        return None
+
+    logger.info("Rate Limit 공유 저장소: Redis")
+    return Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+
+# 요청 본문 앞부분에서 session_id 값을 찾는 패턴 (JSON 전체 파싱 없이)
+_SESSION_ID_PATTERN = re.compile(rb'"session_id"\s*:\s*"([^"\\]{1,256})"')
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    FastAPI Rate Limiting Middleware
+    FastAPI Rate Limiting Middleware (순수 ASGI)
 
     특정 경로에 대해 Rate Limiting을 적용합니다.
+    요청 본문은 버퍼링하지 않으며, body_peek_paths에 지정한 경로에서만
+    IP/헤더/쿼리로 식별할 수 없을 때 본문 앞부분(body_peek_bytes)을 읽어 session_id를 찾습니다.
     """
 
-    def __init__(self, app, rate_limiter: RateLimiter, excluded_paths: list[str] | None = None):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limiter: RateLimiter,
+        excluded_paths: list[str] | None = None,
+        body_peek_paths: list[str] | None = None,
+        body_peek_bytes: int = 4096,
+    ):
+        self.app = app
         self.rate_limiter = rate_limiter
 
         # Rate Limiting에서 제외할 경로 (Health Check 등)
-        self.excluded_paths = excluded_paths or [
-            "/health",
-            "/api/health",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-        ]
+        self.excluded_paths = set(
+            excluded_paths
+            or [
+                "/health",
+                "/api/health",
+                "/docs",
+                "/redoc",
+                "/openapi.json",
+            ]
+        )
+
+        # 본문에서 session_id를 찾을 경로 (POST 요청만)
+        self.body_peek_paths = set(body_peek_paths or [])
+        self.body_peek_bytes = body_peek_bytes
 
-        logger.info(f"RateLimitMiddleware 초기화: excluded_paths={self.excluded_paths}")
+        logger.info(
+            f"RateLimitMiddleware 초기화: excluded_paths={sorted(self.excluded_paths)}, "
+            f"body_peek_paths={sorted(self.body_peek_paths)}"
+        )
 
-    def _get_client_ip(self, request: Request) -> str | None:
+    def _get_client_ip(self, headers: Headers, client: tuple[str, int] | None) -> str | None:
         """
         클라이언트 IP 주소 추출
 
         우선순위:
         1. X-Forwarded-For 헤더 (프록시 환경)
         2. X-Real-IP 헤더
-        3. request.client.host (직접 연결)
-
-        Args:
-            request: FastAPI Request 객체
-
-        Returns:
-            Optional[str]: 클라이언트 IP 주소 (없으면 None)
+        3. scope["client"] (직접 연결)
         """
         # X-Forwarded-For 헤더 체크 (프록시 환경)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get("X-Forwarded-For")
         if forwarded_for:
             # 여러 프록시를 거친 경우 첫 번째 IP 사용
             return forwarded_for.split(",")[0].strip()
 
         # X-Real-IP 헤더 체크
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("X-Real-IP")
         if real_ip:
             return real_ip.strip()
 
         # 직접 연결된 클라이언트 IP
-        if request.client:
-            return request.client.host
+        if client:
+            return client[0]
 
         return None
 
-    async def _get_session_id(self, request: Request) -> str | None:
+    def _get_session_id(self, headers: Headers, scope: Scope) -> str | None:
         """
-        Session ID 추출
+        Session ID 추출 (본문 제외)
 
         우선순위:
-        1. Request body의 session_id (POST 요청)
-        2. Query parameter의 session_id (GET 요청)
-        3. X-Session-ID 헤더
-
-        Args:
-            request: FastAPI Request 객체
-
-        Returns:
-            Optional[str]: Session ID (없으면 None)
+        1. X-Session-ID 헤더
+        2. Query parameter의 session_id
         """
-        # 1. 헤더에서 session_id 추출 (가장 빠름)
-        session_id = request.headers.get("X-Session-ID")
-        if session_id:
-            return cast(str | None, session_id)
-
-        # 2. Query parameter에서 session_id 추출
-        session_id = request.query_params.get("session_id")
+        session_id = headers.get("X-Session-ID")
         if session_id:
-            return cast(str | None, session_id)
+            return cast(str, session_id)
 
-        # 3. POST 요청의 경우 body에서 추출
-        if request.method == "POST":
-            try:
-                # body를 읽기 (한 번만 읽을 수 있으므로 주의)
-                body = await request.body()
-
-                # JSON 파싱
-                if body:
-                    import json
-
-                    try:
-                        data = json.loads(body)
-                        session_id = data.get("session_id")
-                        if session_id:
-                            # body를 다시 사용할 수 있도록 복원
-                            async def receive():
-                                return {"type": "http.request", "body": body}
-
-                            request._receive = receive
-                            return cast(str | None, session_id)
-                    except json.JSONDecodeError:
-                        pass
-            except Exception as e:
-                logger.debug(f"Failed to extract session_id from body: {e}")
+        query_string = scope.get("query_string", b"")
+        if b"session_id" in query_string:
+            for key, value in parse_qsl(query_string.decode("latin-1")):
+                if key == "session_id" and value:
+                    return value
 
         return None
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def _peek_session_id(self, receive: Receive) -> tuple[str | None, Receive]:
         """
-        요청 인터셉션 및 Rate Limiting 적용
+        본문 앞부분에서 session_id 추출
 
-        Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 라우트 핸들러
+        body_peek_bytes까지만 읽고, 읽은 메시지는 다운스트림에 그대로 재생합니다.
 
         Returns:
-            Response: FastAPI Response 객체
+            (session_id 또는 None, 재생용 receive)
         """
-        # 제외 경로 체크
-        if request.url.path in self.excluded_paths:
-            return cast(Response, await call_next(request))
+        buffered: list[Message] = []
+        prefix = b""
+        while len(prefix) < self.body_peek_bytes:
+            message = await receive()
+            buffered.append(message)
+            if message["type"] != "http.request":
+                break
+            prefix += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
 
-        # IP와 Session ID 추출
-        client_ip = self._get_client_ip(request)
-        session_id = await self._get_session_id(request)
+        match = _SESSION_ID_PATTERN.search(prefix[: self.body_peek_bytes])
+        session_id = match.group(1).decode("utf-8", "replace") if match else None
+
+        async def replay() -> Message:
+            if buffered:
+                return buffered.pop(0)
+            return await receive()
+
+        return session_id, replay
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        요청 인터셉션 및 Rate Limiting 적용
+        """
+        # 제외 경로 체크
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        # IP와 Session ID 추출 (Session은 IP를 알 수 없을 때만 사용)
+        headers = Headers(scope=scope)
+        client_ip = self._get_client_ip(headers, scope.get("client"))
+        session_id = None
+        if client_ip is None:
+            session_id = self._get_session_id(headers, scope)
+            if (
+                session_id is None
+                and scope["method"] == "POST"
+                and scope["path"] in self.body_peek_paths
+            ):
+                session_id, receive = await self._peek_session_id(receive)
 
         # Rate Limit 체크 (async 메서드 호출)
-        allowed, limit_type, remaining = await self.rate_limiter.check_rate_limit(
-            ip=client_ip, session_id=session_id
-        )
+        decision = await self.rate_limiter.check(ip=client_ip, session_id=session_id)
 
-        if not allowed:
+        if not decision.allowed:
             # Rate Limit 초과
             logger.warning(
-                f"Rate Limit 거부: path={request.url.path}, "
-                f"ip={client_ip}, session_id={session_id}, type={limit_type}"
+                f"Rate Limit 거부: path={scope['path']}, "
+                f"ip={client_ip}, session_id={session_id}, type={decision.limit_type}"
             )
 
-            return JSONResponse(
+            retry_after = max(1, math.ceil(decision.retry_after))
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "Too Many Requests",
                     "message": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
-                    "limit_type": limit_type,
-                    "retry_after": 60,  # 60초 후 재시도
+                    "limit_type": decision.limit_type,
+                    "retry_after": retry_after,
                 },
                 headers={
-                    "Retry-After": "60",
-                    "X-RateLimit-Limit": str(
-                        self.rate_limiter.ip_limit
-                        if limit_type == "ip"
-                        else self.rate_limiter.session_limit
-                    ),
+                    "Retry-After": str(retry_after),
+                    "X-RateLimit-Limit": str(decision.limit),
                     "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(time.time()) + 60),
+                    "X-RateLimit-Reset": str(int(time.time()) + retry_after),
                 },
             )
-
-        # Rate Limit 통과
-        response = await call_next(request)
-
-        # Rate Limit 정보를 응답 헤더에 추가
-        response.headers["X-RateLimit-Limit"] = str(
-            self.rate_limiter.ip_limit if limit_type == "ip" else self.rate_limiter.session_limit
-        )
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Type"] = limit_type
-
-        return cast(Response, response)
+            await response(scope, receive, send)
+            return
+
+        # Rate Limit 통과: 응답 시작 메시지에 한도 정보 헤더 추가
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-RateLimit-Limit"] = str(decision.limit)
+                response_headers["X-RateLimit-Remaining"] = str(decision.remaining)
+                response_headers["X-RateLimit-Type"] = decision.limit_type
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,62 @@
+"""
+Request Logging Middleware for FastAPI
+
+요청마다 메서드, 경로, 상태 코드, 처리 시간을 로깅합니다 (순수 ASGI).
+
+- process_time: 응답 헤더 전송까지 걸린 시간 (스트리밍 응답의 첫 바이트 시점)
+- total_time: 응답 본문 전송 완료까지 걸린 시간
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.lib.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestLoggingMiddleware:
+    """
+    요청 로깅 미들웨어
+
+    send만 얇게 감싸 상태 코드와 헤더 전송 시점을 기록하고, 본문은 그대로 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        process_time: float | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            total_time = time.perf_counter() - start_time
+            if process_time is None:
+                process_time = total_time
+            client = scope.get("client")
+            logger.info(
+                f"{scope['method']} {scope['path']} - {status_code} - {process_time:.3f}s",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "process_time": process_time,
+                    "total_time": total_time,
+                    "client_ip": client[0] if client else None,
+                },
+            )
@@ -196,6 +196,22 @@ class GeminiEmbedder(BaseEmbedder, Embeddings):
             # 오류 발생 시 영벡터 반환
             return [0.0] * self.output_dimensionality
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        여러 쿼리 임베딩 일괄 생성 (RETRIEVAL_QUERY 타입, 배치 API 1회 호출)
+
+        Args:
+            texts: 임베딩할 쿼리 텍스트 리스트
+
+        Returns:
+            L2 정규화된 1536차원 임베딩 벡터 리스트
+        """
+        if not texts:
+            return []
+
+        logger.debug(f"Embedding {len(texts)} queries with task_type=RETRIEVAL_QUERY")
+        return self._batch_embed(texts, "RETRIEVAL_QUERY")
+
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """
         비동기 문서 임베딩 생성
@@ -48,6 +48,22 @@ class IEmbedder(ABC):
         """
         pass
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        여러 쿼리에 대한 임베딩 벡터 일괄 생성 (RETRIEVAL_QUERY 타입)
+
+        Multi-Query 검색에서 확장 쿼리들을 한 번에 벡터화할 때 사용합니다.
+        기본 구현은 embed_query()를 반복 호출하며, 배치 API를 지원하는
+        구현체는 한 번의 호출로 처리하도록 오버라이드합니다.
+
+        Args:
+            texts: 임베딩할 쿼리 텍스트 리스트
+
+        Returns:
+            정규화된 임베딩 벡터 리스트 (입력 순서 유지)
+        """
+        return [self.embed_query(text) for text in texts]
+
     @abstractmethod
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """
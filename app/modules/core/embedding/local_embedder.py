@@ -184,6 +184,21 @@ class LocalEmbedder(BaseEmbedder):
             logger.error(f"❌ 쿼리 임베딩 실패: {e}")
             return [0.0] * self._output_dimensionality
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        여러 쿼리를 한 번의 encode 배치로 임베딩
+
+        로컬 모델은 쿼리/문서 구분이 없으므로 embed_documents()와 동일한
+        배치 경로를 사용합니다.
+
+        Args:
+            texts: 임베딩할 쿼리 텍스트 리스트
+
+        Returns:
+            임베딩 벡터 리스트 (list[list[float]])
+        """
+        return self.embed_documents(texts)
+
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """
         비동기 문서 임베딩 (동기 메서드 래핑)
@@ -205,6 +205,21 @@ class OpenAIEmbedder(BaseEmbedder, Embeddings):
             # 오류 발생 시 영벡터 반환
             return [0.0] * self.output_dimensionality
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        여러 쿼리 임베딩 일괄 생성 (OpenAI Embeddings API 배치 호출)
+
+        Args:
+            texts: 임베딩할 쿼리 텍스트 리스트
+
+        Returns:
+            L2 정규화된 임베딩 벡터 리스트
+        """
+        if not texts:
+            return []
+
+        return self._batch_embed(texts)
+
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """
         비동기 문서 임베딩 생성
@@ -466,6 +481,21 @@ class OpenRouterEmbedder(BaseEmbedder, Embeddings):
             logger.error(f"Error generating query embedding via OpenRouter: {e}")
             return [0.0] * self.output_dimensionality
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        여러 쿼리 임베딩 일괄 생성 (OpenRouter Embeddings API 배치 호출)
+
+        Args:
+            texts: 임베딩할 쿼리 텍스트 리스트
+
+        Returns:
+            L2 정규화된 임베딩 벡터 리스트
+        """
+        if not texts:
+            return []
+
+        return self._batch_embed(texts)
+
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """
         비동기 문서 임베딩 생성
@@ -0,0 +1,486 @@
+"""
+답변 캐시 (Answer-level response cache)
+
+FAQ처럼 거의 같은 질문이 반복되면 검색 캐시가 적중해도 리랭킹, LLM 생성,
+Self-RAG 검증 비용을 매번 다시 지불합니다. 이 모듈은 최종 답변을 캐시해
+검색 직후 바로 응답합니다 (opt-in, cache.yaml의 answer_cache.enabled).
+
+캐시 키:
+- 정규화된 질문 (NFKC, 대소문자/공백/끝 문장부호 정규화)
+- 검색된 문서 지문 (문서 ID + 본문 해시) - 원본 문서가 바뀌면 지문도 바뀜
+- 프롬프트 버전 (GenerationModule.get_prompt_version)
+
+정확히 일치하는 질문이 없으면 같은 문서 지문 + 프롬프트 버전 그룹 안에서만
+질문 임베딩 코사인 유사도로 비교합니다 (임베딩은 후보가 있을 때만 계산).
+
+무효화:
+- 문서 재적재/삭제 시 invalidate_sources()로 해당 원본을 참조하는 답변 제거
+- 다른 워커에서 재적재된 경우에도 문서 지문(본문 해시)이 달라져 적중하지 않음
+- TTL 만료 + LRU (max_entries)
+
+출처(origin):
+- 답변마다 생성 경로("chat" | "stream")를 기록합니다. /chat/stream 답변은
+  Self-RAG 검증을 거치지 않으므로, Self-RAG가 켜진 /chat은
+  exclude_origins={"stream"}으로 조회해 검증되지 않은 답변을 받지 않습니다.
+
+사용 예시:
+    lookup = await answer_cache.lookup(query, documents, prompt_version)
+    if lookup.hit:
+        return lookup.entry.answer
+    ...
+    await answer_cache.store(lookup, answer, payload, origin="chat")
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, fields
+from typing import Any
+
+import numpy as np
+
+from ....lib.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 원본 문서를 식별하는 메타데이터 키 (재적재 시 무효화 대상)
+SOURCE_METADATA_KEYS = (
+    "source_file",
+    "source_url",
+    "source",
+    "source_id",
+    "document_id",
+    "notion_page_id",
+)
+
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.~？！。…]+$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class AnswerCacheConfig:
+    """답변 캐시 설정"""
+
+    enabled: bool = False
+    max_entries: int = 1000
+    ttl_seconds: int = 3600
+    semantic_enabled: bool = True
+    similarity_threshold: float = 0.95
+    skip_with_session_context: bool = True  # 대화 기록에 의존하는 답변은 캐시하지 않음
+    replay_chunk_chars: int = 24  # 스트리밍 재생 시 청크 크기 (문자 수)
+    replay_delay: float = 0.0  # 스트리밍 재생 시 청크 간 지연 (초)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "AnswerCacheConfig":
+        """설정 딕셔너리 → AnswerCacheConfig (알 수 없는 키는 무시)"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known and v is not None})
+
+
+@dataclass
+class CachedAnswer:
+    """캐시된 최종 답변"""
+
+    answer: str
+    payload: dict[str, Any]  # sources, model_info, topic 등 응답 재구성용 값
+    query: str  # 정규화된 질문
+    group: str  # 문서 지문 + 프롬프트 버전
+    source_keys: frozenset[str]
+    created_at: float
+    origin: str = "chat"  # 생성 경로 ("chat" | "stream")
+    embedding: np.ndarray | None = None
+    hits: int = 0
+
+
+@dataclass
+class AnswerCacheLookup:
+    """조회 결과 (미스면 그대로 store()에 넘겨 저장)"""
+
+    key: str
+    group: str
+    normalized_query: str
+    source_keys: frozenset[str]
+    exclude_origins: frozenset[str] = frozenset()
+    entry: CachedAnswer | None = None
+    match: str | None = None  # "exact" | "semantic"
+    similarity: float | None = None
+    embedding: np.ndarray | None = None
+
+    @property
+    def hit(self) -> bool:
+        return self.entry is not None
+
+    def describe(self) -> dict[str, Any]:
+        """응답/이벤트에 포함할 캐시 적중 정보"""
+        if self.entry is None:
+            return {"hit": False}
+        return {
+            "hit": True,
+            "match": self.match,
+            "similarity": round(self.similarity, 4) if self.similarity is not None else None,
+            "age_seconds": round(time.time() - self.entry.created_at, 1),
+        }
+
+
+def normalize_query(query: str) -> str:
+    """질문 정규화 (NFKC, 소문자, 공백 축약, 끝 문장부호 제거)"""
+    text = unicodedata.normalize("NFKC", query).casefold()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def _doc_field(doc: Any, name: str) -> Any:
+    if isinstance(doc, dict):
+        return doc.get(name)
+    return getattr(doc, name, None)
+
+
+def _doc_metadata(doc: Any) -> dict[str, Any]:
+    metadata = _doc_field(doc, "metadata")
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _doc_content(doc: Any) -> str:
+    content = _doc_field(doc, "content")
+    if content is None:
+        content = _doc_field(doc, "page_content")
+    return str(content or "")
+
+
+def document_fingerprint(documents: Iterable[Any]) -> str:
+    """검색 문서 지문 (문서 ID + 본문 해시, 순서 무관)"""
+    parts = sorted(
+        f"{_doc_field(doc, 'id') or ''}:"
+        f"{hashlib.sha256(_doc_content(doc).encode('utf-8')).hexdigest()[:16]}"
+        for doc in documents
+    )
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def document_source_keys(documents: Iterable[Any]) -> frozenset[str]:
+    """문서가 참조하는 원본 식별자 (문서 ID + 원본 메타데이터 값)"""
+    keys: set[str] = set()
+    for doc in documents:
+        doc_id = _doc_field(doc, "id")
+        if doc_id:
+            keys.add(str(doc_id))
+        metadata = _doc_metadata(doc)
+        for name in SOURCE_METADATA_KEYS:
+            value = metadata.get(name)
+            if value:
+                keys.add(str(value))
+    return frozenset(keys)
+
+
+def split_for_replay(text: str, chunk_chars: int) -> list[str]:
+    """답변을 단어 경계 기준 청크로 분할 (이어 붙이면 원문과 동일)"""
+    chunks: list[str] = []
+    current = ""
+    for token in re.findall(r"\S+\s*|\s+", text):
+        current += token
+        if len(current) >= max(1, chunk_chars):
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """
+    In-memory 최종 답변 캐시 (LRU + TTL)
+
+    에러 시 예외를 전파하지 않고 미스로 처리합니다.
+    """
+
+    def __init__(self, config: AnswerCacheConfig, embedder: Any | None = None) -> None:
+        """
+        Args:
+            config: 답변 캐시 설정
+            embedder: 질문 임베딩 (embed_query/aembed_query 또는 호출 가능 객체, 선택)
+        """
+        self.config = config
+        self.embedder = embedder
+        self._entries: OrderedDict[str, CachedAnswer] = OrderedDict()
+        self._stats = {
+            "lookups": 0,
+            "hits": 0,
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "origin_rejected": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "expired": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "embedder_errors": 0,
+            "tokens_saved": 0,
+        }
+
+        logger.info(
+            "AnswerCache 초기화",
+            enabled=config.enabled,
+            max_entries=config.max_entries,
+            ttl_seconds=config.ttl_seconds,
+            semantic=config.semantic_enabled and embedder is not None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def bypass_reason(self, documents: list[Any], session_context: str | None) -> str | None:
+        """캐시를 사용하지 않아야 하는 이유 (사용 가능하면 None)"""
+        if not self.config.enabled:
+            return "disabled"
+        if not documents:
+            return "no_documents"
+        if session_context and self.config.skip_with_session_context:
+            return "session_context"
+        return None
+
+    def record_bypass(self, reason: str) -> None:
+        self._stats["bypassed"] += 1
+        logger.debug("답변 캐시 우회", reason=reason)
+
+    async def lookup(
+        self,
+        query: str,
+        documents: list[Any],
+        prompt_version: str,
+        exclude_origins: Iterable[str] = (),
+    ) -> AnswerCacheLookup:
+        """
+        정확 일치 → 같은 그룹 내 시맨틱 유사도 순으로 캐시 조회
+
+        Args:
+            query: 사용자 질문 (원문)
+            documents: 검색된 문서 (리랭킹 전)
+            prompt_version: 프롬프트 버전 해시
+            exclude_origins: 받지 않을 생성 경로 (예: Self-RAG가 켜진 /chat은 {"stream"})
+
+        Returns:
+            AnswerCacheLookup (hit이면 entry 포함)
+        """
+        normalized = normalize_query(query)
+        group = _hash(f"{document_fingerprint(documents)}|{prompt_version}")
+        lookup = AnswerCacheLookup(
+            key=_hash(f"{group}|{normalized}"),
+            group=group,
+            normalized_query=normalized,
+            source_keys=document_source_keys(documents),
+            exclude_origins=frozenset(exclude_origins),
+        )
+        if not self.config.enabled:
+            return lookup
+
+        self._stats["lookups"] += 1
+        try:
+            entry = self._get(lookup.key)
+            if entry is not None:
+                if entry.origin not in lookup.exclude_origins:
+                    return self._record_hit(lookup, entry, "exact", 1.0)
+                self._stats["origin_rejected"] += 1
+
+            if self.config.semantic_enabled and self.embedder is not None:
+                match = await self._find_similar(lookup)
+                if match is not None:
+                    return self._record_hit(lookup, *match)
+        except Exception as e:
+            logger.warning("답변 캐시 조회 오류", error=str(e))
+
+        self._stats["misses"] += 1
+        return lookup
+
+    async def store(
+        self,
+        lookup: AnswerCacheLookup,
+        answer: str,
+        payload: dict[str, Any],
+        origin: str = "chat",
+    ) -> None:
+        """
+        미스였던 조회 결과에 최종 답변 저장
+
+        Args:
+            lookup: lookup()이 돌려준 미스 결과
+            answer: 최종 답변
+            payload: 응답 재구성용 값 (sources, model_info 등)
+            origin: 생성 경로 ("chat" | "stream")
+        """
+        if not self.config.enabled or lookup.hit or not answer.strip():
+            return
+
+        self._entries[lookup.key] = CachedAnswer(
+            answer=answer,
+            payload=payload,
+            query=lookup.normalized_query,
+            group=lookup.group,
+            source_keys=lookup.source_keys,
+            created_at=time.time(),
+            origin=origin,
+            embedding=lookup.embedding,
+        )
+        self._entries.move_to_end(lookup.key)
+        while len(self._entries) > max(1, self.config.max_entries):
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        self._stats["stores"] += 1
+        logger.debug("답변 캐시 저장", query=lookup.normalized_query[:30], origin=origin)
+
+    def invalidate_sources(self, source_keys: Iterable[str]) -> int:
+        """
+        원본 문서를 참조하는 캐시 답변 제거 (문서 재적재/삭제 시 호출)
+
+        Args:
+            source_keys: 문서 ID, source_file, source_url 등 원본 식별자
+
+        Returns:
+            제거된 답변 수
+        """
+        keys = {str(key) for key in source_keys if key}
+        if not keys:
+            return 0
+
+        stale = [k for k, entry in self._entries.items() if entry.source_keys & keys]
+        for key in stale:
+            del self._entries[key]
+        self._stats["invalidations"] += len(stale)
+
+        if stale:
+            logger.info("답변 캐시 무효화", sources=sorted(keys)[:10], removed=len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        """모든 캐시 답변 제거"""
+        self._stats["invalidations"] += len(self._entries)
+        self._entries.clear()
+        logger.info("답변 캐시 전체 클리어")
+
+    async def replay(self, answer: str) -> AsyncIterator[str]:
+        """캐시된 답변을 합성 토큰 스트림으로 재생"""
+        for chunk in split_for_replay(answer, self.config.replay_chunk_chars):
+            if self.config.replay_delay > 0:
+                await asyncio.sleep(self.config.replay_delay)
+            yield chunk
+
+    def get_stats(self) -> dict[str, Any]:
+        """적중률 / 무효화 / 절약 토큰 통계"""
+        lookups = self._stats["lookups"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "current_size": len(self._entries),
+            "config": {
+                "enabled": self.config.enabled,
+                "semantic_enabled": self.config.semantic_enabled and self.embedder is not None,
+                "similarity_threshold": self.config.similarity_threshold,
+                "max_entries": self.config.max_entries,
+                "ttl_seconds": self.config.ttl_seconds,
+            },
+        }
+
+    # ========================================
+    # Private 메서드
+    # ========================================
+
+    def _get(self, key: str) -> CachedAnswer | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            del self._entries[key]
+            self._stats["expired"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _is_expired(self, entry: CachedAnswer) -> bool:
+        return time.time() - entry.created_at > self.config.ttl_seconds
+
+    async def _find_similar(
+        self, lookup: AnswerCacheLookup
+    ) -> tuple[CachedAnswer, str, float] | None:
+        """같은 문서 지문 + 프롬프트 버전 그룹에서 가장 유사한 질문 검색"""
+        candidates = [
+            (key, entry)
+            for key, entry in list(self._entries.items())
+            if entry.group == lookup.group
+            and entry.origin not in lookup.exclude_origins
+            and not self._is_expired(entry)
+        ]
+        if not candidates:
+            return None
+
+        lookup.embedding = await self._embed(lookup.normalized_query)
+        if lookup.embedding is None:
+            return None
+
+        best: tuple[str, CachedAnswer] | None = None
+        best_similarity = 0.0
+        for key, entry in candidates:
+            if entry.embedding is None:
+                entry.embedding = await self._embed(entry.query)
+                if entry.embedding is None:
+                    continue
+            similarity = _cosine_similarity(lookup.embedding, entry.embedding)
+            if similarity >= self.config.similarity_threshold and similarity > best_similarity:
+                best, best_similarity = (key, entry), similarity
+
+        if best is None or best[0] not in self._entries:
+            return None
+        self._entries.move_to_end(best[0])
+        return best[1], "semantic", best_similarity
+
+    def _record_hit(
+        self, lookup: AnswerCacheLookup, entry: CachedAnswer, match: str, similarity: float
+    ) -> AnswerCacheLookup:
+        lookup.entry = entry
+        lookup.match = match
+        lookup.similarity = similarity
+        entry.hits += 1
+        self._stats["hits"] += 1
+        self._stats[f"{match}_hits"] += 1
+        self._stats["tokens_saved"] += int(entry.payload.get("tokens_used") or 0)
+        logger.info(
+            "답변 캐시 히트",
+            match=match,
+            similarity=round(similarity, 4),
+            query=lookup.normalized_query[:30],
+        )
+        return lookup
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        if self.embedder is None:
+            return None
+        try:
+            if hasattr(self.embedder, "aembed_query"):
+                vector = await self.embedder.aembed_query(text)
+            elif hasattr(self.embedder, "embed_query"):
+                vector = await asyncio.to_thread(self.embedder.embed_query, text)
+            else:
+                vector = self.embedder(text)  # type: ignore[misc]
+                if hasattr(vector, "__await__"):
+                    vector = await vector
+            return np.asarray(vector, dtype=np.float32)
+        except Exception as e:
+            self._stats["embedder_errors"] += 1
+            logger.warning("답변 캐시 임베딩 생성 오류", error=str(e))
+            return None
+
+
+def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+    if norm == 0.0 or a.shape != b.shape:
+        return 0.0
+    return float(np.dot(a, b) / norm)
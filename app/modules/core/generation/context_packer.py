@@ -0,0 +1,386 @@
+"""
+토큰 예산 기반 컨텍스트 패킹
+
+GenerationModule이 검색 문서를 프롬프트 컨텍스트로 합칠 때,
+고정 개수(상위 5개) 대신 모델별 토큰 예산을 채우도록 문서를 고릅니다.
+
+동작:
+1. 청크별 토큰 수 계산 (tiktoken, 청크 해시별 LRU 캐시)
+2. MMR 방식 선택: 검색 순위(관련도)와 출처 중복 페널티를 함께 고려
+3. 청크별 상한(max_chunk_tokens) 또는 남은 예산을 넘는 청크는 문장 경계에서 자름
+4. 예산이 소진되거나 max_documents에 도달하면 종료
+
+tiktoken 인코딩은 최초 로드 시 BPE 파일을 네트워크로 내려받을 수 있으므로
+요청 경로에서는 로드하지 않습니다. 애플리케이션 시작 시 preload_encoding()으로
+스레드에서 제한 시간 안에 불러오고, 로드 전이거나 실패한 환경(오프라인 등)에서는
+보수적인 문자 수 기반 추정으로 대체합니다.
+"""
+
+import asyncio
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from ....lib.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 문장 경계: 종결 부호 뒤 공백 또는 줄바꿈
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。？！])\s+|\n+")
+
+# 출처 판별에 사용하는 메타데이터 키 (우선순위 순)
+_SOURCE_KEYS = ("source_file", "source", "doc_id", "url", "title")
+
+# 인코딩 이름 → tiktoken 인코딩 (로드 실패 시 None)
+_encodings: dict[str, Any] = {}
+_encodings_lock = threading.Lock()
+
+
+def _fetch_encoding(name: str) -> Any | None:
+    """tiktoken 인코딩 로드 (블로킹, 최초 1회 BPE 파일 다운로드 가능)"""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩 '{name}' 로드 실패, 문자 수 기반 추정 사용: {e}")
+        encoding = None
+    with _encodings_lock:
+        _encodings[name] = encoding
+    return encoding
+
+
+def _load_encoding(name: str) -> Any | None:
+    """로드된 tiktoken 인코딩 조회 (여기서는 로드하지 않음, 없으면 None)"""
+    return _encodings.get(name)
+
+
+async def preload_encoding(name: str, timeout: float = 10.0) -> bool:
+    """
+    tiktoken 인코딩 사전 로드 (애플리케이션 시작 시)
+
+    이벤트 루프를 막지 않도록 스레드에서 로드하고 timeout초까지만 기다립니다.
+    시간을 넘기면 로드는 스레드에서 계속되어 끝나는 대로 쓰이고, 그 전까지는
+    문자 수 기반으로 추정합니다.
+
+    Args:
+        name: tiktoken 인코딩 이름
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        인코딩 사용 가능 여부
+    """
+    if name in _encodings:
+        return _encodings[name] is not None
+    try:
+        encoding = await asyncio.wait_for(asyncio.to_thread(_fetch_encoding, name), timeout)
+    except TimeoutError:
+        logger.warning(
+            f"tiktoken 인코딩 '{name}' 로드가 {timeout}초를 넘김, 로드 전까지 문자 수 기반 추정 사용"
+        )
+        return False
+    return encoding is not None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    문자 수 기반 토큰 추정 (보수적)
+
+    ASCII는 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+class TokenCounter:
+    """
+    청크 해시별 캐시를 가진 토큰 카운터
+
+    같은 청크가 여러 요청에서 반복 검색되므로 해시 → 토큰 수를 LRU로 보관합니다.
+    """
+
+    def __init__(
+        self,
+        encoding_name: str = "o200k_base",
+        cache_size: int = 10000,
+        load_timeout: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            encoding_name: tiktoken 인코딩 이름
+            cache_size: 캐시할 최대 청크 수
+            load_timeout: preload()에서 인코딩 로드를 기다리는 최대 시간 (초)
+        """
+        self.encoding_name = encoding_name
+        self.load_timeout = load_timeout
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def preload(self) -> bool:
+        """인코딩 사전 로드 (GenerationModule.initialize에서 호출)"""
+        return await preload_encoding(self.encoding_name, self.load_timeout)
+
+    def _encode_len(self, text: str) -> int:
+        encoding = _load_encoding(self.encoding_name)
+        if encoding is None:
+            return estimate_tokens(text)
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count(self, text: str, use_cache: bool = True) -> int:
+        """
+        텍스트 토큰 수
+
+        Args:
+            text: 대상 텍스트
+            use_cache: False면 캐시를 조회/저장하지 않음 (잘라낸 중간 결과 등)
+        """
+        if not text:
+            return 0
+        if not use_cache:
+            return self._encode_len(text)
+
+        # 추정치와 실제 토큰 수가 섞이지 않도록 토크나이저 종류를 키에 포함
+        mode = "t" if _load_encoding(self.encoding_name) is not None else "e"
+        key = f"{mode}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        tokens = self._encode_len(text)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = tokens
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "encoding": self.encoding_name,
+            "tokenizer": "tiktoken" if _load_encoding(self.encoding_name) else "estimate",
+            "cached_chunks": len(self._cache),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+        }
+
+
+@dataclass
+class PackedContext:
+    """
+    컨텍스트 패킹 결과
+
+    Attributes:
+        text: 프롬프트에 들어갈 컨텍스트 텍스트
+        documents: 선택된 문서 (선택 순서)
+        tokens_before: 전달된 모든 문서를 그대로 합쳤을 때의 토큰 수
+        tokens_after: 패킹된 컨텍스트 토큰 수
+        budget_tokens: 적용된 토큰 예산
+        trimmed_count: 문장 경계에서 잘린 청크 수
+    """
+
+    text: str
+    documents: list[Any] = field(default_factory=list)
+    tokens_before: int = 0
+    tokens_after: int = 0
+    budget_tokens: int = 0
+    trimmed_count: int = 0
+
+
+def extract_content(doc: Any) -> str:
+    """문서 객체/딕셔너리/문자열에서 본문 추출"""
+    if hasattr(doc, "content"):
+        return str(doc.content or "")
+    if hasattr(doc, "page_content"):
+        return str(doc.page_content or "")
+    if isinstance(doc, dict):
+        return str(doc.get("content", "") or "")
+    if isinstance(doc, str):
+        return doc
+    return ""
+
+
+def _source_key(doc: Any, index: int) -> str:
+    """출처 키 (같은 문서에서 나온 청크 판별용, 없으면 문서별 고유)"""
+    metadata = doc.get("metadata", {}) if isinstance(doc, dict) else getattr(doc, "metadata", None)
+    if isinstance(metadata, dict):
+        for key in _SOURCE_KEYS:
+            value = metadata.get(key)
+            if value:
+                return f"{key}:{value}"
+    return f"#{index}"
+
+
+def _format_part(number: int, content: str) -> str:
+    return f"[문서 {number}]\n{content}\n"
+
+
+class ContextPacker:
+    """
+    모델별 토큰 예산을 채우는 컨텍스트 패커
+
+    검색 결과는 관련도 순으로 정렬되어 전달된다고 가정하며,
+    순위 기반 관련도(1 → 0)와 출처 중복 페널티로 MMR 점수를 계산합니다.
+    """
+
+    def __init__(
+        self,
+        token_counter: TokenCounter | None = None,
+        default_budget_tokens: int = 6000,
+        model_budgets: dict[str, int] | None = None,
+        max_documents: int = 10,
+        max_chunk_tokens: int = 1200,
+        min_chunk_tokens: int = 64,
+        diversity_lambda: float = 0.7,
+    ) -> None:
+        """
+        Args:
+            token_counter: 토큰 카운터 (None이면 기본 인코딩으로 생성)
+            default_budget_tokens: 모델별 예산이 없을 때의 컨텍스트 토큰 예산
+            model_budgets: 모델 ID → 컨텍스트 토큰 예산
+            max_documents: 최대 문서 수
+            max_chunk_tokens: 청크 1개의 최대 토큰 수 (초과분은 문장 경계에서 자름)
+            min_chunk_tokens: 잘라서 넣을 때 최소 토큰 수 (미만이면 넣지 않음)
+            diversity_lambda: 관련도 가중치 (1.0=순위만, 낮을수록 출처 다양성 우선)
+        """
+        self.token_counter = token_counter or TokenCounter()
+        self.default_budget_tokens = default_budget_tokens
+        self.model_budgets = dict(model_budgets or {})
+        self.max_documents = max_documents
+        self.max_chunk_tokens = max_chunk_tokens
+        self.min_chunk_tokens = min_chunk_tokens
+        self.diversity_lambda = diversity_lambda
+
+    @classmethod
+    def from_config(
+        cls, packing_config: dict[str, Any], models_config: dict[str, Any] | None = None
+    ) -> "ContextPacker":
+        """
+        generation.context_packing 설정으로 생성
+
+        모델별 예산은 generation.models.<모델>.context_budget_tokens에서 읽습니다.
+        """
+        model_budgets = {
+            model: int(cfg["context_budget_tokens"])
+            for model, cfg in (models_config or {}).items()
+            if isinstance(cfg, dict) and cfg.get("context_budget_tokens")
+        }
+        return cls(
+            token_counter=TokenCounter(
+                encoding_name=packing_config.get("encoding", "o200k_base"),
+                cache_size=int(packing_config.get("token_cache_size", 10000)),
+                load_timeout=float(packing_config.get("encoding_load_timeout", 10.0)),
+            ),
+            default_budget_tokens=int(packing_config.get("default_budget_tokens", 6000)),
+            model_budgets=model_budgets,
+            max_documents=int(packing_config.get("max_documents", 10)),
+            max_chunk_tokens=int(packing_config.get("max_chunk_tokens", 1200)),
+            min_chunk_tokens=int(packing_config.get("min_chunk_tokens", 64)),
+            diversity_lambda=float(packing_config.get("diversity_lambda", 0.7)),
+        )
+
+    def budget_for(self, model: str | None) -> int:
+        """모델별 컨텍스트 토큰 예산"""
+        if model and model in self.model_budgets:
+            return self.model_budgets[model]
+        return self.default_budget_tokens
+
+    def pack(
+        self, documents: list[Any], model: str | None = None, budget_tokens: int | None = None
+    ) -> PackedContext:
+        """
+        문서를 토큰 예산 안에서 선택/정리하여 컨텍스트 구성
+
+        Args:
+            documents: 관련도 순 검색 결과
+            model: 모델 ID (예산 조회용)
+            budget_tokens: 예산 직접 지정 (None이면 모델별 예산)
+
+        Returns:
+            PackedContext
+        """
+        budget = budget_tokens if budget_tokens is not None else self.budget_for(model)
+        candidates = []
+        tokens_before = 0
+        for index, doc in enumerate(documents):
+            content = extract_content(doc).strip()
+            if not content:
+                continue
+            tokens = self.token_counter.count(content)
+            tokens_before += tokens
+            candidates.append((index, doc, content, tokens, _source_key(doc, index)))
+
+        result = PackedContext(text="", tokens_before=tokens_before, budget_tokens=budget)
+        if not candidates:
+            return result
+
+        total = len(candidates)
+        relevance = {c[0]: 1.0 - position / total for position, c in enumerate(candidates)}
+        source_counts: dict[str, int] = {}
+        parts: list[str] = []
+        remaining = budget
+
+        while candidates and len(parts) < self.max_documents and remaining > 0:
+            # MMR: λ·관련도 - (1-λ)·출처 중복도 (이미 선택된 같은 출처 비율)
+            def mmr(candidate: tuple[int, Any, str, int, str]) -> float:
+                seen = source_counts.get(candidate[4], 0)
+                redundancy = seen / (seen + 1)
+                return (
+                    self.diversity_lambda * relevance[candidate[0]]
+                    - (1 - self.diversity_lambda) * redundancy
+                )
+
+            best = max(candidates, key=mmr)
+            candidates.remove(best)
+            _, doc, content, tokens, source = best
+
+            header_tokens = self.token_counter.count(_format_part(len(parts) + 1, ""))
+            limit = min(self.max_chunk_tokens, remaining - header_tokens)
+            if tokens > limit:
+                if limit < self.min_chunk_tokens and parts:
+                    # 남은 예산으로는 의미 있는 분량을 넣을 수 없음 → 더 짧은 후보 탐색
+                    # (첫 문서는 컨텍스트가 비지 않도록 예산이 작아도 잘라서 포함)
+                    continue
+                content = self._trim_to_tokens(content, limit)
+                if not content:
+                    continue
+                tokens = self.token_counter.count(content, use_cache=False)
+                result.trimmed_count += 1
+
+            parts.append(_format_part(len(parts) + 1, content))
+            result.documents.append(doc)
+            source_counts[source] = source_counts.get(source, 0) + 1
+            remaining -= tokens + header_tokens
+
+        result.text = "\n".join(parts)
+        result.tokens_after = self.token_counter.count(result.text, use_cache=False)
+        return result
+
+    def _trim_to_tokens(self, text: str, limit: int) -> str:
+        """문장 경계에서 limit 토큰 이하로 자름 (첫 문장도 넘치면 문자 단위로 자름)"""
+        sentences = [s for s in _SENTENCE_BOUNDARY.split(text) if s.strip()]
+        kept: list[str] = []
+        used = 0
+        for sentence in sentences:
+            sentence_tokens = self.token_counter.count(sentence, use_cache=False) + 1
+            if used + sentence_tokens > limit:
+                break
+            kept.append(sentence)
+            used += sentence_tokens
+        if kept:
+            return " ".join(kept)
+
+        # 첫 문장이 예산보다 긴 경우: 비율로 자른 뒤 예산 안으로 들어올 때까지 축소
+        cut = text[: max(1, len(text) * limit // max(1, self.token_counter.count(text)))]
+        while cut and self.token_counter.count(cut, use_cache=False) > limit:
+            cut = cut[: int(len(cut) * 0.9)]
+        return cut
@@ -16,9 +16,10 @@ Phase 2 구현 (2025-11-28):
 """
 
 import asyncio
+import hashlib
 import os
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass
 from typing import Any, TypedDict, cast
 
@@ -26,8 +27,19 @@ import httpx
 from openai import OpenAI
 
 from ....lib.errors import ErrorCode, GenerationError
+from ....lib.hedging import AllCandidatesFailedError, HedgingPolicy, LatencyTracker, hedged_call
 from ....lib.logger import get_logger
 from ....lib.prompt_sanitizer import escape_xml, sanitize_for_prompt
+from ....lib.stream_bridge import aiterate, run_in_stream_executor
+from ....lib.usage_accounting import UsageAccountant, UsageAccountingConfig, UsageRecord
+from .answer_cache import AnswerCache, AnswerCacheConfig
+from .context_packer import ContextPacker, PackedContext, extract_content
+from .prompt_cache import (
+    PromptCachePolicy,
+    extract_cached_tokens,
+    extract_completion_tokens,
+    extract_prompt_tokens,
+)
 from .prompt_manager import PromptManager
 
 logger = get_logger(__name__)
@@ -47,6 +59,11 @@ class Stats(TypedDict):
     average_generation_time: float
     fallback_count: int
     error_count: int
+    context_tokens_before: int  # 검색 문서를 그대로 합쳤을 때의 누적 토큰 수
+    context_tokens_after: int  # 토큰 예산 패킹 후 누적 토큰 수
+    context_chunks_trimmed: int
+    prompt_tokens: int  # 응답 usage 기준 누적 입력 토큰 수
+    cached_prompt_tokens: int  # 그중 제공자 프롬프트 캐시에서 읽은 토큰 수
 
 
 @dataclass
@@ -66,6 +83,11 @@ class GenerationResult:
     refusal_reason: str | None = None  # "quality_too_low" | None
     quality_score: float | None = None  # 0.0-1.0
 
+    # 프롬프트 캐시에서 읽은 입력 토큰 수 (제공자가 보고한 경우)
+    cached_tokens: int = 0
+    # 응답 usage 기준 입력 토큰 수 (통계는 헤지 승자 결과만 누적)
+    prompt_tokens: int = 0
+
     def __post_init__(self) -> None:
         if not self.text:
             self.text = self.answer
@@ -100,6 +122,10 @@ class GenerationModule:
         config: dict[str, Any],
         prompt_manager: PromptManager,
         privacy_masker: Any | None = None,  # Phase 2: 개인정보 마스킹
+        embedder: Any | None = None,  # 답변 캐시 시맨틱 매칭용 질문 임베딩
+        usage_store: Any | None = None,  # 사용량 집계 공유 저장소 (None이면 워커 로컬)
+        answer_cache: AnswerCache | None = None,  # DI 컨테이너 공유 답변 캐시 (None이면 자체 생성)
+        usage_accountant: UsageAccountant | None = None,  # DI 컨테이너 공유 사용량 집계기
     ):
         self.config = config
         self.gen_config = config.get("generation", {})
@@ -141,6 +167,38 @@ class GenerationModule:
             "auto_fallback", self.gen_config.get("auto_fallback", True)
         )
 
+        # 헤지 요청 + 지연 시간 기반 폴백 순서 (모델별 롤링 지연 시간)
+        self.hedging = HedgingPolicy.from_dict(self.gen_config.get("hedging"))
+        self.latency_tracker = LatencyTracker(self.hedging)
+
+        # 토큰 예산 기반 컨텍스트 패킹 (비활성화 시 상위 5개 문서 전체 사용)
+        packing_config = self.gen_config.get("context_packing", {})
+        self._context_packing_enabled = packing_config.get("enabled", True)
+        self.context_packer = ContextPacker.from_config(packing_config, self.models_config)
+
+        # 프롬프트 프리픽스 캐싱 (시스템 프롬프트를 제공자 캐시에 재사용)
+        self.prompt_cache = PromptCachePolicy.from_config(
+            self.gen_config.get("prompt_caching", {})
+        )
+
+        # 반복 질문 최종 답변 캐시 (opt-in, RAGPipeline/ChatService가 조회하고 문서 적재 시 무효화)
+        if answer_cache is None:
+            answer_cache_config = AnswerCacheConfig.from_dict(config.get("answer_cache"))
+            answer_cache = AnswerCache(
+                answer_cache_config,
+                embedder=embedder if answer_cache_config.semantic_enabled else None,
+            )
+        self.answer_cache = answer_cache
+
+        # 요청별 토큰/비용 사용량 집계 (라우트 × 모델, 워커별 카운터 → 공유 저장소 플러시)
+        # 플러시 루프 시작/중지는 주입 여부와 관계없이 initialize()/destroy()가 담당
+        if usage_accountant is None:
+            usage_accountant = UsageAccountant(
+                UsageAccountingConfig.from_dict(self.gen_config.get("usage_accounting")),
+                store=usage_store,
+            )
+        self.usage = usage_accountant
+
         # OpenRouter 클라이언트 (아직 초기화 안됨)
         self.client: OpenAI | None = None
 
@@ -152,6 +210,11 @@ class GenerationModule:
             "average_generation_time": 0.0,
             "fallback_count": 0,
             "error_count": 0,
+            "context_tokens_before": 0,
+            "context_tokens_after": 0,
+            "context_chunks_trimmed": 0,
+            "prompt_tokens": 0,
+            "cached_prompt_tokens": 0,
         }
 
         # Phase 2: 개인정보 마스킹 통계 (별도 관리)
@@ -177,6 +240,12 @@ class GenerationModule:
         else:
             self._initialize_openrouter_client()
 
+        # 사용량 공유 저장소 플러시 루프
+        self.usage.start()
+
+        # 토큰 카운터 인코딩 사전 로드 (요청 경로에서 BPE 다운로드로 루프가 막히지 않도록)
+        await self.context_packer.token_counter.preload()
+
         # Phase 2: 개인정보 마스킹 상태 로그
         privacy_status = "enabled" if self._privacy_enabled else "disabled"
         timeout = self.provider_config.get("timeout", 120)
@@ -243,6 +312,7 @@ class GenerationModule:
 
     async def destroy(self) -> None:
         """모듈 정리"""
+        await self.usage.stop()
         self.client = None
         logger.info("GenerationModule 종료 완료")
 
@@ -303,38 +373,57 @@ class GenerationModule:
             if m not in seen:
                 seen.add(m)
                 unique_models.append(m)
-        models_to_try = unique_models
-
-        last_error = None
-
-        for model in models_to_try:
-            try:
-                logger.debug(f"🔄 모델 시도: {model}")
-
-                result = await self._generate_with_model(
-                    model=model, query=query, context_documents=context_documents, options=options
-                )
-
-                # 생성 시간 계산
-                generation_time = time.time() - start_time
-                result.generation_time = generation_time
+        # 요청 모델은 고정, fallback은 최근 에러율/지연 시간 순으로 재정렬
+        models_to_try = self.latency_tracker.order(unique_models, pin_first=True)
+
+        # 컨텍스트는 헤지 호출 밖에서 토큰 예산별 1회만 구성 (패킹 통계는 승자 기준으로 누적)
+        packed_contexts: dict[int | None, tuple[str, PackedContext | None]] = {}
+
+        def context_for(model: str) -> tuple[str, PackedContext | None]:
+            key = self.context_packer.budget_for(model) if self._context_packing_enabled else None
+            if key not in packed_contexts:
+                packed_contexts[key] = self._pack_context(context_documents, model)
+            return packed_contexts[key]
+
+        for candidate in models_to_try:
+            context_for(candidate)
+
+        async def attempt(model: str) -> GenerationResult:
+            logger.debug(f"🔄 모델 시도: {model}")
+            return await self._generate_with_model(
+                model=model,
+                query=query,
+                context_documents=context_documents,
+                options=options,
+                context_text=context_for(model)[0],
+            )
 
-                # Phase 2: 개인정보 마스킹 적용
-                result = self._apply_privacy_masking(result)
+        # 요청 모델이 관측 p90 안에 응답하지 않으면 다음 모델을 병렬 시작 (먼저 성공한 결과 사용)
+        try:
+            result, model = await hedged_call(
+                models_to_try, attempt, self.latency_tracker, operation="generation"
+            )
+        except AllCandidatesFailedError as e:
+            last_error = e.last_error
+        else:
+            # 생성 시간 계산
+            generation_time = time.time() - start_time
+            result.generation_time = generation_time
 
-                # 통계 업데이트
-                self._update_stats(model, result.tokens_used, generation_time)
+            # Phase 2: 개인정보 마스킹 적용
+            result = self._apply_privacy_masking(result)
 
-                if model != requested_model:
-                    self.stats["fallback_count"] += 1
-                    logger.info(f"✅ Fallback 성공: {requested_model} → {model}")
+            # 통계 업데이트 (헤지로 함께 실행된 다른 모델의 결과는 누적하지 않음)
+            self._update_stats(model, result.tokens_used, generation_time)
+            self._record_packing_stats(context_for(model)[1])
+            self.stats["prompt_tokens"] += result.prompt_tokens
+            self.stats["cached_prompt_tokens"] += result.cached_tokens
 
-                return result
+            if model != requested_model:
+                self.stats["fallback_count"] += 1
+                logger.info(f"✅ Fallback 성공: {requested_model} → {model}")
 
-            except Exception as e:
-                logger.warning(f"❌ 모델 {model} 실패: {e}")
-                last_error = e
-                continue
+            return result
 
         # 모든 모델 실패
         self.stats["error_count"] += 1
@@ -346,16 +435,24 @@ class GenerationModule:
         )
 
     async def _generate_with_model(
-        self, model: str, query: str, context_documents: list[Any], options: dict[str, Any]
+        self,
+        model: str,
+        query: str,
+        context_documents: list[Any],
+        options: dict[str, Any],
+        context_text: str | None = None,
     ) -> GenerationResult:
         """
         특정 모델로 OpenRouter API 호출
 
+        self.stats는 갱신하지 않습니다 (헤지 시 승자 결과만 호출자가 누적).
+
         Args:
             model: OpenRouter 모델 ID (예: "anthropic/claude-sonnet-4-5")
             query: 사용자 질문
             context_documents: 컨텍스트 문서
             options: 생성 옵션
+            context_text: 미리 구성한 컨텍스트 (None이면 context_documents로 구성)
 
         Returns:
             GenerationResult
@@ -369,7 +466,8 @@ class GenerationModule:
             )
 
         # 컨텍스트 구성
-        context_text = self._build_context(context_documents)
+        if context_text is None:
+            context_text, _ = self._pack_context(context_documents, model)
 
         # 빈 컨텍스트 검증
         if not context_text:
@@ -385,11 +483,10 @@ class GenerationModule:
         # 모델별 설정 로드
         model_settings = self._get_model_settings(model, options)
 
-        # API 파라미터 구성
-        messages = [
-            {"role": "system", "content": system_content},
-            {"role": "user", "content": user_content},
-        ]
+        # API 파라미터 구성 (system = 캐시 가능한 프리픽스, user = 가변 서픽스)
+        messages = self.prompt_cache.build_messages(
+            system_content, user_content, model=model, provider=self.provider
+        )
 
         api_params = {
             "model": model,
@@ -424,6 +521,7 @@ class GenerationModule:
 
         # API 호출 (타임아웃 적용)
         timeout = model_settings.get("timeout", 120)
+        call_start = time.time()
 
         try:
             response = cast(
@@ -442,14 +540,37 @@ class GenerationModule:
 
             # 토큰 사용량
             tokens_used = 0
+            cached_tokens = 0
+            prompt_tokens = 0
+            completion_tokens = 0
             if hasattr(response, "usage") and response.usage:
                 tokens_used = getattr(response.usage, "total_tokens", 0)
                 if not tokens_used:
                     tokens_used = getattr(response.usage, "prompt_tokens", 0) + getattr(
                         response.usage, "completion_tokens", 0
                     )
+                cached_tokens = extract_cached_tokens(response.usage)
+                prompt_tokens = extract_prompt_tokens(response.usage)
+                completion_tokens = extract_completion_tokens(response.usage)
+                if not completion_tokens and isinstance(tokens_used, int):
+                    completion_tokens = max(tokens_used - prompt_tokens, 0)
+
+            self.usage.record(
+                UsageRecord(
+                    model=model,
+                    route=options.get("usage_route", "generation"),
+                    provider=self.provider,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cached_tokens=cached_tokens,
+                    latency_ms=(time.time() - call_start) * 1000,
+                )
+            )
 
-            logger.info(f"✅ OpenRouter 응답 성공 (model={model}, tokens={tokens_used})")
+            logger.info(
+                f"✅ OpenRouter 응답 성공 (model={model}, tokens={tokens_used}, "
+                f"cached_tokens={cached_tokens})"
+            )
 
             return GenerationResult(
                 answer=answer,
@@ -459,6 +580,8 @@ class GenerationModule:
                 provider="openrouter",
                 generation_time=0,  # 나중에 설정
                 model_config=model_settings,
+                cached_tokens=cached_tokens,
+                prompt_tokens=prompt_tokens,
             )
 
         except TimeoutError as e:
@@ -491,7 +614,13 @@ class GenerationModule:
         # 모델별 설정 오버라이드
         if model in self.models_config:
             model_cfg = self.models_config[model]
-            settings.update({k: v for k, v in model_cfg.items() if k != "description"})
+            settings.update(
+                {
+                    k: v
+                    for k, v in model_cfg.items()
+                    if k not in ("description", "context_budget_tokens")
+                }
+            )
 
         # 런타임 옵션 오버라이드
         for key in ["temperature", "max_tokens", "timeout", "verbosity", "reasoning_effort"]:
@@ -500,30 +629,55 @@ class GenerationModule:
 
         return settings
 
-    def _build_context(self, context_documents: list[Any]) -> str:
-        """컨텍스트 텍스트 구성"""
+    def _build_context(self, context_documents: list[Any], model: str | None = None) -> str:
+        """
+        컨텍스트 텍스트 구성
+
+        context_packing 활성화 시 모델별 토큰 예산을 채우도록 문서를 선택/정리하고,
+        패킹 전후 토큰 수를 통계에 누적합니다.
+        """
+        context_text, packed = self._pack_context(context_documents, model)
+        self._record_packing_stats(packed)
+        return context_text
+
+    def _record_packing_stats(self, packed: PackedContext | None) -> None:
+        """패킹 전후 토큰 수를 통계에 누적 (패킹 미사용 시 무시)"""
+        if packed is None:
+            return
+        self.stats["context_tokens_before"] += packed.tokens_before
+        self.stats["context_tokens_after"] += packed.tokens_after
+        self.stats["context_chunks_trimmed"] += packed.trimmed_count
+
+    def _pack_context(
+        self, context_documents: list[Any], model: str | None = None
+    ) -> tuple[str, PackedContext | None]:
+        """컨텍스트 텍스트와 패킹 결과 반환 (통계 미반영, 패킹 비활성화 시 None)"""
         if not context_documents:
-            return ""
+            return "", None
+
+        if self._context_packing_enabled:
+            packed = self.context_packer.pack(context_documents, model=model)
+            logger.debug(
+                "컨텍스트 패킹 완료",
+                model=model,
+                documents=f"{len(packed.documents)}/{len(context_documents)}",
+                tokens_before=packed.tokens_before,
+                tokens_after=packed.tokens_after,
+                budget=packed.budget_tokens,
+                trimmed=packed.trimmed_count,
+            )
+            return packed.text, packed
 
         # Phase 2: Top-k 최적화
         # - 리랭킹 후 상위 5개 문서만 사용 (토큰 비용 절감)
         # - 롤백 시: context_documents[:15]로 변경
         context_parts = []
         for i, doc in enumerate(context_documents[:5]):
-            content = ""
-            if hasattr(doc, "content"):
-                content = doc.content
-            elif hasattr(doc, "page_content"):
-                content = doc.page_content
-            elif isinstance(doc, dict):
-                content = doc.get("content", "")
-            elif isinstance(doc, str):
-                content = doc
-
+            content = extract_content(doc)
             if content:
                 context_parts.append(f"[문서 {i+1}]\n{content}\n")
 
-        return "\n".join(context_parts)
+        return "\n".join(context_parts), None
 
     async def _build_prompt(
         self, query: str, context_text: str, options: dict[str, Any]
@@ -531,6 +685,10 @@ class GenerationModule:
         """
         프롬프트 구성 (system, user 분리)
 
+        system: 스타일별 시스템 프롬프트 + 고정 규칙 (요청마다 동일 → 프롬프트 캐시 프리픽스)
+        user: 대화 기록, 참고 문서, SQL 결과, 질문 (요청마다 달라지는 서픽스)
+        요청별 값은 system에 넣지 않아야 제공자 캐시가 적중합니다.
+
         Returns:
             (system_content, user_content) 튜플
         """
@@ -539,9 +697,7 @@ class GenerationModule:
         sql_context = options.get("sql_context", "")  # Phase 3: SQL 검색 결과
 
         # 스타일에 따른 프롬프트 이름
-        prompt_name = "system"
-        if style in ("detailed", "concise", "professional", "educational"):
-            prompt_name = style
+        prompt_name = self._prompt_name_for_style(style)
 
         # 프롬프트 매니저에서 동적으로 로드
         try:
@@ -609,6 +765,32 @@ class GenerationModule:
 
         return system_content, user_content
 
+    @staticmethod
+    def _prompt_name_for_style(style: str) -> str:
+        """응답 스타일 → 시스템 프롬프트 이름"""
+        if style in ("detailed", "concise", "professional", "educational"):
+            return style
+        return "system"
+
+    async def get_prompt_version(self, options: dict[str, Any] | None = None) -> str:
+        """
+        답변에 영향을 주는 프롬프트/모델 설정의 버전 해시 (답변 캐시 키용)
+
+        스타일별 시스템 프롬프트 내용과 모델/샘플링 옵션을 해시하므로
+        프롬프트가 수정되면 이전 버전으로 만든 캐시 답변은 더 이상 적중하지 않습니다.
+        """
+        options = options or {}
+        prompt_name = self._prompt_name_for_style(options.get("style", "standard"))
+        content = await self.prompt_manager.get_prompt_content(name=prompt_name, default="")
+        parts = [
+            prompt_name,
+            content,
+            str(options.get("model") or self.default_model),
+            str(options.get("temperature")),
+            str(options.get("max_tokens")),
+        ]
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()[:16]
+
     def _update_stats(self, model: str, tokens_used: int, generation_time: float) -> None:
         """통계 업데이트"""
         if model not in self.stats["generations_by_model"]:
@@ -648,6 +830,8 @@ class GenerationModule:
                 - max_tokens: 최대 토큰 수
                 - temperature: 창의성 (0.0~1.0)
                 - style: 응답 스타일
+                - usage_route: 사용량 집계 라우트 이름 (기본: generation)
+                - on_usage: 스트림 종료 시 이 요청의 사용량(UsageRecord)을 받을 콜백
 
         Yields:
             str: 생성된 텍스트 청크
@@ -678,8 +862,11 @@ class GenerationModule:
                 "일반적으로 앱 시작 시 app/core/di_container.py에서 자동으로 초기화됩니다."
             )
 
+        # 모델 결정 (컨텍스트 토큰 예산이 모델별로 다름)
+        model = options.get("model", self.default_model)
+
         # 컨텍스트 구성
-        context_text = self._build_context(context_documents)
+        context_text = self._build_context(context_documents, model)
 
         # 빈 컨텍스트 검증
         if not context_text:
@@ -691,23 +878,22 @@ class GenerationModule:
         # 프롬프트 구성
         system_content, user_content = await self._build_prompt(query, context_text, options)
 
-        # 모델 결정
-        model = options.get("model", self.default_model)
-
         # 모델별 설정 로드
         model_settings = self._get_model_settings(model, options)
 
-        # API 파라미터 구성
-        messages = [
-            {"role": "system", "content": system_content},
-            {"role": "user", "content": user_content},
-        ]
+        # API 파라미터 구성 (system = 캐시 가능한 프리픽스, user = 가변 서픽스)
+        messages = self.prompt_cache.build_messages(
+            system_content, user_content, model=model, provider=self.provider
+        )
 
         api_params = {
             "model": model,
             "messages": messages,
             "stream": True,  # 스트리밍 활성화
         }
+        if self.usage.config.stream_include_usage:
+            # 마지막 청크로 실제 usage 수신 (OpenAI/OpenRouter/Gemini 호환 API 공통)
+            api_params["stream_options"] = {"include_usage": True}
 
         # Reasoning 모델 (o1, gpt-5) 여부 확인
         is_reasoning_model = "o1" in model.lower() or "gpt-5" in model.lower()
@@ -724,40 +910,98 @@ class GenerationModule:
             prompt_length=len(user_content),
         )
 
-        # 스트리밍 API 호출
-        stream = self.client.chat.completions.create(**api_params)
+        # 스트리밍 API 호출 (동기 클라이언트: 스트림 열기/소비 모두 스트림 전용 스레드에서 실행)
+        stream = await run_in_stream_executor(
+            self.client.chat.completions.create, **api_params  # type: ignore[arg-type]
+        )
 
         # Issue 2 수정: 통계 추적을 위한 청크 카운트 초기화
         chunk_count = 0
+        stream_usage: Any = None
         self.stats["total_generations"] += 1
 
-        # 청크 단위로 yield
-        async for chunk in stream:
-            if chunk.choices and len(chunk.choices) > 0:
-                delta = chunk.choices[0].delta
-                if hasattr(delta, "content") and delta.content:
-                    content = delta.content
-                    chunk_count += 1  # 청크 카운트 증가
-
-                    # Phase 2: 개인정보 마스킹 적용 (청크 단위)
-                    if self._privacy_enabled and self.privacy_masker is not None:
-                        try:
-                            content = self.privacy_masker.mask_text(content)
-                        except Exception as e:
-                            # 마스킹 실패 시 원본 반환 (Graceful Degradation)
-                            logger.warning(f"스트리밍 마스킹 실패: {e}")
-
-                    yield content
-
-        # Issue 2 수정: 스트리밍 완료 후 통계 업데이트
-        generation_time = time.time() - start_time
-        # 청크당 평균 5토큰으로 추정 (스트리밍에서는 정확한 토큰 수 계산 불가)
-        estimated_tokens = chunk_count * 5
-        self._update_stats(model, estimated_tokens, generation_time)
-        logger.debug(
-            f"✅ 스트리밍 완료 (model={model}, chunks={chunk_count}, "
-            f"estimated_tokens={estimated_tokens}, time={generation_time:.2f}s)"
-        )
+        # 청크 단위로 yield (토큰 대기 중에도 이벤트 루프는 다른 연결 처리)
+        # 클라이언트가 중간에 연결을 끊어도 사용량은 finally에서 기록
+        try:
+            async for chunk in aiterate(stream):
+                usage = getattr(chunk, "usage", None)
+                if extract_prompt_tokens(usage) or extract_completion_tokens(usage):
+                    stream_usage = usage
+
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if hasattr(delta, "content") and delta.content:
+                        content = delta.content
+                        chunk_count += 1  # 청크 카운트 증가
+
+                        # Phase 2: 개인정보 마스킹 적용 (청크 단위)
+                        if self._privacy_enabled and self.privacy_masker is not None:
+                            try:
+                                content = self.privacy_masker.mask_text(content)
+                            except Exception as e:
+                                # 마스킹 실패 시 원본 반환 (Graceful Degradation)
+                                logger.warning(f"스트리밍 마스킹 실패: {e}")
+
+                        yield content
+        finally:
+            generation_time = time.time() - start_time
+            record = self._record_stream_usage(
+                model,
+                stream_usage,
+                chunk_count,
+                system_content + user_content,
+                options.get("usage_route", "generation"),
+                generation_time,
+            )
+            self._update_stats(model, record.total_tokens, generation_time)
+            on_usage: Callable[[UsageRecord], None] | None = options.get("on_usage")
+            if on_usage is not None:
+                on_usage(record)
+            logger.debug(
+                f"✅ 스트리밍 완료 (model={model}, chunks={chunk_count}, "
+                f"tokens={record.total_tokens}, estimated={record.estimated}, "
+                f"time={generation_time:.2f}s)"
+            )
+
+    def _record_stream_usage(
+        self,
+        model: str,
+        usage: Any,
+        chunk_count: int,
+        prompt_text: str,
+        route: str,
+        generation_time: float,
+    ) -> UsageRecord:
+        """
+        스트리밍 요청 사용량 기록
+
+        제공자가 마지막 청크로 usage를 보냈으면 그 값을 사용하고, 없으면
+        입력은 프롬프트 토큰 수, 출력은 청크당 평균 5토큰으로 추정합니다.
+        """
+        if usage is not None:
+            prompt_tokens = extract_prompt_tokens(usage)
+            cached_tokens = extract_cached_tokens(usage)
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["cached_prompt_tokens"] += cached_tokens
+            record = UsageRecord(
+                model=model,
+                route=route,
+                provider=self.provider,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=extract_completion_tokens(usage),
+                cached_tokens=cached_tokens,
+            )
+        else:
+            record = UsageRecord(
+                model=model,
+                route=route,
+                provider=self.provider,
+                prompt_tokens=self.context_packer.token_counter.count(prompt_text, use_cache=False),
+                completion_tokens=chunk_count * 5,
+                estimated=True,
+            )
+        record.latency_ms = generation_time * 1000
+        return self.usage.record(record)
 
     # ========================================
     # 유틸리티 메서드
@@ -774,6 +1018,35 @@ class GenerationModule:
             "default_model": self.default_model,
             "fallback_models": self.fallback_models,
             "auto_fallback": self.auto_fallback,
+            "context_packing": self._get_context_packing_stats(),
+            "prompt_caching": self._get_prompt_caching_stats(),
+            "hedging": {
+                "enabled": self.hedging.enabled,
+                "models": self.latency_tracker.get_stats(),
+            },
+        }
+
+    def _get_prompt_caching_stats(self) -> dict[str, Any]:
+        """프롬프트 캐시 적중 통계"""
+        prompt_tokens = self.stats["prompt_tokens"]
+        cached = self.stats["cached_prompt_tokens"]
+        return {
+            "enabled": self.prompt_cache.enabled,
+            "breakpoint_model_prefixes": list(self.prompt_cache.breakpoint_prefixes),
+            "cached_prompt_tokens": cached,
+            "cache_hit_ratio": round(cached / prompt_tokens, 4) if prompt_tokens else 0.0,
+        }
+
+    def _get_context_packing_stats(self) -> dict[str, Any]:
+        """컨텍스트 패킹 설정 및 토큰 절감 통계"""
+        before = self.stats["context_tokens_before"]
+        after = self.stats["context_tokens_after"]
+        return {
+            "enabled": self._context_packing_enabled,
+            "default_budget_tokens": self.context_packer.default_budget_tokens,
+            "model_budgets": self.context_packer.model_budgets,
+            "token_savings_ratio": round(1 - after / before, 4) if before else 0.0,
+            **self.context_packer.token_counter.get_stats(),
         }
 
     async def test_model(self, model: str) -> dict[str, Any]:
@@ -1,12 +1,26 @@
 """
 프롬프트 관리 모듈 (Hybrid Mode: PostgreSQL + JSON Fallback)
+
+프롬프트 조회는 모든 채팅 요청의 경로에 있으므로 워커 메모리에 캐시합니다.
+- 버전 스탬프 무효화: version_poll_interval마다 저장소 버전(PostgreSQL 행 수 + 최신
+  updated_at, JSON 모드는 파일 수정 시각)을 확인하여 다른 워커의 변경을 반영
+- 로컬 변경(생성/수정/삭제/가져오기)은 즉시 캐시 무효화
+- JSON 저장은 write-behind: 변경을 모아 write_behind_delay 후 한 번에 기록하며,
+  임시 파일 작성 후 원자적 rename으로 교체 (중간에 실패해도 기존 파일 유지)
+- 기록 실패 시 지수 백오프로 재예약하고, 종료 시 flush() 실패는 예외로 전달
 """
 
+import asyncio
+import functools
 import json
+import os
+import tempfile
+import time
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from ....infrastructure.persistence.prompt_repository import (
     DuplicatePromptError,
@@ -18,6 +32,23 @@ from ....models.prompts import PromptCreate, PromptResponse, PromptUpdate
 
 logger = get_logger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_MAX_FLUSH_BACKOFF = 30.0  # JSON 저장 재시도 대기 시간 상한 (초)
+
+
+def _invalidates_cache(func: F) -> F:
+    """변경 작업 완료(성공/실패 무관) 후 프롬프트 캐시 무효화"""
+
+    @functools.wraps(func)
+    async def wrapper(self: "PromptManager", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            self._invalidate_cache("local_write")
+
+    return wrapper  # type: ignore[return-value]
+
 
 class PromptManager:
     """
@@ -32,6 +63,9 @@ class PromptManager:
         storage_path: str = "./data/prompts",
         repository: PromptRepository | None = None,
         use_database: bool = True,
+        cache_enabled: bool | None = True,
+        version_poll_interval: float | None = 5.0,
+        write_behind_delay: float | None = 0.5,
     ):
         """
         프롬프트 매니저 초기화 (Hybrid Mode)
@@ -40,11 +74,37 @@ class PromptManager:
             storage_path: 프롬프트 JSON 저장 경로 (폴백용)
             repository: PostgreSQL PromptRepository 인스턴스 (선택적, DI Container에서 주입)
             use_database: PostgreSQL 사용 여부 (기본값: True)
+            cache_enabled: 프롬프트 조회 메모리 캐시 사용 여부
+            version_poll_interval: 저장소 버전 확인 주기 (초, 다른 워커 변경 반영 지연 상한)
+            write_behind_delay: JSON 저장 지연 (초, 0이면 즉시 동기 저장)
         """
         # PostgreSQL Repository (Primary)
         self.use_database = use_database
         self.repository = repository
 
+        # 조회 캐시 (키: "id|name" → PromptResponse, 없는 프롬프트는 None으로 캐시)
+        self.cache_enabled = True if cache_enabled is None else cache_enabled
+        self.version_poll_interval = 5.0 if version_poll_interval is None else version_poll_interval
+        self._cache: dict[str, PromptResponse | None] = {}
+        self._cache_generation = 0  # 무효화마다 증가 (조회 중 무효화된 결과 저장 방지)
+        self._cache_version: str | None = None
+        self._version_checked_at: float | None = None
+        self._cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "version_checks": 0,
+            "version_check_failures": 0,
+        }
+
+        # JSON write-behind
+        self.write_behind_delay = 0.5 if write_behind_delay is None else write_behind_delay
+        self._dirty = False
+        self._flush_task: asyncio.Task[None] | None = None
+        self._json_mtime_ns: int | None = None
+        self._write_stats = {"save_requests": 0, "writes": 0, "write_failures": 0}
+        self._flush_failures = 0  # 연속 실패 횟수 (재시도 백오프 계산용)
+
         # JSON Fallback 설정
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
@@ -65,6 +125,7 @@ class PromptManager:
         """저장된 프롬프트 로드"""
         try:
             if self.prompts_file.exists():
+                self._json_mtime_ns = self.prompts_file.stat().st_mtime_ns
                 with open(self.prompts_file, encoding="utf-8") as f:
                     data = json.load(f)
                     self.prompts = data.get("prompts", {})
@@ -90,21 +151,114 @@ class PromptManager:
             self.prompts = {}
 
     def _save_prompts(self) -> None:
-        """프롬프트 저장"""
+        """
+        프롬프트 저장 요청 (write-behind)
+
+        이벤트 루프 안에서는 write_behind_delay 후 한 번에 기록하도록 예약하고
+        (연속 변경은 1회 쓰기로 합쳐짐), 루프 밖(초기화 등)에서는 즉시 기록합니다.
+        """
+        self._write_stats["save_requests"] += 1
         try:
-            with open(self.prompts_file, "w", encoding="utf-8") as f:
-                json.dump({"prompts": self.prompts}, f, ensure_ascii=False, indent=2)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None or self.write_behind_delay <= 0:
+            self._write_prompts_file(self._serialize_prompts())
+            return
+
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self, delay: float | None = None) -> None:
+        await asyncio.sleep(self.write_behind_delay if delay is None else delay)
+        try:
+            await self.flush()
+        except Exception:
+            pass  # flush()에서 로그/실패 횟수 기록
+
+        if self._dirty:
+            # 기록 실패 또는 기록 중 새 변경 → 재예약 (연속 실패 시 지수 백오프)
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._delayed_flush(self._retry_delay())
+            )
+
+    def _retry_delay(self) -> float:
+        """다음 기록 시도까지 대기 시간 (실패가 없으면 write_behind_delay)"""
+        if self._flush_failures == 0:
+            return self.write_behind_delay
+        base = max(self.write_behind_delay, 0.1)
+        return float(min(base * 2 ** (self._flush_failures - 1), _MAX_FLUSH_BACKOFF))
+
+    async def flush(self) -> None:
+        """
+        대기 중인 JSON 저장을 즉시 기록 (종료 시 호출)
+
+        Raises:
+            Exception: 파일 기록 실패 (변경은 pending으로 남아 재시도 대상)
+        """
+        task = self._flush_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        if not self._dirty:
+            return
+
+        # 스냅샷은 루프 스레드에서 직렬화 (기록 중 변경과 분리)
+        self._dirty = False
+        payload = self._serialize_prompts()
+        try:
+            await asyncio.to_thread(self._write_prompts_file, payload)
+        except asyncio.CancelledError:
+            self._dirty = True  # 종료 flush가 다시 기록
+            raise
+        except Exception as e:
+            self._dirty = True
+            self._flush_failures += 1
+            logger.warning(
+                "JSON 프롬프트 저장 실패, 변경 사항 대기 중",
+                extra={
+                    "error": str(e),
+                    "consecutive_failures": self._flush_failures,
+                    "retry_in_seconds": self._retry_delay(),
+                },
+            )
+            raise
+        self._flush_failures = 0
+
+    def _serialize_prompts(self) -> str:
+        return json.dumps({"prompts": self.prompts}, ensure_ascii=False, indent=2, default=str)
+
+    def _write_prompts_file(self, payload: str) -> None:
+        """임시 파일에 기록 후 원자적 rename으로 교체"""
+        tmp_path: str | None = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.storage_path, prefix=".prompts.", suffix=".json.tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.prompts_file)
+            tmp_path = None
+            self._json_mtime_ns = self.prompts_file.stat().st_mtime_ns
+            self._write_stats["writes"] += 1
             logger.debug(
                 "Saved prompts to storage",
                 extra={"prompt_count": len(self.prompts)}
             )
         except Exception as e:
+            self._write_stats["write_failures"] += 1
             logger.error(
                 "Error saving prompts",
                 extra={"error": str(e)},
                 exc_info=True
             )
             raise
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
 
     def _ensure_default_prompts(self) -> None:
         """기본 프롬프트 확인 및 생성"""
@@ -202,7 +356,7 @@ class PromptManager:
         self, prompt_id: str | None = None, name: str | None = None
     ) -> PromptResponse | None:
         """
-        프롬프트 조회 (Hybrid Mode: PostgreSQL → JSON Fallback)
+        프롬프트 조회 (메모리 캐시 → PostgreSQL → JSON Fallback)
 
         Args:
             prompt_id: 프롬프트 ID
@@ -211,6 +365,94 @@ class PromptManager:
         Returns:
             프롬프트 정보 또는 None
         """
+        if not self.cache_enabled:
+            return await self._fetch_prompt(prompt_id, name)
+
+        await self._revalidate_cache()
+        key = f"{prompt_id or ''}|{name or ''}"
+        if key in self._cache:
+            self._cache_stats["hits"] += 1
+            return self._cache[key]
+
+        self._cache_stats["misses"] += 1
+        generation = self._cache_generation
+        result = await self._fetch_prompt(prompt_id, name)
+        if generation == self._cache_generation:
+            self._cache[key] = result
+        return result
+
+    def _invalidate_cache(self, reason: str) -> None:
+        self._cache_generation += 1
+        if self._cache:
+            self._cache.clear()
+            self._cache_stats["invalidations"] += 1
+            logger.debug("프롬프트 캐시 무효화", extra={"reason": reason})
+
+    async def _revalidate_cache(self) -> None:
+        """버전 확인 주기가 지났으면 저장소 버전을 비교하여 바뀐 경우 캐시 무효화"""
+        now = time.monotonic()
+        checked_at = self._version_checked_at
+        if checked_at is not None and now - checked_at < self.version_poll_interval:
+            return
+        self._version_checked_at = now  # 동시 요청의 중복 확인 방지
+
+        version = await self._current_version()
+        if version != self._cache_version:
+            self._invalidate_cache("version_changed")
+            self._cache_version = version
+
+    async def _current_version(self) -> str | None:
+        """
+        저장소 버전 스탬프
+
+        PostgreSQL: 행 수 + 최신 updated_at (조회 실패 시 None → 복구되면 무효화)
+        JSON 전용: 파일 수정 시각 (다른 프로세스가 바꿨으면 다시 로드)
+        """
+        self._cache_stats["version_checks"] += 1
+        if self.use_database and self.repository:
+            try:
+                return str(await self.repository.get_version())
+            except Exception as e:
+                self._cache_stats["version_check_failures"] += 1
+                logger.debug("프롬프트 버전 조회 실패", extra={"error": str(e)})
+                return None
+
+        try:
+            mtime_ns = self.prompts_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        if mtime_ns != self._json_mtime_ns and not self._dirty:
+            self._load_prompts()
+        return f"json:{mtime_ns}"
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """캐시 적중률 / 신선도 / write-behind 통계"""
+        hits = self._cache_stats["hits"]
+        total = hits + self._cache_stats["misses"]
+        checked_at = self._version_checked_at
+        return {
+            "enabled": self.cache_enabled,
+            "entries": len(self._cache),
+            **self._cache_stats,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "version": self._cache_version,
+            "version_poll_interval": self.version_poll_interval,
+            # 마지막 버전 확인 이후 경과 시간 = 다른 워커 변경이 반영되지 않았을 수 있는 최대 시간
+            "staleness_seconds": (
+                round(time.monotonic() - checked_at, 3) if checked_at is not None else None
+            ),
+            "write_behind": {
+                "delay_seconds": self.write_behind_delay,
+                "pending": self._dirty,
+                "consecutive_failures": self._flush_failures,
+                **self._write_stats,
+            },
+        }
+
+    async def _fetch_prompt(
+        self, prompt_id: str | None = None, name: str | None = None
+    ) -> PromptResponse | None:
+        """저장소에서 프롬프트 조회 (PostgreSQL → JSON Fallback)"""
         # PostgreSQL 시도 (Primary)
         if self.use_database and self.repository:
             try:
@@ -405,6 +647,7 @@ class PromptManager:
             )
             return {"prompts": [], "total": 0, "page": page, "page_size": page_size}
 
+    @_invalidates_cache
     async def create_prompt(self, prompt_data: PromptCreate) -> PromptResponse:
         """
         프롬프트 생성 (Hybrid Mode: PostgreSQL → JSON Fallback)
@@ -470,12 +713,12 @@ class PromptManager:
                 if p.get("name") == prompt_data.name:
                     raise ValueError(f"Prompt with name '{prompt_data.name}' already exists")
 
-            prompt_id = str(uuid.uuid4())
+            prompt_id = prompt_data.id or str(uuid.uuid4())
             now = datetime.now().isoformat()
 
             prompt = {
-                "id": prompt_id,
                 **prompt_data.model_dump(),
+                "id": prompt_id,
                 "created_at": now,
                 "updated_at": now,
             }
@@ -504,7 +747,7 @@ class PromptManager:
         Args:
             prompt: 동기화할 프롬프트
         """
-        prompt_dict = prompt.model_dump()
+        prompt_dict = prompt.model_dump(mode="json")
         self.prompts[prompt.id] = prompt_dict
         self._save_prompts()
         logger.debug(
@@ -512,6 +755,7 @@ class PromptManager:
             extra={"prompt_id": prompt.id}
         )
 
+    @_invalidates_cache
     async def update_prompt(self, prompt_id: str, update_data: PromptUpdate) -> PromptResponse:
         """
         프롬프트 업데이트 (Hybrid Mode: PostgreSQL → JSON Fallback)
@@ -613,6 +857,7 @@ class PromptManager:
             )
             raise
 
+    @_invalidates_cache
     async def delete_prompt(self, prompt_id: str) -> bool:
         """
         프롬프트 삭제 (Hybrid Mode: PostgreSQL → JSON Fallback)
@@ -724,6 +969,7 @@ class PromptManager:
             )
             raise
 
+    @_invalidates_cache
     async def import_prompts(
         self, data: dict[str, Any] | list[dict[str, Any]], overwrite: bool = False
     ) -> dict[str, Any]:
@@ -22,10 +22,16 @@ GraphRAG 모듈
     builder = KnowledgeGraphBuilder(store, entity_extractor, relation_extractor)
     result = await builder.build("텍스트")
 """
-from .builder import KnowledgeGraphBuilder
+from .builder import BuildProgress, KnowledgeGraphBuilder
+from .extraction_cache import FileExtractionCache, IExtractionCache, RedisExtractionCache
 from .extractors import LLMEntityExtractor, LLMRelationExtractor
 from .factory import GraphRAGFactory
-from .interfaces import IEntityExtractor, IGraphStore, IRelationExtractor
+from .interfaces import (
+    IEntityExtractor,
+    IGraphAdjacencyProvider,
+    IGraphStore,
+    IRelationExtractor,
+)
 from .models import Entity, GraphSearchResult, Relation
 from .stores import NetworkXGraphStore
 
@@ -36,6 +42,7 @@ __all__ = [
     "GraphSearchResult",
     # 인터페이스
     "IGraphStore",
+    "IGraphAdjacencyProvider",
     "IEntityExtractor",
     "IRelationExtractor",
     # 구현체
@@ -45,6 +52,11 @@ __all__ = [
     "LLMRelationExtractor",
     # 빌더
     "KnowledgeGraphBuilder",
+    "BuildProgress",
+    # 추출 결과 캐시
+    "IExtractionCache",
+    "FileExtractionCache",
+    "RedisExtractionCache",
     # 팩토리
     "GraphRAGFactory",
 ]
@@ -7,15 +7,60 @@
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from .extraction_cache import decode_extraction, encode_extraction, make_cache_key
+
 if TYPE_CHECKING:
+    from .extraction_cache import IExtractionCache
     from .interfaces import IEntityExtractor, IGraphStore, IRelationExtractor
+    from .models import Entity, Relation
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BuildProgress:
+    """
+    문서 배치 빌드 진행 상황
+
+    Attributes:
+        documents_total: 처리 대상 문서 수 (빈 문서 제외)
+        documents_done: 처리 완료 문서 수 (실패 포함)
+        documents_failed: 추출 실패 문서 수
+        entities: 추출된 엔티티 수 (누적)
+        relations: 추출된 관계 수 (누적)
+        elapsed_seconds: 경과 시간 (초)
+        cache_hits: 추출 캐시 히트 문서 수 (LLM 호출 생략)
+        cache_misses: 추출 캐시 미스 후 LLM 추출에 성공한 문서 수
+    """
+
+    documents_total: int
+    documents_done: int = 0
+    documents_failed: int = 0
+    entities: int = 0
+    relations: int = 0
+    elapsed_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def documents_per_second(self) -> float:
+        """문서 처리량 (docs/s)"""
+        return self.documents_done / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def entities_per_second(self) -> float:
+        """엔티티 처리량 (entities/s)"""
+        return self.entities / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
 class KnowledgeGraphBuilder:
     """
     지식 그래프 빌더
@@ -36,16 +81,37 @@ class KnowledgeGraphBuilder:
         graph_store: IGraphStore,
         entity_extractor: IEntityExtractor,
         relation_extractor: IRelationExtractor,
+        max_concurrency: int = 8,
+        write_batch_size: int = 64,
+        extraction_cache: IExtractionCache | None = None,
     ) -> None:
         """
         Args:
             graph_store: 그래프 저장소
             entity_extractor: 엔티티 추출기
             relation_extractor: 관계 추출기
+            max_concurrency: 동시에 추출할 최대 문서 수 (LLM 호출 동시성)
+            write_batch_size: 일괄 저장 단위 (문서 수, 임베딩 배치 크기를 결정)
+            extraction_cache: 청크별 추출 결과 캐시 (None이면 매번 LLM 추출)
         """
         self._graph_store = graph_store
         self._entity_extractor = entity_extractor
         self._relation_extractor = relation_extractor
+        self._max_concurrency = max(1, max_concurrency)
+        self._write_batch_size = max(1, write_batch_size)
+        self._extraction_cache = extraction_cache
+
+        # 캐시 키 구성 요소 (두 추출기의 프롬프트 버전 / 모델)
+        self._prompt_version = "+".join(
+            str(getattr(e, "prompt_version", type(e).__name__))
+            for e in (entity_extractor, relation_extractor)
+        )
+        self._model = "+".join(
+            str(getattr(e, "model", "")) for e in (entity_extractor, relation_extractor)
+        )
+        self._strict_extraction = all(
+            "strict" in self._extract_parameters(e) for e in (entity_extractor, relation_extractor)
+        )
 
     async def build(self, text: str) -> dict[str, Any]:
         """
@@ -55,56 +121,180 @@ class KnowledgeGraphBuilder:
             text: 소스 텍스트
 
         Returns:
-            빌드 결과 (entities_count, relations_count)
+            빌드 결과 (entities_count, relations_count, cache_hit)
         """
-        # 1. 엔티티 추출
-        entities = await self._entity_extractor.extract(text)
-        logger.info(f"엔티티 {len(entities)}개 추출")
+        # 1. 엔티티/관계 추출 (캐시 히트 시 LLM 호출 생략)
+        try:
+            entities, relations, cache_hit = await self._extract(text, asyncio.Semaphore(1))
+        except Exception as e:
+            # strict 추출 실패: 캐시하지 않고 빈 결과로 진행 (캐시 미사용 시와 동일)
+            logger.warning(f"그래프 추출 실패, 빈 결과로 진행: {e}")
+            entities, relations, cache_hit = [], [], False
+        logger.info(f"엔티티 {len(entities)}개, 관계 {len(relations)}개 추출")
 
-        # 2. 그래프에 엔티티 저장
-        for entity in entities:
-            await self._graph_store.add_entity(entity)
-
-        # 3. 관계 추출
-        relations = await self._relation_extractor.extract(text, entities)
-        logger.info(f"관계 {len(relations)}개 추출")
-
-        # 4. 그래프에 관계 저장
-        for relation in relations:
-            await self._graph_store.add_relation(relation)
+        # 2. 그래프 저장 (엔티티 먼저)
+        await self._write_entities(entities)
+        await self._write_relations(relations)
 
         return {
             "entities_count": len(entities),
             "relations_count": len(relations),
+            "cache_hit": cache_hit,
         }
 
     async def build_from_documents(
         self,
         documents: list[dict[str, Any]],
+        progress_callback: Callable[[BuildProgress], None] | None = None,
     ) -> dict[str, Any]:
         """
         여러 문서에서 지식 그래프 빌드
 
+        write_batch_size개 문서씩 엔티티/관계를 동시 추출(max_concurrency 제한)한 뒤,
+        배치 단위로 add_entities_bulk/add_relations_bulk를 호출합니다.
+        추출에 실패한 문서는 건너뛰고 documents_failed로 집계합니다.
+        추출 캐시가 있으면 내용이 바뀌지 않은 청크는 LLM을 호출하지 않습니다.
+
         Args:
             documents: 문서 리스트 (각 문서는 content, metadata 포함)
+            progress_callback: 배치 완료마다 호출되는 진행 상황 콜백
 
         Returns:
-            빌드 결과 (documents_processed, total_entities, total_relations)
+            빌드 결과 (documents_processed, documents_failed, total_entities,
+            total_relations, elapsed_seconds, documents_per_second, entities_per_second,
+            cache_hits, cache_misses)
         """
-        total_entities = 0
-        total_relations = 0
+        contents = [doc.get("content", "") for doc in documents]
+        contents = [content for content in contents if content]
+
+        progress = BuildProgress(documents_total=len(contents))
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        start_time = time.perf_counter()
+
+        for offset in range(0, len(contents), self._write_batch_size):
+            batch = contents[offset : offset + self._write_batch_size]
+            outcomes = await asyncio.gather(
+                *(self._extract(content, semaphore) for content in batch),
+                return_exceptions=True,
+            )
 
-        for doc in documents:
-            content = doc.get("content", "")
-            if not content:
-                continue
+            batch_entities: list[Entity] = []
+            batch_relations: list[Relation] = []
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    progress.documents_failed += 1
+                    logger.warning(f"문서 그래프 추출 실패: {outcome}")
+                    continue
+                entities, relations, cache_hit = outcome
+                if cache_hit:
+                    progress.cache_hits += 1
+                elif self._extraction_cache is not None:
+                    progress.cache_misses += 1
+                batch_entities.extend(entities)
+                batch_relations.extend(relations)
 
-            result = await self.build(content)
-            total_entities += result["entities_count"]
-            total_relations += result["relations_count"]
+            # 엔티티 먼저 저장해야 관계가 placeholder 대신 실제 노드에 연결됨
+            await self._write_entities(batch_entities)
+            await self._write_relations(batch_relations)
+
+            progress.documents_done += len(batch)
+            progress.entities += len(batch_entities)
+            progress.relations += len(batch_relations)
+            progress.elapsed_seconds = time.perf_counter() - start_time
+
+            logger.info(
+                f"그래프 빌드 진행: {progress.documents_done}/{progress.documents_total} 문서, "
+                f"엔티티 {progress.entities}개, 관계 {progress.relations}개 "
+                f"({progress.documents_per_second:.1f} docs/s, "
+                f"캐시 히트 {progress.cache_hits}/미스 {progress.cache_misses})"
+            )
+            if progress_callback is not None:
+                progress_callback(progress)
+
+        progress.elapsed_seconds = time.perf_counter() - start_time
 
         return {
             "documents_processed": len(documents),
-            "total_entities": total_entities,
-            "total_relations": total_relations,
+            "documents_failed": progress.documents_failed,
+            "total_entities": progress.entities,
+            "total_relations": progress.relations,
+            "elapsed_seconds": progress.elapsed_seconds,
+            "documents_per_second": progress.documents_per_second,
+            "entities_per_second": progress.entities_per_second,
+            "cache_hits": progress.cache_hits,
+            "cache_misses": progress.cache_misses,
         }
+
+    async def _extract(
+        self, text: str, semaphore: asyncio.Semaphore
+    ) -> tuple[list[Entity], list[Relation], bool]:
+        """
+        단일 문서 엔티티/관계 추출 (동시성 제한, 추출 캐시 우선)
+
+        Returns:
+            (엔티티, 관계, 캐시 히트 여부)
+        """
+        if self._extraction_cache is None:
+            async with semaphore:
+                entities = await self._entity_extractor.extract(text)
+                relations = await self._relation_extractor.extract(text, entities)
+            return entities, relations, False
+
+        key = make_cache_key(text, self._prompt_version, self._model)
+        try:
+            cached = await self._extraction_cache.get(key)
+        except Exception as e:
+            logger.warning(f"추출 캐시 조회 실패 (LLM 추출로 진행): {e}")
+            cached = None
+        if cached is not None:
+            entities, relations = decode_extraction(cached)
+            return entities, relations, True
+
+        async with semaphore:
+            if self._strict_extraction:
+                # 실패 결과(빈 리스트)가 캐시되지 않도록 예외로 받음 → documents_failed
+                entity_extractor: Any = self._entity_extractor
+                relation_extractor: Any = self._relation_extractor
+                entities = await entity_extractor.extract(text, strict=True)
+                relations = await relation_extractor.extract(text, entities, strict=True)
+            else:
+                entities = await self._entity_extractor.extract(text)
+                relations = await self._relation_extractor.extract(text, entities)
+
+        try:
+            await self._extraction_cache.set(key, encode_extraction(entities, relations))
+        except Exception as e:
+            logger.warning(f"추출 캐시 저장 실패: {e}")
+        return entities, relations, False
+
+    @staticmethod
+    def _extract_parameters(extractor: Any) -> set[str]:
+        """추출기 클래스 extract 메서드의 파라미터 이름 (모의 객체는 빈 집합)"""
+        method = getattr(type(extractor), "extract", None)
+        if not inspect.iscoroutinefunction(method):
+            return set()
+        return set(inspect.signature(method).parameters)
+
+    async def _write_entities(self, entities: list[Entity]) -> None:
+        """엔티티 저장 (일괄 저장 미지원 저장소는 개별 저장)"""
+        if not entities:
+            return
+        if self._supports_bulk("add_entities_bulk"):
+            await self._graph_store.add_entities_bulk(entities)
+            return
+        for entity in entities:
+            await self._graph_store.add_entity(entity)
+
+    async def _write_relations(self, relations: list[Relation]) -> None:
+        """관계 저장 (일괄 저장 미지원 저장소는 개별 저장)"""
+        if not relations:
+            return
+        if self._supports_bulk("add_relations_bulk"):
+            await self._graph_store.add_relations_bulk(relations)
+            return
+        for relation in relations:
+            await self._graph_store.add_relation(relation)
+
+    def _supports_bulk(self, method_name: str) -> bool:
+        """저장소 클래스에 일괄 저장 코루틴이 정의되어 있는지 확인"""
+        return inspect.iscoroutinefunction(getattr(type(self._graph_store), method_name, None))
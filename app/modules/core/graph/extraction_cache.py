@@ -0,0 +1,166 @@
+"""
+지식 그래프 추출 결과 캐시
+
+KnowledgeGraphBuilder가 청크별 엔티티/관계 추출 결과를 재사용하도록 저장합니다.
+대부분 변경되지 않은 코퍼스를 다시 적재해 그래프를 재구축할 때
+새로 추가되거나 수정된 청크만 LLM 추출 비용을 지불합니다.
+
+캐시 키 = sha256(청크 내용 해시 | 추출기 프롬프트 버전 | 모델)
+- 청크 내용이 바뀌면 키가 바뀜
+- 프롬프트 템플릿/추출 한도가 바뀌면 prompt_version이 바뀜
+- 모델이 바뀌면 키가 바뀜
+
+캐시 값은 엔티티와 관계를 함께 저장하므로(관계가 엔티티 ID를 참조),
+캐시 히트 시 같은 엔티티 ID가 재사용되어 재구축이 upsert로 수렴합니다.
+
+백엔드:
+- FileExtractionCache: 디렉토리 + 키별 JSON 파일 (단일 인스턴스)
+- RedisExtractionCache: Redis 문자열 키 (멀티 인스턴스 공유)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from .models import Entity, Relation
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """청크 내용 해시 (sha256 hex)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(text: str, prompt_version: str, model: str) -> str:
+    """(청크 내용 해시, 프롬프트 버전, 모델) → 캐시 키"""
+    raw = f"{content_hash(text)}|{prompt_version}|{model}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def encode_extraction(entities: list[Entity], relations: list[Relation]) -> dict[str, Any]:
+    """추출 결과 → 캐시 값 (JSON 직렬화 가능)"""
+    return {
+        "entities": [entity.model_dump() for entity in entities],
+        "relations": [relation.model_dump() for relation in relations],
+    }
+
+
+def decode_extraction(value: dict[str, Any]) -> tuple[list[Entity], list[Relation]]:
+    """캐시 값 → 추출 결과"""
+    return (
+        [Entity.model_validate(item) for item in value.get("entities", [])],
+        [Relation.model_validate(item) for item in value.get("relations", [])],
+    )
+
+
+@runtime_checkable
+class IExtractionCache(Protocol):
+    """
+    추출 결과 캐시 인터페이스
+
+    구현 예시:
+    - FileExtractionCache: 로컬 디스크
+    - RedisExtractionCache: Redis
+    """
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """캐시 조회 (없으면 None)"""
+        ...
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """캐시 저장"""
+        ...
+
+
+class FileExtractionCache:
+    """
+    디스크 기반 추출 결과 캐시
+
+    키별 JSON 파일을 키 앞 2자리 하위 디렉토리에 나눠 저장합니다.
+    쓰기는 임시 파일 → os.replace로 원자적이며, 파일 I/O는 스레드에서 실행합니다.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """
+        Args:
+            directory: 캐시 디렉토리 (없으면 생성)
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.json"
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, key, value)
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data: dict[str, Any] = json.load(f)
+                return data
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"손상된 추출 캐시 항목 무시: {path.name} ({e})")
+            return None
+
+    def _write(self, key: str, value: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+
+class RedisExtractionCache:
+    """
+    Redis 기반 추출 결과 캐시
+
+    여러 인스턴스/워커가 같은 추출 결과를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        key_prefix: str = "graph:extraction:",
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """
+        Args:
+            redis_client: redis.asyncio.Redis 클라이언트
+            key_prefix: 키 접두사 (네임스페이스 분리)
+            ttl_seconds: 만료 시간 (None이면 만료 없음)
+        """
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        raw = await self._redis.get(self._key_prefix + key)
+        if raw is None:
+            return None
+        data: dict[str, Any] = json.loads(raw)
+        return data
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        await self._redis.set(
+            self._key_prefix + key,
+            json.dumps(value, ensure_ascii=False, default=str),
+            ex=self._ttl_seconds,
+        )
+
+    async def close(self) -> None:
+        """Redis 연결 풀 종료"""
+        await self._redis.aclose()
@@ -9,6 +9,7 @@ IEntityExtractor 프로토콜을 구현하여 GraphRAGFactory와 호환됩니다
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import uuid
@@ -87,12 +88,25 @@ class LLMEntityExtractor:
         self._llm_client = llm_client
         self._config = {**self.DEFAULT_CONFIG, **(config or {})}
 
-    async def extract(self, text: str) -> list[Entity]:
+    @property
+    def model(self) -> str:
+        """추출에 사용하는 모델 (추출 캐시 키)"""
+        return str(self._config["model"])
+
+    @property
+    def prompt_version(self) -> str:
+        """프롬프트 템플릿 + 추출 한도 해시 (템플릿이 바뀌면 추출 캐시가 무효화됨)"""
+        raw = f"{ENTITY_EXTRACTION_PROMPT}|{self._config['max_entities']}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+
+    async def extract(self, text: str, strict: bool = False) -> list[Entity]:
         """
         텍스트에서 엔티티 추출
 
         Args:
             text: 추출 대상 텍스트
+            strict: True면 LLM 호출/파싱 실패 시 빈 리스트 대신 예외 발생
+                (추출 캐시가 실패 결과를 저장하지 않도록 빌더가 사용)
 
         Returns:
             추출된 엔티티 리스트 (실패 시 빈 리스트)
@@ -118,6 +132,8 @@ class LLMEntityExtractor:
             return entities
 
         except Exception as e:
+            if strict:
+                raise
             logger.warning(f"엔티티 추출 실패 (graceful degradation): {e}")
             return []
 
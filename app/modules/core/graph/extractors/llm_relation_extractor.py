@@ -9,6 +9,7 @@ IRelationExtractor 프로토콜을 구현하여 GraphRAGFactory와 호환됩니
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from typing import Any
@@ -87,10 +88,22 @@ class LLMRelationExtractor:
         self._llm_client = llm_client
         self._config = {**self.DEFAULT_CONFIG, **(config or {})}
 
+    @property
+    def model(self) -> str:
+        """추출에 사용하는 모델 (추출 캐시 키)"""
+        return str(self._config["model"])
+
+    @property
+    def prompt_version(self) -> str:
+        """프롬프트 템플릿 + 추출 한도 해시 (템플릿이 바뀌면 추출 캐시가 무효화됨)"""
+        raw = f"{RELATION_EXTRACTION_PROMPT}|{self._config['max_relations']}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+
     async def extract(
         self,
         text: str,
         entities: list[Entity],
+        strict: bool = False,
     ) -> list[Relation]:
         """
         텍스트에서 엔티티 간 관계 추출
@@ -98,6 +111,7 @@ class LLMRelationExtractor:
         Args:
             text: 추출 대상 텍스트
             entities: 이미 추출된 엔티티 리스트
+            strict: True면 LLM 호출/파싱 실패 시 빈 리스트 대신 예외 발생
 
         Returns:
             추출된 관계 리스트 (실패 시 빈 리스트)
@@ -134,6 +148,8 @@ class LLMRelationExtractor:
             return relations
 
         except Exception as e:
+            if strict:
+                raise
             logger.warning(f"관계 추출 실패 (graceful degradation): {e}")
             return []
 
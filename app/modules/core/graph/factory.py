@@ -111,9 +111,29 @@ class GraphRAGFactory:
         config: dict[str, Any],
         graph_config: dict[str, Any],
     ) -> NetworkXGraphStore:
-        """NetworkX 그래프 저장소 생성"""
-        store = NetworkXGraphStore()
-        logger.info("✅ NetworkXGraphStore 생성")
+        """
+        NetworkX 그래프 저장소 생성
+
+        networkx.persistence.enabled가 true면 스냅샷 + WAL 저장소를 연결합니다.
+        그래프는 첫 사용 시 디스크에서 지연 로드됩니다 (웜 스타트).
+        """
+        persistence_config = graph_config.get("networkx", {}).get("persistence", {})
+        if not persistence_config.get("enabled", False):
+            store = NetworkXGraphStore()
+            logger.info("✅ NetworkXGraphStore 생성")
+            return store
+
+        from .stores.snapshot import GraphSnapshotStore
+
+        directory = persistence_config.get("directory", "data/graph_snapshot")
+        store = NetworkXGraphStore(
+            persistence=GraphSnapshotStore(
+                directory, fsync=persistence_config.get("fsync", False)
+            ),
+            max_wal_entries=persistence_config.get("max_wal_entries", 10_000),
+            snapshot_interval_seconds=persistence_config.get("snapshot_interval_seconds", 300),
+        )
+        logger.info(f"✅ NetworkXGraphStore 생성 (스냅샷 + WAL: {directory})")
         return store
 
     @staticmethod
@@ -145,6 +165,8 @@ class GraphRAGFactory:
         neo4j_section = graph_config.get("neo4j", {})
         pool_config = neo4j_section.get("connection_pool", {})
         retry_config = neo4j_section.get("retry", {})
+        write_config = neo4j_section.get("write", {})
+        search_config = neo4j_section.get("search", {})
 
         # 환경 변수 + YAML 설정 병합
         store_config = {
@@ -161,6 +183,15 @@ class GraphRAGFactory:
             # 재시도 설정 (기본값 포함)
             "max_retries": retry_config.get("max_attempts", 3),
             "retry_delay": retry_config.get("delay", 1.0),
+            # 일괄 쓰기 / 스키마 설정 (기본값 포함)
+            "write_batch_size": write_config.get("batch_size", 1000),
+            "create_schema": neo4j_section.get("create_schema", True),
+            # 검색 인덱스 설정 (기본값 포함)
+            "search_indexes": search_config.get("indexes", True),
+            "fulltext_analyzer": search_config.get("fulltext_analyzer", "cjk"),
+            "embedding_dimensions": search_config.get("embedding_dimensions"),
+            "search_overfetch": search_config.get("overfetch", 4),
+            "rrf_k": search_config.get("rrf_k", 60),
         }
 
         # URI는 필수
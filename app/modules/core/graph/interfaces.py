@@ -7,6 +7,7 @@ runtime_checkable Protocol을 사용하여 duck typing 지원.
 """
 from typing import Any, Protocol, runtime_checkable
 
+from .adjacency import GraphAdjacency
 from .models import Entity, GraphSearchResult, Relation
 
 
@@ -39,6 +40,24 @@ class IGraphStore(Protocol):
         """
         ...
 
+    async def add_entities_bulk(self, entities: list[Entity]) -> None:
+        """
+        엔티티 일괄 추가 (임베딩 배치 + 일괄 쓰기)
+
+        Args:
+            entities: 추가할 엔티티 리스트 (같은 ID는 마지막 항목 기준)
+        """
+        ...
+
+    async def add_relations_bulk(self, relations: list[Relation]) -> None:
+        """
+        관계 일괄 추가
+
+        Args:
+            relations: 추가할 관계 리스트
+        """
+        ...
+
     async def get_entity(self, entity_id: str) -> Entity | None:
         """
         엔티티 조회
@@ -103,6 +122,24 @@ class IGraphStore(Protocol):
         ...
 
 
+@runtime_checkable
+class IGraphAdjacencyProvider(Protocol):
+    """
+    CSR 인접 행렬 제공 인터페이스 (선택적 그래프 저장소 기능)
+
+    구현 예시:
+    - NetworkXGraphStore: 인메모리 그래프에서 CSR 스냅샷 생성/캐시
+    """
+
+    async def get_adjacency(self) -> GraphAdjacency:
+        """
+        CSR 인접 행렬 스냅샷 반환
+
+        Returns:
+            다중 홉 확장/PPR에 사용할 GraphAdjacency
+        """
+        ...
+
 @runtime_checkable
 class IEntityExtractor(Protocol):
     """
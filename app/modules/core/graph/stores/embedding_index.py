@@ -0,0 +1,191 @@
+"""
+엔티티 임베딩 행렬 인덱스
+NetworkXGraphStore의 벡터 검색용 인메모리 인덱스
+
+특징:
+- 사전 정규화된 float32 연속 행렬 (행 = 엔티티)
+- entity_id ↔ 행 번호 매핑, 엔티티 타입별 행 마스크
+- add_entity 시 증분 갱신 (용량 2배 확장, 삭제는 마지막 행과 교체)
+- 검색 = 행렬-벡터 곱 1회 + argpartition
+"""
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EntityEmbeddingIndex:
+    """
+    엔티티 임베딩 행렬 인덱스 (정확 코사인 유사도)
+
+    모든 벡터를 저장 시점에 L2 정규화하므로 코사인 유사도가 내적 하나로 계산됩니다.
+    """
+
+    def __init__(self, initial_capacity: int = 1024) -> None:
+        """
+        Args:
+            initial_capacity: 초기 행 용량 (부족하면 2배씩 확장)
+        """
+        self._initial_capacity = max(1, initial_capacity)
+        self._matrix: np.ndarray | None = None  # (capacity, dim) float32, 첫 벡터에서 할당
+        self._ids: list[str] = []  # 행 번호 → entity_id
+        self._rows: dict[str, int] = {}  # entity_id → 행 번호
+        self._types: list[str] = []  # 행 번호 → 엔티티 타입
+        self._type_masks: dict[str, np.ndarray] = {}  # 타입 → (capacity,) bool 마스크
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._rows
+
+    @property
+    def dimension(self) -> int | None:
+        """임베딩 차원 (아직 벡터가 없으면 None)"""
+        return None if self._matrix is None else int(self._matrix.shape[1])
+
+    def upsert(self, entity_id: str, entity_type: str, embedding: list[float]) -> bool:
+        """
+        엔티티 임베딩 추가 또는 갱신
+
+        Args:
+            entity_id: 엔티티 ID
+            entity_type: 엔티티 타입 (타입 필터 마스크용)
+            embedding: 임베딩 벡터
+
+        Returns:
+            인덱싱 여부 (영벡터/차원 불일치면 False, 기존 행은 제거됨)
+        """
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+
+        if norm == 0.0 or (self._matrix is not None and vector.shape[0] != self._matrix.shape[1]):
+            if norm != 0.0:
+                logger.warning(
+                    f"Embedding dimension mismatch for entity {entity_id}: "
+                    f"{vector.shape[0]} != {self.dimension}"
+                )
+            self.remove(entity_id)
+            return False
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self._initial_capacity, vector.shape[0]), dtype=np.float32)
+
+        row = self._rows.get(entity_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(entity_id)
+            self._types.append(entity_type)
+            self._rows[entity_id] = row
+        elif self._types[row] != entity_type:
+            self._type_masks[self._types[row]][row] = False
+            self._types[row] = entity_type
+
+        self._matrix[row] = vector / norm
+        self._type_mask(entity_type)[row] = True
+        return True
+
+    def remove(self, entity_id: str) -> None:
+        """엔티티 임베딩 제거 (마지막 행을 빈 자리로 이동)"""
+        row = self._rows.pop(entity_id, None)
+        if row is None or self._matrix is None:
+            return
+
+        last = len(self._ids) - 1
+        self._type_masks[self._types[row]][row] = False
+
+        if row != last:
+            moved_id, moved_type = self._ids[last], self._types[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row], self._types[row] = moved_id, moved_type
+            self._rows[moved_id] = row
+            self._type_masks[moved_type][last] = False
+            self._type_masks[moved_type][row] = True
+
+        self._ids.pop()
+        self._types.pop()
+
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int = 10,
+        entity_types: list[str] | None = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """
+        코사인 유사도 상위 top_k 검색
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            top_k: 최대 결과 수
+            entity_types: 필터링할 엔티티 타입 (None이면 전체)
+            min_score: 이 값보다 큰 유사도만 반환
+
+        Returns:
+            (entity_id, 유사도) 리스트 (유사도 내림차순)
+        """
+        size = len(self._ids)
+        if self._matrix is None or size == 0 or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0 or query.shape[0] != self._matrix.shape[1]:
+            return []
+
+        scores = self._matrix[:size] @ (query / norm)
+
+        if entity_types:
+            mask = np.zeros(size, dtype=bool)
+            for entity_type in entity_types:
+                type_mask = self._type_masks.get(entity_type)
+                if type_mask is not None:
+                    mask |= type_mask[:size]
+            scores = np.where(mask, scores, -np.inf)
+
+        candidates = np.flatnonzero(scores > min_score)
+        if candidates.size == 0:
+            return []
+
+        if candidates.size > top_k:
+            top = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[top]
+
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._ids[row], float(scores[row])) for row in order]
+
+    def clear(self) -> None:
+        """인덱스 초기화"""
+        self._matrix = None
+        self._ids.clear()
+        self._rows.clear()
+        self._types.clear()
+        self._type_masks.clear()
+
+    def _type_mask(self, entity_type: str) -> np.ndarray:
+        """타입별 행 마스크 (없으면 생성)"""
+        mask = self._type_masks.get(entity_type)
+        if mask is None:
+            assert self._matrix is not None
+            mask = np.zeros(self._matrix.shape[0], dtype=bool)
+            self._type_masks[entity_type] = mask
+        return mask
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """행렬/마스크 용량 확보 (2배 확장)"""
+        assert self._matrix is not None
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+
+        new_capacity = max(rows, capacity * 2)
+        matrix = np.zeros((new_capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:capacity] = self._matrix
+        self._matrix = matrix
+
+        for entity_type, mask in self._type_masks.items():
+            grown = np.zeros(new_capacity, dtype=bool)
+            grown[:capacity] = mask
+            self._type_masks[entity_type] = grown
@@ -6,8 +6,10 @@ IGraphStore 프로토콜을 구현하며, Neo4j의 Cypher 쿼리를 사용합니
 
 주요 기능:
 - 엔티티/관계 CRUD (MERGE 사용으로 중복 방지)
+- UNWIND 배치 일괄 쓰기 (관리형 트랜잭션 + 재시도, 처리량 통계)
+- Entity.id 유니크 제약조건 / Entity.type 인덱스 자동 생성
 - 깊이 기반 이웃 탐색 (가변 길이 경로)
-- 전문 검색 (CONTAINS 기반, 향후 Full-text index 확장 가능)
+- 전문 검색 인덱스 + 벡터 인덱스 검색 (Cypher 내 RRF 병합, CONTAINS 대체 경로)
 - 비동기 드라이버 지원
 
 생성일: 2026-01-05
@@ -15,13 +17,15 @@ IGraphStore 프로토콜을 구현하며, Neo4j의 Cypher 쿼리를 사용합니
 from __future__ import annotations
 
 import asyncio
+import inspect
+import re
 import time
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from neo4j import AsyncDriver, AsyncGraphDatabase
-from neo4j.exceptions import ServiceUnavailable, TransientError
+from neo4j.exceptions import ClientError, ServiceUnavailable, TransientError
 
 from app.lib.logger import get_logger
 from app.modules.core.graph.interfaces import IGraphStore
@@ -34,6 +38,12 @@ T = TypeVar("T")
 
 logger = get_logger(__name__)
 
+# Lucene 쿼리 문법 특수문자 (전문 검색 입력 이스케이프용)
+_LUCENE_SPECIAL_CHARS = re.compile(r'[+\-&|!(){}\[\]^"~*?:\\/]')
+
+# DDL에 직접 들어가는 애널라이저 이름 검증 (파라미터 바인딩 불가)
+_ANALYZER_NAME = re.compile(r"^[a-z0-9_-]+$")
+
 
 class Neo4jGraphStore(IGraphStore):
     """
@@ -48,6 +58,73 @@ class Neo4jGraphStore(IGraphStore):
         _config: 설정 딕셔너리
     """
 
+    _FULLTEXT_INDEX = "entity_name_fulltext"
+    _VECTOR_INDEX = "entity_embedding_index"
+
+    # MERGE가 인덱스를 타도록 시작 시 생성하는 스키마 (IF NOT EXISTS로 멱등)
+    _SCHEMA_STATEMENTS = (
+        "CREATE CONSTRAINT entity_id_unique IF NOT EXISTS "
+        "FOR (e:Entity) REQUIRE e.id IS UNIQUE",
+        "CREATE INDEX entity_type_index IF NOT EXISTS FOR (e:Entity) ON (e.type)",
+    )
+
+    # 임베딩은 값이 있을 때만 갱신 (임베더 없이 쓰면 기존 벡터 유지)
+    _ENTITY_UPSERT_QUERY = """
+    UNWIND $rows AS row
+    MERGE (e:Entity {id: row.id})
+    SET e.name = row.name,
+        e.type = row.type,
+        e.properties = row.properties,
+        e.embedding = coalesce(row.embedding, e.embedding)
+    """
+
+    _RELATION_UPSERT_QUERY = """
+    UNWIND $rows AS row
+    MERGE (s:Entity {id: row.source_id})
+    MERGE (t:Entity {id: row.target_id})
+    MERGE (s)-[r:RELATES_TO]->(t)
+    SET r.type = row.type,
+        r.weight = row.weight
+    """
+
+    # 검색 분기: 인덱스 조회 → 타입 필터 → 순위 기반 RRF 기여도 (rank는 0부터)
+    _FULLTEXT_BRANCH = """
+        CALL db.index.fulltext.queryNodes($fulltext_index, $fulltext_query, {limit: $fetch_k})
+        YIELD node, score
+        WHERE $entity_types IS NULL OR node.type IN $entity_types
+        WITH node, score ORDER BY score DESC LIMIT $fetch_k
+        WITH collect(node) AS nodes
+        UNWIND range(0, size(nodes) - 1) AS rank
+        RETURN nodes[rank] AS node, 1.0 / ($rrf_k + rank + 1) AS rrf
+    """
+
+    _VECTOR_BRANCH = """
+        CALL db.index.vector.queryNodes($vector_index, $fetch_k, $embedding)
+        YIELD node, score
+        WHERE $entity_types IS NULL OR node.type IN $entity_types
+        WITH node, score ORDER BY score DESC LIMIT $fetch_k
+        WITH collect(node) AS nodes
+        UNWIND range(0, size(nodes) - 1) AS rank
+        RETURN nodes[rank] AS node, 1.0 / ($rrf_k + rank + 1) AS rrf
+    """
+
+    _FUSED_RETURN = """
+    WITH node AS e, sum(rrf) AS score
+    ORDER BY score DESC
+    LIMIT $top_k
+    OPTIONAL MATCH (e)-[r:RELATES_TO]-(related:Entity)
+    RETURN
+        e {.id, .name, .type, .properties} as entity,
+        score,
+        collect(DISTINCT {
+            source_id: startNode(r).id,
+            target_id: endNode(r).id,
+            type: r.type,
+            weight: r.weight
+        }) as relations
+    ORDER BY score DESC
+    """
+
     def __init__(self, config: dict[str, Any]) -> None:
         """
         Neo4jGraphStore 초기화
@@ -63,9 +140,16 @@ class Neo4jGraphStore(IGraphStore):
                 - query_timeout (float): 쿼리 실행 타임아웃 초 (기본값: 60.0)
                 - max_retries (int): 최대 재시도 횟수 (기본값: 3)
                 - retry_delay (float): 재시도 대기 시간 초 (기본값: 1.0)
+                - write_batch_size (int): UNWIND 배치당 행 수 (기본값: 1000)
+                - create_schema (bool): 제약조건/인덱스 자동 생성 여부 (기본값: True)
+                - search_indexes (bool): 전문 검색/벡터 인덱스 검색 사용 (기본값: True)
+                - fulltext_analyzer (str): 전문 검색 애널라이저 (기본값: "cjk", 한국어 bigram)
+                - embedding_dimensions (int): 벡터 인덱스 차원 (기본값: None, 첫 임베딩에서 결정)
+                - search_overfetch (int): 타입 필터 시 후보 배수 (기본값: 4)
+                - rrf_k (int): 전문/벡터 결과 RRF 상수 (기본값: 60)
 
         Raises:
-            ValueError: uri가 누락된 경우
+            ValueError: uri가 누락되었거나 fulltext_analyzer 이름이 잘못된 경우
         """
         uri = config.get("uri")
         if not uri:
@@ -85,8 +169,30 @@ class Neo4jGraphStore(IGraphStore):
         self._max_retries = config.get("max_retries", 3)
         self._retry_delay = config.get("retry_delay", 1.0)
 
+        # 일괄 쓰기 설정
+        self._write_batch_size = max(1, int(config.get("write_batch_size", 1000)))
+        self._create_schema = bool(config.get("create_schema", True))
+        self._write_stats: dict[str, Any] = {"rows": 0, "batches": 0, "seconds": 0.0}
+
+        # 검색 인덱스 설정
+        self._use_search_indexes = bool(config.get("search_indexes", True))
+        self._fulltext_analyzer = config.get("fulltext_analyzer", "cjk")
+        if not _ANALYZER_NAME.match(self._fulltext_analyzer):
+            raise ValueError(f"잘못된 fulltext_analyzer 이름: {self._fulltext_analyzer}")
+        dimensions = config.get("embedding_dimensions")
+        self._embedding_dimensions: int | None = int(dimensions) if dimensions else None
+        self._search_overfetch = max(1, int(config.get("search_overfetch", 4)))
+        self._rrf_k = int(config.get("rrf_k", 60))
+        self._embedder: Any = None  # 임베딩 모델 (선택적, 벡터 인덱스 검색용)
+        self._search_stats = {"index_searches": 0, "contains_searches": 0}
+
         # 상태 추적
         self._closed = False
+        self._schema_ready = False
+        self._schema_lock = asyncio.Lock()
+        self._vector_index_ready = False
+        self._vector_index_checked = False
+        self._index_search_available = True
 
         # Neo4j 비동기 드라이버 초기화 (연결 풀 설정 적용)
         self._driver: AsyncDriver | None = AsyncGraphDatabase.driver(
@@ -101,6 +207,31 @@ class Neo4jGraphStore(IGraphStore):
             f"pool_size={self._max_pool_size}, timeout={self._connection_timeout}s"
         )
 
+    def set_embedder(self, embedder: Any) -> None:
+        """
+        임베딩 모델 설정 (엔티티 임베딩 저장 + 벡터 인덱스 검색 활성화)
+
+        Args:
+            embedder: 임베딩 기능을 가진 객체 (embed_query/aembed_query, embed_documents 지원)
+        """
+        self._embedder = embedder
+
+    async def _embed_query(self, text: str) -> list[float]:
+        """
+        단일 텍스트 임베딩
+
+        DI 임베더(IEmbedder)의 embed_query는 동기 메서드이므로 aembed_query가 있으면
+        그것을, 없으면 스레드에서 embed_query를 호출합니다 (이벤트 루프 블로킹 방지).
+        """
+        aembed = getattr(self._embedder, "aembed_query", None)
+        if inspect.iscoroutinefunction(aembed):
+            return list(await aembed(text))
+
+        embed = self._embedder.embed_query
+        if inspect.iscoroutinefunction(embed):
+            return list(await embed(text))
+        return list(await asyncio.to_thread(embed, text))
+
     def _get_driver(self) -> AsyncDriver:
         """초기화된 Neo4j AsyncDriver 반환"""
         if self._driver is None:
@@ -164,6 +295,7 @@ class Neo4jGraphStore(IGraphStore):
                 - response_time_ms (float): 응답 시간 (밀리초)
                 - pool_size (int): 연결 풀 크기
                 - database (str): 데이터베이스 이름
+                - writes (dict): 일괄 쓰기 처리량 (rows_written, rows_per_second 등)
                 - error (str, optional): 오류 메시지 (실패 시)
         """
         start = time.perf_counter()
@@ -178,6 +310,7 @@ class Neo4jGraphStore(IGraphStore):
                 "response_time_ms": round(elapsed, 2),
                 "pool_size": self._max_pool_size,
                 "database": self._database,
+                "writes": self._write_throughput(),
             }
         except Exception as e:
             elapsed = (time.perf_counter() - start) * 1000
@@ -186,6 +319,7 @@ class Neo4jGraphStore(IGraphStore):
                 "connected": False,
                 "response_time_ms": round(elapsed, 2),
                 "error": str(e),
+                "writes": self._write_throughput(),
             }
 
     @asynccontextmanager
@@ -286,14 +420,28 @@ class Neo4jGraphStore(IGraphStore):
         Args:
             entity: 추가할 엔티티
         """
-        # MERGE를 사용하여 중복 방지
+        # MERGE를 사용하여 중복 방지 (임베딩은 값이 있을 때만 갱신)
         query = """
         MERGE (e:Entity {id: $id})
         SET e.name = $name,
             e.type = $type,
-            e.properties = $properties
+            e.properties = $properties,
+            e.embedding = coalesce($embedding, e.embedding)
         """
 
+        embedding: list[float] | None = None
+        text_to_embed = self._embedding_text(entity)
+        if self._embedder is not None and text_to_embed:
+            try:
+                embedding = await self._embed_query(text_to_embed)
+            except Exception as e:
+                logger.warning(f"엔티티 임베딩 생성 실패 {entity.id}: {e}")
+        if embedding:
+            try:
+                await self._ensure_vector_index(len(embedding))
+            except Exception as e:
+                logger.warning(f"Neo4j 벡터 인덱스 생성 실패: {e}")
+
         driver = self._get_driver()
         async with driver.session(database=self._database) as session:
             await session.run(
@@ -302,6 +450,7 @@ class Neo4jGraphStore(IGraphStore):
                 name=entity.name,
                 type=entity.type,
                 properties=dict(entity.properties) if entity.properties else {},
+                embedding=embedding,
             )
 
         logger.debug(f"엔티티 추가: {entity.id} ({entity.type})")
@@ -339,6 +488,253 @@ class Neo4jGraphStore(IGraphStore):
             f"관계 추가: {relation.source_id} -[{relation.type}]-> {relation.target_id}"
         )
 
+    async def add_entities_bulk(self, entities: list[Entity]) -> None:
+        """
+        엔티티 일괄 추가 (UNWIND 배치 MERGE)
+
+        write_batch_size개씩 `UNWIND $rows AS row MERGE ...` 한 번으로 저장합니다.
+        하나의 세션을 재사용하며, 배치마다 관리형 쓰기 트랜잭션(execute_write)으로
+        실행하고 일시 오류는 지수 백오프로 재시도합니다.
+
+        Args:
+            entities: 추가할 엔티티 리스트
+        """
+        embeddings = await self._embed_entities(entities)
+        rows = [
+            {
+                "id": entity.id,
+                "name": entity.name,
+                "type": entity.type,
+                "properties": dict(entity.properties) if entity.properties else {},
+                "embedding": embedding,
+            }
+            for entity, embedding in zip(entities, embeddings, strict=True)
+        ]
+        written = await self._write_batches(self._ENTITY_UPSERT_QUERY, rows)
+        logger.debug(f"엔티티 일괄 추가: {written}개")
+
+    async def add_relations_bulk(self, relations: list[Relation]) -> None:
+        """
+        관계 일괄 추가 (UNWIND 배치 MERGE)
+
+        소스/타겟 노드가 없으면 add_relation과 동일하게 플레이스홀더를 생성합니다.
+
+        Args:
+            relations: 추가할 관계 리스트
+        """
+        rows = [
+            {
+                "source_id": relation.source_id,
+                "target_id": relation.target_id,
+                "type": relation.type,
+                "weight": relation.weight,
+            }
+            for relation in relations
+        ]
+        written = await self._write_batches(self._RELATION_UPSERT_QUERY, rows)
+        logger.debug(f"관계 일괄 추가: {written}개")
+
+    async def ensure_schema(self) -> None:
+        """
+        제약조건/인덱스 생성 (멱등)
+
+        Entity.id 유니크 제약조건(인덱스 포함)과 Entity.type 인덱스를 생성하여
+        MERGE/타입 필터가 인덱스를 타도록 하고, Entity.name 전문 검색 인덱스를 만듭니다.
+        embedding_dimensions가 설정되어 있으면 벡터 인덱스도 함께 생성합니다.
+        최초 일괄 쓰기/검색 전에 자동 호출되며, 애플리케이션 시작 시 직접 호출할 수도 있습니다.
+        create_schema 여부와 무관하게 이미 존재하는 벡터 인덱스를 감지하므로
+        재시작/읽기 전용 워커도 벡터 검색 분기를 사용합니다.
+        """
+        if not self._vector_index_checked:
+            await self._detect_vector_index()
+
+        if self._schema_ready or not self._create_schema:
+            return
+
+        async with self._schema_lock:
+            if self._schema_ready:
+                return
+
+            driver = self._get_driver()
+            async with driver.session(database=self._database) as session:
+                for statement in (*self._SCHEMA_STATEMENTS, self._fulltext_index_statement()):
+                    await self._execute_with_retry(session.run, statement)
+
+            self._schema_ready = True
+            logger.info(
+                "Neo4j 스키마 준비 완료 (Entity.id 유니크 제약조건, Entity.type 인덱스, "
+                f"전문 검색 인덱스 analyzer={self._fulltext_analyzer})"
+            )
+
+        if self._embedding_dimensions:
+            await self._ensure_vector_index(self._embedding_dimensions)
+
+    async def _detect_vector_index(self) -> None:
+        """기존 벡터 인덱스 존재 여부 확인 (프로세스당 1회, 일시 오류 시 다음 호출에서 재시도)"""
+        try:
+            driver = self._get_driver()
+            async with driver.session(database=self._database) as session:
+                result = await session.run(
+                    "SHOW INDEXES YIELD name, type WHERE type = 'VECTOR' RETURN name"
+                )
+                records = await result.data()
+        except ClientError as e:
+            # SHOW INDEXES 미지원 서버 → 쓰기 시 생성 경로만 사용
+            self._vector_index_checked = True
+            logger.warning(f"Neo4j 벡터 인덱스 조회 불가: {e}")
+            return
+        except Exception as e:
+            logger.warning(f"Neo4j 벡터 인덱스 조회 실패: {e}")
+            return
+
+        self._vector_index_checked = True
+        if any(record.get("name") == self._VECTOR_INDEX for record in records):
+            self._vector_index_ready = True
+            logger.info(f"기존 Neo4j 벡터 인덱스 감지: {self._VECTOR_INDEX}")
+
+    def _fulltext_index_statement(self) -> str:
+        """Entity.name 전문 검색 인덱스 DDL (애널라이저는 생성자에서 검증됨)"""
+        return (
+            f"CREATE FULLTEXT INDEX {self._FULLTEXT_INDEX} IF NOT EXISTS "
+            "FOR (e:Entity) ON EACH [e.name] "
+            f"OPTIONS {{indexConfig: {{`fulltext.analyzer`: '{self._fulltext_analyzer}'}}}}"
+        )
+
+    async def _ensure_vector_index(self, dimensions: int) -> None:
+        """
+        Entity.embedding 벡터 인덱스 생성 (멱등, 코사인 유사도)
+
+        차원은 설정값 또는 처음 저장하는 임베딩 길이로 결정됩니다.
+        """
+        if self._vector_index_ready or not self._create_schema:
+            return
+
+        if self._embedding_dimensions and dimensions != self._embedding_dimensions:
+            logger.warning(
+                f"임베딩 차원 불일치: {dimensions} != {self._embedding_dimensions} (설정값 사용)"
+            )
+        dimensions = int(self._embedding_dimensions or dimensions)
+        statement = (
+            f"CREATE VECTOR INDEX {self._VECTOR_INDEX} IF NOT EXISTS "
+            "FOR (e:Entity) ON (e.embedding) "
+            f"OPTIONS {{indexConfig: {{`vector.dimensions`: {dimensions}, "
+            "`vector.similarity_function`: 'cosine'}}"
+        )
+
+        async with self._schema_lock:
+            if self._vector_index_ready:
+                return
+            driver = self._get_driver()
+            async with driver.session(database=self._database) as session:
+                await self._execute_with_retry(session.run, statement)
+            self._vector_index_ready = True
+            logger.info(f"Neo4j 벡터 인덱스 준비 완료 (dimensions={dimensions})")
+
+    @staticmethod
+    def _embedding_text(entity: Entity) -> str:
+        """임베딩 대상 텍스트 (이름 + 설명, NetworkXGraphStore와 동일)"""
+        return f"{entity.name} {entity.properties.get('description', '')}".strip()
+
+    async def _embed_entities(self, entities: list[Entity]) -> list[list[float] | None]:
+        """
+        엔티티 임베딩 일괄 생성 (embed_documents 1회)
+
+        임베더가 없거나 실패하면 None으로 채워 임베딩 없이 저장합니다.
+        """
+        embeddings: list[list[float] | None] = [None] * len(entities)
+        if self._embedder is None:
+            return embeddings
+
+        texts = [self._embedding_text(entity) for entity in entities]
+        targets = [i for i, text in enumerate(texts) if text]
+        if not targets:
+            return embeddings
+
+        try:
+            embed = self._embedder.embed_documents
+            batch = [texts[i] for i in targets]
+            if inspect.iscoroutinefunction(embed):
+                vectors = await embed(batch)
+            else:
+                vectors = await asyncio.to_thread(embed, batch)
+            for i, vector in zip(targets, vectors, strict=True):
+                embeddings[i] = list(vector)
+        except Exception as e:
+            logger.warning(f"엔티티 임베딩 일괄 생성 실패 ({len(targets)}개): {e}")
+            return [None] * len(entities)
+
+        first = embeddings[targets[0]]
+        if first:
+            try:
+                await self._ensure_vector_index(len(first))
+            except Exception as e:
+                logger.warning(f"Neo4j 벡터 인덱스 생성 실패: {e}")
+
+        return embeddings
+
+    async def _write_batches(self, query: str, rows: list[dict[str, Any]]) -> int:
+        """
+        행 리스트를 배치 단위 UNWIND 쿼리로 저장
+
+        Args:
+            query: `$rows` 파라미터를 UNWIND하는 쓰기 쿼리
+            rows: 저장할 행 리스트
+
+        Returns:
+            저장한 행 수
+        """
+        if not rows:
+            return 0
+
+        try:
+            await self.ensure_schema()
+        except Exception as e:
+            # 스키마 생성 실패는 쓰기를 막지 않음 (다음 일괄 쓰기에서 재시도)
+            logger.warning(f"Neo4j 스키마 생성 실패, 인덱스 없이 진행: {e}")
+
+        start = time.perf_counter()
+        written = 0
+        driver = self._get_driver()
+        async with driver.session(database=self._database) as session:
+            for offset in range(0, len(rows), self._write_batch_size):
+                batch = rows[offset : offset + self._write_batch_size]
+                written += await self._execute_with_retry(
+                    session.execute_write, self._run_write, query, batch
+                )
+                self._write_stats["batches"] += 1
+
+        self._write_stats["rows"] += written
+        self._write_stats["seconds"] += time.perf_counter() - start
+        return written
+
+    @staticmethod
+    async def _run_write(tx: Any, query: str, rows: list[dict[str, Any]]) -> int:
+        """관리형 트랜잭션 함수 - 배치 1개 실행 후 결과 소비"""
+        result = await tx.run(query, rows=rows)
+        await result.consume()
+        return len(rows)
+
+    def _search_info(self) -> dict[str, Any]:
+        """검색 경로 상태/통계"""
+        return {
+            "index_search_enabled": self._use_search_indexes and self._index_search_available,
+            "vector_index_ready": self._vector_index_ready,
+            "fulltext_analyzer": self._fulltext_analyzer,
+            **self._search_stats,
+        }
+
+    def _write_throughput(self) -> dict[str, Any]:
+        """누적 일괄 쓰기 처리량 통계"""
+        seconds = self._write_stats["seconds"]
+        rows = self._write_stats["rows"]
+        return {
+            "rows_written": rows,
+            "write_batches": self._write_stats["batches"],
+            "write_seconds": round(seconds, 3),
+            "rows_per_second": round(rows / seconds, 1) if seconds > 0 else 0.0,
+            "write_batch_size": self._write_batch_size,
+        }
+
     async def get_entity(self, entity_id: str) -> Entity | None:
         """
         ID로 엔티티를 조회합니다.
@@ -478,8 +874,10 @@ class Neo4jGraphStore(IGraphStore):
         """
         그래프에서 엔티티를 검색합니다.
 
-        엔티티 이름에 대해 CONTAINS 검색을 수행합니다.
-        대소문자를 무시한 부분 문자열 매칭입니다.
+        전문 검색 인덱스(+ 임베더가 있으면 벡터 인덱스)를 쿼리 1회로 조회하고
+        Cypher 내에서 RRF로 병합합니다. 인덱스가 없거나 비활성화된 경우
+        이름 CONTAINS 검색(라벨 전체 스캔)으로 대체합니다.
+        타입 필터는 항상 $entity_types 파라미터로 전달합니다.
 
         Args:
             query: 검색 쿼리 문자열
@@ -489,82 +887,181 @@ class Neo4jGraphStore(IGraphStore):
         Returns:
             GraphSearchResult: 검색된 엔티티와 연관 관계
         """
-        # 타입 필터 조건 생성
-        type_filter = ""
-        if entity_types:
-            type_conditions = " OR ".join(
-                [f"e.type = '{t}'" for t in entity_types]
+        records: list[dict[str, Any]] | None = None
+        fulltext_query = self._to_fulltext_query(query)
+
+        if self._use_search_indexes and self._index_search_available and fulltext_query:
+            try:
+                await self.ensure_schema()
+            except Exception as e:
+                logger.warning(f"Neo4j 스키마 생성 실패: {e}")
+
+            try:
+                records = await self._search_indexed(
+                    query, fulltext_query, entity_types, top_k
+                )
+                self._search_stats["index_searches"] += 1
+            except ClientError as e:
+                # 인덱스 미존재/미지원 서버 → 이후 검색은 CONTAINS 경로 사용
+                self._index_search_available = False
+                logger.warning(f"Neo4j 인덱스 검색 불가, CONTAINS 검색으로 대체: {e}")
+
+        if records is None:
+            records = await self._search_contains(query, entity_types, top_k)
+            self._search_stats["contains_searches"] += 1
+
+        entities, relations = self._parse_entity_records(records)
+
+        # 검색 점수 계산 (간단한 휴리스틱)
+        score = min(1.0, len(entities) / top_k) if top_k > 0 else 0.0
+
+        logger.info(f"검색 완료: query='{query}' -> {len(entities)}개 엔티티")
+
+        return GraphSearchResult(
+            entities=entities,
+            relations=relations,
+            score=score,
+        )
+
+    async def _search_indexed(
+        self,
+        query: str,
+        fulltext_query: str,
+        entity_types: list[str] | None,
+        top_k: int,
+    ) -> list[dict[str, Any]]:
+        """
+        전문 검색 + 벡터 인덱스 검색 (단일 쿼리, Cypher 내 RRF 병합)
+
+        타입 필터는 인덱스 조회 후 적용되므로 필터가 있으면 search_overfetch배
+        후보를 가져옵니다.
+        """
+        embedding: list[float] | None = None
+        if self._embedder is not None and self._vector_index_ready:
+            try:
+                embedding = await self._embed_query(query)
+            except Exception as e:
+                logger.warning(f"쿼리 임베딩 실패, 전문 검색만 사용: {e}")
+
+        branches = [self._FULLTEXT_BRANCH]
+        if embedding is not None:
+            branches.append(self._VECTOR_BRANCH)
+
+        cypher_query = (
+            "CALL {"
+            + "\n    UNION ALL\n".join(branches)
+            + "}"
+            + self._FUSED_RETURN
+        )
+        fetch_k = top_k * self._search_overfetch if entity_types else top_k
+
+        driver = self._get_driver()
+        async with driver.session(database=self._database) as session:
+            result = await session.run(
+                cypher_query,
+                fulltext_index=self._FULLTEXT_INDEX,
+                fulltext_query=fulltext_query,
+                vector_index=self._VECTOR_INDEX,
+                embedding=embedding,
+                entity_types=entity_types or None,
+                fetch_k=fetch_k,
+                top_k=top_k,
+                rrf_k=self._rrf_k,
             )
-            type_filter = f"AND ({type_conditions})"
+            records: list[dict[str, Any]] = await result.data()
+        return records
 
-        # CONTAINS를 사용한 부분 문자열 검색
-        cypher_query = f"""
+    async def _search_contains(
+        self,
+        query: str,
+        entity_types: list[str] | None,
+        top_k: int,
+    ) -> list[dict[str, Any]]:
+        """이름 CONTAINS 검색 (인덱스 미사용 대체 경로)"""
+        cypher_query = """
         MATCH (e:Entity)
-        WHERE toLower(e.name) CONTAINS toLower($search_query) {type_filter}
+        WHERE toLower(e.name) CONTAINS toLower($search_query)
+          AND ($entity_types IS NULL OR e.type IN $entity_types)
         WITH e
         LIMIT $top_k
         OPTIONAL MATCH (e)-[r:RELATES_TO]-(related:Entity)
         RETURN
-            e {{.id, .name, .type, .properties}} as entity,
-            collect(DISTINCT {{
+            e {.id, .name, .type, .properties} as entity,
+            collect(DISTINCT {
                 source_id: startNode(r).id,
                 target_id: endNode(r).id,
                 type: r.type,
                 weight: r.weight
-            }}) as relations
+            }) as relations
         """
 
+        driver = self._get_driver()
+        async with driver.session(database=self._database) as session:
+            result = await session.run(
+                cypher_query,
+                search_query=query,
+                entity_types=entity_types or None,
+                top_k=top_k,
+            )
+            records: list[dict[str, Any]] = await result.data()
+        return records
+
+    @staticmethod
+    def _parse_entity_records(
+        records: list[dict[str, Any]],
+    ) -> tuple[list[Entity], list[Relation]]:
+        """검색 레코드(entity, relations) → 엔티티/관계 리스트 (관계 중복 제거)"""
         entities: list[Entity] = []
         relations: list[Relation] = []
         seen_relations: set[str] = set()
 
-        driver = self._get_driver()
-        async with driver.session(database=self._database) as session:
-            result = await session.run(cypher_query, search_query=query, top_k=top_k)
-            records = await result.data()
-
-            for record in records:
-                # 엔티티 추가
-                entity_data = record["entity"]
-                entities.append(
-                    Entity(
-                        id=entity_data["id"],
-                        name=entity_data.get("name", ""),
-                        type=entity_data.get("type", "unknown"),
-                        properties=entity_data.get("properties", {}),
-                    )
+        for record in records:
+            # 엔티티 추가
+            entity_data = record["entity"]
+            entities.append(
+                Entity(
+                    id=entity_data["id"],
+                    name=entity_data.get("name", ""),
+                    type=entity_data.get("type", "unknown"),
+                    properties=entity_data.get("properties", {}),
                 )
+            )
 
-                # 관계 추가 (중복 제거)
-                for rel_data in record.get("relations", []):
-                    # 관계가 없는 경우 (OPTIONAL MATCH 결과)
-                    if rel_data.get("source_id") is None:
-                        continue
-                    rel_key = (
-                        f"{rel_data['source_id']}-{rel_data['type']}-"
-                        f"{rel_data['target_id']}"
-                    )
-                    if rel_key not in seen_relations:
-                        relations.append(
-                            Relation(
-                                source_id=rel_data["source_id"],
-                                target_id=rel_data["target_id"],
-                                type=rel_data.get("type", "unknown"),
-                                weight=rel_data.get("weight", 1.0),
-                            )
+            # 관계 추가 (중복 제거)
+            for rel_data in record.get("relations", []):
+                # 관계가 없는 경우 (OPTIONAL MATCH 결과)
+                if rel_data.get("source_id") is None:
+                    continue
+                rel_key = (
+                    f"{rel_data['source_id']}-{rel_data['type']}-"
+                    f"{rel_data['target_id']}"
+                )
+                if rel_key not in seen_relations:
+                    relations.append(
+                        Relation(
+                            source_id=rel_data["source_id"],
+                            target_id=rel_data["target_id"],
+                            type=rel_data.get("type", "unknown"),
+                            weight=rel_data.get("weight", 1.0),
                         )
-                        seen_relations.add(rel_key)
+                    )
+                    seen_relations.add(rel_key)
 
-        # 검색 점수 계산 (간단한 휴리스틱)
-        score = min(1.0, len(entities) / top_k) if top_k > 0 else 0.0
+        return entities, relations
 
-        logger.info(f"검색 완료: query='{query}' -> {len(entities)}개 엔티티")
+    @staticmethod
+    def _to_fulltext_query(query: str) -> str:
+        """
+        사용자 입력 → Lucene 쿼리 문자열
 
-        return GraphSearchResult(
-            entities=entities,
-            relations=relations,
-            score=score,
-        )
+        특수문자를 이스케이프하고 연산자 키워드(AND/OR/NOT)를 소문자로 바꿔
+        입력이 쿼리 문법으로 해석되지 않도록 합니다. 토큰은 OR로 매칭됩니다.
+        """
+        tokens = []
+        for token in query.split():
+            escaped = _LUCENE_SPECIAL_CHARS.sub(r"\\\g<0>", token)
+            tokens.append(escaped.lower() if escaped in ("AND", "OR", "NOT") else escaped)
+        return " ".join(tokens)
 
     async def clear(self) -> None:
         """
@@ -593,12 +1090,14 @@ class Neo4jGraphStore(IGraphStore):
         상세 통계는 get_stats_async()를 사용하세요.
 
         Returns:
-            통계 정보 딕셔너리 (provider, database, uri)
+            통계 정보 딕셔너리 (provider, database, uri, writes)
         """
         return {
             "provider": "neo4j",
             "database": self._database,
             "uri": self._config.get("uri", "unknown"),
+            "writes": self._write_throughput(),
+            "search": self._search_info(),
         }
 
     async def get_stats_async(self) -> dict[str, Any]:
@@ -629,6 +1128,8 @@ class Neo4jGraphStore(IGraphStore):
                     "uri": self._config.get("uri", "unknown"),
                     "entity_count": record["entity_count"],
                     "relation_count": record["relation_count"],
+                    "writes": self._write_throughput(),
+                    "search": self._search_info(),
                 }
 
         # 조회 실패 시 기본 통계 반환
@@ -3,19 +3,24 @@ NetworkX 기반 인메모리 그래프 저장소
 경량 구현으로 PoC 및 소규모 데이터에 적합
 
 특징:
-- 인메모리 저장 (서버 재시작 시 초기화)
+- 인메모리 저장 (persistence 설정 시 스냅샷 + WAL로 재시작 후 복구)
 - 단일 인스턴스 환경에 적합
 - 빠른 그래프 연산 (NetworkX 최적화)
 """
+import asyncio
+import inspect
 import logging
+import time
 from collections import deque
 from typing import Any
 
 import networkx as nx
-import numpy as np
 
+from ..adjacency import GraphAdjacency
 from ..interfaces import IGraphStore
 from ..models import Entity, GraphSearchResult, Relation
+from .embedding_index import EntityEmbeddingIndex
+from .snapshot import GraphSnapshot, GraphSnapshotStore
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +34,47 @@ class NetworkXGraphStore(IGraphStore):
     v3.3.0: 벡터 검색 기능 통합으로 오타 및 의미적 유사도 검색 지원.
     """
 
-    def __init__(self) -> None:
-        """그래프 초기화"""
+    def __init__(
+        self,
+        persistence: GraphSnapshotStore | None = None,
+        max_wal_entries: int = 10_000,
+        snapshot_interval_seconds: float | None = None,
+    ) -> None:
+        """
+        그래프 초기화
+
+        Args:
+            persistence: 스냅샷/WAL 저장소 (None이면 순수 인메모리)
+            max_wal_entries: WAL 항목이 이 수에 도달하면 백그라운드 스냅샷
+            snapshot_interval_seconds: 마지막 스냅샷 이후 이 시간이 지나면 다음 쓰기 때 스냅샷
+        """
         self._graph = nx.DiGraph()  # 방향 그래프
         self._entities: dict[str, Entity] = {}
         self._embedder: Any = None  # 임베딩 모델 (선택적)
+        self._embedding_index = EntityEmbeddingIndex()  # 정규화된 임베딩 행렬 (벡터 검색용)
+
+        # CSR 인접 행렬 캐시 (그래프 변경 시 버전 증가 → 다음 요청에서 재구성)
+        self._graph_version = 0
+        self._adjacency: GraphAdjacency | None = None
+        self._adjacency_version = -1
+
+        # 영속화 (스냅샷 + WAL) - 첫 사용 시 지연 로드
+        self._persistence = persistence
+        self._max_wal_entries = max(1, max_wal_entries)
+        self._snapshot_interval = snapshot_interval_seconds
+        self._loaded = persistence is None
+        self._load_lock = asyncio.Lock()
+        self._snapshot_lock = asyncio.Lock()
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._last_snapshot_time = time.monotonic()
+        self._persistence_stats = {"snapshots_written": 0, "last_snapshot_bytes": 0, "replayed": 0}
 
     def set_embedder(self, embedder: Any) -> None:
         """
         임베딩 모델 설정
 
         Args:
-            embedder: 임베딩 기능을 가진 객체 (async embed_query, embed_documents 지원)
+            embedder: 임베딩 기능을 가진 객체 (embed_query, embed_documents; 동기/비동기 모두 지원)
         """
         self._embedder = embedder
 
@@ -50,6 +84,7 @@ class NetworkXGraphStore(IGraphStore):
 
         엔티티의 이름과 속성을 기반으로 임베딩을 생성하여 노드에 저장합니다.
         """
+        await self._ensure_loaded()
         self._entities[entity.id] = entity
 
         # 임베딩 대상 텍스트 구성 (이름 + 설명)
@@ -59,10 +94,84 @@ class NetworkXGraphStore(IGraphStore):
         embedding = None
         if self._embedder and text_to_embed:
             try:
-                embedding = await self._embedder.embed_query(text_to_embed)
+                embedding = await self._embed_query(text_to_embed)
             except Exception as e:
                 logger.warning(f"Failed to create embedding for entity {entity.id}: {e}")
 
+        self._store_entity(entity, embedding)
+        self._log({"op": "entities", "items": [self._entity_record(entity, embedding)]})
+
+    async def add_entities_bulk(self, entities: list[Entity]) -> None:
+        """
+        엔티티 일괄 추가 또는 업데이트
+
+        임베딩 대상 텍스트를 모아 embed_documents 1회로 임베딩합니다.
+        같은 ID가 여러 번 있으면 마지막 엔티티가 저장됩니다 (add_entity 반복과 동일).
+        """
+        await self._ensure_loaded()
+        unique = list({entity.id: entity for entity in entities}.values())
+        if not unique:
+            return
+
+        texts = [
+            f"{entity.name} {entity.properties.get('description', '')}".strip()
+            for entity in unique
+        ]
+        embeddings: list[Any] = [None] * len(unique)
+
+        if self._embedder:
+            targets = [i for i, text in enumerate(texts) if text]
+            try:
+                vectors = await self._embed_documents([texts[i] for i in targets])
+                for i, vector in zip(targets, vectors, strict=True):
+                    embeddings[i] = vector
+            except Exception as e:
+                logger.warning(f"Failed to create embeddings for {len(targets)} entities: {e}")
+
+        for entity, embedding in zip(unique, embeddings, strict=True):
+            self._entities[entity.id] = entity
+            self._store_entity(entity, embedding)
+
+        self._log(
+            {
+                "op": "entities",
+                "items": [
+                    self._entity_record(entity, embedding)
+                    for entity, embedding in zip(unique, embeddings, strict=True)
+                ],
+            }
+        )
+
+    async def _embed_query(self, text: str) -> list[float]:
+        """
+        단일 텍스트 임베딩
+
+        DI 임베더(IEmbedder)의 embed_query는 동기 메서드이므로 aembed_query가 있으면
+        그것을, 없으면 스레드에서 embed_query를 호출합니다 (이벤트 루프 블로킹 방지).
+        """
+        aembed = getattr(self._embedder, "aembed_query", None)
+        if inspect.iscoroutinefunction(aembed):
+            return list(await aembed(text))
+
+        embed = self._embedder.embed_query
+        if inspect.iscoroutinefunction(embed):
+            return list(await embed(text))
+        return list(await asyncio.to_thread(embed, text))
+
+    async def _embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """임베더의 embed_documents 호출 (동기 임베더는 스레드에서 실행)"""
+        if not texts:
+            return []
+        embed = self._embedder.embed_documents
+        if inspect.iscoroutinefunction(embed):
+            vectors = await embed(texts)
+        else:
+            vectors = await asyncio.to_thread(embed, texts)
+        return list(vectors)
+
+    def _store_entity(self, entity: Entity, embedding: Any) -> None:
+        """노드 저장 + 벡터 검색 인덱스 증분 갱신"""
+        self._graph_version += 1
         self._graph.add_node(
             entity.id,
             name=entity.name,
@@ -71,8 +180,15 @@ class NetworkXGraphStore(IGraphStore):
             embedding=embedding,  # 벡터 저장
         )
 
+        # 임베딩이 없으면 기존 행 제거
+        if embedding is not None:
+            self._embedding_index.upsert(entity.id, entity.type, embedding)
+        else:
+            self._embedding_index.remove(entity.id)
+
     async def add_relation(self, relation: Relation) -> None:
         """관계 추가 (없는 엔티티는 자동 생성)"""
+        await self._ensure_loaded()
         # 엔티티가 없으면 placeholder 생성
         if relation.source_id not in self._entities:
             placeholder = Entity(
@@ -90,7 +206,32 @@ class NetworkXGraphStore(IGraphStore):
             )
             await self.add_entity(placeholder)
 
-        # 엣지 추가
+        self._add_edge(relation)
+        self._log({"op": "relations", "items": [relation.model_dump()]})
+
+    async def add_relations_bulk(self, relations: list[Relation]) -> None:
+        """
+        관계 일괄 추가 (없는 엔티티는 placeholder를 일괄 생성)
+        """
+        await self._ensure_loaded()
+        missing: dict[str, Entity] = {}
+        for relation in relations:
+            for entity_id in (relation.source_id, relation.target_id):
+                if entity_id not in self._entities and entity_id not in missing:
+                    missing[entity_id] = Entity(id=entity_id, name=entity_id, type="unknown")
+
+        if missing:
+            await self.add_entities_bulk(list(missing.values()))
+
+        for relation in relations:
+            self._add_edge(relation)
+
+        if relations:
+            self._log({"op": "relations", "items": [r.model_dump() for r in relations]})
+
+    def _add_edge(self, relation: Relation) -> None:
+        """엣지 추가"""
+        self._graph_version += 1
         self._graph.add_edge(
             relation.source_id,
             relation.target_id,
@@ -101,6 +242,7 @@ class NetworkXGraphStore(IGraphStore):
 
     async def get_entity(self, entity_id: str) -> Entity | None:
         """엔티티 조회"""
+        await self._ensure_loaded()
         return self._entities.get(entity_id)
 
     async def get_neighbors(
@@ -110,6 +252,7 @@ class NetworkXGraphStore(IGraphStore):
         max_depth: int = 1,
     ) -> GraphSearchResult:
         """BFS 기반 이웃 탐색"""
+        await self._ensure_loaded()
         if entity_id not in self._graph:
             return GraphSearchResult(entities=[], relations=[], score=0.0)
 
@@ -191,7 +334,8 @@ class NetworkXGraphStore(IGraphStore):
         """
         그래프 검색 (벡터 유사도 + 이름 매칭)
 
-        1. 임베더가 있는 경우: 쿼리 임베딩 후 모든 노드와 코사인 유사도 검색
+        1. 임베더가 있는 경우: 쿼리 임베딩 후 임베딩 행렬과 코사인 유사도 검색
+           (행렬-벡터 곱 1회 + argpartition, 타입 필터는 행 마스크)
         2. 임베더가 없는 경우: 단순 이름 문자열 매칭 (하위 호환성)
 
         Args:
@@ -199,48 +343,29 @@ class NetworkXGraphStore(IGraphStore):
             entity_types: 필터링할 엔티티 유형
             top_k: 최대 결과 수
         """
+        await self._ensure_loaded()
         if not self._entities:
             return GraphSearchResult(entities=[], relations=[], score=0.0)
 
         # 1. 벡터 검색 시도 (임베더가 설정된 경우)
-        if self._embedder:
+        if self._embedder and len(self._embedding_index) > 0:
             try:
-                query_vec = np.array(await self._embedder.embed_query(query))
-
-                scored_entities = []
-                for node_id, node_data in self._graph.nodes(data=True):
-                    # 타입 필터링
-                    if entity_types and node_data.get("type") not in entity_types:
-                        continue
-
-                    node_vec = node_data.get("embedding")
-                    if node_vec is None:
-                        continue
-
-                    # 코사인 유사도 계산
-                    node_vec_np = np.array(node_vec)
-                    dot_product = np.dot(query_vec, node_vec_np)
-                    norm_a = np.linalg.norm(query_vec)
-                    norm_b = np.linalg.norm(node_vec_np)
-
-                    similarity = dot_product / (norm_a * norm_b) if norm_a > 0 and norm_b > 0 else 0.0
-
-                    if similarity > 0:
-                        entity = self._entities.get(node_id)
-                        if entity:
-                            scored_entities.append((entity, float(similarity)))
-
-                # 점수 높은 순으로 정렬
-                scored_entities.sort(key=lambda x: x[1], reverse=True)
+                query_vec = await self._embed_query(query)
+                scored_ids = self._embedding_index.search(
+                    query_vec, top_k=top_k, entity_types=entity_types
+                )
 
-                matched_entities = [e for e, s in scored_entities[:top_k]]
-                best_score = scored_entities[0][1] if scored_entities else 0.0
+                matched_entities = [
+                    self._entities[entity_id]
+                    for entity_id, _ in scored_ids
+                    if entity_id in self._entities
+                ]
 
                 if matched_entities:
                     return GraphSearchResult(
                         entities=matched_entities,
                         relations=[],
-                        score=best_score
+                        score=scored_ids[0][1],
                     )
             except Exception as e:
                 logger.warning(f"Vector search failed, falling back to string match: {e}")
@@ -266,13 +391,213 @@ class NetworkXGraphStore(IGraphStore):
 
     async def clear(self) -> None:
         """그래프 전체 삭제"""
+        await self._ensure_loaded()
+        self._clear_memory()
+        self._log({"op": "clear"})
+
+    async def get_adjacency(self) -> GraphAdjacency:
+        """
+        CSR 인접 행렬 스냅샷 반환 (그래프가 바뀌지 않았으면 캐시 재사용)
+
+        노드 속성 doc_id를 함께 담아 확장 결과를 문서 ID로 매핑할 수 있게 합니다.
+        """
+        await self._ensure_loaded()
+        if self._adjacency is not None and self._adjacency_version == self._graph_version:
+            return self._adjacency
+
+        node_ids = list(self._graph.nodes)
+        entities = [self._entities.get(node_id) for node_id in node_ids]
+        edges = list(self._graph.edges(data="weight", default=1.0))
+        self._adjacency = GraphAdjacency(
+            node_ids=node_ids,
+            sources=[source for source, _, _ in edges],
+            targets=[target for _, target, _ in edges],
+            weights=[weight for _, _, weight in edges],
+            names=[e.name if e else node_id for e, node_id in zip(entities, node_ids, strict=True)],
+            types=[e.type if e else "unknown" for e in entities],
+            doc_ids=[
+                str(e.properties["doc_id"]) if e and e.properties.get("doc_id") else None
+                for e in entities
+            ],
+        )
+        self._adjacency_version = self._graph_version
+        logger.debug(
+            f"CSR adjacency rebuilt: {len(self._adjacency)} nodes, "
+            f"{self._adjacency.edge_count} edges"
+        )
+        return self._adjacency
+
+    def _clear_memory(self) -> None:
+        """메모리 상의 그래프/인덱스 초기화"""
+        self._graph_version += 1
         self._graph.clear()
         self._entities.clear()
+        self._embedding_index.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """그래프 통계 반환"""
-        return {
+        stats: dict[str, Any] = {
             "node_count": self._graph.number_of_nodes(),
             "edge_count": self._graph.number_of_edges(),
             "entity_types": list({e.type for e in self._entities.values()}),
+            "indexed_embeddings": len(self._embedding_index),
         }
+        if self._persistence is not None:
+            stats["persistence"] = {
+                "directory": str(self._persistence.directory),
+                "loaded": self._loaded,
+                "wal_entries": self._persistence.wal_entries,
+                **self._persistence_stats,
+            }
+        return stats
+
+    # ------------------------------------------------------------------
+    # 영속화 (스냅샷 + WAL)
+    # ------------------------------------------------------------------
+
+    async def load(self) -> None:
+        """
+        스냅샷 + WAL에서 그래프 복구 (웜 스타트)
+
+        첫 사용 시 자동으로 호출되며, 시작 시점에 미리 로드하려면 직접 호출합니다.
+        """
+        await self._ensure_loaded()
+
+    async def save_snapshot(self) -> None:
+        """
+        현재 그래프를 스냅샷으로 저장하고 WAL을 비움
+
+        배열 구성은 이벤트 루프에서(일관된 시점), 파일 쓰기는 스레드에서 수행합니다.
+        스냅샷 작성 중 발생한 변경은 새 WAL에 기록됩니다.
+        """
+        if self._persistence is None:
+            return
+
+        async with self._snapshot_lock:
+            await self._ensure_loaded()
+            snapshot = GraphSnapshot(
+                entities=list(self._entities.values()),
+                relations=[
+                    Relation(
+                        source_id=source_id,
+                        target_id=target_id,
+                        type=data.get("type", "unknown"),
+                        weight=data.get("weight", 1.0),
+                        properties=data.get("properties", {}),
+                    )
+                    for source_id, target_id, data in self._graph.edges(data=True)
+                ],
+                embeddings={
+                    entity_id: self._graph.nodes[entity_id].get("embedding")
+                    for entity_id in self._entities
+                },
+            )
+            self._persistence.rotate_wal()
+
+            start = time.perf_counter()
+            size = await asyncio.to_thread(self._persistence.write_snapshot, snapshot)
+            self._persistence.discard_prev_wal()
+
+            self._last_snapshot_time = time.monotonic()
+            self._persistence_stats["snapshots_written"] += 1
+            self._persistence_stats["last_snapshot_bytes"] = size
+            logger.info(
+                f"Graph snapshot saved: {len(snapshot.entities)} nodes, "
+                f"{len(snapshot.relations)} edges, {size} bytes "
+                f"({time.perf_counter() - start:.2f}s)"
+            )
+
+    async def close(self) -> None:
+        """종료 시 진행 중 스냅샷 대기 후 미반영 변경을 스냅샷으로 저장"""
+        if self._persistence is None:
+            return
+
+        if self._snapshot_task is not None:
+            await asyncio.gather(self._snapshot_task, return_exceptions=True)
+        if self._loaded and self._persistence.wal_entries > 0:
+            await self.save_snapshot()
+        self._persistence.close()
+
+    async def _ensure_loaded(self) -> None:
+        """최초 1회 스냅샷 로드 + WAL 재생"""
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded or self._persistence is None:
+                return
+
+            start = time.perf_counter()
+            snapshot, records = await asyncio.to_thread(self._read_persisted)
+
+            if snapshot is not None:
+                for entity in snapshot.entities:
+                    self._entities[entity.id] = entity
+                    self._store_entity(entity, snapshot.embeddings.get(entity.id))
+                for relation in snapshot.relations:
+                    self._add_edge(relation)
+
+            for record in records:
+                self._replay(record)
+
+            self._loaded = True
+            self._persistence_stats["replayed"] = len(records)
+            logger.info(
+                f"Graph warm start: {len(self._entities)} nodes, "
+                f"{self._graph.number_of_edges()} edges, {len(records)} WAL records replayed "
+                f"({time.perf_counter() - start:.2f}s)"
+            )
+
+    def _read_persisted(self) -> tuple[GraphSnapshot | None, list[dict[str, Any]]]:
+        """스냅샷 + WAL 읽기 (스레드에서 실행)"""
+        assert self._persistence is not None
+        return self._persistence.read_snapshot(), self._persistence.read_wal()
+
+    def _replay(self, record: dict[str, Any]) -> None:
+        """WAL 레코드 1건 적용 (로그를 다시 남기지 않음)"""
+        op = record.get("op")
+        if op == "entities":
+            for item in record.get("items", []):
+                embedding = item.pop("embedding", None)
+                entity = Entity(**item)
+                self._entities[entity.id] = entity
+                self._store_entity(entity, embedding)
+        elif op == "relations":
+            for item in record.get("items", []):
+                self._add_edge(Relation(**item))
+        elif op == "clear":
+            self._clear_memory()
+        else:
+            logger.warning(f"Unknown WAL record op: {op}")
+
+    def _log(self, record: dict[str, Any]) -> None:
+        """변경을 WAL에 기록하고 필요하면 백그라운드 스냅샷 예약"""
+        if self._persistence is None:
+            return
+
+        self._persistence.append(record)
+
+        if self._snapshot_task is not None and not self._snapshot_task.done():
+            return
+        interval_elapsed = (
+            self._snapshot_interval is not None
+            and time.monotonic() - self._last_snapshot_time >= self._snapshot_interval
+        )
+        if self._persistence.wal_entries >= self._max_wal_entries or interval_elapsed:
+            self._snapshot_task = asyncio.create_task(self._background_snapshot())
+
+    async def _background_snapshot(self) -> None:
+        """백그라운드 스냅샷 (실패해도 WAL이 남아 있으므로 복구 가능)"""
+        try:
+            await self.save_snapshot()
+        except Exception as e:
+            logger.error(f"Graph snapshot failed (WAL retained): {e}")
+
+    @staticmethod
+    def _entity_record(entity: Entity, embedding: Any) -> dict[str, Any]:
+        """WAL용 엔티티 레코드"""
+        record = entity.model_dump()
+        if embedding is not None and hasattr(embedding, "tolist"):
+            embedding = embedding.tolist()
+        record["embedding"] = embedding
+        return record
@@ -0,0 +1,253 @@
+"""
+그래프 스냅샷 + WAL(Write-Ahead Log) 영속화
+NetworkXGraphStore의 재시작 시 웜 스타트용
+
+디스크 구성 (directory/):
+- graph.npz: 노드/엣지 배열 + 임베딩 행렬 스냅샷 (NumPy, allow_pickle=False)
+- wal.jsonl: 마지막 스냅샷 이후 변경 로그 (1줄 = 1 쓰기 호출)
+- wal.prev.jsonl: 스냅샷 작성 중 교체된 이전 WAL (스냅샷 완료 시 삭제)
+
+복구 = 스냅샷 로드 → wal.prev.jsonl → wal.jsonl 순서로 재생.
+모든 변경은 upsert이므로 스냅샷에 이미 반영된 로그를 다시 재생해도 결과가 같습니다.
+"""
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..models import Entity, Relation
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass
+class GraphSnapshot:
+    """
+    그래프 스냅샷 (메모리 표현)
+
+    Attributes:
+        entities: 엔티티 리스트
+        relations: 관계 리스트
+        embeddings: entity_id → 임베딩 벡터 (임베딩이 있는 엔티티만)
+    """
+
+    entities: list[Entity] = field(default_factory=list)
+    relations: list[Relation] = field(default_factory=list)
+    embeddings: dict[str, Any] = field(default_factory=dict)
+
+
+def _json_column(values: list[dict[str, Any]]) -> np.ndarray:
+    """속성 딕셔너리 리스트 → JSON 문자열 배열"""
+    return np.array([json.dumps(v, ensure_ascii=False, default=str) for v in values], dtype=str)
+
+
+def _str_column(values: list[str]) -> np.ndarray:
+    """문자열 리스트 → 유니코드 배열 (빈 리스트도 str dtype 유지)"""
+    return np.array(values, dtype=str)
+
+
+class GraphSnapshotStore:
+    """
+    스냅샷 파일 + WAL 관리자
+
+    모든 메서드는 동기 파일 I/O입니다. 스냅샷 쓰기/로드처럼 큰 작업은
+    호출부에서 asyncio.to_thread로 실행합니다.
+    """
+
+    SNAPSHOT_FILE = "graph.npz"
+    WAL_FILE = "wal.jsonl"
+    PREV_WAL_FILE = "wal.prev.jsonl"
+
+    def __init__(self, directory: str | Path, fsync: bool = False) -> None:
+        """
+        Args:
+            directory: 스냅샷/WAL 디렉토리 (없으면 생성)
+            fsync: WAL 기록마다 fsync 여부 (내구성 ↑, 쓰기 지연 ↑)
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._wal: Any = None  # 추가 모드 파일 핸들 (최초 기록 시 열림)
+        self._wal_entries = 0
+
+    @property
+    def directory(self) -> Path:
+        """스냅샷 디렉토리"""
+        return self._directory
+
+    @property
+    def wal_entries(self) -> int:
+        """현재 WAL에 기록된 항목 수 (마지막 스냅샷 이후)"""
+        return self._wal_entries
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self._directory / self.SNAPSHOT_FILE
+
+    @property
+    def wal_path(self) -> Path:
+        return self._directory / self.WAL_FILE
+
+    @property
+    def prev_wal_path(self) -> Path:
+        return self._directory / self.PREV_WAL_FILE
+
+    # ------------------------------------------------------------------
+    # WAL
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any]) -> None:
+        """WAL에 변경 1건 기록"""
+        if self._wal is None:
+            self._wal = open(self.wal_path, "a", encoding="utf-8")  # noqa: SIM115
+        self._wal.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._wal.flush()
+        if self._fsync:
+            os.fsync(self._wal.fileno())
+        self._wal_entries += 1
+
+    def rotate_wal(self) -> None:
+        """
+        현재 WAL을 wal.prev.jsonl로 교체 (스냅샷 시작 시점)
+
+        이후 변경은 새 WAL에 기록되고, 스냅샷이 완료되면 이전 WAL을 삭제합니다.
+        이전 WAL이 남아 있으면(직전 스냅샷 실패) 현재 WAL을 이어 붙입니다.
+        """
+        self.close()
+        if not self.wal_path.exists():
+            return
+        if self.prev_wal_path.exists():
+            with open(self.prev_wal_path, "a", encoding="utf-8") as prev:
+                prev.write(self.wal_path.read_text(encoding="utf-8"))
+            self.wal_path.unlink()
+        else:
+            os.replace(self.wal_path, self.prev_wal_path)
+
+    def discard_prev_wal(self) -> None:
+        """스냅샷 완료 후 이전 WAL 삭제"""
+        self.prev_wal_path.unlink(missing_ok=True)
+
+    def read_wal(self) -> list[dict[str, Any]]:
+        """복구용 WAL 레코드 (이전 WAL → 현재 WAL 순서, 손상된 마지막 줄은 무시)"""
+        records: list[dict[str, Any]] = []
+        for path in (self.prev_wal_path, self.wal_path):
+            if not path.exists():
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # 기록 도중 종료된 마지막 줄 (부분 기록)
+                        logger.warning(f"Skipping corrupt WAL line {path.name}:{line_no}")
+        self._wal_entries = sum(1 for _ in records)
+        return records
+
+    def close(self) -> None:
+        """WAL 파일 핸들 닫기"""
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        self._wal_entries = 0
+
+    # ------------------------------------------------------------------
+    # 스냅샷
+    # ------------------------------------------------------------------
+
+    def write_snapshot(self, snapshot: GraphSnapshot) -> int:
+        """
+        스냅샷 원자적 저장 (임시 파일 → os.replace)
+
+        Returns:
+            저장한 파일 크기 (bytes)
+        """
+        node_ids = [entity.id for entity in snapshot.entities]
+        rows = {entity_id: i for i, entity_id in enumerate(node_ids)}
+
+        embedded = [
+            (rows[entity_id], vector)
+            for entity_id, vector in snapshot.embeddings.items()
+            if entity_id in rows and vector is not None
+        ]
+        dimension = len(embedded[0][1]) if embedded else 0
+        embedded = [(row, vector) for row, vector in embedded if len(vector) == dimension]
+        matrix = np.zeros((len(embedded), dimension), dtype=np.float32)
+        for i, (_, vector) in enumerate(embedded):
+            matrix[i] = vector
+
+        arrays: dict[str, np.ndarray] = {
+            "format_version": np.array([SNAPSHOT_FORMAT_VERSION], dtype=np.int64),
+            "node_ids": _str_column(node_ids),
+            "node_names": _str_column([entity.name for entity in snapshot.entities]),
+            "node_types": _str_column([entity.type for entity in snapshot.entities]),
+            "node_properties": _json_column([entity.properties for entity in snapshot.entities]),
+            "edge_sources": _str_column([r.source_id for r in snapshot.relations]),
+            "edge_targets": _str_column([r.target_id for r in snapshot.relations]),
+            "edge_types": _str_column([r.type for r in snapshot.relations]),
+            "edge_weights": np.array([r.weight for r in snapshot.relations], dtype=np.float64),
+            "edge_properties": _json_column([r.properties for r in snapshot.relations]),
+            "embedding_rows": np.array([row for row, _ in embedded], dtype=np.int64),
+            "embeddings": matrix,
+        }
+
+        tmp_path = self.snapshot_path.with_suffix(".tmp.npz")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        return self.snapshot_path.stat().st_size
+
+    def read_snapshot(self) -> GraphSnapshot | None:
+        """스냅샷 로드 (파일이 없으면 None)"""
+        if not self.snapshot_path.exists():
+            return None
+
+        with np.load(self.snapshot_path, allow_pickle=False) as data:
+            version = int(data["format_version"][0])
+            if version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"Unsupported graph snapshot format version: {version}")
+
+            node_ids = data["node_ids"].tolist()
+            entities = [
+                Entity(id=entity_id, name=name, type=entity_type, properties=json.loads(props))
+                for entity_id, name, entity_type, props in zip(
+                    node_ids,
+                    data["node_names"].tolist(),
+                    data["node_types"].tolist(),
+                    data["node_properties"].tolist(),
+                    strict=True,
+                )
+            ]
+            relations = [
+                Relation(
+                    source_id=source_id,
+                    target_id=target_id,
+                    type=relation_type,
+                    weight=weight,
+                    properties=json.loads(props),
+                )
+                for source_id, target_id, relation_type, weight, props in zip(
+                    data["edge_sources"].tolist(),
+                    data["edge_targets"].tolist(),
+                    data["edge_types"].tolist(),
+                    data["edge_weights"].tolist(),
+                    data["edge_properties"].tolist(),
+                    strict=True,
+                )
+            ]
+            matrix = data["embeddings"]
+            embeddings = {
+                node_ids[row]: matrix[i]
+                for i, row in enumerate(data["embedding_rows"].tolist())
+            }
+
+        return GraphSnapshot(entities=entities, relations=relations, embeddings=embeddings)
@@ -15,12 +15,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from app.modules.core.retrieval.fusion import DEFAULT_RRF_K, rrf_fuse
 from app.modules.core.retrieval.interfaces import SearchResult
 
 logger = logging.getLogger(__name__)
 
 # RRF 상수 (일반적으로 60 사용)
-_RRF_K = 60
+_RRF_K = DEFAULT_RRF_K
 
 
 class HybridMerger:
@@ -57,42 +58,38 @@ class HybridMerger:
         if not dense_results and not bm25_results:
             return []
 
-        rrf_scores: dict[str, float] = {}
-        doc_info: dict[str, dict[str, Any]] = {}
+        # RRF 점수 계산: weight / (k + rank), rank는 1-based
+        fused = rrf_fuse(
+            [
+                [result.id for result in dense_results],
+                [bm25_item["id"] for bm25_item in bm25_results],
+            ],
+            weights=[self._alpha, 1.0 - self._alpha],
+            k=_RRF_K,
+            rank_start=1,
+        )
 
-        # Dense 결과 RRF 점수
-        for rank, result in enumerate(dense_results):
-            rrf_score = self._alpha * (1.0 / (_RRF_K + rank + 1))
-            rrf_scores[result.id] = rrf_scores.get(result.id, 0.0) + rrf_score
-            if result.id not in doc_info:
-                doc_info[result.id] = {
-                    "content": result.content,
-                    "metadata": result.metadata,
-                }
-
-        # BM25 결과 RRF 점수
-        bm25_weight = 1.0 - self._alpha
-        for rank, bm25_item in enumerate(bm25_results):
-            doc_id = bm25_item["id"]
-            rrf_score = bm25_weight * (1.0 / (_RRF_K + rank + 1))
-            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + rrf_score
-            if doc_id not in doc_info:
-                doc_info[doc_id] = {
-                    "content": bm25_item["content"],
-                    "metadata": bm25_item.get("metadata", {}),
-                }
-
-        # 정렬 + SearchResult 변환
-        sorted_ids = sorted(rrf_scores.keys(), key=lambda x: rrf_scores[x], reverse=True)
+        # 문서 정보 (첫 등장 기준: Dense 우선)
+        doc_info: dict[str, dict[str, Any]] = {}
+        for result in dense_results:
+            doc_info.setdefault(
+                result.id, {"content": result.content, "metadata": result.metadata}
+            )
+        for bm25_item in bm25_results:
+            doc_info.setdefault(
+                bm25_item["id"],
+                {"content": bm25_item["content"], "metadata": bm25_item.get("metadata", {})},
+            )
 
+        # 상위 top_k 선택 + SearchResult 변환
         merged: list[SearchResult] = []
-        for doc_id in sorted_ids[:top_k]:
+        for doc_id, score in fused.top_k(top_k):
             info = doc_info[doc_id]
             merged.append(
                 SearchResult(
                     id=doc_id,
                     content=info["content"],
-                    score=rrf_scores[doc_id],
+                    score=score,
                     metadata=info["metadata"],
                 )
             )
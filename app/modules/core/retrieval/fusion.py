@@ -0,0 +1,349 @@
+"""
+Fusion 모듈 - 검색 결과 병합 공용 커널
+
+여러 검색 소스(다중 쿼리, Dense/BM25, 벡터/그래프, 다중 컬렉션)의 순위 리스트를
+하나로 병합하는 NumPy 기반 커널입니다. 오케스트레이터, HybridMerger,
+VectorGraphHybridSearch, MongoDBRetriever, WeaviateRetriever가 모두 이 모듈을 사용합니다.
+
+구현 방식:
+- 문서 ID 인터닝: 문자열 ID를 등장 순서대로 정수 인덱스로 매핑 (DocIdInterner)
+- 점수 누적: 리스트별 기여도 배열을 만들어 np.bincount로 한 번에 합산
+- Top-K 선택: np.argpartition으로 후보를 추린 뒤 후보만 정렬
+
+지원 병합 방식:
+- rrf_fuse: 가중 RRF, score = Σ weight_i / (k + rank_i)
+- convex_fuse: 정규화 점수의 볼록 결합, score = Σ weight_i * norm(score_i)
+- first_seen_fuse: 중복 제거 (첫 등장 점수 유지)
+
+동점 처리:
+    점수가 같으면 먼저 등장한 문서가 앞에 위치합니다.
+    (기존 sorted(..., reverse=True)의 안정 정렬 결과와 동일)
+
+사용 예시:
+    fused = rrf_fuse([["a", "b"], ["b", "c"]], weights=[1.0, 0.8], k=60)
+    for doc_id, score in fused.top_k(10):
+        ...
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+
+# RRF 상수 (일반적으로 60 사용)
+DEFAULT_RRF_K = 60
+
+
+class DocIdInterner:
+    """
+    문서 ID → 정수 인덱스 매핑
+
+    처음 등장한 순서대로 0부터 인덱스를 부여합니다.
+    인덱스 순서가 곧 "첫 등장 순서"이므로 동점 처리 기준으로도 사용됩니다.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._index
+
+    @property
+    def ids(self) -> list[str]:
+        """인터닝된 문서 ID 목록 (인덱스 순서 = 첫 등장 순서)"""
+        return list(self._index)
+
+    def intern(self, doc_id: str) -> int:
+        """문서 ID의 인덱스 반환 (없으면 새로 부여)"""
+        index = self._index
+        return index.setdefault(doc_id, len(index))
+
+    def intern_many(self, doc_ids: Sequence[str]) -> np.ndarray:
+        """여러 문서 ID를 한 번에 인터닝하여 int64 인덱스 배열 반환"""
+        index = self._index
+        for doc_id in doc_ids:
+            if doc_id not in index:
+                index[doc_id] = len(index)
+        return np.fromiter(map(index.__getitem__, doc_ids), dtype=np.int64, count=len(doc_ids))
+
+    def index_of(self, doc_id: str) -> int | None:
+        """문서 ID의 인덱스 조회 (없으면 None)"""
+        return self._index.get(doc_id)
+
+
+@dataclass
+class FusionResult:
+    """
+    병합 결과
+
+    Attributes:
+        ids: 인터닝된 문서 ID 목록 (첫 등장 순서)
+        scores: 문서별 병합 점수 (ids와 같은 순서, float64)
+        appearances: 문서별 등장 횟수 (ids와 같은 순서, int64)
+    """
+
+    ids: list[str]
+    scores: np.ndarray
+    appearances: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def top_k_indices(self, k: int | None) -> np.ndarray:
+        """점수 내림차순 상위 k개 인덱스 (k=None이면 전체 정렬)"""
+        return top_k_indices(self.scores, len(self.ids) if k is None else k)
+
+    def top_k(self, k: int | None) -> list[tuple[str, float]]:
+        """점수 내림차순 상위 k개의 (doc_id, score) 목록"""
+        return [(self.ids[i], float(self.scores[i])) for i in self.top_k_indices(k)]
+
+    def as_dict(self) -> dict[str, float]:
+        """{doc_id: score} 딕셔너리로 변환 (첫 등장 순서 유지)"""
+        return dict(zip(self.ids, self.scores.tolist(), strict=True))
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 배열에서 상위 k개 인덱스를 내림차순으로 반환
+
+    np.argpartition으로 k번째 점수를 O(n)에 찾은 뒤, 그 점수 이상인 후보만
+    (점수 내림차순, 인덱스 오름차순)으로 정렬합니다. 경계값 동점도 후보에
+    포함하므로 결과는 전체 안정 정렬 후 자른 것과 동일합니다.
+
+    Args:
+        scores: 1차원 점수 배열
+        k: 반환할 최대 개수
+
+    Returns:
+        상위 k개 인덱스 배열 (int64)
+    """
+    n = int(scores.shape[0])
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if k < n:
+        kth_value = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        candidates = np.flatnonzero(scores >= kth_value)
+    else:
+        candidates = np.arange(n, dtype=np.int64)
+
+    # lexsort: 마지막 키가 1순위 → (-score, index) 순 정렬
+    order = np.lexsort((candidates, -scores[candidates]))
+    selected: np.ndarray = candidates[order][:k]
+    return selected.astype(np.int64, copy=False)
+
+
+def _resolve_weights(weights: Sequence[float] | None, count: int) -> list[float]:
+    """가중치 기본값(1.0) 적용 및 길이 보정"""
+    if weights is None:
+        return [1.0] * count
+    if len(weights) < count:
+        return list(weights) + [1.0] * (count - len(weights))
+    return list(weights[:count])
+
+
+def rrf_fuse(
+    ranked_ids: Sequence[Sequence[str]],
+    weights: Sequence[float] | None = None,
+    k: int = DEFAULT_RRF_K,
+    rank_start: int = 0,
+    ranks: Sequence[Sequence[int]] | None = None,
+    interner: DocIdInterner | None = None,
+) -> FusionResult:
+    """
+    가중 RRF(Reciprocal Rank Fusion)
+
+    score(doc) = Σ weight_i / (k + rank_i)
+
+    Args:
+        ranked_ids: 소스별 문서 ID 순위 리스트 (상위부터)
+        weights: 소스별 가중치 (기본값: 모두 1.0, 부족하면 1.0으로 패딩)
+        k: RRF 상수 (기본값: 60)
+        rank_start: 첫 순위 값 (0-based 또는 1-based, 호출부의 기존 공식 유지용)
+        ranks: 소스별 명시적 순위 (None이면 리스트 위치 + rank_start 사용)
+        interner: 재사용할 인터너 (증분 병합 시 사용, 기본값: 새로 생성)
+
+    Returns:
+        FusionResult (첫 등장 순서의 ids, RRF 점수, 등장 횟수)
+    """
+    interner = interner if interner is not None else DocIdInterner()
+    resolved_weights = _resolve_weights(weights, len(ranked_ids))
+
+    # 모든 소스를 하나의 평탄한 배열로 처리 (소스별 루프 없이 한 번에 계산)
+    lengths = np.fromiter((len(ids) for ids in ranked_ids), dtype=np.int64, count=len(ranked_ids))
+    flat_ids = list(chain.from_iterable(ranked_ids))
+    indices = interner.intern_many(flat_ids)
+
+    if ranks is not None:
+        positions = np.fromiter(
+            chain.from_iterable(ranks), dtype=np.float64, count=len(flat_ids)
+        )
+    else:
+        # 소스 내 위치 = 전체 위치 - 소스 시작 오프셋
+        starts = np.cumsum(lengths) - lengths
+        positions = (
+            np.arange(len(flat_ids), dtype=np.float64)
+            - np.repeat(starts, lengths)
+            + rank_start
+        )
+
+    source_weights = np.repeat(np.asarray(resolved_weights, dtype=np.float64), lengths)
+    return _accumulate(interner, [indices], [source_weights / (k + positions)])
+
+
+def minmax_normalize(scores: np.ndarray) -> np.ndarray:
+    """
+    Min-Max 정규화 (0~1)
+
+    모든 점수가 같으면 1.0으로 채웁니다 (단일 결과도 최상위로 취급).
+    """
+    if scores.size == 0:
+        return scores.astype(np.float64, copy=True)
+    low = float(scores.min())
+    high = float(scores.max())
+    if high - low <= 0.0:
+        return np.ones_like(scores, dtype=np.float64)
+    return (scores.astype(np.float64) - low) / (high - low)
+
+
+def convex_fuse(
+    ranked_ids: Sequence[Sequence[str]],
+    score_lists: Sequence[Sequence[float]],
+    weights: Sequence[float] | None = None,
+    normalizer: Callable[[np.ndarray], np.ndarray] | None = minmax_normalize,
+    interner: DocIdInterner | None = None,
+) -> FusionResult:
+    """
+    정규화 점수의 볼록 결합 (Convex Combination Fusion)
+
+    score(doc) = Σ weight_i * normalizer(score_i)
+
+    RRF가 순위만 사용하는 것과 달리 원본 점수 분포를 반영합니다.
+    normalizer로 RRFScoreNormalizer.normalize_array 같은 score_normalizer 출력을
+    그대로 사용할 수 있습니다. 가중치 합이 1이면 결과도 정규화 범위 안에 머뭅니다.
+
+    Args:
+        ranked_ids: 소스별 문서 ID 리스트
+        score_lists: 소스별 원본 점수 리스트 (ranked_ids와 같은 길이)
+        weights: 소스별 가중치 (기본값: 모두 1.0)
+        normalizer: 소스별 점수 정규화 함수 (None이면 원본 점수 사용)
+        interner: 재사용할 인터너
+
+    Returns:
+        FusionResult
+    """
+    if len(ranked_ids) != len(score_lists):
+        raise ValueError(
+            f"ranked_ids({len(ranked_ids)})와 score_lists({len(score_lists)}) 길이 불일치"
+        )
+
+    interner = interner if interner is not None else DocIdInterner()
+    resolved_weights = _resolve_weights(weights, len(ranked_ids))
+
+    index_chunks: list[np.ndarray] = []
+    contribution_chunks: list[np.ndarray] = []
+
+    for ids, scores, weight in zip(ranked_ids, score_lists, resolved_weights, strict=True):
+        if not ids:
+            continue
+        if len(ids) != len(scores):
+            raise ValueError(f"ID 수({len(ids)})와 점수 수({len(scores)}) 불일치")
+        raw = np.asarray(scores, dtype=np.float64)
+        normalized = normalizer(raw) if normalizer is not None else raw
+        index_chunks.append(interner.intern_many(ids))
+        contribution_chunks.append(weight * np.asarray(normalized, dtype=np.float64))
+
+    return _accumulate(interner, index_chunks, contribution_chunks)
+
+
+def first_seen_fuse(
+    ranked_ids: Sequence[Sequence[str]],
+    score_lists: Sequence[Sequence[float]],
+    interner: DocIdInterner | None = None,
+) -> FusionResult:
+    """
+    단순 병합 (중복 제거, 첫 등장 점수 유지)
+
+    RRF를 사용하지 않는 폴백 경로용입니다.
+
+    Args:
+        ranked_ids: 소스별 문서 ID 리스트
+        score_lists: 소스별 원본 점수 리스트
+
+    Returns:
+        FusionResult (scores는 각 문서가 처음 등장했을 때의 점수)
+    """
+    interner = interner if interner is not None else DocIdInterner()
+    index_chunks: list[np.ndarray] = []
+    score_chunks: list[np.ndarray] = []
+
+    for ids, scores in zip(ranked_ids, score_lists, strict=True):
+        if not ids:
+            continue
+        index_chunks.append(interner.intern_many(ids))
+        score_chunks.append(np.asarray(scores, dtype=np.float64))
+
+    size = len(interner)
+    if not index_chunks:
+        return FusionResult(
+            ids=interner.ids,
+            scores=np.zeros(size, dtype=np.float64),
+            appearances=np.zeros(size, dtype=np.int64),
+        )
+
+    all_indices = np.concatenate(index_chunks)
+    all_scores = np.concatenate(score_chunks)
+
+    # 인덱스별 첫 등장 위치 (np.unique는 첫 위치를 반환)
+    unique_indices, first_positions = np.unique(all_indices, return_index=True)
+    first_scores = np.zeros(size, dtype=np.float64)
+    first_scores[unique_indices] = all_scores[first_positions]
+
+    return FusionResult(
+        ids=interner.ids,
+        scores=first_scores,
+        appearances=np.bincount(all_indices, minlength=size).astype(np.int64),
+    )
+
+
+def _accumulate(
+    interner: DocIdInterner,
+    index_chunks: list[np.ndarray],
+    contribution_chunks: list[np.ndarray],
+) -> FusionResult:
+    """인덱스/기여도 배열을 합산하여 FusionResult 생성"""
+    size = len(interner)
+    if not index_chunks:
+        return FusionResult(
+            ids=interner.ids,
+            scores=np.zeros(size, dtype=np.float64),
+            appearances=np.zeros(size, dtype=np.int64),
+        )
+
+    all_indices = np.concatenate(index_chunks)
+    all_contributions = np.concatenate(contribution_chunks)
+
+    return FusionResult(
+        ids=interner.ids,
+        scores=np.bincount(all_indices, weights=all_contributions, minlength=size),
+        appearances=np.bincount(all_indices, minlength=size).astype(np.int64),
+    )
+
+
+__all__ = [
+    "DEFAULT_RRF_K",
+    "DocIdInterner",
+    "FusionResult",
+    "convex_fuse",
+    "first_seen_fuse",
+    "minmax_normalize",
+    "rrf_fuse",
+    "top_k_indices",
+]
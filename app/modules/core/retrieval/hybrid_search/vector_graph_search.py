@@ -9,6 +9,7 @@ VectorGraphHybridSearch - 벡터+그래프 결합 검색
 - RRF(Reciprocal Rank Fusion)로 결과 결합
 - 가중치 기반 점수 조정
 - 그래프 비활성화 시 벡터 전용 모드
+- 그래프 확장: 매칭 엔티티를 시드로 CSR 인접 행렬 k-hop/PPR 전파 → 이웃 엔티티의 doc_id까지 회수
 
 RRF 공식:
     score = sum(weight * 1/(k + rank))
@@ -25,14 +26,22 @@ RRF 공식:
 """
 from __future__ import annotations
 
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 from app.lib.logger import get_logger
-from app.modules.core.graph.interfaces import IGraphStore
+from app.modules.core.graph.interfaces import IGraphAdjacencyProvider, IGraphStore
+from app.modules.core.retrieval.fusion import FusionResult, rrf_fuse
 from app.modules.core.retrieval.interfaces import IRetriever, SearchResult
 
 from .interfaces import HybridSearchResult, IHybridSearchStrategy
 
+if TYPE_CHECKING:
+    from app.modules.core.graph.adjacency import GraphAdjacency
+    from app.modules.core.graph.models import GraphSearchResult
+
 logger = get_logger(__name__)
 
 
@@ -67,6 +76,13 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
                 - vector_weight: 벡터 검색 가중치 (기본값: 0.6)
                 - graph_weight: 그래프 검색 가중치 (기본값: 0.4)
                 - rrf_k: RRF 상수 (기본값: 60)
+                - graph_expansion: 그래프 확장 설정 (저장소가 get_adjacency를 지원할 때)
+                    - enabled (기본값: True)
+                    - method: "khop" 또는 "ppr" (기본값: "khop")
+                    - max_hops: k-hop 최대 홉 수 (기본값: 2)
+                    - hop_decay: 홉당 감쇠 계수 (기본값: 0.5)
+                    - ppr_alpha: PPR 재시작 확률 (기본값: 0.15)
+                    - ppr_iterations: PPR 최대 반복 (기본값: 20)
         """
         self._retriever = retriever
         self._graph_store = graph_store
@@ -77,6 +93,17 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
         self._default_graph_weight = config.get("graph_weight", 0.4)
         self._rrf_k = config.get("rrf_k", 60)
 
+        # 그래프 확장 설정
+        expansion = config.get("graph_expansion", {})
+        self._expansion_enabled = expansion.get("enabled", True)
+        self._expansion_method = expansion.get("method", "khop")
+        if self._expansion_method not in ("khop", "ppr"):
+            raise ValueError(f"지원하지 않는 graph_expansion.method: {self._expansion_method}")
+        self._max_hops = expansion.get("max_hops", 2)
+        self._hop_decay = expansion.get("hop_decay", 0.5)
+        self._ppr_alpha = expansion.get("ppr_alpha", 0.15)
+        self._ppr_iterations = expansion.get("ppr_iterations", 20)
+
         # 모드 결정
         mode = "하이브리드" if graph_store else "벡터 전용"
         logger.info(
@@ -226,6 +253,8 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
         그래프 검색 수행
 
         그래프에서 엔티티를 검색하고 SearchResult로 변환합니다.
+        저장소가 CSR 인접 행렬(get_adjacency)을 제공하면 매칭 엔티티를 시드로
+        이웃까지 점수를 전파해 다중 홉 엔티티의 문서도 함께 반환합니다.
 
         Args:
             query: 검색 쿼리
@@ -242,6 +271,17 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
             # 그래프 검색
             graph_result = await self._graph_store.search(query, top_k=top_k)
 
+            store = self._graph_store
+            if (
+                self._expansion_enabled
+                and isinstance(store, IGraphAdjacencyProvider)
+                and graph_result.entities
+            ):
+                adjacency = await store.get_adjacency()
+                expanded = self._expand_from_seeds(adjacency, graph_result, top_k)
+                logger.debug(f"그래프 검색(확장): {len(expanded)}개 결과")
+                return expanded
+
             # 엔티티에서 문서 ID 추출하여 SearchResult로 변환
             results: list[SearchResult] = []
             for idx, entity in enumerate(graph_result.entities):
@@ -269,6 +309,72 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
             logger.error(f"그래프 검색 실패: {e}")
             return []
 
+    def _expansion_supported(self) -> bool:
+        """저장소가 IGraphAdjacencyProvider를 구현하고 확장이 활성화되었는지"""
+        return self._expansion_enabled and isinstance(self._graph_store, IGraphAdjacencyProvider)
+
+    def _expand_from_seeds(
+        self,
+        adjacency: GraphAdjacency,
+        graph_result: GraphSearchResult,
+        top_k: int,
+    ) -> list[SearchResult]:
+        """
+        시드 엔티티에서 점수를 전파하고 doc_id 단위로 집계
+
+        시드 점수는 기존 순위 감소 점수(graph_score / rank)를 사용합니다.
+        같은 문서를 가리키는 엔티티가 여러 개면 가장 높은 점수를 사용합니다.
+        doc_id가 없는 엔티티도 경로(브리지)로는 사용됩니다.
+        """
+        start = time.perf_counter()
+        base_score = graph_result.score if graph_result.score > 0 else 1.0
+        seeds = {
+            entity.id: base_score / (idx + 1) for idx, entity in enumerate(graph_result.entities)
+        }
+
+        if self._expansion_method == "ppr":
+            expansion = adjacency.personalized_pagerank(
+                seeds, alpha=self._ppr_alpha, iterations=self._ppr_iterations
+            )
+        else:
+            expansion = adjacency.k_hop(seeds, max_hops=self._max_hops, decay=self._hop_decay)
+
+        reached = np.flatnonzero(expansion.scores > 0)
+        order = reached[np.argsort(-expansion.scores[reached], kind="stable")]
+
+        results: list[SearchResult] = []
+        seen_docs: set[str] = set()
+        for row in order.tolist():
+            doc_id = adjacency.doc_ids[row]
+            if doc_id is None or doc_id in seen_docs:
+                continue
+            seen_docs.add(doc_id)
+            score = float(expansion.scores[row])
+            results.append(
+                SearchResult(
+                    id=doc_id,
+                    content=f"[그래프] {adjacency.names[row]}",
+                    score=score,
+                    metadata={
+                        "source": "graph",
+                        "entity_id": adjacency.node_ids[row],
+                        "entity_type": adjacency.types[row],
+                        "graph_score": score,
+                        "graph_hops": int(expansion.hops[row]),
+                        "expansion": self._expansion_method,
+                    },
+                )
+            )
+            if len(results) >= top_k:
+                break
+
+        logger.debug(
+            f"그래프 확장({self._expansion_method}): 시드 {len(seeds)}개 → "
+            f"도달 {reached.size}개 노드, {len(results)}개 문서 "
+            f"({(time.perf_counter() - start) * 1000:.2f}ms)"
+        )
+        return results
+
     def _combine_with_rrf(
         self,
         vector_results: list[SearchResult],
@@ -298,14 +404,15 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
             result.id: rank + 1 for rank, result in enumerate(graph_results)
         }
 
-        # RRF 점수 계산
-        rrf_scores = self._calculate_rrf_scores(
+        # RRF 점수 계산 + 상위 top_k 선택
+        fused = self._fuse_ranks(
             vector_ranks=vector_ranks,
             graph_ranks=graph_ranks,
             vector_weight=vector_weight,
             graph_weight=graph_weight,
             k=self._rrf_k,
         )
+        top_entries = fused.top_k(top_k)
 
         # 결과 딕셔너리 생성 (ID → SearchResult)
         all_results: dict[str, SearchResult] = {}
@@ -313,21 +420,14 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
             if result.id not in all_results:
                 all_results[result.id] = result
 
-        # RRF 점수 기준으로 정렬
-        sorted_ids = sorted(
-            rrf_scores.keys(),
-            key=lambda x: rrf_scores[x],
-            reverse=True,
-        )[:top_k]
-
         # 결과 생성 (메타데이터에 hybrid_score 추가)
         combined_results: list[SearchResult] = []
-        for doc_id in sorted_ids:
+        for doc_id, rrf_score in top_entries:
             if doc_id in all_results:
                 result = all_results[doc_id]
                 # 새로운 메타데이터 생성 (원본 보존)
                 new_metadata = dict(result.metadata)
-                new_metadata["hybrid_score"] = rrf_scores[doc_id]
+                new_metadata["hybrid_score"] = rrf_score
                 new_metadata["vector_rank"] = vector_ranks.get(doc_id)
                 new_metadata["graph_rank"] = graph_ranks.get(doc_id)
 
@@ -336,7 +436,7 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
                     SearchResult(
                         id=result.id,
                         content=result.content,
-                        score=rrf_scores[doc_id],  # RRF 점수로 대체
+                        score=rrf_score,  # RRF 점수로 대체
                         metadata=new_metadata,
                     )
                 )
@@ -366,25 +466,29 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
         Returns:
             RRF 점수 딕셔너리 (doc_id → score)
         """
-        scores: dict[str, float] = {}
-
-        # 모든 문서 ID 수집
-        all_doc_ids = set(vector_ranks.keys()) | set(graph_ranks.keys())
-
-        for doc_id in all_doc_ids:
-            score = 0.0
-
-            # 벡터 검색 RRF 점수
-            if doc_id in vector_ranks:
-                score += vector_weight * (1.0 / (k + vector_ranks[doc_id]))
-
-            # 그래프 검색 RRF 점수
-            if doc_id in graph_ranks:
-                score += graph_weight * (1.0 / (k + graph_ranks[doc_id]))
-
-            scores[doc_id] = score
+        return self._fuse_ranks(
+            vector_ranks=vector_ranks,
+            graph_ranks=graph_ranks,
+            vector_weight=vector_weight,
+            graph_weight=graph_weight,
+            k=k,
+        ).as_dict()
 
-        return scores
+    def _fuse_ranks(
+        self,
+        vector_ranks: dict[str, int],
+        graph_ranks: dict[str, int],
+        vector_weight: float,
+        graph_weight: float,
+        k: int,
+    ) -> FusionResult:
+        """랭크 딕셔너리를 공용 fusion 커널로 병합"""
+        return rrf_fuse(
+            [list(vector_ranks.keys()), list(graph_ranks.keys())],
+            weights=[vector_weight, graph_weight],
+            k=k,
+            ranks=[list(vector_ranks.values()), list(graph_ranks.values())],
+        )
 
     def get_config(self) -> dict[str, Any]:
         """
@@ -398,4 +502,5 @@ class VectorGraphHybridSearch(IHybridSearchStrategy):
             "graph_weight": self._default_graph_weight,
             "rrf_k": self._rrf_k,
             "graph_enabled": self._graph_store is not None,
+            "graph_expansion": self._expansion_method if self._expansion_supported() else None,
         }
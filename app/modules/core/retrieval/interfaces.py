@@ -6,11 +6,11 @@ Retrieval Module Interfaces
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """검색 결과 데이터 클래스"""
 
@@ -19,10 +19,32 @@ class SearchResult:
     score: float
     metadata: dict[str, Any]
 
-    def __post_init__(self) -> None:
-        # 하위 호환성을 위해 속성으로도 접근 가능하게 설정
-        for key, value in self.metadata.items():
-            setattr(self, key, value)
+    def __getattr__(self, name: str) -> Any:
+        # 하위 호환성: result.source_file처럼 메타데이터 키를 속성으로 접근
+        # (생성 시 복사하지 않고 조회 시점에 metadata에서 읽음)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return object.__getattribute__(self, "metadata")[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """
+    경량 검색 결과 (퓨전 단계용)
+
+    본문(content) 없이 ID, 점수, 소수의 메타데이터(_collection 등)만 보관합니다.
+    다중 쿼리 RRF 병합에서는 대부분의 후보가 버려지므로, 최종 top_k만
+    ILightweightRetriever.hydrate()로 본문/전체 메타데이터를 한 번에 채웁니다.
+    """
+
+    id: str
+    score: float
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
 class IRetriever(Protocol):
@@ -63,6 +85,87 @@ class IRetriever(Protocol):
         ...
 
 
+@runtime_checkable
+class IBatchRetriever(Protocol):
+    """
+    다중 쿼리 일괄 검색 인터페이스 (Protocol 기반, IRetriever 확장 기능)
+
+    확장 쿼리 N개를 임베딩 배치 1회 + 벡터 DB 멀티 벡터 요청 1회로 검색합니다.
+    이 기능이 없는 Retriever는 쿼리별 search() 병렬 호출로 폴백합니다.
+
+    구현 예시:
+    - ChromaRetriever: col.query(query_embeddings=[...])
+    - QdrantRetriever: client.search_batch()
+    - PgVectorRetriever: unnest + LATERAL 단일 SQL
+    - PineconeRetriever: 임베딩 배치 + 쿼리별 병렬 요청
+    """
+
+    async def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        여러 쿼리에 대한 벡터 검색 일괄 수행
+
+        Args:
+            queries: 검색 쿼리 문자열 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건 (모든 쿼리에 공통 적용)
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+        """
+        ...
+
+
+@runtime_checkable
+class ILightweightRetriever(Protocol):
+    """
+    경량 검색 + 지연 본문 로딩 인터페이스 (Protocol 기반, IRetriever 확장 기능)
+
+    다중 쿼리 검색 시 쿼리별 결과를 SearchHit(본문 없음)로 받아 병합하고,
+    병합 후 살아남은 top_k만 hydrate()로 일괄 조회합니다.
+    이 기능이 없는 Retriever는 search()/search_many() 경로를 그대로 사용합니다.
+
+    구현 예시:
+    - WeaviateRetriever: return_properties 제한 hybrid + fetch_objects_by_ids
+    """
+
+    async def search_hits(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[SearchHit]:
+        """
+        본문 없이 ID/점수/경량 메타데이터만 검색
+
+        Args:
+            query: 검색 쿼리 문자열
+            top_k: 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건
+
+        Returns:
+            점수 내림차순 SearchHit 리스트
+        """
+        ...
+
+    async def hydrate(self, hits: list[SearchHit]) -> list[SearchResult]:
+        """
+        SearchHit의 본문과 전체 메타데이터를 일괄 조회
+
+        Args:
+            hits: 본문을 채울 SearchHit 리스트
+
+        Returns:
+            hits 순서를 유지한 SearchResult 리스트 (점수와 hit 메타데이터 유지,
+            조회되지 않은 문서는 제외)
+        """
+        ...
+
+
 class IReranker(Protocol):
     """
     리랭킹 인터페이스 (Protocol 기반)
@@ -109,11 +109,22 @@ Facade 패턴으로 재구성한 것입니다.
 ⚠️ 주의: 기존 검증된 워크플로우를 재사용합니다. 새로 작성하지 않았습니다.
 """
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from ....lib.logger import get_logger
 from ....lib.types import HealthCheckDict, OrchestratorStatsDict
-from .interfaces import ICacheManager, IReranker, IRetriever, SearchResult
+from .fusion import first_seen_fuse, rrf_fuse
+from .interfaces import (
+    IBatchRetriever,
+    ICacheManager,
+    ILightweightRetriever,
+    IReranker,
+    IRetriever,
+    SearchHit,
+    SearchResult,
+)
 from .query_expansion import IQueryExpansionEngine
 from .scoring import ScoringService
 
@@ -124,6 +135,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# RRF 병합 대상 (전체 결과 또는 본문 없는 경량 결과)
+_ResultT = TypeVar("_ResultT", SearchResult, SearchHit)
+
 
 class RetrievalOrchestrator:
     """
@@ -218,8 +232,19 @@ class RetrievalOrchestrator:
             "rerank_count": 0,
             "query_expansion_count": 0,
             "hybrid_search_count": 0,  # 🆕 하이브리드 검색 횟수
+            "batch_search_count": 0,  # search_many 일괄 검색 횟수
+            "speculative_expansion_count": 0,  # 추측 실행 쿼리 확장 횟수
+            "expansion_timeouts": 0,  # 추측 실행 중 확장 타임아웃 횟수
+            "late_expansion_searches": 0,  # 추측 실행 타임아웃 후 취소된 확장 쿼리 검색 수
+            "lightweight_merge_count": 0,  # 경량 결과 병합 후 top_k만 본문 로딩한 횟수
         }
 
+        # 추측 실행(Speculative) 쿼리 확장 설정
+        # 원본 쿼리 검색을 즉시 시작하고 확장은 병렬로 진행 (확장 지연을 검색 뒤로 숨김)
+        speculative_config = (self.config.get("query_expansion") or {}).get("speculative") or {}
+        self._speculative_expansion = bool(speculative_config.get("enabled", False))
+        self._speculative_timeout = float(speculative_config.get("timeout", 2.0))
+
         logger.info(
             "RetrievalOrchestrator 초기화",
             extra={
@@ -368,49 +393,41 @@ class RetrievalOrchestrator:
             # Step 2: 쿼리 확장 (선택적)
             search_queries = [query]  # 기본값: 원본 쿼리만 사용
             expanded_query_obj = None
+            should_expand = self._should_expand(query_expansion_enabled)
+            use_hybrid = effective_use_graph and self._hybrid_strategy is not None
 
-            if self.query_expansion:
-                # 쿼리 확장 활성화 여부 판단
-                should_expand = query_expansion_enabled
-
-                if should_expand is None:
-                    # 자동 판단: config 또는 쿼리 복잡도 기반
-                    # config.yaml의 query_expansion.enabled 또는 multi_query.enable_query_expansion 사용
-                    query_exp_config = self.config.get("query_expansion", {})
-                    multi_query_config = self.config.get("multi_query", {})
-                    should_expand = query_exp_config.get(
-                        "enabled", multi_query_config.get("enable_query_expansion", True)
-                    )
+            # 추측 실행 모드: 벡터 검색 경로에서는 확장을 기다리지 않고 원본 검색을 먼저 시작
+            speculative = should_expand and self._speculative_expansion and not use_hybrid
 
-                if should_expand:
-                    try:
-                        logger.debug(
-                            "쿼리 확장 시작",
-                            extra={"query": query[:50]}
-                        )
-                        expanded_query_obj = await self.query_expansion.expand(query)
-                        search_queries = expanded_query_obj.all_queries
-                        self.stats["query_expansion_count"] += 1
+            if should_expand and not speculative and self.query_expansion:
+                try:
+                    logger.debug(
+                        "쿼리 확장 시작",
+                        extra={"query": query[:50]}
+                    )
+                    expanded_query_obj = await self.query_expansion.expand(query)
+                    search_queries = expanded_query_obj.all_queries
+                    self.stats["query_expansion_count"] += 1
 
-                        logger.info(
-                            "쿼리 확장 완료",
-                            extra={
-                                "query_count": len(search_queries),
-                                "complexity": expanded_query_obj.complexity.value,
-                                "intent": expanded_query_obj.intent.value
-                            }
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "쿼리 확장 실패, 원본 쿼리 사용",
-                            extra={"error": str(e)},
-                            exc_info=True
-                        )
-                        search_queries = [query]
+                    logger.info(
+                        "쿼리 확장 완료",
+                        extra={
+                            "query_count": len(search_queries),
+                            "complexity": expanded_query_obj.complexity.value,
+                            "intent": expanded_query_obj.intent.value
+                        }
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "쿼리 확장 실패, 원본 쿼리 사용",
+                        extra={"error": str(e)},
+                        exc_info=True
+                    )
+                    search_queries = [query]
 
             # Step 3: 검색 실행 (하이브리드 또는 벡터 검색)
             # 🆕 하이브리드 검색: effective_use_graph=True && 하이브리드 전략 존재
-            if effective_use_graph and self._hybrid_strategy is not None:
+            if use_hybrid and self._hybrid_strategy is not None:
                 logger.info(
                     "하이브리드 검색 시작",
                     extra={"query": query[:50], "top_k": top_k}
@@ -450,7 +467,10 @@ class RetrievalOrchestrator:
                 )
 
                 try:
-                    if len(search_queries) == 1:
+                    if speculative:
+                        # 추측 실행: 원본 검색 + 쿼리 확장 병렬, 확장 쿼리는 도착 즉시 검색
+                        search_results = await self._speculative_search(query, top_k, filters)
+                    elif len(search_queries) == 1:
                         # 단일 쿼리: 기존 로직 유지
                         search_results = await self.retriever.search(query, top_k, filters)
                         self.stats["retrieval_count"] += 1
@@ -629,6 +649,11 @@ class RetrievalOrchestrator:
                 "retrieval_count": self.stats["retrieval_count"],
                 "rerank_count": self.stats["rerank_count"],
                 "query_expansion_count": self.stats["query_expansion_count"],
+                "speculative_expansion_count": self.stats["speculative_expansion_count"],
+                "expansion_timeouts": self.stats["expansion_timeouts"],
+                "late_expansion_searches": self.stats["late_expansion_searches"],
+                "batch_search_count": self.stats["batch_search_count"],
+                "lightweight_merge_count": self.stats["lightweight_merge_count"],
                 "cache_hit_rate": (
                     self.stats["cache_hits"] / self.stats["total_requests"] * 100
                     if self.stats["total_requests"] > 0
@@ -798,6 +823,259 @@ class RetrievalOrchestrator:
 
     # ========== 내부 헬퍼 메서드 ==========
 
+    def _should_expand(self, query_expansion_enabled: bool | None) -> bool:
+        """
+        쿼리 확장 실행 여부 판단
+
+        Args:
+            query_expansion_enabled: 호출자가 지정한 값 (None이면 설정 기반 자동 판단)
+
+        Returns:
+            쿼리 확장 엔진이 있고 확장이 활성화되어 있으면 True
+        """
+        if not self.query_expansion:
+            return False
+
+        if query_expansion_enabled is not None:
+            return query_expansion_enabled
+
+        # 자동 판단: config.yaml의 query_expansion.enabled 또는
+        # multi_query.enable_query_expansion 사용
+        query_exp_config = self.config.get("query_expansion") or {}
+        multi_query_config = self.config.get("multi_query") or {}
+        return bool(
+            query_exp_config.get(
+                "enabled", multi_query_config.get("enable_query_expansion", True)
+            )
+        )
+
+    async def _speculative_search(
+        self,
+        query: str,
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """
+        추측 실행(Speculative) 쿼리 확장 검색
+
+        쿼리 확장(LLM 왕복)을 기다리지 않고 원본 쿼리 검색을 즉시 시작합니다.
+        확장 쿼리가 도착하면 그 즉시 쿼리별 검색(일괄 검색 지원 시 search_many 1회)을
+        시작하고, 끝나는 순서대로 결과를 수집한 뒤 마지막에 원본 결과와 한 번에 RRF로
+        병합합니다 (RRF는 순서와 무관하므로 점진 병합과 결과가 같음).
+
+        타임아웃 (query_expansion.speculative.timeout, 검색 시작 기준 초):
+            - 그 안에 확장이 끝나지 않으면 확장을 취소하고 원본 결과만 사용합니다.
+            - 원본 검색이 끝났고 타임아웃도 지났다면 그때까지 도착한 확장 쿼리
+              결과만 병합하고 남은 검색은 취소합니다 (원본 대비 추가 지연 상한).
+
+        호출자가 취소되거나 타임아웃되면 원본 검색, 확장, 확장 쿼리 검색 작업을 모두
+        취소하고 종료를 기다린 뒤 전파합니다.
+
+        Args:
+            query: 원본 쿼리
+            top_k: 최종 반환할 결과 수
+            filters: 검색 필터
+
+        Returns:
+            검색 결과 리스트 (확장 성공 시 RRF 병합 결과)
+        """
+        assert self.query_expansion is not None  # _should_expand()에서 보장
+
+        search_top_k = top_k * 2  # RRF 통합용 여유분 (_search_and_merge와 동일)
+        lightweight = self._lightweight_enabled()
+        deadline = asyncio.get_running_loop().time() + self._speculative_timeout
+        original_task: asyncio.Task[Any] = asyncio.create_task(
+            cast(ILightweightRetriever, self.retriever).search_hits(query, search_top_k, filters)
+            if lightweight
+            else self.retriever.search(query, search_top_k, filters)
+        )
+        expansion_task = asyncio.create_task(self.query_expansion.expand(query))
+        self.stats["speculative_expansion_count"] += 1
+        self.stats["retrieval_count"] += 1
+
+        tasks: list[asyncio.Task[Any]] = [original_task, expansion_task]
+        try:
+            expanded_queries: list[str] = []
+            done, _ = await asyncio.wait({expansion_task}, timeout=self._speculative_timeout)
+
+            if not done:
+                expansion_task.cancel()
+                self.stats["expansion_timeouts"] += 1
+                logger.info(
+                    "쿼리 확장 타임아웃, 원본 쿼리 결과만 사용",
+                    extra={"timeout_s": self._speculative_timeout}
+                )
+            elif expansion_task.exception() is not None:
+                logger.warning(
+                    "쿼리 확장 실패, 원본 쿼리 결과만 사용",
+                    extra={"error": str(expansion_task.exception())}
+                )
+            else:
+                expanded_query_obj = expansion_task.result()
+                expanded_queries = [q for q in expanded_query_obj.all_queries if q != query]
+                self.stats["query_expansion_count"] += 1
+                logger.info(
+                    "쿼리 확장 완료 (추측 실행)",
+                    extra={
+                        "query_count": len(expanded_queries) + 1,
+                        "complexity": expanded_query_obj.complexity.value,
+                        "intent": expanded_query_obj.intent.value
+                    }
+                )
+
+            queries = [query, *expanded_queries]
+            self.stats["retrieval_count"] += len(expanded_queries)
+
+            # 확장 쿼리 검색 즉시 시작 (원본 검색은 이미 진행 중)
+            slots: dict[asyncio.Task[Any], list[int]] = {original_task: [0]}
+            launched = self._launch_expanded_searches(
+                expanded_queries, search_top_k, filters, lightweight
+            )
+            tasks.extend(launched)
+            slots.update(launched)
+            outcomes = await self._collect_speculative(slots, len(queries), original_task, deadline)
+            arrived = [i for i, outcome in enumerate(outcomes) if outcome is not None]
+            queries = [queries[i] for i in arrived]
+            results_per_query = [outcomes[i] for i in arrived]
+
+            if lightweight:
+                try:
+                    return await self._speculative_merge_hits(results_per_query, queries, top_k)
+                except Exception as e:
+                    logger.warning(
+                        "경량 검색 실패, 전체 결과 검색으로 폴백",
+                        extra={"error": str(e), "query_count": len(queries)}
+                    )
+                    if len(queries) == 1:
+                        return (await self.retriever.search(query, search_top_k, filters))[:top_k]
+                    results_per_query = await self._search_queries(queries, search_top_k, filters)
+                    return self._rrf_merge(results_per_query, queries, [1.0] * len(queries), top_k)
+
+            if len(queries) == 1:
+                if isinstance(results_per_query[0], BaseException):
+                    raise results_per_query[0]
+                return cast(list[SearchResult], results_per_query[0][:top_k])
+
+            return self._rrf_merge(results_per_query, queries, [1.0] * len(queries), top_k)
+        finally:
+            # 호출자 취소/타임아웃이나 조기 반환 시에도 남은 확장/검색 작업을 정리
+            leftover = [task for task in tasks if not task.done()]
+            for task in leftover:
+                task.cancel()
+            if leftover:
+                await asyncio.gather(*leftover, return_exceptions=True)
+
+    def _launch_expanded_searches(
+        self,
+        expanded_queries: list[str],
+        search_top_k: int,
+        filters: dict[str, Any] | None,
+        lightweight: bool,
+    ) -> dict["asyncio.Task[Any]", list[int]]:
+        """
+        확장 쿼리 검색 태스크 시작
+
+        Returns:
+            {태스크: 결과가 들어갈 쿼리 위치 목록} (원본 쿼리가 0번, 확장 쿼리는 1번부터)
+            경량 검색과 일괄 미지원 Retriever는 쿼리별 태스크, 일괄 검색은 태스크 1개
+        """
+        if not expanded_queries:
+            return {}
+
+        positions = list(range(1, len(expanded_queries) + 1))
+        if not lightweight and len(expanded_queries) > 1 and isinstance(
+            self.retriever, IBatchRetriever
+        ):
+            task = asyncio.create_task(
+                self._search_queries(expanded_queries, search_top_k, filters)
+            )
+            return {task: positions}
+
+        tasks: dict[asyncio.Task[Any], list[int]] = {}
+        for position, expanded in zip(positions, expanded_queries, strict=True):
+            search = (
+                cast(ILightweightRetriever, self.retriever).search_hits
+                if lightweight
+                else self.retriever.search
+            )
+            tasks[asyncio.create_task(search(expanded, search_top_k, filters))] = [position]
+        return tasks
+
+    async def _collect_speculative(
+        self,
+        slots: dict["asyncio.Task[Any]", list[int]],
+        query_count: int,
+        original_task: "asyncio.Task[Any]",
+        deadline: float,
+    ) -> list[Any]:
+        """
+        추측 실행 검색 결과를 끝나는 순서대로 수집
+
+        원본 검색은 항상 기다립니다. 원본이 끝난 뒤에는 deadline까지만 확장 쿼리
+        검색을 기다리고, 그때까지 끝나지 않은 검색은 취소합니다.
+
+        Returns:
+            쿼리 순서대로 정렬된 결과 (실패는 예외 객체, 도착하지 않은 쿼리는 None)
+        """
+        loop = asyncio.get_running_loop()
+        outcomes: list[Any] = [None] * query_count
+        pending = set(slots)
+
+        while pending:
+            timeout = None if original_task in pending else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                positions = slots[task]
+                outcome: Any = task.exception() or task.result()
+                if isinstance(outcome, BaseException) or len(positions) == 1:
+                    for position in positions:
+                        outcomes[position] = outcome
+                else:
+                    for position, result in zip(positions, outcome, strict=True):
+                        outcomes[position] = result
+
+        if pending:
+            for task in pending:
+                task.cancel()
+            dropped = sum(len(slots[task]) for task in pending)
+            self.stats["late_expansion_searches"] += dropped
+            logger.info(
+                "확장 쿼리 검색 지연, 도착한 결과만 병합",
+                extra={"dropped_queries": dropped, "timeout_s": self._speculative_timeout}
+            )
+        return outcomes
+
+    async def _speculative_merge_hits(
+        self,
+        hits_per_query: list[Any],
+        queries: list[str],
+        top_k: int,
+    ) -> list[SearchResult]:
+        """
+        추측 실행 경로의 경량 병합 (원본 SearchHit + 확장 쿼리 SearchHit → top_k 본문 로딩)
+
+        Raises:
+            Exception: 원본 경량 검색 실패, 모든 쿼리 실패, 결과 형식 오류 시
+                (호출 측에서 전체 결과 경로로 폴백)
+        """
+        if len(queries) == 1:
+            if isinstance(hits_per_query[0], BaseException):
+                raise hits_per_query[0]
+            return await self._hydrate(self._validate_hits(hits_per_query[0])[:top_k])
+
+        for hits in hits_per_query:
+            if not isinstance(hits, BaseException):
+                self._validate_hits(hits)
+        if all(isinstance(hits, BaseException) for hits in hits_per_query):
+            raise cast(BaseException, hits_per_query[0])
+
+        merged_hits = self._rrf_merge(hits_per_query, queries, [1.0] * len(queries), top_k)
+        return await self._hydrate(merged_hits)
+
     async def _search_and_merge(
         self,
         queries: list[str],
@@ -842,8 +1120,6 @@ class RetrievalOrchestrator:
             weights = [1.0, 0.8, 0.6]
             results = await _search_and_merge(queries, 15, weights=weights)
         """
-        import asyncio
-
         # 가중치 기본값 설정
         if weights is None:
             weights = [1.0] * len(queries)
@@ -857,7 +1133,6 @@ class RetrievalOrchestrator:
         # 모든 쿼리를 병렬로 검색 (각각 top_k*2개 검색)
         # top_k*2로 검색하는 이유: RRF 통합 시 더 많은 후보 확보
         search_top_k = top_k * 2
-        search_tasks = [self.retriever.search(q, search_top_k, filters) for q in queries]
 
         logger.info(
             "Multi-Query 병렬 검색 시작",
@@ -868,8 +1143,20 @@ class RetrievalOrchestrator:
             }
         )
 
+        if use_rrf and self._lightweight_enabled():
+            try:
+                # 경량 결과(SearchHit)로 병합한 뒤 살아남은 top_k만 본문 로딩
+                hits_per_query = await self._search_hits(queries, search_top_k, filters)
+                merged_hits = self._rrf_merge(hits_per_query, queries, weights, top_k)
+                return await self._hydrate(merged_hits)
+            except Exception as e:
+                logger.warning(
+                    "경량 검색 실패, 전체 결과 검색으로 폴백",
+                    extra={"error": str(e), "query_count": len(queries)}
+                )
+
         start_time = asyncio.get_event_loop().time()
-        results_per_query = await asyncio.gather(*search_tasks, return_exceptions=True)
+        results_per_query = await self._search_queries(queries, search_top_k, filters)
         search_time = (asyncio.get_event_loop().time() - start_time) * 1000
 
         logger.info(
@@ -895,16 +1182,114 @@ class RetrievalOrchestrator:
 
         return merged_results
 
+    async def _search_queries(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult] | BaseException]:
+        """
+        여러 쿼리 검색 실행 (일괄 검색 우선, 쿼리별 병렬 검색 폴백)
+
+        Retriever가 IBatchRetriever(search_many)를 구현하면 임베딩 배치 1회 +
+        벡터 DB 요청 1회로 처리합니다. 미지원이거나 일괄 검색이 실패하면
+        기존처럼 쿼리별 search()를 병렬 호출하며, 개별 실패는 예외 객체로 담깁니다.
+
+        Args:
+            queries: 검색할 쿼리 리스트
+            top_k: 쿼리당 검색 결과 수
+            filters: 검색 필터
+
+        Returns:
+            쿼리 순서대로 정렬된 결과 리스트 (실패한 쿼리는 예외 객체)
+        """
+        if len(queries) > 1 and isinstance(self.retriever, IBatchRetriever):
+            try:
+                batch_results = await self.retriever.search_many(queries, top_k, filters)
+                if not isinstance(batch_results, list) or len(batch_results) != len(queries):
+                    raise ValueError("search_many 결과 수가 쿼리 수와 다릅니다")
+                self.stats["batch_search_count"] += 1
+                return list(batch_results)
+            except Exception as e:
+                logger.warning(
+                    "일괄 검색 실패, 쿼리별 검색으로 폴백",
+                    extra={"error": str(e), "query_count": len(queries)}
+                )
+
+        search_tasks = [self.retriever.search(q, top_k, filters) for q in queries]
+        return list(await asyncio.gather(*search_tasks, return_exceptions=True))
+
+    def _lightweight_enabled(self) -> bool:
+        """
+        경량 검색(SearchHit) + 지연 본문 로딩 경로 사용 여부
+
+        Retriever가 ILightweightRetriever를 구현하고(lightweight_hits_enabled가 False면 제외),
+        병합 단계에서 SearchHit에 없는 메타데이터(file_type)가 필요하지 않을 때만 사용합니다.
+        Mock 객체가 Protocol 검사를 통과하지 않도록 클래스에 정의된 코루틴인지 확인합니다.
+        """
+        return (
+            isinstance(self.retriever, ILightweightRetriever)
+            and inspect.iscoroutinefunction(getattr(type(self.retriever), "search_hits", None))
+            and getattr(self.retriever, "lightweight_hits_enabled", True) is not False
+            and not self.scoring_service.file_type_weight_enabled
+        )
+
+    async def _search_hits(
+        self,
+        queries: list[str],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchHit] | BaseException]:
+        """
+        여러 쿼리 경량 검색 (쿼리별 search_hits() 병렬 호출)
+
+        Returns:
+            쿼리 순서대로 정렬된 SearchHit 리스트 (실패한 쿼리는 예외 객체)
+
+        Raises:
+            Exception: 모든 쿼리가 실패했거나 결과 형식이 잘못된 경우
+        """
+        retriever = cast(ILightweightRetriever, self.retriever)
+        outcomes: list[list[SearchHit] | BaseException] = list(
+            await asyncio.gather(
+                *(retriever.search_hits(q, top_k, filters) for q in queries),
+                return_exceptions=True,
+            )
+        )
+        for outcome in outcomes:
+            if not isinstance(outcome, BaseException):
+                self._validate_hits(outcome)
+        if all(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise cast(BaseException, outcomes[0])
+        return outcomes
+
+    @staticmethod
+    def _validate_hits(hits: Any) -> list[SearchHit]:
+        """search_hits() 반환값 형식 검증"""
+        if not isinstance(hits, list) or not all(isinstance(hit, SearchHit) for hit in hits):
+            raise TypeError("search_hits 결과는 SearchHit 리스트여야 합니다")
+        return hits
+
+    async def _hydrate(self, hits: list[SearchHit]) -> list[SearchResult]:
+        """병합 후 살아남은 SearchHit의 본문/메타데이터 일괄 로딩"""
+        if not hits:
+            return []
+        results = await cast(ILightweightRetriever, self.retriever).hydrate(hits)
+        if not isinstance(results, list) or not all(isinstance(r, SearchResult) for r in results):
+            raise TypeError("hydrate 결과는 SearchResult 리스트여야 합니다")
+        self.stats["lightweight_merge_count"] += 1
+        return results
+
     def _rrf_merge(
         self,
         results_per_query: list[
-            list[SearchResult] | BaseException
+            list[_ResultT] | BaseException
         ],  # asyncio.gather with return_exceptions=True
         queries: list[str],
         weights: list[float],
         top_k: int,
         rrf_k: int = 60,
-    ) -> list[SearchResult]:
+    ) -> list[_ResultT]:
         """
         RRF (Reciprocal Rank Fusion) 알고리즘으로 결과 통합
 
@@ -924,10 +1309,10 @@ class RetrievalOrchestrator:
         Returns:
             RRF 점수로 정렬된 결과 리스트
         """
-        # 문서별 RRF 점수 계산
-        doc_scores: dict[str, float] = {}  # {doc_id: rrf_score}
-        doc_objects: dict[str, SearchResult] = {}  # {doc_id: SearchResult}
-        doc_appearances: dict[str, int] = {}  # {doc_id: 등장 횟수}
+        # 성공한 쿼리 결과만 수집 (문서 ID가 없는 결과 제외)
+        ranked_ids: list[list[str]] = []
+        ranked_weights: list[float] = []
+        doc_objects: dict[str, _ResultT] = {}  # {doc_id: 결과 객체} (첫 등장)
 
         for query_idx, results in enumerate(results_per_query):
             if isinstance(results, BaseException):  # asyncio.gather with return_exceptions=True
@@ -942,27 +1327,21 @@ class RetrievalOrchestrator:
                 )
                 continue
 
-            weight = weights[query_idx]
-
-            for rank, result in enumerate(results):
-                # 문서 ID 추출
+            ids: list[str] = []
+            for result in results:
                 doc_id = self._get_doc_id(result)
-
                 if not doc_id:
                     continue
+                ids.append(doc_id)
+                doc_objects.setdefault(doc_id, result)
 
-                # RRF 점수 계산: weight / (k + rank)
-                rrf_score = weight / (rrf_k + rank)
+            ranked_ids.append(ids)
+            ranked_weights.append(weights[query_idx])
 
-                # 점수 누적
-                doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + rrf_score
-
-                # 문서 객체 저장 (첫 등장 시)
-                if doc_id not in doc_objects:
-                    doc_objects[doc_id] = result
-
-                # 등장 횟수 카운트
-                doc_appearances[doc_id] = doc_appearances.get(doc_id, 0) + 1
+        # RRF 점수 계산: Σ weight / (k + rank), rank는 0-based
+        fused = rrf_fuse(ranked_ids, weights=ranked_weights, k=rrf_k, rank_start=0)
+        doc_scores = fused.scores
+        doc_appearances = fused.appearances
 
         # 설정 기반 가중치 적용 (ScoringService 사용)
         # 기본값: 비활성화 → 순수 RRF 점수 반환 (Blank System 원칙)
@@ -978,8 +1357,9 @@ class RetrievalOrchestrator:
             )
             weight_applied_count = 0
 
-            for doc_id, result in doc_objects.items():
-                original_score = doc_scores[doc_id]
+            for idx, doc_id in enumerate(fused.ids):
+                result = doc_objects[doc_id]
+                original_score = float(doc_scores[idx])
 
                 # 메타데이터에서 컬렉션과 파일타입 추출
                 metadata = result.metadata or {}
@@ -999,42 +1379,39 @@ class RetrievalOrchestrator:
                     result.metadata["_score_before_weight"] = original_score
                     weight_applied_count += 1
 
-                doc_scores[doc_id] = adjusted_score
+                doc_scores[idx] = adjusted_score
 
             logger.info(
                 "가중치 적용 완료",
                 extra={"weighted_documents": weight_applied_count}
             )
 
-        # RRF 점수로 정렬 (가중치 적용 후)
-        sorted_doc_ids = sorted(
-            doc_scores.keys(), key=lambda doc_id: doc_scores[doc_id], reverse=True
-        )
-
-        # SearchResult 객체에 RRF 점수 적용
+        # RRF 점수로 상위 top_k 선택 (가중치 적용 후)
         merged_results = []
-        for doc_id in sorted_doc_ids[:top_k]:
+        for idx in fused.top_k_indices(top_k):
+            doc_id = fused.ids[idx]
             result = doc_objects[doc_id]
-            rrf_score = doc_scores[doc_id]
+            rrf_score = float(doc_scores[idx])
+            appearances = int(doc_appearances[idx])
 
             # 원본 점수 유지하면서 RRF 점수 추가
             if hasattr(result, "score"):
                 result.metadata = result.metadata or {}
                 result.metadata["original_score"] = result.score
                 result.metadata["rrf_score"] = rrf_score
-                result.metadata["query_appearances"] = doc_appearances[doc_id]
+                result.metadata["query_appearances"] = appearances
                 result.score = rrf_score  # RRF 점수로 교체
             elif isinstance(result, dict):
                 result["metadata"] = result.get("metadata", {})
                 result["metadata"]["original_score"] = result.get("score", 0.0)
                 result["metadata"]["rrf_score"] = rrf_score
-                result["metadata"]["query_appearances"] = doc_appearances[doc_id]
+                result["metadata"]["query_appearances"] = appearances
                 result["score"] = rrf_score
 
             merged_results.append(result)
 
         if len(doc_appearances) > 0:
-            avg_appearances = sum(doc_appearances.values()) / len(doc_appearances)
+            avg_appearances = float(doc_appearances.mean())
             logger.info(
                 "RRF 병합 완료",
                 extra={
@@ -1078,8 +1455,9 @@ class RetrievalOrchestrator:
 
         RRF를 사용하지 않는 경우의 폴백 로직
         """
-        merged_results = []
-        seen_ids = set()
+        ranked_ids: list[list[str]] = []
+        score_lists: list[list[float]] = []
+        doc_objects: dict[str, SearchResult] = {}
 
         for i, results in enumerate(results_per_query):
             if isinstance(results, BaseException):  # asyncio.gather with return_exceptions=True
@@ -1094,27 +1472,29 @@ class RetrievalOrchestrator:
                 )
                 continue
 
+            ids: list[str] = []
+            scores: list[float] = []
             for result in results:
                 doc_id = self._get_doc_id(result)
+                if not doc_id:
+                    continue
+                ids.append(doc_id)
+                scores.append(getattr(result, "score", 0.0))
+                doc_objects.setdefault(doc_id, result)
 
-                if doc_id and doc_id not in seen_ids:
-                    seen_ids.add(doc_id)
-                    merged_results.append(result)
-
-        # 원본 점수 기준 정렬
-        merged_results.sort(
-            key=lambda x: getattr(x, "score", 0.0),  # SearchResult는 dataclass, .get() 불필요
-            reverse=True,
-        )
+            ranked_ids.append(ids)
+            score_lists.append(scores)
 
-        return merged_results[:top_k]
+        # 중복 제거 (첫 등장 유지) + 원본 점수 기준 상위 top_k
+        fused = first_seen_fuse(ranked_ids, score_lists)
+        return [doc_objects[fused.ids[idx]] for idx in fused.top_k_indices(top_k)]
 
-    def _get_doc_id(self, result: SearchResult | dict) -> str | None:
+    def _get_doc_id(self, result: SearchResult | SearchHit | dict) -> str | None:
         """
         SearchResult에서 문서 ID 추출
 
         Args:
-            result: SearchResult 객체 또는 dict
+            result: SearchResult / SearchHit 객체 또는 dict
 
         Returns:
             문서 ID 또는 None
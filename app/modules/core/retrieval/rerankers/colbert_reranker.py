@@ -17,8 +17,7 @@ ColBERT의 Late Interaction 방식은 쿼리와 문서의 토큰별 유사도를
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
-
+from .....lib.http_transport import get_http_client
 from .....lib.logger import get_logger
 from ..interfaces import SearchResult
 
@@ -189,23 +188,23 @@ class JinaColBERTReranker:
             f"documents={len(documents)}"
         )
 
-        # HTTP 요청 실행
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.config.endpoint,
-                json=request_data,
-                headers=headers,
-                timeout=self.config.timeout,
-            )
+        # HTTP 요청 실행 (호스트별 공유 커넥션 풀)
+        client = get_http_client(self.config.endpoint)
+        response = await client.post(
+            self.config.endpoint,
+            json=request_data,
+            headers=headers,
+            timeout=self.config.timeout,
+        )
 
-            # 응답 상태 확인
-            if response.status_code != 200:
-                raise Exception(
-                    f"API error: {response.status_code} - {response.text}"
-                )
+        # 응답 상태 확인
+        if response.status_code != 200:
+            raise Exception(
+                f"API error: {response.status_code} - {response.text}"
+            )
 
-            # JSON 파싱
-            response_data = response.json()
+        # JSON 파싱
+        response_data = response.json()
 
         # 결과 재구성
         reranked_results: list[SearchResult] = []
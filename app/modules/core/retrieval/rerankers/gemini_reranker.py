@@ -18,6 +18,7 @@ from typing import Any
 import httpx
 import structlog
 
+from .....lib.http_transport import get_http_client
 from ..interfaces import IReranker, SearchResult
 
 logger = structlog.get_logger(__name__)
@@ -40,6 +41,8 @@ class GeminiFlashReranker(IReranker):
     - 에러 시 원본 결과 반환 (fail-safe)
     """
 
+    _BASE_URL = "https://generativelanguage.googleapis.com"
+
     def __init__(
         self,
         api_key: str,
@@ -62,14 +65,9 @@ class GeminiFlashReranker(IReranker):
         self.timeout = timeout
         self.model = model
 
-        # ✅ httpx AsyncClient 생성 (네이티브 async)
-        self.http_client = httpx.AsyncClient(
-            base_url="https://generativelanguage.googleapis.com",
-            headers={
-                "Content-Type": "application/json",
-            },
-            timeout=httpx.Timeout(timeout, connect=5.0),  # 전체 타임아웃 + 연결 타임아웃
-        )
+        # ✅ 요청 헤더/타임아웃 (클라이언트는 호스트별 공유 커넥션 풀 사용)
+        self._headers = {"Content-Type": "application/json"}
+        self._timeout = httpx.Timeout(timeout, connect=5.0)  # 전체 타임아웃 + 연결 타임아웃
 
         # 통계 추적
         self._stats = {
@@ -158,9 +156,11 @@ Do not include any other text, explanation, or formatting. Only the JSON object.
 
             # Gemini REST API 호출
             response = await self.http_client.post(
-                f"/v1beta/models/{self.model}:generateContent",
+                f"{self._BASE_URL}/v1beta/models/{self.model}:generateContent",
                 params={"key": self.api_key},  # API Key를 query parameter로 전달
                 json=request_body,
+                headers=self._headers,
+                timeout=self._timeout,
             )
 
             # HTTP 에러 체크
@@ -417,13 +417,17 @@ Do not include any other text, explanation, or formatting. Only the JSON object.
             logger.error("health_check_failed", error=str(e))
             return False
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Gemini API 호스트용 공유 AsyncClient"""
+        return get_http_client(self._BASE_URL)
+
     async def cleanup(self) -> None:
         """
-        리소스 정리 (httpx AsyncClient 종료)
+        리소스 정리
 
-        애플리케이션 종료 시 호출 필요
+        공유 커넥션 풀은 애플리케이션 종료 시 http_transport.aclose()로 닫힙니다.
         """
-        await self.http_client.aclose()
         logger.info("gemini_flash_reranker_cleanup_completed")
 
     def supports_caching(self) -> bool:
@@ -9,6 +9,7 @@ from typing import Any
 
 import httpx
 
+from .....lib.http_transport import get_http_client
 from .....lib.logger import get_logger
 from ..interfaces import SearchResult
 
@@ -115,17 +116,17 @@ class JinaReranker:
                 f"documents={len(documents)}, top_n={request_data['top_n']}"
             )
 
-            # HTTP 요청 실행 (asyncio + httpx)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.endpoint,
-                    json=request_data,
-                    headers=headers,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-
-                rerank_response = response.json()
+            # HTTP 요청 실행 (호스트별 공유 커넥션 풀)
+            client = get_http_client(self.endpoint)
+            response = await client.post(
+                self.endpoint,
+                json=request_data,
+                headers=headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            rerank_response = response.json()
 
             # 결과 재구성 (기존 SearchResult 객체에 새 스코어 적용)
             reranked_results = []
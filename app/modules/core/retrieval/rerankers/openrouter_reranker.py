@@ -14,6 +14,7 @@ from typing import Any
 
 import httpx
 
+from .....lib.http_transport import get_http_client
 from .....lib.logger import get_logger
 from ..interfaces import IReranker, SearchResult
 
@@ -31,6 +32,8 @@ class OpenRouterReranker(IReranker):
     - Graceful Fallback (오류 시 원본 반환)
     """
 
+    _BASE_URL = "https://openrouter.ai/api/v1"
+
     def __init__(
         self,
         api_key: str,
@@ -53,15 +56,12 @@ class OpenRouterReranker(IReranker):
         self.max_documents = max_documents
         self.timeout = timeout
 
-        # httpx AsyncClient 생성
-        self.http_client = httpx.AsyncClient(
-            base_url="https://openrouter.ai/api/v1",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
-            timeout=httpx.Timeout(timeout, connect=5.0),
-        )
+        # 요청 헤더/타임아웃 (클라이언트는 호스트별 공유 커넥션 풀 사용)
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        }
+        self._timeout = httpx.Timeout(timeout, connect=5.0)
 
         # 통계 추적
         self._stats = {
@@ -77,9 +77,13 @@ class OpenRouterReranker(IReranker):
         """리랭커 초기화 (HTTP API이므로 추가 초기화 불필요)"""
         logger.debug("OpenRouterReranker 초기화 완료")
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """OpenRouter 호스트용 공유 AsyncClient"""
+        return get_http_client(self._BASE_URL)
+
     async def close(self) -> None:
-        """리소스 정리"""
-        await self.http_client.aclose()
+        """리소스 정리 (공유 커넥션 풀은 애플리케이션 종료 시 닫힘)"""
         logger.info("OpenRouterReranker 종료 완료")
 
     async def rerank(
@@ -115,7 +119,9 @@ class OpenRouterReranker(IReranker):
 
             # API 요청
             response = await self.http_client.post(
-                "/chat/completions",
+                f"{self._BASE_URL}/chat/completions",
+                headers=self._headers,
+                timeout=self._timeout,
                 json={
                     "model": self.model,
                     "messages": [{"role": "user", "content": prompt}],
@@ -19,6 +19,7 @@ from typing import Any, Protocol, runtime_checkable
 
 from app.lib.logger import get_logger
 from app.modules.core.retrieval.interfaces import SearchResult
+from app.modules.core.retrieval.retrievers.query_embedding import embed_queries
 
 logger = get_logger(__name__)
 
@@ -46,6 +47,16 @@ class IVectorStore(Protocol):
         """벡터 유사도 검색"""
         ...
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """다중 벡터 일괄 유사도 검색"""
+        ...
+
 
 class ChromaRetriever:
     """
@@ -153,20 +164,8 @@ class ChromaRetriever:
                 filters=filters,
             )
 
-            # 3. SearchResult로 변환
-            dense_results = self._convert_to_search_results(raw_results)
-
-            # Phase 1: 하이브리드 검색 (BM25 엔진이 주입된 경우)
-            if self._hybrid_enabled and self._bm25_index is not None and self._hybrid_merger is not None:
-                bm25_results = self._bm25_index.search(query, top_k=top_k)
-                merged: list[SearchResult] = self._hybrid_merger.merge(
-                    dense_results=dense_results,
-                    bm25_results=bm25_results,
-                    top_k=top_k,
-                )
-                results = merged
-            else:
-                results = dense_results
+            # 3. SearchResult로 변환 (+ 하이브리드 병합)
+            results = self._finalize_results(query, raw_results, top_k)
 
             # 4. 통계 업데이트
             self._stats["total_searches"] += 1
@@ -188,6 +187,89 @@ class ChromaRetriever:
             )
             raise
 
+    async def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        다중 쿼리 일괄 Dense 검색 (IBatchRetriever)
+
+        검색 흐름:
+        1. 모든 쿼리를 한 번에 벡터화 (embed_queries)
+        2. ChromaVectorStore.search_many()로 col.query 1회 호출
+        3. 쿼리별 결과를 SearchResult로 변환 (+ 하이브리드 병합)
+
+        Args:
+            queries: 검색 쿼리 문자열 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+        """
+        if not queries:
+            return []
+
+        try:
+            query_vectors = embed_queries(self.embedder, queries)
+            raw_results_per_query = await self.store.search_many(
+                collection=self.collection_name,
+                query_vectors=query_vectors,
+                top_k=top_k,
+                filters=filters,
+            )
+
+            results_per_query = [
+                self._finalize_results(query, raw_results, top_k)
+                for query, raw_results in zip(queries, raw_results_per_query, strict=True)
+            ]
+
+            self._stats["total_searches"] += len(queries)
+            logger.info(
+                f"ChromaRetriever 일괄 검색 완료: {len(queries)}개 쿼리 "
+                f"(hybrid={self._hybrid_enabled})"
+            )
+            return results_per_query
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(
+                f"ChromaRetriever 일괄 검색 실패: {e}",
+                extra={"query_count": len(queries)},
+                exc_info=True,
+            )
+            raise
+
+    def _finalize_results(
+        self, query: str, raw_results: list[dict[str, Any]], top_k: int
+    ) -> list[SearchResult]:
+        """
+        Store 결과를 SearchResult로 변환하고 하이브리드 모드면 BM25 결과와 병합
+
+        Args:
+            query: 검색 쿼리 (BM25 검색용)
+            raw_results: ChromaVectorStore 검색 결과
+            top_k: 반환할 최대 결과 수
+
+        Returns:
+            SearchResult 리스트
+        """
+        dense_results = self._convert_to_search_results(raw_results)
+
+        # Phase 1: 하이브리드 검색 (BM25 엔진이 주입된 경우)
+        if self._hybrid_enabled and self._bm25_index is not None and self._hybrid_merger is not None:
+            bm25_results = self._bm25_index.search(query, top_k=top_k)
+            merged: list[SearchResult] = self._hybrid_merger.merge(
+                dense_results=dense_results,
+                bm25_results=bm25_results,
+                top_k=top_k,
+            )
+            return merged
+
+        return dense_results
+
     async def health_check(self) -> bool:
         """
         Chroma 연결 상태 확인
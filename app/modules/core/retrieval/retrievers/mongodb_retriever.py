@@ -26,11 +26,31 @@ from pymongo.collection import Collection
 from pymongo.errors import PyMongoError
 
 from .....lib.logger import get_logger
+from .....lib.metadata_filter import (
+    CardinalityCache,
+    FilterOp,
+    FilterPlanner,
+    FilterStrategy,
+    filter_fields,
+    filter_ops,
+    parse_filters,
+    to_mongo_query,
+)
 from .....lib.mongodb_client import MongoDBClient
+from ..fusion import rrf_fuse
 from ..interfaces import SearchResult
 
 logger = get_logger(__name__)
 
+# 문서 메타데이터 중첩 경로 (metadata.metadata.<field>)
+METADATA_FIELD_PREFIX = "metadata.metadata."
+
+# Atlas $vectorSearch numCandidates 상한
+MAX_NUM_CANDIDATES = 10_000
+
+# $vectorSearch.filter가 지원하지 않아 $match로 후처리해야 하는 연산자
+NON_VECTOR_FILTER_OPS = frozenset({FilterOp.EXISTS})
+
 
 class MongoDBRetriever:
     """
@@ -61,6 +81,7 @@ class MongoDBRetriever:
         collection_name: str = "documents",
         dense_weight: float = 0.6,
         sparse_weight: float = 0.4,
+        prefilter_fields: list[str] | None = None,
     ):
         """
         MongoDB Retriever 초기화 (DI Container)
@@ -71,6 +92,10 @@ class MongoDBRetriever:
             collection_name: MongoDB 컬렉션 이름 (기본: "documents")
             dense_weight: Dense vector 가중치 (기본: 0.6)
             sparse_weight: float BM25 가중치 (기본: 0.4)
+            prefilter_fields: Atlas vector 인덱스에 filter 타입으로 등록된 메타데이터 필드.
+                필터가 이 필드만 사용하면 $vectorSearch.filter로 pushdown하고,
+                그 외에는 후보를 넉넉히 가져온 뒤 $match로 후처리합니다.
+                None이면 mongodb.vector_search.prefilter_fields 설정을 사용합니다.
 
         Note:
             가중치 합은 1.0이 아니어도 됨 (MongoDB가 자동 정규화)
@@ -88,17 +113,29 @@ class MongoDBRetriever:
         self.vector_index_name = "vector_index"
         self.fulltext_index_name = "default"
 
+        # 메타데이터 필터 pushdown 계획
+        if prefilter_fields is None:
+            vector_config = mongodb_client.config.get("vector_search") or {}
+            prefilter_fields = vector_config.get("prefilter_fields") or []
+        self.prefilter_fields = frozenset(prefilter_fields)
+        self._filter_planner = FilterPlanner()
+        self._cardinality_cache = CardinalityCache()
+
         # 통계
         self.stats = {
             "total_searches": 0,
             "hybrid_searches": 0,
             "vector_searches": 0,
             "fulltext_searches": 0,
+            "prefiltered_searches": 0,
+            "exact_scan_searches": 0,
+            "postfiltered_searches": 0,
         }
 
         logger.info(
             f"MongoDBRetriever 초기화: collection={collection_name}, "
-            f"weights=(dense={dense_weight}, sparse={sparse_weight})"
+            f"weights=(dense={dense_weight}, sparse={sparse_weight}), "
+            f"prefilter_fields={sorted(self.prefilter_fields)}"
         )
 
     async def initialize(self) -> None:
@@ -312,41 +349,126 @@ class MongoDBRetriever:
         Returns:
             검색 결과 리스트 (dict with _id, content, metadata, score)
         """
-        pipeline = [
-            {
-                "$vectorSearch": {
-                    "index": self.vector_index_name,
-                    "path": "embedding",
-                    "queryVector": query_embedding,
-                    "numCandidates": top_k * 10,
-                    "limit": top_k,
-                }
-            },
-            {
-                "$project": {
-                    "_id": 1,
-                    "content": 1,
-                    "metadata": 1,
-                    "score": {"$meta": "vectorSearchScore"},
-                }
-            },
-        ]
-
-        # 필터링 추가
-        if filters:
-            match_stage: dict[str, Any] = {"$match": {}}
-            for key, value in filters.items():
-                match_stage["$match"][f"metadata.metadata.{key}"] = value
-            pipeline.insert(1, match_stage)
-
         if self.collection is None:
             logger.error("Collection이 초기화되지 않음")
             return []
 
+        pipeline = await self._build_vector_pipeline(query_embedding, top_k, filters)
         cursor = await asyncio.to_thread(self.collection.aggregate, pipeline)
         results = await asyncio.to_thread(list, cursor)
         return results
 
+    async def _build_vector_pipeline(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        $vectorSearch 파이프라인 구성 (메타데이터 필터 pushdown)
+
+        $vectorSearch 직후 $match를 붙이면 limit=top_k로 잘린 결과를 다시 거르므로
+        필터가 선택적일수록 결과가 top_k보다 적어집니다. FilterPlanner로 전략을 고릅니다.
+        - PRE_FILTER: $vectorSearch.filter로 ANN 탐색 중 필터 (filter 인덱스 필드만)
+        - EXACT_SCAN: 매칭 문서가 적으면 exact=True로 부분집합 전수 탐색
+        - POST_FILTER: limit을 fetch_k로 늘린 뒤 $match → $limit top_k
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            top_k: 반환할 결과 수
+            filters: 메타데이터 필터링
+
+        Returns:
+            aggregate 파이프라인
+        """
+        vector_stage: dict[str, Any] = {
+            "index": self.vector_index_name,
+            "path": "embedding",
+            "queryVector": query_embedding,
+            "numCandidates": min(top_k * 10, MAX_NUM_CANDIDATES),
+            "limit": top_k,
+        }
+        project_stage: dict[str, Any] = {
+            "$project": {
+                "_id": 1,
+                "content": 1,
+                "metadata": 1,
+                "score": {"$meta": "vectorSearchScore"},
+            }
+        }
+
+        filter_expr = parse_filters(filters)
+        if filter_expr is None:
+            return [{"$vectorSearch": vector_stage}, project_stage]
+
+        query = to_mongo_query(filter_expr, METADATA_FIELD_PREFIX)
+        supports_prefilter = filter_fields(filter_expr) <= self.prefilter_fields and not (
+            filter_ops(filter_expr) & NON_VECTOR_FILTER_OPS
+        )
+        matching, total = await self._estimate_cardinality(query)
+        plan = self._filter_planner.plan(
+            top_k, matching=matching, total=total, supports_prefilter=supports_prefilter
+        )
+
+        if plan.strategy is FilterStrategy.EXACT_SCAN:
+            del vector_stage["numCandidates"]
+            vector_stage["exact"] = True
+            vector_stage["filter"] = query
+            self.stats["exact_scan_searches"] += 1
+            return [{"$vectorSearch": vector_stage}, project_stage]
+
+        if plan.strategy is FilterStrategy.PRE_FILTER:
+            vector_stage["filter"] = query
+            self.stats["prefiltered_searches"] += 1
+            return [{"$vectorSearch": vector_stage}, project_stage]
+
+        vector_stage["limit"] = plan.fetch_k
+        vector_stage["numCandidates"] = min(plan.fetch_k * 10, MAX_NUM_CANDIDATES)
+        self.stats["postfiltered_searches"] += 1
+        return [
+            {"$vectorSearch": vector_stage},
+            {"$match": query},
+            {"$limit": top_k},
+            project_stage,
+        ]
+
+    async def _estimate_cardinality(self, query: dict[str, Any]) -> tuple[int | None, int | None]:
+        """
+        필터 매칭 문서 수 / 전체 문서 수 추정 (TTL 캐시)
+
+        매칭 수는 exact_scan_threshold + 1에서 세기를 멈춥니다. 전략 결정에는
+        "임계값 이하인지"만 필요하고, 상한에 걸린 값은 선택도의 하한이므로
+        POST_FILTER는 보수적으로(더 많이) over-fetch합니다.
+
+        Returns:
+            (매칭 문서 수, 전체 문서 수). 추정 실패 시 (None, None)
+        """
+        matching_key, total_key = ("matching", repr(query)), ("total",)
+        matching = self._cardinality_cache.get(matching_key)
+        total = self._cardinality_cache.get(total_key)
+        if matching is not None and total is not None:
+            return matching, total
+
+        if self.collection is None:
+            return None, None
+
+        try:
+            count_limit = self._filter_planner.exact_scan_threshold + 1
+            matching, total = await asyncio.gather(
+                asyncio.to_thread(self.collection.count_documents, query, limit=count_limit),
+                asyncio.to_thread(self.collection.estimated_document_count),
+            )
+        except PyMongoError as e:
+            logger.debug(f"MongoDB 필터 카디널리티 추정 실패: {e}")
+            return None, None
+
+        if not isinstance(matching, int) or not isinstance(total, int):
+            return None, None
+
+        self._cardinality_cache.set(matching_key, matching)
+        self._cardinality_cache.set(total_key, total)
+        return matching, total
+
     async def _fulltext_search_only(
         self,
         query: str,
@@ -385,12 +507,10 @@ class MongoDBRetriever:
             },
         ]
 
-        # 필터링 추가
-        if filters:
-            match_stage: dict[str, Any] = {"$match": {}}
-            for key, value in filters.items():
-                match_stage["$match"][f"metadata.metadata.{key}"] = value
-            pipeline.insert(1, match_stage)
+        # 필터링 추가 ($limit 이전에 적용)
+        filter_expr = parse_filters(filters)
+        if filter_expr is not None:
+            pipeline.insert(1, {"$match": to_mongo_query(filter_expr, METADATA_FIELD_PREFIX)})
 
         if self.collection is None:
             logger.error("Collection이 초기화되지 않음")
@@ -426,29 +546,24 @@ class MongoDBRetriever:
         Returns:
             통합된 검색 결과 리스트 (SearchResult)
         """
-        # 문서별 RRF 점수 계산
-        doc_scores: dict[str, float] = {}
-        doc_data: dict[str, dict[str, Any]] = {}
-
-        # Vector Search 결과 처리
-        for rank, doc in enumerate(vector_results, start=1):
-            doc_id = str(doc["_id"])
-            rrf_score = self.dense_weight / (k + rank)
-            doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + rrf_score
-            doc_data[doc_id] = doc
+        vector_ids = [str(doc["_id"]) for doc in vector_results]
+        fulltext_ids = [str(doc["_id"]) for doc in fulltext_results]
 
-        # Full-Text Search 결과 처리
-        for rank, doc in enumerate(fulltext_results, start=1):
-            doc_id = str(doc["_id"])
-            rrf_score = self.sparse_weight / (k + rank)
-            doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + rrf_score
-
-            # Full-text에만 있는 문서는 doc_data에 추가
-            if doc_id not in doc_data:
-                doc_data[doc_id] = doc
-
-        # 점수로 정렬
-        sorted_doc_ids = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        # 문서 원본 (Vector 우선, Full-text에만 있는 문서 추가)
+        doc_data: dict[str, dict[str, Any]] = {}
+        for doc_id, doc in zip(vector_ids, vector_results, strict=True):
+            doc_data.setdefault(doc_id, doc)
+        for doc_id, doc in zip(fulltext_ids, fulltext_results, strict=True):
+            doc_data.setdefault(doc_id, doc)
+
+        # RRF 점수 계산 (rank는 1-based) + 상위 top_k 선택
+        fused = rrf_fuse(
+            [vector_ids, fulltext_ids],
+            weights=[self.dense_weight, self.sparse_weight],
+            k=k,
+            rank_start=1,
+        )
+        sorted_doc_ids = fused.top_k(top_k)
 
         # SearchResult로 변환
         results = []
@@ -490,38 +605,13 @@ class MongoDBRetriever:
             # Query embedding 생성
             query_embedding = await asyncio.to_thread(self.embedder.embed_query, query)
 
-            # Vector search pipeline
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": self.vector_index_name,
-                        "path": "embedding",
-                        "queryVector": query_embedding,
-                        "numCandidates": top_k * 10,
-                        "limit": top_k,
-                    }
-                },
-                {
-                    "$project": {
-                        "_id": 1,
-                        "content": 1,
-                        "metadata": 1,
-                        "score": {"$meta": "vectorSearchScore"},
-                    }
-                },
-            ]
-
-            # 필터링 추가 (중첩된 메타데이터 구조)
-            if filters:
-                match_stage: dict[str, Any] = {"$match": {}}
-                for key, value in filters.items():
-                    match_stage["$match"][f"metadata.metadata.{key}"] = value
-                pipeline.insert(1, match_stage)
-
             if self.collection is None:
                 logger.error("Collection이 초기화되지 않음")
                 return []
 
+            # Vector search pipeline (필터 pushdown 포함)
+            pipeline = await self._build_vector_pipeline(query_embedding, top_k, filters)
+
             # MongoDB aggregate 실행
             cursor = await asyncio.to_thread(self.collection.aggregate, pipeline)
 
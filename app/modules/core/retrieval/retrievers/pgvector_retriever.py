@@ -21,6 +21,7 @@ from typing import Any, Protocol, runtime_checkable
 
 from app.lib.logger import get_logger
 from app.modules.core.retrieval.interfaces import SearchResult
+from app.modules.core.retrieval.retrievers.query_embedding import embed_queries
 
 logger = get_logger(__name__)
 
@@ -48,6 +49,16 @@ class IVectorStore(Protocol):
         """벡터 유사도 검색"""
         ...
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """다중 벡터 일괄 유사도 검색"""
+        ...
+
 
 class PgVectorRetriever:
     """
@@ -178,6 +189,58 @@ class PgVectorRetriever:
             )
             raise
 
+    async def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        다중 쿼리 일괄 Dense 검색 (IBatchRetriever)
+
+        검색 흐름:
+        1. 모든 쿼리를 한 번에 벡터화 (embed_queries)
+        2. PgVectorStore.search_many()로 일괄 검색 (unnest + LATERAL 단일 SQL 실행)
+        3. 쿼리별 결과를 SearchResult로 변환
+
+        Args:
+            queries: 검색 쿼리 문자열 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+        """
+        if not queries:
+            return []
+
+        try:
+            query_vectors = embed_queries(self.embedder, queries)
+            raw_results_per_query = await self.store.search_many(
+                collection=self.table_name,
+                query_vectors=query_vectors,
+                top_k=top_k,
+                filters=filters,
+            )
+
+            results_per_query = [
+                self._convert_to_search_results(raw_results)
+                for raw_results in raw_results_per_query
+            ]
+
+            self._stats["total_searches"] += len(queries)
+            logger.info(f"PgVectorRetriever 일괄 검색 완료: {len(queries)}개 쿼리")
+            return results_per_query
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(
+                f"PgVectorRetriever 일괄 검색 실패: {e}",
+                extra={"query_count": len(queries)},
+                exc_info=True,
+            )
+            raise
+
     async def health_check(self) -> bool:
         """
         pgvector 연결 상태 확인
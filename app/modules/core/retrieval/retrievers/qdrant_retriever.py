@@ -18,10 +18,12 @@ Note:
     hybrid_alpha 파라미터로 Dense/Sparse 가중치를 조절할 수 있습니다.
 """
 
+import asyncio
 from typing import Any, Protocol, runtime_checkable
 
 from app.lib.logger import get_logger
 from app.modules.core.retrieval.interfaces import SearchResult
+from app.modules.core.retrieval.retrievers.query_embedding import embed_queries
 
 logger = get_logger(__name__)
 
@@ -50,6 +52,16 @@ class IVectorStore(Protocol):
         """벡터 유사도 검색"""
         ...
 
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """다중 벡터 일괄 유사도 검색"""
+        ...
+
 
 class QdrantRetriever:
     """
@@ -225,6 +237,62 @@ class QdrantRetriever:
             )
             raise
 
+    async def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        다중 쿼리 일괄 Dense 검색 (IBatchRetriever)
+
+        검색 흐름:
+        1. 모든 쿼리를 한 번에 벡터화 (embed_queries)
+        2. QdrantVectorStore.search_many()로 일괄 검색 (search_batch 1회 호출)
+        3. 쿼리별 결과를 SearchResult로 변환
+
+        Args:
+            queries: 검색 쿼리 문자열 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트의 리스트
+        """
+        if not queries:
+            return []
+
+        # 하이브리드(Sparse) 모드는 쿼리별 Sparse 벡터가 필요하므로 개별 검색으로 폴백
+        if self.hybrid_alpha < 1.0 and self._sparse_encoder is not None:
+            return list(await asyncio.gather(*(self.search(q, top_k, filters) for q in queries)))
+
+        try:
+            query_vectors = embed_queries(self.embedder, queries)
+            raw_results_per_query = await self.store.search_many(
+                collection=self.collection_name,
+                query_vectors=query_vectors,
+                top_k=top_k,
+                filters=filters,
+            )
+
+            results_per_query = [
+                self._convert_to_search_results(raw_results)
+                for raw_results in raw_results_per_query
+            ]
+
+            self._stats["total_searches"] += len(queries)
+            logger.info(f"QdrantRetriever 일괄 검색 완료: {len(queries)}개 쿼리")
+            return results_per_query
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(
+                f"QdrantRetriever 일괄 검색 실패: {e}",
+                extra={"query_count": len(queries)},
+                exc_info=True,
+            )
+            raise
+
     async def health_check(self) -> bool:
         """
         Qdrant 연결 상태 확인
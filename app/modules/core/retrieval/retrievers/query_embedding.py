@@ -0,0 +1,28 @@
+"""
+쿼리 일괄 임베딩 헬퍼
+
+Retriever.search_many()에서 여러 쿼리를 한 번에 벡터화할 때 사용합니다.
+임베딩 모델이 embed_queries()(배치 API)를 제공하면 1회 호출로 처리하고,
+없으면 embed_query()를 쿼리 수만큼 호출합니다.
+"""
+
+from typing import Any
+
+
+def embed_queries(embedder: Any, queries: list[str]) -> list[list[float]]:
+    """
+    여러 쿼리를 입력 순서대로 벡터화
+
+    Args:
+        embedder: 임베딩 모델 (embed_query 필수, embed_queries 선택)
+        queries: 벡터화할 쿼리 리스트
+
+    Returns:
+        쿼리 벡터 리스트 (queries와 같은 순서/길이)
+    """
+    batch_embed = getattr(embedder, "embed_queries", None)
+    if callable(batch_embed):
+        vectors = batch_embed(queries)
+        if isinstance(vectors, list) and len(vectors) == len(queries):
+            return vectors
+    return [embedder.embed_query(query) for query in queries]
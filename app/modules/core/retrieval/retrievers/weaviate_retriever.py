@@ -28,8 +28,9 @@ Weaviate Retriever - 하이브리드 검색 (Dense + Sparse BM25)
 """
 
 import asyncio
+import inspect
 from datetime import UTC
-from typing import Any
+from typing import Any, TypeVar
 
 from weaviate.classes.query import MetadataQuery
 from weaviate.collections.collection import Collection
@@ -37,7 +38,8 @@ from weaviate.exceptions import WeaviateQueryError
 
 from .....lib.logger import get_logger
 from .....lib.weaviate_client import WeaviateClient
-from ..interfaces import SearchResult
+from ..fusion import rrf_fuse
+from ..interfaces import SearchHit, SearchResult
 
 # Phase 2: BM25 고도화 모듈 (Optional Import - Graceful Degradation)
 try:
@@ -52,6 +54,28 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# 다중 컬렉션 RRF 병합 대상 (전체 결과 또는 경량 결과)
+_ResultT = TypeVar("_ResultT", SearchResult, SearchHit)
+
+
+def _hybrid_accepts_no_properties() -> bool:
+    """
+    설치된 weaviate-client의 hybrid()가 return_properties=False(프로퍼티 미반환)를 받는지 확인
+
+    search()는 v4.19+ 호환성 문제로 return_properties를 쓰지 않으므로, 경량 검색은
+    클라이언트 시그니처가 bool 값을 명시적으로 허용할 때만 사용합니다.
+    """
+    try:
+        from weaviate.collections.queries.hybrid.query.executor import _HybridQueryExecutor
+
+        parameter = inspect.signature(_HybridQueryExecutor.hybrid).parameters["return_properties"]
+    except (ImportError, AttributeError, KeyError, TypeError, ValueError):
+        return False
+    return "bool" in str(parameter.annotation)
+
+
+HYBRID_SUPPORTS_NO_PROPERTIES = _hybrid_accepts_no_properties()
+
 
 class WeaviateRetriever:
     """
@@ -141,8 +165,13 @@ class WeaviateRetriever:
             "errors": 0,
             "bm25_preprocessed": 0,  # Phase 2: BM25 전처리 적용 횟수
             "multi_collection_searches": 0,  # Phase 3: 다중 컬렉션 검색 횟수
+            "lightweight_searches": 0,  # 본문 없는 경량 검색 횟수
+            "hydrated_documents": 0,  # 지연 로딩으로 본문을 조회한 문서 수
         }
 
+        # 경량 검색 경로 사용 여부 (클라이언트가 프로퍼티 없는 hybrid 조회를 지원할 때만)
+        self.lightweight_hits_enabled = HYBRID_SUPPORTS_NO_PROPERTIES
+
         # 로그 메시지 구성
         bm25_status = "enabled" if self._bm25_preprocessing_enabled else "disabled"
         multi_col_status = (
@@ -394,28 +423,149 @@ class WeaviateRetriever:
             return_metadata=MetadataQuery(score=True),
         )
 
-        results = []
-        for obj in response.objects:
-            # NotionMetadata 결과에 collection 정보 추가
-            metadata = dict(obj.properties)
-            metadata["_collection"] = collection_name
-
-            # metadata 필드를 source_file로 매핑 (소스 표시용)
-            # shop_name 또는 name 필드가 있으면 이를 source_file로 사용
-            entity_name = metadata.get("shop_name") or metadata.get("name")
-            if entity_name:
-                metadata["source_file"] = f"{entity_name} (메타데이터)"
-                metadata["file_type"] = "METADATA"
-
-            results.append(
-                SearchResult(
-                    id=str(obj.uuid),
-                    content=str(obj.properties.get("content", "")),
-                    score=obj.metadata.score if obj.metadata.score else 0.0,
-                    metadata=metadata,
+        return [
+            self._to_search_result(
+                obj, collection_name, obj.metadata.score if obj.metadata.score else 0.0
+            )
+            for obj in response.objects
+        ]
+
+    @staticmethod
+    def _to_search_result(obj: Any, collection_name: str, score: float) -> SearchResult:
+        """Weaviate 객체를 SearchResult로 변환"""
+        # NotionMetadata 결과에 collection 정보 추가
+        metadata = dict(obj.properties)
+        metadata["_collection"] = collection_name
+
+        # metadata 필드를 source_file로 매핑 (소스 표시용)
+        # shop_name 또는 name 필드가 있으면 이를 source_file로 사용
+        entity_name = metadata.get("shop_name") or metadata.get("name")
+        if entity_name:
+            metadata["source_file"] = f"{entity_name} (메타데이터)"
+            metadata["file_type"] = "METADATA"
+
+        return SearchResult(
+            id=str(obj.uuid),
+            content=str(obj.properties.get("content", "")),
+            score=score,
+            metadata=metadata,
+        )
+
+    async def search_hits(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[SearchHit]:
+        """
+        경량 하이브리드 검색 (ILightweightRetriever)
+
+        search()와 같은 hybrid 쿼리를 프로퍼티/벡터 없이(return_properties=False,
+        include_vector=False) 실행해 UUID/점수/컬렉션만 반환합니다. 다중 쿼리 RRF 병합 후
+        hydrate()로 최종 top_k의 본문만 조회하므로 버려지는 후보의 본문 전송/할당이 없습니다.
+        설치된 클라이언트가 이를 지원하지 않으면 search() 결과를 SearchHit로 변환합니다.
+
+        Args:
+            query: 검색 쿼리 문자열
+            top_k: 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건 (search()와 동일하게 현재 미사용)
+
+        Returns:
+            SearchHit 리스트 (다중 컬렉션이면 RRF 병합 결과)
+        """
+        if self.collection is None:
+            raise RuntimeError("Weaviate 'Documents' 컬렉션이 존재하지 않습니다.")
+
+        if not self.lightweight_hits_enabled:
+            return [
+                SearchHit(
+                    id=result.id,
+                    score=result.score,
+                    metadata={
+                        "_collection": result.metadata.get("_collection", self.collection_name)
+                    },
+                )
+                for result in await self.search(query, top_k, filters)
+            ]
+
+        processed_query = self._preprocess_query(query)
+        query_embedding = await asyncio.to_thread(self.embedder.embed_query, query)
+
+        collections: dict[str, Collection] = {
+            self.collection_name: self.collection,
+            **self._additional_collection_objects,
+        }
+        hits_per_collection: list[list[SearchHit] | BaseException] = []
+        for collection_name, collection in collections.items():
+            try:
+                response = collection.query.hybrid(
+                    query=processed_query,
+                    vector=query_embedding,
+                    alpha=self.alpha,
+                    limit=top_k,
+                    include_vector=False,
+                    return_metadata=MetadataQuery(score=True),
+                    return_properties=False,
                 )
+            except Exception as e:
+                if collection_name == self.collection_name:
+                    raise
+                hits_per_collection.append(e)
+                continue
+            hits_per_collection.append(
+                [
+                    SearchHit(
+                        id=str(obj.uuid),
+                        score=obj.metadata.score if obj.metadata.score else 0.0,
+                        metadata={"_collection": collection_name},
+                    )
+                    for obj in response.objects
+                ]
             )
 
+        self.stats["lightweight_searches"] += 1
+        if len(hits_per_collection) == 1:
+            return hits_per_collection[0]  # type: ignore[return-value]
+        return self._rrf_merge_results(hits_per_collection, top_k)
+
+    async def hydrate(self, hits: list[SearchHit]) -> list[SearchResult]:
+        """
+        SearchHit의 본문/전체 프로퍼티를 컬렉션별 fetch_objects_by_ids 1회로 조회
+
+        Args:
+            hits: 본문을 채울 SearchHit 리스트
+
+        Returns:
+            hits 순서를 유지한 SearchResult 리스트 (점수와 hit 메타데이터 유지,
+            삭제 등으로 조회되지 않은 문서는 제외)
+        """
+        collections: dict[str, Collection] = {self.collection_name: self.collection}  # type: ignore[dict-item]
+        collections.update(self._additional_collection_objects)
+
+        ids_by_collection: dict[str, list[str]] = {}
+        for hit in hits:
+            collection_name = hit.metadata.get("_collection", self.collection_name)
+            ids_by_collection.setdefault(collection_name, []).append(hit.id)
+
+        fetched: dict[str, SearchResult] = {}
+        for collection_name, ids in ids_by_collection.items():
+            collection = collections.get(collection_name)
+            if collection is None:
+                continue
+            response = collection.query.fetch_objects_by_ids(ids, limit=len(ids))
+            for obj in response.objects:
+                fetched[str(obj.uuid)] = self._to_search_result(obj, collection_name, 0.0)
+
+        results = []
+        for hit in hits:
+            result = fetched.get(hit.id)
+            if result is None:
+                continue
+            result.metadata.update(hit.metadata)
+            result.score = hit.score
+            results.append(result)
+
+        self.stats["hydrated_documents"] += len(results)
         return results
 
     async def _search_multi_collections(
@@ -490,10 +640,10 @@ class WeaviateRetriever:
 
     def _rrf_merge_results(
         self,
-        results_per_collection: list[list[SearchResult] | BaseException],
+        results_per_collection: list[list[_ResultT] | BaseException],
         top_k: int,
         rrf_k: int = 60,
-    ) -> list[SearchResult]:
+    ) -> list[_ResultT]:
         """
         RRF (Reciprocal Rank Fusion)로 다중 컬렉션 결과 병합
 
@@ -507,8 +657,8 @@ class WeaviateRetriever:
         Returns:
             RRF 점수로 정렬된 결과 리스트
         """
-        doc_scores: dict[str, float] = {}
-        doc_objects: dict[str, SearchResult] = {}
+        ranked_ids: list[list[str]] = []
+        doc_objects: dict[str, _ResultT] = {}
         doc_sources: dict[str, list[str]] = {}  # 어느 컬렉션에서 왔는지
 
         for col_idx, results in enumerate(results_per_collection):
@@ -516,12 +666,10 @@ class WeaviateRetriever:
                 logger.warning(f"컬렉션 {col_idx} 검색 실패: {results}")
                 continue
 
-            for rank, result in enumerate(results):
-                doc_id = result.id
+            ranked_ids.append([result.id for result in results])
 
-                # RRF 점수 계산
-                rrf_score = 1.0 / (rrf_k + rank)
-                doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + rrf_score
+            for result in results:
+                doc_id = result.id
 
                 # 문서 객체 저장 (첫 등장 시)
                 if doc_id not in doc_objects:
@@ -533,18 +681,16 @@ class WeaviateRetriever:
                 if collection_name not in doc_sources[doc_id]:
                     doc_sources[doc_id].append(collection_name)
 
-        # RRF 점수로 정렬
-        sorted_doc_ids = sorted(
-            doc_scores.keys(), key=lambda doc_id: doc_scores[doc_id], reverse=True
-        )
+        # RRF 점수 계산 (rank는 0-based, 가중치 1.0) + 상위 top_k 선택
+        fused = rrf_fuse(ranked_ids, k=rrf_k, rank_start=0)
 
         # 최종 결과 생성
         merged_results = []
-        for doc_id in sorted_doc_ids[:top_k]:
+        for doc_id, rrf_score in fused.top_k(top_k):
             result = doc_objects[doc_id]
-            result.metadata["_rrf_score"] = doc_scores[doc_id]
+            result.metadata["_rrf_score"] = rrf_score
             result.metadata["_sources"] = doc_sources[doc_id]
-            result.score = doc_scores[doc_id]  # RRF 점수로 교체
+            result.score = rrf_score  # RRF 점수로 교체
             merged_results.append(result)
 
         return merged_results
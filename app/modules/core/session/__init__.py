@@ -7,6 +7,7 @@ Phase 1.5: Enhanced Session 구조 개선
   - session_service.py: 세션 CRUD + 통계 + DB 연동
   - memory_service.py: LangChain 메모리 관리
   - admin_service.py: Admin API 로직
+- store.py: 세션 문서/히스토리 저장소 (memory, redis, sqlite)
 - schemas/: 데이터 모델 정의
 
 Export:
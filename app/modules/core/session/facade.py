@@ -6,6 +6,7 @@ Phase 4: 기존 734줄 God Object를 Service 기반 구조로 분리
 - MemoryService: LangChain 메모리 관리
 - AdminService: Admin API 로직
 - CleanupService: 자동 정리 작업
+- SessionStore: 세션 문서/히스토리 저장소 (memory, redis, sqlite)
 - EnhancedSessionModule: Facade (기존 인터페이스 유지)
 
 ⚠️ 주의: 기존 검증된 코드를 재구성했습니다. 로직 변경 없음.
@@ -70,7 +71,8 @@ class CleanupService:
                 current_time = datetime.now(UTC)
                 expired_sessions = []
 
-                for session_id, session in self.session_service.sessions.items():
+                sessions = await self.session_service.list_sessions()
+                for session_id, session in sessions.items():
                     last_accessed = session["last_accessed"]
                     # datetime 객체 간 차이를 초 단위로 변환
                     if isinstance(last_accessed, datetime):
@@ -118,9 +120,9 @@ class EnhancedSessionModule:
         self.config = config
         session_config = config.get("session", {})
 
-        # Service 인스턴스 생성/주입
-        self.session_service = SessionService(config)
+        # Service 인스턴스 생성/주입 (세션 저장소는 MemoryService와 공유)
         self.memory_service = memory_service  # DI 주입
+        self.session_service = SessionService(config, store=memory_service.store)
         self.admin_service = AdminService(ttl=session_config.get("ttl", 7200))
         self.cleanup_service = CleanupService(
             session_service=self.session_service,
@@ -163,8 +165,9 @@ class EnhancedSessionModule:
         try:
             await self.cleanup_service.stop()
 
-            self.session_service.sessions.clear()
-            self.memory_service.memories.clear()
+            # 공유 저장소의 세션은 다른 워커가 계속 사용하므로 연결만 닫음
+            self.memory_service.clear()
+            await self.session_service.store.close()
             logger.info("Enhanced session module destroyed")
 
         except Exception as e:
@@ -188,8 +191,11 @@ class EnhancedSessionModule:
     async def get_session(
         self, session_id: str, context: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        """세션 조회 (SessionService로 위임)"""
-        return await self.session_service.get_session(session_id, context)
+        """세션 조회 (SessionService로 위임, 만료 시 메모리/Lock도 회수)"""
+        result = await self.session_service.get_session(session_id, context)
+        if result.get("reason") == "session_expired":
+            self.memory_service.delete_memory(session_id)
+        return result
 
     async def delete_session(self, session_id: str):
         """세션 삭제 (SessionService + MemoryService)"""
@@ -198,17 +204,19 @@ class EnhancedSessionModule:
 
     async def get_stats(self) -> dict[str, Any]:
         """통계 반환 (SessionService로 위임)"""
-        return await self.session_service.get_stats()
+        stats = await self.session_service.get_stats()
+        stats["history_cache"] = self.memory_service.get_cache_stats()
+        stats["conversation_summary"] = self.memory_service.get_summary_stats()
+        return stats
 
     async def clear_cache(self):
         """캐시 클리어 (SessionService + MemoryService)"""
         await self.session_service.clear_cache()
 
         # 메모리도 함께 제거
+        sessions = await self.session_service.list_sessions()
         expired_ids = [
-            sid
-            for sid in list(self.memory_service.memories.keys())
-            if sid not in self.session_service.sessions
+            sid for sid in list(self.memory_service.memories.keys()) if sid not in sessions
         ]
         for session_id in expired_ids:
             self.memory_service.delete_memory(session_id)
@@ -228,7 +236,7 @@ class EnhancedSessionModule:
         대화 추가
         기존 코드: enhanced_session.py의 add_conversation() (L184-242)
         """
-        session_result = await self.session_service.get_session(session_id)
+        session_result = await self.get_session(session_id)
         if not session_result["is_valid"]:
             raise ValueError(f"Invalid session: {session_id}")
 
@@ -269,11 +277,18 @@ class EnhancedSessionModule:
             if metadata["topic"] not in session["topics"]:
                 session["topics"].append(metadata["topic"])
 
+        # 사용자 정보 / 메시지 메타데이터 / 히스토리 버전 반영
+        # (요약 상태는 저장소의 별도 키에 있으므로 이 저장이 덮어쓰지 않음)
+        await self.session_service.save_session(session_id, session)
+
+        # 밀려난 대화 요약은 응답 경로 밖(백그라운드)에서 진행
+        self.memory_service.schedule_summary(session_id)
+
         logger.debug(f"Conversation added to enhanced session: {session_id}")
 
     async def get_context_string(self, session_id: str) -> str:
         """컨텍스트 문자열 반환 (MemoryService로 위임)"""
-        session_result = await self.session_service.get_session(session_id)
+        session_result = await self.get_session(session_id)
         if not session_result["is_valid"]:
             return ""
 
@@ -282,7 +297,7 @@ class EnhancedSessionModule:
 
     async def get_chat_history(self, session_id: str) -> dict[str, Any]:
         """채팅 히스토리 반환 (MemoryService로 위임)"""
-        session_result = await self.session_service.get_session(session_id)
+        session_result = await self.get_session(session_id)
         if not session_result["is_valid"]:
             return {"messages": [], "message_count": 0}
 
@@ -329,18 +344,25 @@ class EnhancedSessionModule:
     ) -> dict[str, Any]:
         """모든 세션 목록 조회 (AdminService로 위임)"""
         return await self.admin_service.get_all_sessions(
-            self.session_service.sessions, status, limit, offset
+            await self.session_service.list_sessions(), status, limit, offset
         )
 
     async def get_session_details(self, session_id: str) -> dict[str, Any] | None:
         """세션 상세 정보 조회 (AdminService로 위임)"""
+        session = await self.session_service.store.load(session_id)
+        if session is None:
+            return None
+
+        chat_history = await self.memory_service.load_history(session_id)
         return await self.admin_service.get_session_details(
-            session_id, self.session_service.sessions, self.memory_service.memories
+            session_id, {session_id: session}, {session_id: chat_history}
         )
 
     async def get_recent_chats(self, limit: int = 20) -> list[dict[str, Any]]:
         """최근 채팅 로그 조회 (AdminService로 위임)"""
-        return await self.admin_service.get_recent_chats(self.session_service.sessions, limit)
+        return await self.admin_service.get_recent_chats(
+            await self.session_service.list_sessions(), limit
+        )
 
     async def get_debug_trace(
         self, session_id: str, message_id: str
@@ -355,7 +377,7 @@ class EnhancedSessionModule:
         Returns:
             debug_trace 딕셔너리 또는 None (찾지 못한 경우)
         """
-        session_result = await self.session_service.get_session(session_id)
+        session_result = await self.get_session(session_id)
         if not session_result["is_valid"]:
             return None
 
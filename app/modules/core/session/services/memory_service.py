@@ -6,16 +6,16 @@ Phase 4.3: enhanced_session.py에서 추출한 검증된 메모리 관리 로직
 
 import asyncio
 import re
-from collections import defaultdict
+from collections import OrderedDict
 from datetime import UTC
 from typing import Any
 
-from cachetools import TTLCache
 from langchain_core.chat_history import InMemoryChatMessageHistory
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 
 from .....lib.logger import get_logger
 from .....lib.mongodb_client import MongoDBClient
+from ..store import SessionStore, create_session_store
 
 logger = get_logger(__name__)
 
@@ -30,6 +30,17 @@ class MemoryService:
     - Window 로직 (max_exchanges 유지)
     - 사용자 정보 추출
 
+    히스토리 보관:
+    - 메모리 저장소: self.memories가 원본 (기존 동작, 만료 시 정리)
+    - 공유 저장소(redis/sqlite): 저장소가 원본이고 self.memories는 워커별 LRU 캐시.
+      세션 문서의 history_version과 캐시 버전이 다르면(다른 워커가 추가) 다시 읽음
+
+    대화 요약 (conversation_summary.enabled):
+    - 윈도우에서 밀려난 메시지를 저장소의 요약 상태(세션 문서와 별도 키) pending에 보관
+    - 응답 후 백그라운드 작업이 pending만 기존 요약에 접어 넣음 (증분 요약)
+    - 요약 반영은 folded_upto 기준 CAS라 세션 문서 저장과 서로 덮어쓰지 않음
+    - 컨텍스트 생성은 마지막으로 완료된 요약 + 아직 접지 않은 pending을 그대로 사용
+
     기존 코드 기반: enhanced_session.py의 메모리 및 대화 관리 메서드들
     """
 
@@ -38,6 +49,7 @@ class MemoryService:
         max_exchanges: int | None = None,
         config: dict[str, Any] | None = None,
         mongodb_client: MongoDBClient | None = None,
+        store: SessionStore | None = None,
     ):
         """
         Args:
@@ -45,20 +57,30 @@ class MemoryService:
                            None일 경우 기본값 10 사용
             config: 전체 설정 딕셔너리 (요약 기능 설정 포함)
             mongodb_client: MongoDB 클라이언트 (DI)
+            store: 세션 저장소 (None이면 session.storage_backend 설정으로 생성)
         """
         self.max_exchanges = max_exchanges if max_exchanges is not None else 10
         self.config = config or {}
         self.mongodb_client = mongodb_client
+        session_config = self.config.get("session", {})
+
+        # 세션 저장소 (SessionService와 공유)
+        self.store: SessionStore = (
+            store if store is not None else create_session_store(self.config)
+        )
 
-        # LangChain 메모리 저장소 (enhanced_session.py L35)
-        self.memories: dict[str, InMemoryChatMessageHistory] = {}
+        # LangChain 메모리 (메모리 저장소: 원본 / 공유 저장소: 워커별 LRU 캐시)
+        self.memories: OrderedDict[str, InMemoryChatMessageHistory] = OrderedDict()
+        self.history_cache_size = session_config.get("history_cache_size", 1000)
+        self._history_versions: dict[str, int] = {}
+        self.cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "resyncs": 0}
 
         # 🔒 세션별 Lock 딕셔너리 (Race Condition 방지)
         # 각 세션은 독립적인 Lock을 가지므로 다른 세션끼리는 병렬 처리 가능
-        self.session_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # 세션 만료/삭제 및 캐시 축출 시 함께 회수됨
+        self.session_locks: dict[str, asyncio.Lock] = {}
 
         # 요약 설정 로드
-        session_config = self.config.get("session", {})
         summary_config = session_config.get("conversation_summary", {})
 
         self.summary_enabled = summary_config.get("enabled", False)
@@ -66,12 +88,14 @@ class MemoryService:
         self.summary_llm_provider = summary_config.get("llm_provider", "google")
         self.summary_llm_model = summary_config.get("llm_model", "gemini-2.0-flash-lite")
 
-        # 요약 캐시 (TTLCache: 최대 100개 세션, TTL 1시간)
-        cache_ttl = summary_config.get("cache_ttl", 3600)
-        self.summary_cache: TTLCache = TTLCache(maxsize=100, ttl=cache_ttl)
+        # 백그라운드 요약 작업 (세션당 최대 1개, 실행 중 밀려난 대화는 같은 작업이 이어서 반영)
+        self._summary_tasks: dict[str, asyncio.Task] = {}
+        self._summary_due: set[str] = set()
+        self.summary_stats = {"folds": 0, "folded_messages": 0, "failures": 0, "conflicts": 0}
 
         logger.info(
             f"MemoryService 초기화: max_exchanges={max_exchanges}, "
+            f"store={self.store.backend}, "
             f"LangChain 0.3+ InMemoryChatMessageHistory 사용, "
             f"Session-level locks 활성화 (Race Condition 보호), "
             f"대화 요약 기능={'활성화' if self.summary_enabled else '비활성화'} "
@@ -90,7 +114,7 @@ class MemoryService:
             InMemoryChatMessageHistory 인스턴스
         """
         chat_history = InMemoryChatMessageHistory()
-        self.memories[session_id] = chat_history
+        self._cache_history(session_id, chat_history, version=0)
         logger.debug(f"메모리 생성: {session_id}")
         return chat_history
 
@@ -102,21 +126,118 @@ class MemoryService:
             session_id: 세션 ID
 
         Returns:
-            InMemoryChatMessageHistory 또는 None
+            InMemoryChatMessageHistory 또는 None (공유 저장소에서는 캐시된 경우만)
         """
         return self.memories.get(session_id)
 
+    async def load_history(
+        self, session_id: str, session: dict[str, Any] | None = None
+    ) -> InMemoryChatMessageHistory | None:
+        """
+        히스토리 조회 (공유 저장소는 캐시 미스 시 저장소에서 지연 로드)
+
+        Args:
+            session_id: 세션 ID
+            session: 세션 데이터 (history_version으로 캐시 신선도 확인)
+
+        Returns:
+            InMemoryChatMessageHistory 또는 None (메모리 저장소에 없는 경우)
+        """
+        chat_history = self.memories.get(session_id)
+        if not self.store.shared:
+            return chat_history
+
+        version = session.get("history_version", 0) if session is not None else None
+        if chat_history is not None and (
+            version is None or self._history_versions.get(session_id) == version
+        ):
+            self.memories.move_to_end(session_id)
+            self.cache_stats["hits"] += 1
+            return chat_history
+
+        self.cache_stats["misses"] += 1
+        stored = await self.store.load_messages(session_id)
+        chat_history = InMemoryChatMessageHistory(
+            messages=[self._to_message(item) for item in stored]
+        )
+        self._cache_history(session_id, chat_history, version=version or 0)
+        return chat_history
+
     def delete_memory(self, session_id: str):
         """
-        메모리 삭제
+        메모리 삭제 (세션 Lock도 함께 회수)
+
+        공유 저장소의 히스토리는 SessionService.delete_session이 세션 문서와 함께 삭제합니다.
 
         Args:
             session_id: 세션 ID
         """
-        if session_id in self.memories:
-            del self.memories[session_id]
+        self.session_locks.pop(session_id, None)
+        self._history_versions.pop(session_id, None)
+        self._summary_due.discard(session_id)
+        task = self._summary_tasks.pop(session_id, None)
+        if task is not None:
+            task.cancel()
+        if self.memories.pop(session_id, None) is not None:
             logger.debug(f"메모리 삭제: {session_id}")
 
+    def clear(self):
+        """워커 로컬 히스토리, Lock, 요약 작업 전체 정리 (모듈 종료 시)"""
+        for task in self._summary_tasks.values():
+            task.cancel()
+        self._summary_tasks.clear()
+        self._summary_due.clear()
+        self.memories.clear()
+        self.session_locks.clear()
+        self._history_versions.clear()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """히스토리 캐시 / Lock 통계"""
+        return {
+            **self.cache_stats,
+            "size": len(self.memories),
+            "max_size": self.history_cache_size if self.store.shared else None,
+            "locks": len(self.session_locks),
+        }
+
+    def get_summary_stats(self) -> dict[str, Any]:
+        """백그라운드 대화 요약 통계"""
+        return {
+            "enabled": self.summary_enabled,
+            **self.summary_stats,
+            "running": sum(1 for task in self._summary_tasks.values() if not task.done()),
+        }
+
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        lock = self.session_locks.get(session_id)
+        if lock is None:
+            lock = self.session_locks[session_id] = asyncio.Lock()
+        return lock
+
+    def _cache_history(
+        self, session_id: str, chat_history: InMemoryChatMessageHistory, version: int
+    ) -> None:
+        self.memories[session_id] = chat_history
+        self.memories.move_to_end(session_id)
+        self._history_versions[session_id] = version
+        if not self.store.shared:
+            return
+
+        # 공유 저장소: 캐시 상한 초과 시 가장 오래 쓰지 않은 세션 축출
+        while len(self.memories) > self.history_cache_size:
+            evicted_id, _ = self.memories.popitem(last=False)
+            self._history_versions.pop(evicted_id, None)
+            lock = self.session_locks.get(evicted_id)
+            if lock is not None and not lock.locked():
+                del self.session_locks[evicted_id]
+            self.cache_stats["evictions"] += 1
+
+    @staticmethod
+    def _to_message(item: dict[str, str]) -> BaseMessage:
+        if item.get("role") == "human":
+            return HumanMessage(content=item["content"])
+        return AIMessage(content=item["content"])
+
     async def add_conversation(
         self, session_id: str, session: dict[str, Any], user_message: str, assistant_response: str
     ):
@@ -145,7 +266,7 @@ class MemoryService:
             user_message: 사용자 메시지
             assistant_response: AI 응답
         """
-        chat_history = self.memories.get(session_id)
+        chat_history = await self.load_history(session_id, session)
 
         if not chat_history:
             raise ValueError(f"Chat history not found for session: {session_id}")
@@ -156,7 +277,7 @@ class MemoryService:
         # 🔒 메시지 추가, 윈도우 트리밍, MongoDB 저장 (Lock으로 보호)
         # 같은 세션의 동시 요청은 여기서 순차 처리됨
         # MongoDB 저장도 Lock 안에서 수행하여 메모리-DB 불일치 방지
-        async with self.session_locks[session_id]:
+        async with self._lock_for(session_id):
             # LangChain 0.3+ 방식: 메시지 추가 (L200-202)
             chat_history.add_user_message(user_message)
             chat_history.add_ai_message(assistant_response)
@@ -164,9 +285,11 @@ class MemoryService:
             # Window 로직: 최대 교환 수 유지 (L204-213)
             max_messages = self.max_exchanges * 2
             current_messages = chat_history.messages
+            aged_out: list[BaseMessage] = []
 
             if len(current_messages) > max_messages:
                 messages_to_remove = len(current_messages) - max_messages
+                aged_out = current_messages[:messages_to_remove]
                 chat_history.messages = current_messages[messages_to_remove:]
                 logger.debug(
                     f"Window trimming: {messages_to_remove}개 오래된 메시지 제거, "
@@ -186,19 +309,140 @@ class MemoryService:
                         else {}
                     ),
                 )
+
+                # 공유 저장소 반영 (capped list) 후 세션 문서에 히스토리 버전 기록
+                if self.store.shared:
+                    cached_version = self._history_versions.get(session_id)
+                    version = await self.store.append_messages(
+                        session_id,
+                        [
+                            {"role": "human", "content": user_message},
+                            {"role": "ai", "content": assistant_response},
+                        ],
+                        max_messages,
+                    )
+                    # 세션 문서는 last-writer-wins라 history_version이 뒤처질 수 있으므로
+                    # 저장소 카운터로 확인: 이번 추가분만큼만 늘지 않았으면 다른 워커가 끼어든 것
+                    if cached_version is None or version != cached_version + 2:
+                        stored = await self.store.load_messages(session_id)
+                        chat_history.messages = [self._to_message(item) for item in stored]
+                        self.cache_stats["resyncs"] += 1
+                    session["history_version"] = version
+                    self._history_versions[session_id] = version
             except Exception as e:
-                # MongoDB 저장 실패 시 메모리도 롤백
-                logger.error(f"MongoDB 저장 실패, 메모리 롤백: {e}", exc_info=True)
+                # MongoDB/저장소 저장 실패 시 메모리도 롤백
+                logger.error(f"대화 저장 실패, 메모리 롤백: {e}", exc_info=True)
                 # 마지막 2개 메시지(user + assistant) 제거
                 if len(chat_history.messages) >= 2:
                     chat_history.messages = chat_history.messages[:-2]
                 raise  # 에러를 상위로 전파하여 클라이언트에게 실패 알림
 
+            # 윈도우에서 밀려난 메시지는 요약 대기열로 (요약 자체는 schedule_summary에서)
+            if self.summary_enabled and aged_out:
+                await self._queue_for_summary(session_id, aged_out)
+
+    def schedule_summary(self, session_id: str) -> None:
+        """
+        요약 대기 메시지가 있으면 백그라운드 요약 작업 시작
+
+        응답 경로의 저장이 끝난 뒤 호출합니다 (요약 LLM 호출은 요청을 기다리게 하지 않음).
+        같은 세션의 작업이 이미 실행 중이면 그 작업이 새 대기 메시지까지 이어서 처리합니다.
+
+        Args:
+            session_id: 세션 ID
+        """
+        if session_id not in self._summary_due:
+            return
+        self._summary_due.discard(session_id)
+
+        running = self._summary_tasks.get(session_id)
+        if running is not None and not running.done():
+            return
+
+        task = asyncio.create_task(self._fold_summary(session_id))
+        self._summary_tasks[session_id] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if self._summary_tasks.get(session_id) is done:
+                del self._summary_tasks[session_id]
+
+        task.add_done_callback(_forget)
+
+    async def _queue_for_summary(self, session_id: str, messages: list[BaseMessage]) -> None:
+        items = [
+            {
+                "role": "human" if isinstance(message, HumanMessage) else "ai",
+                "content": str(message.content),
+            }
+            for message in messages
+        ]
+        try:
+            # 요약이 계속 실패해도 대기열은 윈도우 크기를 넘지 않음 (가장 오래된 것부터 버림)
+            state = await self.store.queue_summary(session_id, items, self.max_exchanges * 2)
+        except Exception as e:
+            # 대화 자체는 이미 저장됨 → 요약 대기열만 누락 (요청은 실패시키지 않음)
+            self.summary_stats["failures"] += 1
+            logger.error(f"요약 대기열 추가 실패: {e}", session_id=session_id, exc_info=True)
+            return
+        if self._needs_summary(state):
+            self._summary_due.add(session_id)
+
+    def _needs_summary(self, state: dict[str, Any] | None) -> bool:
+        if not state or not state["pending"]:
+            return False
+        # 전체 교환 수 = 밀려난 교환 + 윈도우 (윈도우는 밀려난 시점에 가득 차 있음)
+        return state["aged"] // 2 + self.max_exchanges > self.summary_trigger_count
+
+    async def _fold_summary(self, session_id: str) -> None:
+        """
+        대기 메시지를 기존 요약에 접어 넣음 (백그라운드)
+
+        LLM 호출 동안 다른 요청이 대기열에 추가하거나 다른 워커가 먼저 요약할 수 있으므로,
+        결과는 저장소의 commit_summary(CAS)로 folded_upto가 그대로일 때만 반영합니다.
+        반영한 메시지는 대기열에서 제거하고, 남은 대기 메시지가 있으면 반복합니다.
+        """
+        while True:
+            try:
+                state = await self.store.load_summary(session_id)
+                if not self._needs_summary(state):
+                    return
+                assert state is not None  # _needs_summary에서 보장
+
+                base_upto = state["folded_upto"]
+                batch = [item for item in state["pending"] if item["seq"] > base_upto]
+                if not batch:
+                    return
+
+                summary = await self._summarize_conversations(
+                    [self._to_message(item) for item in batch], previous_summary=state["text"]
+                )
+                folded_upto = batch[-1]["seq"]
+                applied = await self.store.commit_summary(
+                    session_id, base_upto, summary, folded_upto
+                )
+            except Exception as e:
+                # 대기열은 유지 → 다음 대화 추가 시 재시도
+                self.summary_stats["failures"] += 1
+                logger.warning(f"대화 요약 실패, 다음 회차에 재시도: {e}", session_id=session_id)
+                return
+
+            if not applied:
+                self.summary_stats["conflicts"] += 1
+                continue
+
+            self.summary_stats["folds"] += 1
+            self.summary_stats["folded_messages"] += len(batch)
+            logger.debug(
+                f"대화 요약 갱신: {len(batch)}개 메시지 반영",
+                session_id=session_id,
+                folded_upto=folded_upto,
+            )
+
     async def get_context_string(self, session_id: str, session: dict[str, Any]) -> str:
         """
         세션 컨텍스트 문자열 반환 (요약 기능 포함)
         기존 코드: enhanced_session.py의 get_context_string() (L244-287)
-        신규: 대화가 많을 경우 오래된 대화를 요약하여 토큰 효율 개선
+        신규: 윈도우에서 밀려난 대화는 백그라운드 증분 요약으로 대체 (요청 경로에서 LLM 호출 없음)
 
         Args:
             session_id: 세션 ID
@@ -207,7 +451,7 @@ class MemoryService:
         Returns:
             컨텍스트 문자열
         """
-        chat_history = self.memories.get(session_id)
+        chat_history = await self.load_history(session_id, session)
 
         if not chat_history:
             return ""
@@ -228,50 +472,21 @@ class MemoryService:
 
         # 메시지 가져오기 (L270-279)
         messages = chat_history.messages
-        message_count = len(messages) // 2  # 교환 수 (사용자 + AI = 1교환)
+        state = await self.store.load_summary(session_id) if self.summary_enabled else None
 
-        # 🆕 요약 로직 (옵션B 구현)
-        if self.summary_enabled and message_count > self.summary_trigger_count:
-            logger.debug(
-                f"요약 모드 활성화: session_id={session_id}, "
-                f"대화 수={message_count}, trigger={self.summary_trigger_count}"
-            )
+        if state and (state.get("text") or state.get("pending")):
+            # 요약 모드: 마지막으로 완료된 요약을 기다리지 않고 사용
+            # (아직 요약에 반영되지 않은 밀려난 메시지는 원문 그대로 포함)
+            if state.get("text"):
+                context_parts.append(f"\n[이전 대화 요약]\n{state['text']}")
 
-            # 캐시 키: session_id + 대화 개수
-            cache_key = f"{session_id}_{message_count}"
-
-            # 캐시 확인
-            summary = self.summary_cache.get(cache_key)
-
-            if summary:
-                logger.debug(f"요약 캐시 히트: {cache_key}")
-            else:
-                logger.debug(f"요약 캐시 미스, LLM 요약 생성 중: {cache_key}")
-
-                # 최근 5개 제외한 나머지를 요약
-                max_recent = self.max_exchanges  # 기본 5개
-                old_messages = messages[: -max_recent * 2] if len(messages) > max_recent * 2 else []
-
-                if old_messages:
-                    try:
-                        summary = await self._summarize_conversations(old_messages)
-                        self.summary_cache[cache_key] = summary
-                        logger.info(f"✅ 요약 생성 완료: {summary[:100]}...")
-                    except Exception as e:
-                        logger.error(f"요약 생성 실패, 폴백: {e}")
-                        summary = None
-
-            # 요약 추가
-            if summary:
-                context_parts.append(f"\n[이전 대화 요약]\n{summary}")
-
-            # 최근 대화만 추가
-            recent_messages = (
-                messages[-max_recent * 2 :] if len(messages) > max_recent * 2 else messages
-            )
-            if recent_messages:
+            pending = [item for item in state["pending"] if item["seq"] > state["folded_upto"]]
+            if pending or messages:
                 context_parts.append("\n[최근 대화 내역]")
-                for message in recent_messages:
+                for item in pending:
+                    speaker = "사용자" if item["role"] == "human" else "AI"
+                    context_parts.append(f"{speaker}: {item['content']}")
+                for message in messages:
                     if isinstance(message, HumanMessage):
                         context_parts.append(f"사용자: {message.content}")
                     elif isinstance(message, AIMessage):
@@ -306,7 +521,7 @@ class MemoryService:
         Returns:
             {'messages': list, 'message_count': int}
         """
-        chat_history = self.memories.get(session_id)
+        chat_history = await self.load_history(session_id, session)
 
         if not chat_history:
             return {"messages": [], "message_count": 0}
@@ -440,9 +655,9 @@ class MemoryService:
         """
         try:
             # Feature Flag 확인 (app/config/features/session.yaml)
-            from app.lib.config_loader import load_config
+            from app.lib.config_loader import get_config
 
-            config = load_config()
+            config = get_config()
             session_config = config.get("session", {})
 
             if not session_config.get("save_chat_to_mongodb", False):
@@ -538,16 +753,22 @@ class MemoryService:
             logger.error(f"MongoDB 채팅 히스토리 저장 실패: {e}", exc_info=True)
             # ❌ raise 하지 않음 → 채팅 중단 없음
 
-    async def _summarize_conversations(self, messages: list) -> str:
+    async def _summarize_conversations(
+        self, messages: list, previous_summary: str | None = None
+    ) -> str:
         """
-        대화 목록을 LLM으로 요약
+        대화 목록을 LLM으로 요약 (기존 요약이 있으면 새 대화만 반영해 갱신)
 
         Args:
             messages: LangChain 메시지 리스트 (HumanMessage, AIMessage)
+            previous_summary: 이전까지의 요약 (없으면 새로 요약)
 
         Returns:
             요약 문자열 (2-3문장)
 
+        Raises:
+            Exception: LLM 호출 실패 (호출자가 대기열을 유지하고 재시도)
+
         예시:
             Input: [
                 HumanMessage("포인트는 어떻게 받아요?"),
@@ -557,18 +778,29 @@ class MemoryService:
             ]
             Output: "사용자가 포인트 적립 방법과 광고 시청 횟수를 문의했습니다."
         """
-        try:
-            # 메시지를 텍스트로 변환
-            conversation_text = []
-            for msg in messages:
-                if isinstance(msg, HumanMessage):
-                    conversation_text.append(f"사용자: {msg.content}")
-                elif isinstance(msg, AIMessage):
-                    conversation_text.append(f"AI: {msg.content}")
+        # 메시지를 텍스트로 변환
+        conversation_text = []
+        for msg in messages:
+            if isinstance(msg, HumanMessage):
+                conversation_text.append(f"사용자: {msg.content}")
+            elif isinstance(msg, AIMessage):
+                conversation_text.append(f"AI: {msg.content}")
+
+        full_text = "\n".join(conversation_text)
+
+        # 요약 프롬프트 (증분: 기존 요약 + 새로 밀려난 대화만 전달)
+        if previous_summary:
+            prompt = f"""아래 기존 요약에 새 대화 내용을 반영하여 2-3문장으로 갱신된 요약을 작성해주세요.
+핵심 주제와 사용자가 궁금해했던 내용을 중심으로, 기존 요약의 중요한 정보는 유지합니다.
 
-            full_text = "\n".join(conversation_text)
+기존 요약:
+{previous_summary}
 
-            # 요약 프롬프트
+새 대화 내용:
+{full_text}
+
+갱신된 요약:"""
+        else:
             prompt = f"""아래 대화 내용을 2-3문장으로 간결하게 요약해주세요.
 핵심 주제와 사용자가 궁금해했던 내용을 중심으로 요약합니다.
 
@@ -577,27 +809,19 @@ class MemoryService:
 
 요약:"""
 
-            # LLM 호출 (Gemini)
-            import google.generativeai as genai
-
-            model = genai.GenerativeModel(self.summary_llm_model)
-            response = await asyncio.to_thread(
-                model.generate_content,
-                prompt,
-                generation_config={
-                    "temperature": 0.3,  # 안정적인 요약
-                    "max_output_tokens": 200,  # 짧게
-                },
-            )
-
-            summary = response.text.strip()
-            logger.debug(f"대화 요약 생성 성공: {summary[:100]}...")
-            return summary
+        # LLM 호출 (Gemini)
+        import google.generativeai as genai
+
+        model = genai.GenerativeModel(self.summary_llm_model)
+        response = await asyncio.to_thread(
+            model.generate_content,
+            prompt,
+            generation_config={
+                "temperature": 0.3,  # 안정적인 요약
+                "max_output_tokens": 200,  # 짧게
+            },
+        )
 
-        except Exception as e:
-            logger.error(f"대화 요약 생성 실패: {e}", exc_info=True)
-            # 폴백: 첫 사용자 메시지만 반환
-            for msg in messages:
-                if isinstance(msg, HumanMessage):
-                    return f"사용자가 '{msg.content[:50]}...'에 대해 문의했습니다."
-            return "이전 대화 내용"
+        summary = response.text.strip()
+        logger.debug(f"대화 요약 생성 성공: {summary[:100]}...")
+        return summary
@@ -13,6 +13,8 @@ from uuid import uuid4
 from app.infrastructure.persistence.helpers import timestamps
 from app.lib.logger import get_logger
 
+from ..store import MemorySessionStore, SessionStore, create_session_store
+
 logger = get_logger(__name__)
 
 
@@ -25,14 +27,16 @@ class SessionService:
     - 통계 수집 및 관리
     - TTL 기반 세션 만료 검사
     - PostgreSQL 연동 (선택적)
+    - 세션 문서는 SessionStore(memory/redis/sqlite)에 저장
 
     기존 코드 기반: enhanced_session.py의 세션 관리 메서드들
     """
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: dict[str, Any], store: SessionStore | None = None):
         """
         Args:
             config: 세션 설정 (ttl, max_exchanges, cleanup_interval)
+            store: 세션 저장소 (None이면 session.storage_backend 설정으로 생성)
         """
         self.config = config
         session_config = config.get("session", {})
@@ -42,8 +46,8 @@ class SessionService:
         self.max_exchanges = session_config.get("max_exchanges", 10)
         self.cleanup_interval = session_config.get("cleanup_interval", 600)
 
-        # 인메모리 세션 저장소 (enhanced_session.py L34-35)
-        self.sessions: dict[str, dict[str, Any]] = {}
+        # 세션 저장소 (MemoryService와 같은 인스턴스를 공유)
+        self.store: SessionStore = store if store is not None else create_session_store(config)
 
         # 🔒 세션 생성 Lock (전역 Lock - session_id 중복 체크 보호)
         # session_id 중복 체크 및 생성은 전역적으로 일어나므로 global lock 사용
@@ -62,9 +66,22 @@ class SessionService:
 
         logger.info(
             f"SessionService 초기화: ttl={self.ttl}s, max_exchanges={self.max_exchanges}, "
+            f"store={self.store.backend}, "
             f"Session creation lock 활성화 (Race Condition 보호)"
         )
 
+    @property
+    def sessions(self) -> dict[str, dict[str, Any]]:
+        """
+        메모리 저장소의 세션 딕셔너리 (하위 호환)
+
+        외부 저장소(redis/sqlite)에서는 워커가 세션을 보관하지 않으므로 빈 딕셔너리입니다.
+        전체 세션이 필요하면 list_sessions()를 사용하세요.
+        """
+        if isinstance(self.store, MemorySessionStore):
+            return self.store.sessions
+        return {}
+
     def set_ip_geolocation(self, ip_geolocation):
         """IP Geolocation 모듈 의존성 주입"""
         self.ip_geolocation = ip_geolocation
@@ -80,7 +97,7 @@ class SessionService:
 
         ⚠️ Race Condition 시나리오:
         - 클라이언트가 같은 session_id로 동시에 두 번 요청
-        - 두 요청이 동시에 self.sessions dict를 확인
+        - 두 요청이 동시에 세션 저장소를 확인
         - 결과: 둘 다 "session_id 없음"으로 판단하여 중복 생성
 
         ✅ Lock 전략:
@@ -118,7 +135,7 @@ class SessionService:
             if session_id is None:
                 session_id = str(uuid4())
             else:
-                if session_id in self.sessions:
+                if await self.store.load(session_id) is not None:
                     logger.warning(f"요청된 세션 ID가 이미 존재함: {session_id}, 새 ID로 대체")
                     session_id = str(uuid4())
             uuid_time = time.time() - uuid_start
@@ -142,7 +159,7 @@ class SessionService:
 
             # 세션 저장 (L117-120)
             save_start = time.time()
-            self.sessions[session_id] = session_data
+            await self.store.save(session_id, session_data)
             self.stats["total_sessions"] += 1
             self.stats["active_sessions"] += 1
             save_time = time.time() - save_start
@@ -169,13 +186,11 @@ class SessionService:
                 "lock_wait": f"{lock_acquired_time*1000:.2f}ms",
                 "uuid_gen": f"{uuid_time*1000:.2f}ms",
                 "data_create": f"{data_time*1000:.2f}ms",
-                "dict_save": f"{save_time*1000:.2f}ms",
+                "store_save": f"{save_time*1000:.2f}ms",
                 "db_save": f"{db_time*1000:.2f}ms",
-                "total_sessions": len(self.sessions),
+                "store": self.store.backend,
             },
         )
-        logger.debug(f"생성 후 세션 목록: {list(self.sessions.keys())}")
-        logger.debug(f"생성 후 전체 세션 수: {len(self.sessions)}")
 
         return {"session_id": session_id, "location": location_data or {}}
 
@@ -194,14 +209,11 @@ class SessionService:
             {'is_valid': bool, 'session': dict, ...}
         """
         # 세션 존재 여부 확인 (L137-144)
-        if session_id not in self.sessions:
+        session = await self.store.load(session_id)
+        if session is None:
             logger.warning(f"세션을 찾을 수 없음: {session_id}")
-            logger.debug(f"현재 세션 목록: {list(self.sessions.keys())}")
-            logger.debug(f"전체 세션 수: {len(self.sessions)}")
             return {"is_valid": False, "reason": "session_not_found"}
 
-        session = self.sessions[session_id]
-
         # TTL 검사: datetime 기반 정밀 시간 비교 (타임스탬프 float 연산 취약점 개선)
         current_time = datetime.now(UTC)
         last_accessed = session.get("last_accessed")
@@ -238,6 +250,9 @@ class SessionService:
         if context:
             session["metadata"].update(context)
 
+        # 외부 저장소는 문서 저장으로 TTL도 함께 연장됨 (메모리 저장소는 같은 객체라 무비용)
+        await self.store.save(session_id, session)
+
         return {
             "is_valid": True,
             "session": session,
@@ -253,11 +268,29 @@ class SessionService:
         Args:
             session_id: 삭제할 세션 ID
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        if await self.store.delete(session_id):
             self.stats["active_sessions"] = max(0, self.stats["active_sessions"] - 1)
             logger.debug(f"Enhanced session deleted: {session_id}")
 
+    async def save_session(self, session_id: str, session: dict[str, Any]):
+        """
+        변경된 세션 문서 저장 (대화 추가 후 메타데이터/사용자 정보 반영)
+
+        Args:
+            session_id: 세션 ID
+            session: 세션 데이터
+        """
+        await self.store.save(session_id, session)
+
+    async def list_sessions(self) -> dict[str, dict[str, Any]]:
+        """
+        전체 세션 문서 조회 (관리 API / 정리 작업용)
+
+        Returns:
+            {session_id: 세션 데이터}
+        """
+        return await self.store.scan()
+
     async def get_stats(self) -> dict[str, Any]:
         """
         통계 반환
@@ -269,8 +302,9 @@ class SessionService:
         current_time = datetime.now(UTC)  # ✅ datetime으로 변경
 
         # 활성 세션 재계산 (L356-361)
+        sessions = await self.store.scan()
         active_count = 0
-        for session in self.sessions.values():
+        for session in sessions.values():
             last_accessed = session["last_accessed"]
             # 하위 호환성: float 타임스탬프 처리
             if isinstance(last_accessed, int | float):
@@ -284,7 +318,8 @@ class SessionService:
 
         return {
             **self.stats,
-            "total_sessions_in_memory": len(self.sessions),
+            "total_sessions_in_memory": len(sessions),
+            "storage_backend": self.store.backend,
             "ttl_seconds": self.ttl,
             "max_exchanges": self.max_exchanges,
         }
@@ -297,7 +332,7 @@ class SessionService:
         expired_sessions = []
         current_time = datetime.now(UTC)  # ✅ datetime으로 변경
 
-        for session_id, session in self.sessions.items():
+        for session_id, session in (await self.store.scan()).items():
             last_accessed = session["last_accessed"]
             # 하위 호환성: float 타임스탬프 처리
             if isinstance(last_accessed, int | float):
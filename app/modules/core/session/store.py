@@ -0,0 +1,660 @@
+"""
+Session Store - 세션 문서와 대화 히스토리 저장소
+
+세션 문서(메타데이터, 사용자 정보, 메시지 메타데이터)와 대화 히스토리(capped list)를
+하나의 저장소 인터페이스 뒤에 둡니다. SessionService는 세션 문서를, MemoryService는
+히스토리와 대화 요약 상태를 같은 저장소 인스턴스로 읽고 씁니다.
+
+대화 요약 상태는 세션 문서와 별도 키에 두고 원자적으로 갱신합니다. 세션 문서는
+요청이 읽은 사본을 통째로 다시 저장(last-writer-wins)하므로, 같은 문서에 두면
+백그라운드 요약 결과와 요청의 대기열 추가가 서로를 덮어씁니다.
+
+저장소:
+- MemorySessionStore: 프로세스 내부 딕셔너리 (기본값, 기존 동작과 동일)
+- RedisSessionStore: Redis 문자열(JSON) + 리스트, 키 TTL로 만료 (멀티 워커 공유)
+- SQLiteSessionStore: 로컬 SQLite 파일 (WAL, 단일 호스트 멀티 워커 공유)
+
+shared=True인 저장소에서는 워커가 세션을 소유하지 않으므로 MemoryService가
+작은 LRU 캐시만 유지하고 나머지는 필요할 때 저장소에서 읽어옵니다.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from app.lib.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Redis/SQLite 키 만료를 세션 TTL보다 약간 늦춰 SessionService가
+# "session_expired"를 먼저 판정하고 정리할 수 있게 합니다.
+EXPIRY_GRACE_SECONDS = 60
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, set):
+        return list(value)
+    raise TypeError(f"직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def _json_object_hook(value: dict[str, Any]) -> Any:
+    if len(value) == 1 and "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+def encode_session(session: dict[str, Any]) -> str:
+    """세션 문서 → JSON (datetime 보존)"""
+    return json.dumps(session, default=_json_default, ensure_ascii=False)
+
+
+def decode_session(raw: str | bytes) -> dict[str, Any]:
+    """JSON → 세션 문서"""
+    decoded: dict[str, Any] = json.loads(raw, object_hook=_json_object_hook)
+    return decoded
+
+
+def new_summary_state() -> dict[str, Any]:
+    """
+    빈 대화 요약 상태
+
+    - text: 마지막으로 완료된 요약 (없으면 None)
+    - folded_upto: 요약에 반영된 마지막 메시지 seq
+    - aged: 윈도우에서 밀려난 메시지 누적 수 (seq 발급 카운터)
+    - pending: 아직 요약에 반영되지 않은 메시지 [{seq, role, content}]
+    """
+    return {"text": None, "folded_upto": 0, "aged": 0, "pending": []}
+
+
+def queue_into_summary(
+    state: dict[str, Any], messages: list[dict[str, str]], max_pending: int
+) -> None:
+    """요약 대기열에 메시지 추가 (seq 발급, 최근 max_pending개만 유지)"""
+    for message in messages:
+        state["aged"] += 1
+        state["pending"].append({"seq": state["aged"], **message})
+    # 요약이 계속 실패해도 대기열은 상한을 넘지 않음 (가장 오래된 것부터 버림)
+    del state["pending"][: max(0, len(state["pending"]) - max_pending)]
+
+
+def fold_into_summary(state: dict[str, Any], text: str, folded_upto: int) -> None:
+    """요약 결과 반영 (folded_upto 이하 대기 메시지 제거)"""
+    state["text"] = text
+    state["folded_upto"] = folded_upto
+    state["pending"] = [item for item in state["pending"] if item["seq"] > folded_upto]
+
+
+@runtime_checkable
+class SessionStore(Protocol):
+    """
+    세션 저장소 인터페이스
+
+    메시지는 {"role": "human" | "ai", "content": str} 형식입니다.
+    append_messages는 세션별 히스토리 버전(추가한 메시지 수만큼 증가하는 카운터)을 반환합니다.
+    MemoryService는 이 값을 세션 문서의 history_version에 기록해 워커 캐시의 신선도를
+    판단하고, 반환값이 캐시 버전 + 추가 수와 다르면 다른 워커가 끼어든 것으로 보고 다시 읽습니다.
+    """
+
+    backend: str
+    shared: bool
+
+    async def load(self, session_id: str) -> dict[str, Any] | None:
+        """세션 문서 조회 (없거나 만료되면 None)"""
+        ...
+
+    async def save(self, session_id: str, session: dict[str, Any]) -> None:
+        """세션 문서 저장 (TTL 갱신)"""
+        ...
+
+    async def delete(self, session_id: str) -> bool:
+        """세션 문서와 히스토리 삭제 (삭제했으면 True)"""
+        ...
+
+    async def scan(self) -> dict[str, dict[str, Any]]:
+        """전체 세션 문서 (관리 API / 정리 작업용, O(N))"""
+        ...
+
+    async def append_messages(
+        self, session_id: str, messages: list[dict[str, str]], max_messages: int
+    ) -> int:
+        """히스토리에 메시지 추가 후 최근 max_messages개만 유지 (새 히스토리 버전 반환)"""
+        ...
+
+    async def load_messages(self, session_id: str) -> list[dict[str, str]]:
+        """히스토리 조회 (오래된 순)"""
+        ...
+
+    async def load_summary(self, session_id: str) -> dict[str, Any] | None:
+        """대화 요약 상태 조회 (없으면 None)"""
+        ...
+
+    async def queue_summary(
+        self, session_id: str, messages: list[dict[str, str]], max_pending: int
+    ) -> dict[str, Any]:
+        """밀려난 메시지를 요약 대기열에 원자적으로 추가 (갱신된 상태 반환)"""
+        ...
+
+    async def commit_summary(
+        self, session_id: str, expected_upto: int, text: str, folded_upto: int
+    ) -> bool:
+        """folded_upto가 expected_upto 그대로일 때만 요약 반영 (CAS, 반영했으면 True)"""
+        ...
+
+    async def close(self) -> None:
+        """연결 정리"""
+        ...
+
+
+class MemorySessionStore:
+    """
+    프로세스 내부 세션 저장소 (기본값)
+
+    세션 문서를 복사하지 않고 그대로 보관하므로 호출자가 문서를 직접 수정해도
+    반영됩니다 (기존 SessionService.sessions 딕셔너리와 같은 동작).
+    히스토리는 MemoryService가 직접 보관하므로 여기서는 보조 용도입니다.
+    """
+
+    backend = "memory"
+    shared = False
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.histories: dict[str, list[dict[str, str]]] = {}
+        self.summaries: dict[str, dict[str, Any]] = {}
+        self._versions: dict[str, int] = {}
+
+    async def load(self, session_id: str) -> dict[str, Any] | None:
+        return self.sessions.get(session_id)
+
+    async def save(self, session_id: str, session: dict[str, Any]) -> None:
+        self.sessions[session_id] = session
+
+    async def delete(self, session_id: str) -> bool:
+        self.histories.pop(session_id, None)
+        self.summaries.pop(session_id, None)
+        self._versions.pop(session_id, None)
+        return self.sessions.pop(session_id, None) is not None
+
+    async def scan(self) -> dict[str, dict[str, Any]]:
+        return dict(self.sessions)
+
+    async def append_messages(
+        self, session_id: str, messages: list[dict[str, str]], max_messages: int
+    ) -> int:
+        history = self.histories.setdefault(session_id, [])
+        history.extend(messages)
+        del history[: max(0, len(history) - max_messages)]
+        self._versions[session_id] = self._versions.get(session_id, 0) + len(messages)
+        return self._versions[session_id]
+
+    async def load_messages(self, session_id: str) -> list[dict[str, str]]:
+        return list(self.histories.get(session_id, []))
+
+    # 요약 상태: 읽기~쓰기 사이에 await가 없으므로 그 자체로 원자적
+    async def load_summary(self, session_id: str) -> dict[str, Any] | None:
+        state = self.summaries.get(session_id)
+        return copy.deepcopy(state) if state is not None else None
+
+    async def queue_summary(
+        self, session_id: str, messages: list[dict[str, str]], max_pending: int
+    ) -> dict[str, Any]:
+        state = self.summaries.setdefault(session_id, new_summary_state())
+        queue_into_summary(state, messages, max_pending)
+        return copy.deepcopy(state)
+
+    async def commit_summary(
+        self, session_id: str, expected_upto: int, text: str, folded_upto: int
+    ) -> bool:
+        state = self.summaries.get(session_id)
+        if state is None or state["folded_upto"] != expected_upto:
+            return False
+        fold_into_summary(state, text, folded_upto)
+        return True
+
+    async def close(self) -> None:
+        self.sessions.clear()
+        self.histories.clear()
+        self.summaries.clear()
+        self._versions.clear()
+
+
+class RedisSessionStore:
+    """
+    Redis 기반 세션 저장소
+
+    키 구성 (key_prefix 기준):
+    - {prefix}data:{session_id}: 세션 문서 JSON (SET EX)
+    - {prefix}history:{session_id}: 메시지 리스트 (RPUSH + LTRIM으로 상한 유지)
+    - {prefix}hver:{session_id}: 히스토리 버전 카운터 (INCRBY)
+    - {prefix}summary:{session_id}: 대화 요약 상태 JSON (WATCH/MULTI로 원자적 갱신)
+
+    모든 키는 세션 TTL로 만료되므로 워커가 정리하지 않아도 Redis에 쌓이지 않습니다.
+    """
+
+    backend = "redis"
+    shared = True
+
+    def __init__(self, redis_client: Any, ttl_seconds: int, key_prefix: str = "rag:session:"):
+        """
+        Args:
+            redis_client: redis.asyncio.Redis 클라이언트 (decode_responses=True)
+            ttl_seconds: 세션 TTL (초)
+            key_prefix: 키 접두사 (네임스페이스 분리)
+        """
+        self._redis = redis_client
+        self._expire = int(ttl_seconds) + EXPIRY_GRACE_SECONDS
+        self._prefix = key_prefix
+
+    def _data_key(self, session_id: str) -> str:
+        return f"{self._prefix}data:{session_id}"
+
+    def _history_key(self, session_id: str) -> str:
+        return f"{self._prefix}history:{session_id}"
+
+    def _version_key(self, session_id: str) -> str:
+        return f"{self._prefix}hver:{session_id}"
+
+    def _summary_key(self, session_id: str) -> str:
+        return f"{self._prefix}summary:{session_id}"
+
+    async def load(self, session_id: str) -> dict[str, Any] | None:
+        raw = await self._redis.get(self._data_key(session_id))
+        return decode_session(raw) if raw else None
+
+    async def save(self, session_id: str, session: dict[str, Any]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.set(self._data_key(session_id), encode_session(session), ex=self._expire)
+        pipe.expire(self._history_key(session_id), self._expire)
+        pipe.expire(self._version_key(session_id), self._expire)
+        pipe.expire(self._summary_key(session_id), self._expire)
+        await pipe.execute()
+
+    async def delete(self, session_id: str) -> bool:
+        removed = await self._redis.delete(
+            self._data_key(session_id),
+            self._history_key(session_id),
+            self._version_key(session_id),
+            self._summary_key(session_id),
+        )
+        return bool(removed)
+
+    async def scan(self) -> dict[str, dict[str, Any]]:
+        data_prefix = f"{self._prefix}data:"
+        keys = [key async for key in self._redis.scan_iter(match=f"{data_prefix}*", count=500)]
+        sessions: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(keys), 500):
+            batch = keys[start : start + 500]
+            for key, raw in zip(batch, await self._redis.mget(batch), strict=True):
+                if raw:
+                    sessions[str(key)[len(data_prefix) :]] = decode_session(raw)
+        return sessions
+
+    async def append_messages(
+        self, session_id: str, messages: list[dict[str, str]], max_messages: int
+    ) -> int:
+        history_key = self._history_key(session_id)
+        version_key = self._version_key(session_id)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.rpush(history_key, *(json.dumps(m, ensure_ascii=False) for m in messages))
+        if max_messages > 0:
+            pipe.ltrim(history_key, -max_messages, -1)
+        else:
+            pipe.ltrim(history_key, 1, 0)  # start > end → 빈 리스트 (-0은 전체 유지가 됨)
+        pipe.expire(history_key, self._expire)
+        pipe.incrby(version_key, len(messages))
+        pipe.expire(version_key, self._expire)
+        results = await pipe.execute()
+        return int(results[3])
+
+    async def load_messages(self, session_id: str) -> list[dict[str, str]]:
+        raw = await self._redis.lrange(self._history_key(session_id), 0, -1)
+        return [json.loads(item) for item in raw]
+
+    async def load_summary(self, session_id: str) -> dict[str, Any] | None:
+        raw = await self._redis.get(self._summary_key(session_id))
+        return json.loads(raw) if raw else None
+
+    async def queue_summary(
+        self, session_id: str, messages: list[dict[str, str]], max_pending: int
+    ) -> dict[str, Any]:
+        def update(state: dict[str, Any]) -> bool:
+            queue_into_summary(state, messages, max_pending)
+            return True
+
+        state, _ = await self._update_summary(session_id, update)
+        return state
+
+    async def commit_summary(
+        self, session_id: str, expected_upto: int, text: str, folded_upto: int
+    ) -> bool:
+        def update(state: dict[str, Any]) -> bool:
+            if state["folded_upto"] != expected_upto:
+                return False
+            fold_into_summary(state, text, folded_upto)
+            return True
+
+        _, applied = await self._update_summary(session_id, update, create=False)
+        return applied
+
+    async def _update_summary(
+        self, session_id: str, update: Any, create: bool = True
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        요약 상태 낙관적 트랜잭션 (WATCH → GET → MULTI/SET → EXEC)
+
+        EXEC 전에 다른 클라이언트가 키를 바꾸면 WatchError로 실패하므로 다시 읽어
+        update를 재적용합니다. update가 False를 반환하면 쓰지 않습니다.
+        """
+        from redis.exceptions import WatchError
+
+        key = self._summary_key(session_id)
+        while True:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.get(key)
+                    if not raw and not create:
+                        return new_summary_state(), False
+                    state = json.loads(raw) if raw else new_summary_state()
+                    if not update(state):
+                        return state, False
+                    pipe.multi()
+                    pipe.set(key, json.dumps(state, ensure_ascii=False), ex=self._expire)
+                    await pipe.execute()
+                    return state, True
+                except WatchError:
+                    continue
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class SQLiteSessionStore:
+    """
+    SQLite 기반 세션 저장소
+
+    같은 호스트의 여러 워커가 하나의 파일을 공유합니다 (WAL 모드).
+    sqlite3 호출은 asyncio.to_thread로 이벤트 루프 밖에서 실행하고,
+    연결 하나를 스레드 락으로 직렬화합니다.
+    """
+
+    backend = "sqlite"
+    shared = True
+
+    def __init__(self, path: str | Path, ttl_seconds: int):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 가능)
+            ttl_seconds: 세션 TTL (초)
+        """
+        self._expire = int(ttl_seconds) + EXPIRY_GRACE_SECONDS
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, "
+                "role TEXT NOT NULL, content TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_session ON messages (session_id, id)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_versions ("
+                "session_id TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "session_id TEXT PRIMARY KEY, state TEXT NOT NULL, folded_upto INTEGER NOT NULL)"
+            )
+
+    async def _run(self, fn: Any, *args: Any) -> Any:
+        def locked() -> Any:
+            with self._lock:
+                return fn(*args)
+
+        return await asyncio.to_thread(locked)
+
+    def _load(self, session_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT data FROM sessions WHERE session_id = ? AND expires_at > ?",
+            (session_id, time.time()),
+        ).fetchone()
+        return decode_session(row[0]) if row else None
+
+    def _save(self, session_id: str, data: str) -> None:
+        self._conn.execute(
+            "INSERT INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET data = excluded.data, "
+            "expires_at = excluded.expires_at",
+            (session_id, data, time.time() + self._expire),
+        )
+
+    def _delete(self, session_id: str) -> bool:
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._conn.execute("DELETE FROM history_versions WHERE session_id = ?", (session_id,))
+            self._conn.execute("DELETE FROM summaries WHERE session_id = ?", (session_id,))
+            cursor = self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return cursor.rowcount > 0
+
+    def _scan(self) -> dict[str, dict[str, Any]]:
+        now = time.time()
+        # 만료 행은 조회 시점에 함께 정리 (정리 작업이 주기적으로 호출)
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute(
+                "DELETE FROM messages WHERE session_id IN "
+                "(SELECT session_id FROM sessions WHERE expires_at <= ?)",
+                (now,),
+            )
+            for table in ("history_versions", "summaries"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE session_id IN "
+                    "(SELECT session_id FROM sessions WHERE expires_at <= ?)",
+                    (now,),
+                )
+            self._conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        rows = self._conn.execute("SELECT session_id, data FROM sessions").fetchall()
+        return {session_id: decode_session(data) for session_id, data in rows}
+
+    def _append(self, session_id: str, messages: list[dict[str, str]], max_messages: int) -> int:
+        self._conn.execute("BEGIN")
+        try:
+            cursor = self._conn.cursor()
+            cursor.executemany(
+                "INSERT INTO messages (session_id, role, content) VALUES (?, ?, ?)",
+                [(session_id, m["role"], m["content"]) for m in messages],
+            )
+            self._conn.execute(
+                "INSERT INTO history_versions (session_id, version) VALUES (?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET version = version + excluded.version",
+                (session_id, len(messages)),
+            )
+            version = self._conn.execute(
+                "SELECT version FROM history_versions WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "DELETE FROM messages WHERE session_id = ? AND id NOT IN "
+                "(SELECT id FROM messages WHERE session_id = ? ORDER BY id DESC LIMIT ?)",
+                (session_id, session_id, max_messages),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return int(version)
+
+    def _load_messages(self, session_id: str) -> list[dict[str, str]]:
+        rows = self._conn.execute(
+            "SELECT role, content FROM messages WHERE session_id = ? ORDER BY id",
+            (session_id,),
+        ).fetchall()
+        return [{"role": role, "content": content} for role, content in rows]
+
+    def _load_summary(self, session_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT state FROM summaries WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _queue_summary(
+        self, session_id: str, messages: list[dict[str, str]], max_pending: int
+    ) -> dict[str, Any]:
+        # BEGIN IMMEDIATE: 읽기 전에 쓰기 잠금을 잡아 다른 프로세스와의 갱신 유실 방지
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            state = self._load_summary(session_id) or new_summary_state()
+            queue_into_summary(state, messages, max_pending)
+            self._conn.execute(
+                "INSERT INTO summaries (session_id, state, folded_upto) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET state = excluded.state",
+                (session_id, json.dumps(state, ensure_ascii=False), state["folded_upto"]),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return state
+
+    def _commit_summary(
+        self, session_id: str, expected_upto: int, text: str, folded_upto: int
+    ) -> bool:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            state = self._load_summary(session_id)
+            if state is None or state["folded_upto"] != expected_upto:
+                self._conn.execute("COMMIT")
+                return False
+            fold_into_summary(state, text, folded_upto)
+            cursor = self._conn.execute(
+                "UPDATE summaries SET state = ?, folded_upto = ? "
+                "WHERE session_id = ? AND folded_upto = ?",
+                (json.dumps(state, ensure_ascii=False), folded_upto, session_id, expected_upto),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return cursor.rowcount == 1
+
+    async def load(self, session_id: str) -> dict[str, Any] | None:
+        result: dict[str, Any] | None = await self._run(self._load, session_id)
+        return result
+
+    async def save(self, session_id: str, session: dict[str, Any]) -> None:
+        await self._run(self._save, session_id, encode_session(session))
+
+    async def delete(self, session_id: str) -> bool:
+        return bool(await self._run(self._delete, session_id))
+
+    async def scan(self) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = await self._run(self._scan)
+        return result
+
+    async def append_messages(
+        self, session_id: str, messages: list[dict[str, str]], max_messages: int
+    ) -> int:
+        return int(await self._run(self._append, session_id, messages, max_messages))
+
+    async def load_messages(self, session_id: str) -> list[dict[str, str]]:
+        result: list[dict[str, str]] = await self._run(self._load_messages, session_id)
+        return result
+
+    async def load_summary(self, session_id: str) -> dict[str, Any] | None:
+        result: dict[str, Any] | None = await self._run(self._load_summary, session_id)
+        return result
+
+    async def queue_summary(
+        self, session_id: str, messages: list[dict[str, str]], max_pending: int
+    ) -> dict[str, Any]:
+        result: dict[str, Any] = await self._run(
+            self._queue_summary, session_id, messages, max_pending
+        )
+        return result
+
+    async def commit_summary(
+        self, session_id: str, expected_upto: int, text: str, folded_upto: int
+    ) -> bool:
+        return bool(
+            await self._run(self._commit_summary, session_id, expected_upto, text, folded_upto)
+        )
+
+    async def close(self) -> None:
+        await self._run(self._conn.close)
+
+
+def create_session_store(config: dict[str, Any] | None) -> SessionStore:
+    """
+    설정에 맞는 세션 저장소 생성
+
+    session.storage_backend:
+    - memory (기본): MemorySessionStore
+    - redis: REDIS_URL 필요, 없거나 redis 패키지 미설치 시 memory로 폴백
+    - sqlite: session.sqlite_path 파일
+
+    Args:
+        config: 전체 설정 딕셔너리
+
+    Returns:
+        SessionStore 구현체
+    """
+    session_config = (config or {}).get("session", {}) or {}
+    backend = session_config.get("storage_backend", "memory")
+    ttl = session_config.get("ttl", 7200)
+
+    if backend == "redis":
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            logger.warning("REDIS_URL 미설정, 세션 저장소를 메모리로 대체")
+            return MemorySessionStore()
+        try:
+            from redis.asyncio import Redis
+        except ImportError:
+            logger.warning(
+                "Redis 패키지 미설치, 세션 저장소를 메모리로 대체",
+                extra={"required_package": "redis"},
+            )
+            return MemorySessionStore()
+
+        logger.info("세션 저장소: Redis")
+        return RedisSessionStore(
+            Redis.from_url(redis_url, decode_responses=True),
+            ttl_seconds=ttl,
+            key_prefix=session_config.get("redis_key_prefix", "rag:session:"),
+        )
+
+    if backend == "sqlite":
+        path = session_config.get("sqlite_path", "data/sessions.db")
+        logger.info("세션 저장소: SQLite", extra={"path": str(path)})
+        return SQLiteSessionStore(path, ttl_seconds=ttl)
+
+    if backend != "memory":
+        logger.warning(f"알 수 없는 세션 저장소 백엔드: {backend}, 메모리 사용")
+    return MemorySessionStore()
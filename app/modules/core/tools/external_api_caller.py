@@ -18,6 +18,7 @@ from urllib.parse import urlparse
 import httpx
 
 from ....lib.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from ....lib.http_transport import get_http_client
 from ....lib.logger import get_logger
 from .tool_loader import ToolDefinition
 
@@ -52,28 +53,31 @@ class ExternalAPICaller:
 
     def __init__(self):
         """초기화"""
-        self.client: httpx.AsyncClient | None = None
+        self._initialized = False
         self.circuit_breakers: dict[str, CircuitBreaker] = {}
 
         logger.info("ExternalAPICaller 초기화")
 
     async def initialize(self):
-        """클라이언트 초기화"""
-        if self.client is None:
-            # httpx.AsyncClient 생성
-            self.client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),  # 기본 타임아웃
-                follow_redirects=False,
-                verify=True,  # SSL 검증
-            )
-            logger.info("httpx AsyncClient 초기화 완료")
+        """
+        클라이언트 초기화
+
+        요청은 호스트별 공유 커넥션 풀(app.lib.http_transport)을 사용합니다.
+        (리다이렉트 미추적, SSL 검증은 httpx 기본값)
+        """
+        if not self._initialized:
+            self._initialized = True
+            logger.info("공유 HTTP 커넥션 풀 사용 준비 완료")
 
     async def close(self):
-        """클라이언트 종료"""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
-            logger.info("httpx AsyncClient 종료")
+        """
+        클라이언트 종료
+
+        공유 커넥션 풀은 애플리케이션 종료 시 http_transport.aclose()로 닫힙니다.
+        """
+        if self._initialized:
+            self._initialized = False
+            logger.info("ExternalAPICaller 종료")
 
     def get_circuit_breaker(self, tool_name: str, config: dict[str, Any]) -> CircuitBreaker:
         """
@@ -109,7 +113,7 @@ class ExternalAPICaller:
         Returns:
             API 호출 결과
         """
-        if self.client is None:
+        if not self._initialized:
             await self.initialize()
 
         execution = tool_def.execution
@@ -282,8 +286,8 @@ class ExternalAPICaller:
         )
 
         # Client 초기화 확인
-        if not self.client:
-            logger.error("httpx AsyncClient가 초기화되지 않음")
+        if not self._initialized:
+            logger.error("ExternalAPICaller가 초기화되지 않음")
             return APICallResult(
                 success=False,
                 error={"code": "NOT_INITIALIZED", "message": "API Client가 초기화되지 않았습니다"},
@@ -292,8 +296,9 @@ class ExternalAPICaller:
         start_time = time.time()
 
         try:
-            # HTTP 요청
-            response = await self.client.request(
+            # HTTP 요청 (호스트별 공유 커넥션 풀)
+            client = get_http_client(url)
+            response = await client.request(
                 method=method, url=url, json=parameters, headers=headers, timeout=timeout
             )
 
@@ -21,8 +21,7 @@ import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
-import httpx
-
+from ....lib.http_transport import get_http_client
 from ....lib.logger import get_logger
 
 logger = get_logger(__name__)
@@ -239,15 +238,16 @@ class BraveProvider:
             "count": max_results,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self._BASE_URL,
-                headers=headers,
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        # 호스트별 공유 커넥션 풀 (요청마다 TLS 핸드셰이크 방지)
+        client = get_http_client(self._BASE_URL)
+        response = await client.get(
+            self._BASE_URL,
+            headers=headers,
+            params=params,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def search(self, query: str, max_results: int = 5) -> WebSearchResponse:
         """
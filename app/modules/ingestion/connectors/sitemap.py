@@ -14,6 +14,7 @@ from typing import Any
 import httpx
 from bs4 import BeautifulSoup
 
+from app.lib.http_transport import get_http_client
 from app.modules.ingestion.interfaces import IIngestionConnector, StandardDocument
 
 logger = logging.getLogger(__name__)
@@ -50,8 +51,9 @@ class SitemapConnector(IIngestionConnector):
         async with self._semaphore:
             for attempt in range(self.max_retries):
                 try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        return await self._fetch_and_parse_page(client, url)
+                    # 호스트별 공유 커넥션 풀 (같은 사이트 페이지끼리 커넥션 재사용)
+                    client = get_http_client(url)
+                    return await self._fetch_and_parse_page(client, url)
                 except (httpx.ConnectError, httpx.TimeoutException) as e:
                     if attempt == self.max_retries - 1:
                         logger.error(f"Failed to fetch {url} after {self.max_retries} retries: {e}")
@@ -66,18 +68,18 @@ class SitemapConnector(IIngestionConnector):
 
     async def _parse_sitemap(self, sitemap_url: str) -> list[str]:
         """사이트맵 XML에서 <loc> 태그의 URL 목록 추출"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(sitemap_url)
-            response.raise_for_status()
+        client = get_http_client(sitemap_url)
+        response = await client.get(sitemap_url, timeout=self.timeout)
+        response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "xml")
-            urls = [loc.text.strip() for loc in soup.find_all("loc")]
-            logger.info(f"Found {len(urls)} URLs in sitemap {sitemap_url}")
-            return urls
+        soup = BeautifulSoup(response.content, "xml")
+        urls = [loc.text.strip() for loc in soup.find_all("loc")]
+        logger.info(f"Found {len(urls)} URLs in sitemap {sitemap_url}")
+        return urls
 
     async def _fetch_and_parse_page(self, client: httpx.AsyncClient, url: str) -> StandardDocument:
         """단일 HTML 페이지에서 본문 텍스트 추출"""
-        response = await client.get(url)
+        response = await client.get(url, timeout=self.timeout)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "lxml")
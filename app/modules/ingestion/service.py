@@ -14,6 +14,7 @@ from app.batch.metadata_chunker import MetadataChunker
 from app.batch.notion_client import NotionAPIClient
 from app.core.interfaces.storage import IMetadataStore, IVectorStore
 from app.lib.logger import get_logger
+from app.modules.core.generation.answer_cache import AnswerCache
 from app.modules.ingestion.interfaces import IIngestionConnector
 
 logger = get_logger(__name__)
@@ -35,13 +36,21 @@ class IngestionService:
         metadata_store: IMetadataStore,
         config: dict[str, Any] | None = None,
         notion_client: NotionAPIClient | None = None,
-        chunker: MetadataChunker | None = None
+        chunker: MetadataChunker | None = None,
+        answer_cache: AnswerCache | None = None,
     ):
         self.vector_store = vector_store
         self.metadata_store = metadata_store
         self.config = config or {}
         self.notion_client = notion_client
         self.chunker = chunker or MetadataChunker()
+        self.answer_cache = answer_cache  # 재적재된 원본을 참조하는 캐시 답변 무효화
+
+    def _invalidate_answers(self, source_keys: set[str]) -> None:
+        """재적재된 원본 문서를 근거로 만든 캐시 답변 제거"""
+        if self.answer_cache and source_keys:
+            removed = self.answer_cache.invalidate_sources(source_keys)
+            logger.info(f"Answer cache invalidated: {removed} answers ({len(source_keys)} sources)")
 
     async def ingest_from_connector(self, connector: IIngestionConnector, category_name: str) -> IngestionResult:
         """
@@ -102,6 +111,7 @@ class IngestionService:
             if all_chunks:
                 try:
                     result.vector_saved = await self.vector_store.add_documents("Documents", all_chunks)
+                    self._invalidate_answers({meta["source_url"] for meta in metadata_list})
                 except Exception as vector_error:
                     logger.error(f"Vector storage failed: {vector_error}")
                     result.errors.append(f"Vector storage failed: {vector_error}")
@@ -200,6 +210,7 @@ class IngestionService:
                     documents=all_chunks
                 )
                 result.vector_saved = saved_vectors
+                self._invalidate_answers({page.id for page in pages})
 
             if metadata_list:
                 # Save item by item or batch if supported
@@ -6,10 +6,10 @@ OneRAG FastAPI Application
 import asyncio
 import os
 import sys
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 # ⚠️ 중요: 환경 변수를 가장 먼저 로드 (다른 모든 import보다 먼저!)
 from dotenv import load_dotenv
@@ -30,9 +30,8 @@ except ImportError:
     LANGSMITH_AVAILABLE = False
 
 import uvicorn
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -74,10 +73,20 @@ from app.core.di_container import (
     initialize_async_resources_graceful,  # Graceful Degradation 지원
 )
 from app.infrastructure.persistence.connection import db_manager  # PostgreSQL 연결 관리자
-from app.lib.auth import get_api_key_auth  # API Key 인증
-from app.lib.config_loader import ConfigLoader
+from app.lib.auth import APIKeyAuthMiddleware, get_api_key_auth  # API Key 인증
+from app.lib.config_loader import (
+    ConfigLoader,
+    ConfigWatcher,
+    changed_sections,
+    install_reload_signal_handler,
+    subscribe_config,
+    thaw_config,
+)
 from app.lib.env_validator import EnvValidator, validate_all_env
+from app.lib.http_transport import configure_http_transport, http_transport
 from app.lib.logger import get_logger
+from app.middleware.compression import StreamingSafeGZipMiddleware
+from app.middleware.request_logger import RequestLoggingMiddleware
 
 # Phase 1.3: 신규 Retrieval Architecture (Orchestrator Pattern)
 
@@ -124,6 +133,9 @@ class RAGChatbotApp:
             # Container에 설정 주입
             self.container.config.from_dict(self.config)
 
+            # 외부 HTTP 호출 공유 커넥션 풀 설정 (첫 외부 호출 전에 적용)
+            configure_http_transport(self.config.get("http_transport"))
+
             # Feature Flag: Graceful Degradation 활성화 여부 체크
             enable_graceful_degradation = (
                 os.getenv("ENABLE_GRACEFUL_DEGRADATION", "false").lower() == "true"
@@ -157,6 +169,21 @@ class RAGChatbotApp:
         except Exception as e:
             logger.error(f"❌ Error during cleanup: {e}")
 
+    def apply_config_reload(self, old: Mapping[str, Any], new: Mapping[str, Any]) -> None:
+        """
+        설정 스냅샷 교체 시 DI Container 설정 갱신 (subscribe_config 구독자)
+
+        이후 생성되는 Factory provider(rag_pipeline, chat_service, ingestion_service)는
+        새 설정으로 만들어진다. 이미 생성된 Singleton 모듈은 재시작 전까지 기존 설정을 유지한다.
+        """
+        config = thaw_config(new)
+        self.container.config.from_dict(config)
+        self.config = config
+        logger.info(
+            "🔄 DI Container 설정 갱신",
+            extra={"changed_sections": changed_sections(old, new)},
+        )
+
     def get_modules_dict(self) -> dict[str, Any]:
         """
         라우터 의존성 주입을 위한 모듈 딕셔너리 반환
@@ -191,6 +218,8 @@ class RAGChatbotApp:
             "self_rag": self.container.self_rag(),
             "circuit_breaker_factory": self.container.circuit_breaker_factory(),  # ✅ Circuit Breaker Factory 추가
             "sql_search_service": self.container.sql_search_service(),  # ✅ SQL Search Service 추가 (Phase 3)
+            "answer_cache": self.container.answer_cache(),  # 반복 질문 답변 캐시
+            "usage_accountant": self.container.usage_accountant(),  # 토큰/비용 사용량 집계
         }
 
 
@@ -198,14 +227,18 @@ class RAGChatbotApp:
 rag_app = RAGChatbotApp()
 
 # Rate Limiter 인스턴스 (전역 생성 - lifespan에서 cleanup task 관리)
-from app.middleware.rate_limiter import RateLimiter
+from app.middleware.rate_limiter import RateLimiter, create_rate_limit_redis
 
 rate_limiter = RateLimiter(
     ip_limit=30,  # IP 기반: 분당 30개
     session_limit=10,  # Session 기반: 분당 10개
     window_seconds=60,  # 1분 윈도우
+    redis_client=create_rate_limit_redis(),  # RATE_LIMIT_BACKEND=redis 시 워커 간 공유
 )
 
+# 설정 파일 감시자 (lifespan에서 시작/중지)
+config_watcher = ConfigWatcher()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -347,6 +380,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         rate_limiter.start_cleanup_task()
         logger.info("✅ Rate Limiter cleanup task started")
 
+        # 설정 스냅샷 핫 리로드 (파일 mtime 폴링 + SIGHUP)
+        config_watcher.interval_seconds = float(os.getenv("CONFIG_WATCH_INTERVAL", "10"))
+        unsubscribe_config_reload = subscribe_config(rag_app.apply_config_reload)
+        config_watcher.start()
+        if install_reload_signal_handler(asyncio.get_running_loop()):
+            logger.info("✅ SIGHUP 설정 리로드 핸들러 등록")
+
         logger.info("✅ Application started successfully")
 
     except Exception as e:
@@ -357,8 +397,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # 종료 시
     try:
+        config_watcher.stop()
+        unsubscribe_config_reload()
+
         # Rate Limiter cleanup task 중지
         await rate_limiter.stop_cleanup_task()
+        await rate_limiter.close()
         logger.info("✅ Rate Limiter cleanup task stopped")
 
         # Tool Executor 리소스 정리 (httpx AsyncClient 종료, DI Container에서)
@@ -368,6 +412,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.warning(f"⚠️ Tool Executor cleanup warning: {e}")
 
+        # 프롬프트 JSON write-behind 대기분 기록
+        try:
+            await rag_app.container.prompt_manager().flush()
+        except Exception as e:
+            logger.warning(f"⚠️ Prompt flush warning: {e}")
+
         await rag_app.cleanup_modules()
 
         # PostgreSQL 연결 종료 (안전하게 처리)
@@ -393,6 +443,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.warning(f"⚠️ MongoDB close warning: {e}")
 
+        # 공유 HTTP 커넥션 풀 종료 (외부 제공자 keep-alive 커넥션)
+        try:
+            await http_transport.aclose()
+            logger.info("✅ HTTP transport pool closed")
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP transport close warning: {e}")
+
         # LangSmith 트레이스 flush
         if langsmith_enabled and LANGSMITH_AVAILABLE:
             try:
@@ -541,18 +598,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# SSE(text/event-stream) 응답은 압축하지 않음 (압축 버퍼에 이벤트가 묶이는 문제 방지)
+app.add_middleware(StreamingSafeGZipMiddleware, minimum_size=1000)
 
 
 # API Key 인증 미들웨어 추가
 # ⚠️ 주의: 인증 미들웨어는 다른 미들웨어보다 먼저 실행되도록 마지막에 등록
-@app.middleware("http")
-async def api_key_auth_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """API Key 인증 미들웨어"""
-    response = await api_key_auth.authenticate_request(request, call_next)
-    return cast(Response, response)
+# 아래 미들웨어는 모두 순수 ASGI (BaseHTTPMiddleware의 요청별 태스크/스트림 래핑 없음)
+app.add_middleware(APIKeyAuthMiddleware, auth=api_key_auth)
 
 
 # Rate Limiting Middleware 추가 (IP/Session 기반)
@@ -662,28 +715,8 @@ async def api_info() -> dict[str, Any]:
     }
 
 
-@app.middleware("http")
-async def log_requests(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """요청 로깅 미들웨어"""
-    start_time = asyncio.get_event_loop().time()
-
-    response = await call_next(request)
-
-    process_time = asyncio.get_event_loop().time() - start_time
-    logger.info(
-        f"{request.method} {request.url.path} - {response.status_code} - {process_time:.3f}s",
-        extra={
-            "method": request.method,
-            "path": str(request.url.path),
-            "status_code": response.status_code,
-            "process_time": process_time,
-            "client_ip": request.client.host if request.client else None,
-        },
-    )
-
-    return response
+# 요청 로깅 미들웨어 (가장 바깥쪽)
+app.add_middleware(RequestLoggingMiddleware)
 
 
 def main() -> None:
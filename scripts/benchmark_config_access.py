@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+설정 조회 벤치마크
+
+요청 경로에서 설정을 읽는 두 가지 방식을 비교합니다.
+
+- load_config: 호출마다 ConfigLoader 생성 + YAML 파싱/병합/검증 (기존 방식,
+  MemoryService._save_message_to_mongodb 등)
+- get_config: 프로세스 전역 불변 스냅샷 참조 (1회 로드 후 공유)
+
+사용법:
+    python scripts/benchmark_config_access.py
+    python scripts/benchmark_config_access.py --iterations 50 --snapshot-iterations 1000000
+"""
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.lib.config_loader import get_config, load_config
+
+
+def read_session_flag_loaded() -> bool:
+    config = load_config()
+    return bool(config.get("session", {}).get("save_chat_to_mongodb", False))
+
+
+def read_session_flag_snapshot() -> bool:
+    config = get_config()
+    return bool(config.get("session", {}).get("save_chat_to_mongodb", False))
+
+
+def measure(func, iterations):
+    """호출당 소요 시간 목록 (마이크로초)"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설정 조회 벤치마크")
+    parser.add_argument("--iterations", type=int, default=30, help="load_config 반복 횟수")
+    parser.add_argument(
+        "--snapshot-iterations", type=int, default=100_000, help="get_config 반복 횟수"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # 로드마다 찍히는 환경 감지 로그 억제
+
+    get_config()  # 최초 스냅샷 로드는 측정에서 제외
+    results = {
+        "load_config": measure(read_session_flag_loaded, args.iterations),
+        "get_config": measure(read_session_flag_snapshot, args.snapshot_iterations),
+    }
+
+    print(f"{'mode':>12s} | {'calls':>8s} | {'mean (µs)':>11s} | {'p50 (µs)':>10s} | {'p99 (µs)':>10s}")
+    print("-" * 64)
+    for mode, samples in results.items():
+        ordered = sorted(samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        print(
+            f"{mode:>12s} | {len(samples):>8d} | {statistics.mean(samples):>11.2f} | "
+            f"{statistics.median(samples):>10.2f} | {p99:>10.2f}"
+        )
+    speedup = statistics.mean(results["load_config"]) / statistics.mean(results["get_config"])
+    print(f"\n호출당 평균 {speedup:,.0f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
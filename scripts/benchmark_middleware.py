@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+미들웨어 스택 벤치마크 (/chat 지연, /chat/stream 첫 이벤트 도착 시간)
+
+main.py와 같은 순서(요청 로깅 → 에러 로깅 → Rate Limit → 인증 → GZip → CORS)로
+두 가지 스택을 구성하고, 가짜 /api/chat, /api/chat/stream 엔드포인트에 요청합니다.
+
+- legacy: BaseHTTPMiddleware / @app.middleware("http") 기반 (기존 방식 재현,
+  POST 본문 전체를 읽어 session_id 추출, Starlette GZipMiddleware)
+- asgi: 순수 ASGI 미들웨어 (app.middleware.*, APIKeyAuthMiddleware,
+  StreamingSafeGZipMiddleware)
+
+각 스택을 uvicorn으로 임시 포트에 띄워 실제 HTTP로 요청합니다 (Accept-Encoding: gzip).
+/chat/stream은 토큰마다 token-delay만큼 대기하는 SSE 응답에서 첫 이벤트가
+클라이언트에 도착하기까지의 시간을 측정합니다.
+
+사용법:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --requests 2000 --streams 20 --events 20 --token-delay 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.lib.auth import APIKeyAuth, APIKeyAuthMiddleware
+from app.middleware.compression import StreamingSafeGZipMiddleware
+from app.middleware.error_logger import ErrorLoggingMiddleware
+from app.middleware.rate_limiter import RateLimiter, RateLimitMiddleware
+from app.middleware.request_logger import RequestLoggingMiddleware
+
+API_KEY = "bench-key"
+EXCLUDED_PATHS = ["/health", "/api/chat", "/api/chat/session", "/api/chat/stream", "/"]
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """기존 RateLimitMiddleware.dispatch 재현 (POST 본문 전체 읽기 포함)"""
+
+    def __init__(self, app, rate_limiter):
+        super().__init__(app)
+        self.rate_limiter = rate_limiter
+
+    async def dispatch(self, request, call_next):
+        if request.url.path in EXCLUDED_PATHS:
+            return await call_next(request)
+        client_ip = request.client.host if request.client else None
+        session_id = request.headers.get("X-Session-ID")
+        if not session_id and request.method == "POST":
+            body = await request.body()
+            session_id = json.loads(body).get("session_id") if body else None
+        await self.rate_limiter.check(ip=client_ip, session_id=session_id)
+        return await call_next(request)
+
+
+class LegacyErrorLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except Exception:
+            raise
+
+
+def add_endpoints(app, events, token_delay):
+    @app.post("/api/chat")
+    async def chat(request: Request):
+        payload = await request.json()
+        return {"answer": "환불은 7일 이내 가능합니다. " * 40, "session_id": payload["session_id"]}
+
+    @app.post("/api/chat/stream")
+    async def chat_stream(request: Request):
+        await request.json()
+
+        async def stream():
+            for i in range(events):
+                await asyncio.sleep(token_delay)
+                yield f"event: chunk\ndata: 토큰{i}\n\n"
+            yield "event: done\ndata: {}\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+def build_legacy(events, token_delay):
+    app = FastAPI()
+    add_endpoints(app, events, token_delay)
+    auth = APIKeyAuth(api_key=API_KEY)
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"])
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+    @app.middleware("http")
+    async def api_key_auth_middleware(request, call_next):
+        return await auth.authenticate_request(request, call_next)
+
+    app.add_middleware(LegacyRateLimitMiddleware, rate_limiter=RateLimiter(ip_limit=10**9))
+    app.add_middleware(LegacyErrorLoggingMiddleware)
+
+    @app.middleware("http")
+    async def log_requests(request, call_next):
+        start_time = asyncio.get_event_loop().time()
+        response = await call_next(request)
+        logging.getLogger("bench").info(
+            "%s %s %s %.3f",
+            request.method,
+            request.url.path,
+            response.status_code,
+            asyncio.get_event_loop().time() - start_time,
+        )
+        return response
+
+    return app
+
+
+def build_asgi(events, token_delay):
+    app = FastAPI()
+    add_endpoints(app, events, token_delay)
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"])
+    app.add_middleware(StreamingSafeGZipMiddleware, minimum_size=1000)
+    app.add_middleware(APIKeyAuthMiddleware, auth=APIKeyAuth(api_key=API_KEY))
+    app.add_middleware(
+        RateLimitMiddleware,
+        rate_limiter=RateLimiter(ip_limit=10**9),
+        excluded_paths=EXCLUDED_PATHS,
+    )
+    app.add_middleware(ErrorLoggingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+HEADERS = {"X-API-Key": API_KEY, "Accept-Encoding": "gzip"}
+
+
+async def bench_chat(client, requests):
+    """POST /api/chat 요청당 지연 (마이크로초)"""
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/chat", json={"message": "환불 규정", "session_id": f"s{i}"}, headers=HEADERS
+        )
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+async def bench_stream(client, streams):
+    """POST /api/chat/stream 첫 이벤트 도착 시간과 전체 시간 (밀리초)"""
+    first_event, total = [], []
+    for i in range(streams):
+        start = time.perf_counter()
+        first = None
+        async with client.stream(
+            "POST",
+            "/api/chat/stream",
+            json={"message": "환불", "session_id": f"s{i}"},
+            headers=HEADERS,
+        ) as response:
+            async for line in response.aiter_lines():
+                if first is None and line.startswith("data:"):
+                    first = time.perf_counter() - start
+        total.append((time.perf_counter() - start) * 1000)
+        first_event.append(first * 1000)
+    return first_event, total
+
+
+@asynccontextmanager
+async def serve(app):
+    """uvicorn을 임시 포트로 띄우고 base_url 반환"""
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="error", access_log=False)
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        await task
+
+
+async def main_async(args):
+    logging.disable(logging.WARNING)  # 요청 로그가 표를 가리지 않도록
+
+    print(
+        f"POST /api/chat {args.requests:,}건, /api/chat/stream {args.streams}건 "
+        f"({args.events}개 이벤트 × {args.token_delay * 1000:.0f}ms)\n"
+    )
+    print(
+        f"{'stack':>7s} | {'chat p50 (µs)':>13s} | {'chat p99 (µs)':>13s} | "
+        f"{'first event (ms)':>16s} | {'stream total (ms)':>17s}"
+    )
+    print("-" * 80)
+    for name, build in (("legacy", build_legacy), ("asgi", build_asgi)):
+        app = build(args.events, args.token_delay)
+        async with serve(app) as base_url, httpx.AsyncClient(base_url=base_url) as client:
+            await bench_chat(client, 100)  # 워밍업
+            chat = sorted(await bench_chat(client, args.requests))
+            first_event, total = await bench_stream(client, args.streams)
+        print(
+            f"{name:>7s} | {statistics.median(chat):>13.1f} | "
+            f"{chat[min(len(chat) - 1, int(len(chat) * 0.99))]:>13.1f} | "
+            f"{statistics.median(first_event):>16.1f} | {statistics.median(total):>17.1f}"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미들웨어 스택 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="/chat 요청 수")
+    parser.add_argument("--streams", type=int, default=10, help="/chat/stream 요청 수")
+    parser.add_argument("--events", type=int, default=20, help="스트림당 이벤트 수")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="이벤트 간격 (초)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
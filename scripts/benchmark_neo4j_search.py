@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Neo4j 그래프 검색 벤치마크
+
+합성 그래프(엔티티 N개 + 관계)를 크기별로 적재한 뒤 Neo4jGraphStore.search의
+기존 CONTAINS 경로(라벨 전체 스캔)와 전문 검색 인덱스 경로의 지연 시간을 비교합니다.
+그래프가 커질수록 CONTAINS는 선형으로 느려지고 인덱스 경로는 평탄해야 합니다.
+
+⚠️ 실행 중인 Neo4j 5.x 필요 (NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD).
+   대상 데이터베이스의 기존 데이터는 모두 삭제됩니다.
+
+사용법:
+    python scripts/benchmark_neo4j_search.py
+    python scripts/benchmark_neo4j_search.py --sizes 1000 10000 100000 --queries 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.modules.core.graph.models import Entity, Relation
+from app.modules.core.graph.stores.neo4j_store import Neo4jGraphStore
+
+REGIONS = ["강남", "서초", "송파", "마포", "용산", "성수", "판교", "분당", "해운대", "수원"]
+CATEGORIES = ["맛집", "카페", "병원", "학원", "헬스장", "서점", "약국", "미용실", "빵집", "꽃집"]
+ENTITY_TYPES = ["company", "place", "person", "product"]
+
+
+def make_graph(size, rng):
+    """합성 엔티티/관계 생성 (이름 = 지역 + 카테고리 + 일련번호)"""
+    entities = [
+        Entity(
+            id=f"e{i}",
+            name=f"{rng.choice(REGIONS)} {rng.choice(CATEGORIES)} {i}",
+            type=rng.choice(ENTITY_TYPES),
+        )
+        for i in range(size)
+    ]
+    relations = [
+        Relation(
+            source_id=f"e{i}",
+            target_id=f"e{rng.randrange(size)}",
+            type="related_to",
+            weight=round(rng.random(), 3),
+        )
+        for i in range(size)
+    ]
+    return entities, relations
+
+
+async def measure(store, queries, top_k, entity_types):
+    """검색 지연 시간 (밀리초 리스트)"""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        await store.search(query, entity_types=entity_types, top_k=top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(latencies):
+    """p50 / p95 (밀리초)"""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return statistics.median(ordered), p95
+
+
+async def run(args):
+    base_config = {
+        "uri": os.getenv("NEO4J_URI"),
+        "user": os.getenv("NEO4J_USER", "neo4j"),
+        "password": os.getenv("NEO4J_PASSWORD", ""),
+        "database": args.database,
+        "write_batch_size": args.batch_size,
+    }
+    if not base_config["uri"]:
+        sys.exit("NEO4J_URI 환경 변수가 필요합니다.")
+
+    indexed = Neo4jGraphStore({**base_config, "search_indexes": True})
+    contains = Neo4jGraphStore({**base_config, "search_indexes": False})
+    rng = random.Random(0)
+    entity_types = ["company", "place"] if args.filter_types else None
+
+    print(f"\n{'entities':>10s} | {'CONTAINS p50/p95 (ms)':>22s} | {'index p50/p95 (ms)':>20s}")
+    print("-" * 60)
+
+    try:
+        for size in args.sizes:
+            await indexed.clear()
+            entities, relations = make_graph(size, rng)
+            await indexed.add_entities_bulk(entities)
+            await indexed.add_relations_bulk(relations)
+            async with indexed._get_driver().session(database=args.database) as session:
+                await session.run("CALL db.awaitIndexes(300)")
+
+            queries = [
+                f"{rng.choice(REGIONS)} {rng.choice(CATEGORIES)}" for _ in range(args.queries)
+            ]
+            # 워밍업 (쿼리 플랜 캐시)
+            await measure(contains, queries[:5], args.top_k, entity_types)
+            await measure(indexed, queries[:5], args.top_k, entity_types)
+
+            contains_p50, contains_p95 = summarize(
+                await measure(contains, queries, args.top_k, entity_types)
+            )
+            indexed_p50, indexed_p95 = summarize(
+                await measure(indexed, queries, args.top_k, entity_types)
+            )
+            print(
+                f"{size:>10,d} | {contains_p50:>10.2f} / {contains_p95:>9.2f} | "
+                f"{indexed_p50:>8.2f} / {indexed_p95:>9.2f}"
+            )
+
+        print(f"\n인덱스 경로 통계: {indexed.get_stats()['search']}\n")
+    finally:
+        await indexed.close()
+        await contains.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Neo4j 그래프 검색 벤치마크")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000], help="그래프 크기"
+    )
+    parser.add_argument("--queries", type=int, default=100, help="크기별 검색 횟수")
+    parser.add_argument("--top-k", type=int, default=10, help="반환할 결과 수")
+    parser.add_argument("--batch-size", type=int, default=1000, help="UNWIND 배치 크기")
+    parser.add_argument("--database", default="neo4j", help="대상 데이터베이스")
+    parser.add_argument("--filter-types", action="store_true", help="타입 필터 적용")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
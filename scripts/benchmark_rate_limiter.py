@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter 벤치마크
+
+1) 판정 비용: 추적 IP가 상한(max_tracked_ips)에 도달한 상태에서 새 IP가 계속 유입될 때
+   - sliding-window: 기존 방식 (IP별 타임스탬프 리스트 + 전역 락 + min() 전수 탐색 제거)
+   - gcra: 키당 TAT float 1개 + OrderedDict LRU (app.middleware.rate_limiter)
+2) 미들웨어 오버헤드: RateLimitMiddleware 유무에 따른 요청당 처리 시간 차이를 재고,
+   5k req/s에서 그 오버헤드가 워커 CPU를 얼마나 차지하는지 환산
+   (httpx ASGITransport 순차 요청, 네트워크 제외)
+
+사용법:
+    python scripts/benchmark_rate_limiter.py
+    python scripts/benchmark_rate_limiter.py --tracked 10000 --requests 5000 --rate 5000 --samples 5000
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+from fastapi import FastAPI
+
+from app.middleware.rate_limiter import RateLimiter, RateLimitMiddleware
+
+
+class SlidingWindowLimiter:
+    """기존 RateLimiter.check_rate_limit의 IP 경로 재현"""
+
+    def __init__(self, ip_limit, window_seconds, max_tracked_ips):
+        self.ip_limit = ip_limit
+        self.window_seconds = window_seconds
+        self.max_tracked_ips = max_tracked_ips
+        self.ip_requests = defaultdict(list)
+        self.lock = asyncio.Lock()
+
+    async def check_rate_limit(self, ip=None, session_id=None):
+        current_time = time.time()
+        async with self.lock:
+            if len(self.ip_requests) >= self.max_tracked_ips and ip not in self.ip_requests:
+                oldest_ip = min(
+                    self.ip_requests.keys(),
+                    key=lambda k: self.ip_requests[k][0][0] if self.ip_requests[k] else float("inf"),
+                )
+                del self.ip_requests[oldest_ip]
+            request_list = self.ip_requests[ip]
+            cutoff_time = current_time - self.window_seconds
+            while request_list and request_list[0][0] < cutoff_time:
+                request_list.pop(0)
+            count = sum(c for _, c in request_list)
+            if count >= self.ip_limit:
+                return False, "ip", 0
+            request_list.append((current_time, 1))
+            return True, "ip", self.ip_limit - count - 1
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def bench_check(limiter, tracked, requests):
+    """상한까지 채운 뒤 새 IP 요청당 판정 시간 (마이크로초)"""
+    for i in range(tracked):
+        await limiter.check_rate_limit(ip=f"10.0.{i // 256}.{i % 256}")
+    samples = []
+    for i in range(requests):
+        ip = f"172.16.{i // 256}.{i % 256}"
+        start = time.perf_counter()
+        await limiter.check_rate_limit(ip=ip)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def build_app(limiter):
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if limiter is not None:
+        app.add_middleware(RateLimitMiddleware, rate_limiter=limiter)
+    return app
+
+
+async def bench_middleware(app, samples, ips):
+    """순차 요청의 요청당 처리 시간 (마이크로초)"""
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i in range(samples):
+            headers = {"X-Forwarded-For": f"192.168.{(i % ips) // 256}.{i % 256}"}
+            start = time.perf_counter()
+            await client.get("/api/ping", headers=headers)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+async def main_async(args):
+    logging.disable(logging.WARNING)  # 한도 초과 경고 로그가 표를 가리지 않도록
+
+    print(f"1) 판정 비용 (추적 IP {args.tracked:,}개 상한, 새 IP {args.requests:,}건)")
+    print(f"{'limiter':>15s} | {'mean (µs)':>10s} | {'p50 (µs)':>9s} | {'p99 (µs)':>9s}")
+    print("-" * 52)
+    limiters = {
+        "sliding-window": SlidingWindowLimiter(30, 60, args.tracked),
+        "gcra": RateLimiter(ip_limit=30, window_seconds=60),
+    }
+    limiters["gcra"].ip_store.max_keys = args.tracked
+    for name, limiter in limiters.items():
+        samples = await bench_check(limiter, args.tracked, args.requests)
+        print(
+            f"{name:>15s} | {statistics.mean(samples):>10.2f} | "
+            f"{statistics.median(samples):>9.2f} | {percentile(samples, 0.99):>9.2f}"
+        )
+
+    print(f"\n2) 미들웨어 오버헤드 (순차 요청 {args.samples:,}건, {args.rate:,} req/s 환산)")
+    print(f"{'middleware':>15s} | {'p50 (µs)':>9s} | {'mean (µs)':>10s}")
+    print("-" * 41)
+    apps = {
+        "none": build_app(None),
+        "gcra": build_app(RateLimiter(ip_limit=1_000_000, window_seconds=60)),
+    }
+    means = {}
+    for name, app in apps.items():
+        await bench_middleware(app, 200, args.ips)  # 워밍업
+        latencies = await bench_middleware(app, args.samples, args.ips)
+        means[name] = statistics.mean(latencies)
+        print(f"{name:>15s} | {statistics.median(latencies):>9.1f} | {means[name]:>10.1f}")
+    overhead = means["gcra"] - means["none"]
+    print(
+        f"\n미들웨어 오버헤드: 요청당 {overhead:.1f}µs → {args.rate:,} req/s에서 "
+        f"코어 {overhead * args.rate / 1_000_000:.0%} (GCRA 판정 자체는 1) 참고, 나머지는 BaseHTTPMiddleware 비용)\n"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate Limiter 벤치마크")
+    parser.add_argument("--tracked", type=int, default=10_000, help="추적 IP 상한")
+    parser.add_argument("--requests", type=int, default=2_000, help="상한 도달 후 새 IP 요청 수")
+    parser.add_argument("--rate", type=int, default=5_000, help="CPU 점유율 환산 요청률 (req/s)")
+    parser.add_argument("--samples", type=int, default=3_000, help="미들웨어 측정 요청 수")
+    parser.add_argument("--ips", type=int, default=50_000, help="미들웨어 요청에 쓸 IP 개수")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
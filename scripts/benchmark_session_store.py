@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+세션 저장소 벤치마크
+
+세션 N개에 대화를 채운 뒤 워커 프로세스가 붙잡고 있는 메모리와
+요청 경로(get_context_string + add_conversation) 지연을 저장소별로 비교합니다.
+
+- memory: 워커 내부 딕셔너리 (세션 수에 비례해 증가)
+- sqlite: 세션/히스토리는 파일, 워커는 history_cache_size 크기의 LRU만 유지
+
+사용법:
+    python scripts/benchmark_session_store.py
+    python scripts/benchmark_session_store.py --sessions 5000 --exchanges 10 --cache-size 500
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.modules.core.session.facade import EnhancedSessionModule
+from app.modules.core.session.services.memory_service import MemoryService
+from app.modules.core.session.store import MemorySessionStore, SQLiteSessionStore
+
+ANSWER = "환불은 구매일로부터 7일 이내에 고객센터 또는 앱에서 신청할 수 있습니다. " * 4
+
+
+def build_module(store, args):
+    config = {
+        "session": {
+            "ttl": 3600,
+            "max_exchanges": args.exchanges,
+            "history_cache_size": args.cache_size,
+        }
+    }
+    memory_service = MemoryService(max_exchanges=args.exchanges, config=config, store=store)
+    return EnhancedSessionModule(config, memory_service)
+
+
+async def run(name, store, args):
+    """세션 채우기 → 잔여 메모리 측정 → 무작위 세션 요청 지연 측정"""
+    gc.collect()
+    tracemalloc.start()
+    module = build_module(store, args)
+
+    session_ids = []
+    for _ in range(args.sessions):
+        session_id = (await module.create_session({"user_agent": "bench"}))["session_id"]
+        for turn in range(args.exchanges):
+            await module.add_conversation(session_id, f"질문 {turn}: 환불 기간은?", ANSWER)
+        session_ids.append(session_id)
+
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples = []
+    for i in range(args.requests):
+        session_id = session_ids[(i * 7919) % len(session_ids)]
+        start = time.perf_counter()
+        await module.get_context_string(session_id)
+        await module.add_conversation(session_id, "추가 질문", ANSWER)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    stats = module.memory_service.get_cache_stats()
+    await module.destroy()
+    return {
+        "name": name,
+        "retained_mb": retained / 1024 / 1024,
+        "cached": stats["size"],
+        "locks": stats["locks"],
+        "p50": statistics.median(samples),
+        "p99": sorted(samples)[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+async def main_async(args):
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            await run("memory", MemorySessionStore(), args),
+            await run("sqlite", SQLiteSessionStore(Path(tmp) / "sessions.db", 3600), args),
+        ]
+
+    print(
+        f"{'store':>8s} | {'retained (MB)':>13s} | {'cached':>7s} | {'locks':>6s} | "
+        f"{'p50 (ms)':>9s} | {'p99 (ms)':>9s}"
+    )
+    print("-" * 68)
+    for r in results:
+        print(
+            f"{r['name']:>8s} | {r['retained_mb']:>13.1f} | {r['cached']:>7d} | "
+            f"{r['locks']:>6d} | {r['p50']:>9.3f} | {r['p99']:>9.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 저장소 벤치마크")
+    parser.add_argument("--sessions", type=int, default=2000, help="세션 수")
+    parser.add_argument("--exchanges", type=int, default=10, help="세션당 대화 교환 수")
+    parser.add_argument("--cache-size", type=int, default=200, help="워커별 히스토리 LRU 크기")
+    parser.add_argument("--requests", type=int, default=500, help="지연 측정 요청 수")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
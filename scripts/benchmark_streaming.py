@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+/chat/stream 동시 세션 벤치마크
+
+동기 LLM SDK 스트림(토큰마다 블로킹 대기)을 흉내 낸 클라이언트로
+ChatService → GenerationModule.stream_answer → /chat/stream 경로를 구성하고,
+N개 세션을 동시에 요청해 총 소요 시간과 이벤트 루프 지연을 측정합니다.
+
+- blocking: 이벤트 루프에서 동기 스트림을 직접 순회 (기존 방식)
+- thread-bridge: app.lib.stream_bridge로 스트림 전용 스레드에서 순회
+
+blocking은 토큰 대기가 직렬화되어 총 시간 ≈ 세션 수 × 세션당 시간이고,
+그동안 이벤트 루프가 멈춰 다른 요청(헬스체크 등)도 지연됩니다.
+
+사용법:
+    python scripts/benchmark_streaming.py
+    python scripts/benchmark_streaming.py --sessions 200 --chunks 20 --token-delay 0.02
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import importlib
+
+import httpx
+from fastapi import FastAPI
+
+import app.modules.core.generation.generator as generator_module
+from app.api.services.chat_service import ChatService
+from app.lib.stream_bridge import aiterate
+from app.modules.core.generation.generator import GenerationModule
+
+chat_router = importlib.import_module("app.api.routers.chat_router")
+
+
+class BlockingCompletions:
+    """stream=True 요청에 토큰마다 블로킹 대기하는 동기 이터레이터 반환"""
+
+    def __init__(self, chunks, token_delay):
+        self.chunks = chunks
+        self.token_delay = token_delay
+
+    def create(self, **params):
+        def stream():
+            for i in range(self.chunks):
+                time.sleep(self.token_delay)
+                delta = SimpleNamespace(content=f"토큰{i} ")
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        return stream()
+
+
+async def blocking_aiterate(stream):
+    """기존 방식: 이벤트 루프에서 동기 스트림 직접 순회"""
+    for item in stream:
+        yield item
+
+
+def build_app(args):
+    prompt_manager = MagicMock()
+    prompt_manager.get_prompt_content = AsyncMock(return_value="시스템 프롬프트")
+    generator = GenerationModule(
+        config={"generation": {"openrouter": {"api_key": "benchmark"}}},
+        prompt_manager=prompt_manager,
+    )
+    generator.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=BlockingCompletions(args.chunks, args.token_delay))
+    )
+    retrieval = MagicMock()
+    retrieval.search = AsyncMock(return_value=[{"content": "참고 문서"}])
+
+    chat_router.limiter.enabled = False
+    chat_router.set_chat_service(
+        ChatService({"generation": generator, "retrieval": retrieval}, {})
+    )
+    app = FastAPI()
+    app.include_router(chat_router.router)
+    return app
+
+
+async def run_mode(app, args):
+    """(총 시간 초, 이벤트 루프 지연 p50/max 밀리초)"""
+    lags = []
+    stop = asyncio.Event()
+
+    async def heartbeat(interval=0.005):
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append((time.perf_counter() - start - interval) * 1000)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        monitor = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                client.post("/chat/stream", json={"message": f"질문 {i}"})
+                for i in range(args.sessions)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await monitor
+
+    return elapsed, statistics.median(lags), max(lags)
+
+
+async def main_async(args):
+    logging.disable(logging.WARNING)  # 요청별 info 로그가 표를 가리지 않도록
+    app = build_app(args)
+    serial = args.sessions * args.chunks * args.token_delay
+    print(
+        f"\n세션 {args.sessions}개 × 청크 {args.chunks}개 × 토큰 대기 {args.token_delay * 1000:.0f}ms "
+        f"(직렬 시 {serial:.1f}s)\n"
+    )
+    print(f"{'mode':>14s} | {'total (s)':>9s} | {'loop lag p50 (ms)':>17s} | {'max (ms)':>8s}")
+    print("-" * 60)
+
+    for mode, iterate in (("blocking", blocking_aiterate), ("thread-bridge", aiterate)):
+        generator_module.aiterate = iterate
+        elapsed, lag_p50, lag_max = await run_mode(app, args)
+        print(f"{mode:>14s} | {elapsed:>9.2f} | {lag_p50:>17.2f} | {lag_max:>8.1f}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/chat/stream 동시 세션 벤치마크")
+    parser.add_argument("--sessions", type=int, default=50, help="동시 스트리밍 세션 수")
+    parser.add_argument("--chunks", type=int, default=10, help="세션당 청크 수")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="청크 간 대기 (초)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
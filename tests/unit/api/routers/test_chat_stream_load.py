@@ -0,0 +1,91 @@
+"""
+/chat/stream 동시 세션 부하 테스트
+
+동기 LLM SDK 스트림(토큰마다 블로킹 대기)을 흉내 낸 클라이언트로 실제
+ChatService → GenerationModule.stream_answer → /chat/stream 경로를 구성하고,
+여러 세션을 동시에 요청했을 때 토큰 대기가 직렬화되지 않는지 검증합니다.
+(이벤트 루프에서 동기 스트림을 순회하면 총 시간 ≈ 세션 수 × 세션당 시간)
+"""
+
+import asyncio
+import importlib
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+SESSIONS = 20
+CHUNKS_PER_SESSION = 5
+TOKEN_DELAY = 0.04  # 청크 간 SDK 블로킹 대기 (초)
+
+
+class BlockingCompletions:
+    """stream=True 요청에 동기 이터레이터를 반환하는 Chat Completions (openai 동기 SDK 모방)"""
+
+    def create(self, **params):
+        assert params["stream"] is True
+
+        def stream():
+            for i in range(CHUNKS_PER_SESSION):
+                time.sleep(TOKEN_DELAY)
+                delta = SimpleNamespace(content=f"토큰{i} ")
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        return stream()
+
+
+@pytest.fixture
+def stream_app(monkeypatch):
+    from app.api.services.chat_service import ChatService
+    from app.modules.core.generation.generator import GenerationModule
+
+    prompt_manager = MagicMock()
+    prompt_manager.get_prompt_content = AsyncMock(return_value="시스템 프롬프트")
+    generator = GenerationModule(
+        config={"generation": {"openrouter": {"api_key": "test-key"}}},
+        prompt_manager=prompt_manager,
+    )
+    generator.client = SimpleNamespace(chat=SimpleNamespace(completions=BlockingCompletions()))
+
+    retrieval = MagicMock()
+    retrieval.search = AsyncMock(return_value=[{"content": "참고 문서"}])
+    service = ChatService({"generation": generator, "retrieval": retrieval}, {})
+
+    # app.api.routers 패키지의 chat_router 속성은 APIRouter이므로 모듈을 직접 가져옴
+    chat_router = importlib.import_module("app.api.routers.chat_router")
+    monkeypatch.setattr(chat_router.limiter, "enabled", False)
+    monkeypatch.setattr(chat_router, "chat_service", service)
+    app = FastAPI()
+    app.include_router(chat_router.router)
+    return app
+
+
+class TestChatStreamConcurrency:
+    """동시 스트리밍 세션 부하 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_interleave(self, stream_app):
+        transport = httpx.ASGITransport(app=stream_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+            async def session(i: int) -> list[str]:
+                response = await client.post("/chat/stream", json={"message": f"질문 {i}"})
+                assert response.status_code == 200
+                return [
+                    json.loads(line[6:])["data"]
+                    for line in response.text.splitlines()
+                    if line.startswith("data: ") and '"chunk"' in line
+                ]
+
+            start = time.perf_counter()
+            results = await asyncio.gather(*(session(i) for i in range(SESSIONS)))
+            elapsed = time.perf_counter() - start
+
+        serial_time = SESSIONS * CHUNKS_PER_SESSION * TOKEN_DELAY
+        assert all(len(chunks) == CHUNKS_PER_SESSION for chunks in results)
+        # 토큰 대기가 스레드에서 겹쳐 진행됨 (직렬이면 약 4초)
+        assert elapsed < serial_time * 0.3, f"elapsed={elapsed:.2f}s, serial={serial_time:.2f}s"
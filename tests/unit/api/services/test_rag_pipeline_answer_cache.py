@@ -0,0 +1,260 @@
+"""
+답변 캐시 파이프라인 연동 테스트
+
+테스트 범위:
+1. /chat (RAGPipeline.execute): 반복 질문은 리랭킹/생성 없이 캐시 답변 반환
+2. Fallback 답변은 캐시하지 않음
+3. /chat/stream (ChatService.stream_rag_pipeline): 캐시 답변을 합성 청크로 재생
+4. ChatService.get_stats에 적중 통계 포함
+5. Self-RAG가 켜져 있으면 /chat/stream이 저장한 답변을 /chat에서 사용하지 않음
+"""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.services.chat_service import ChatService
+from app.api.services.rag_pipeline import (
+    FormattedSources,
+    PreparedContext,
+    RAGPipeline,
+    RerankResults,
+    RetrievalResults,
+    RouteDecision,
+)
+from app.modules.core.generation.answer_cache import AnswerCache, AnswerCacheConfig
+from app.modules.core.generation.generator import GenerationResult
+
+DOCS = [SimpleNamespace(id="d1", content="환불은 7일 이내", metadata={"source_file": "faq.pdf"})]
+
+
+def _generation(answer: str = "7일 이내 환불됩니다.", provider: str = "google") -> GenerationResult:
+    return GenerationResult(
+        answer=answer,
+        text=answer,
+        tokens_used=120,
+        model_used="gemini-2.5-flash",
+        provider=provider,
+        generation_time=1.0,
+    )
+
+
+@pytest.fixture
+def answer_cache() -> AnswerCache:
+    return AnswerCache(AnswerCacheConfig(enabled=True, replay_chunk_chars=4))
+
+
+@pytest.fixture
+def pipeline(answer_cache: AnswerCache) -> RAGPipeline:
+    generation_module = AsyncMock()
+    generation_module.get_prompt_version = AsyncMock(return_value="v1")
+    return RAGPipeline(
+        config={"privacy": {"enabled": False}},
+        query_router=MagicMock(enabled=False),
+        query_expansion=None,
+        retrieval_module=AsyncMock(),
+        generation_module=generation_module,
+        session_module=AsyncMock(),
+        self_rag_module=None,
+        extract_topic_func=lambda x: "refund",
+        circuit_breaker_factory=MagicMock(),
+        cost_tracker=MagicMock(),
+        performance_metrics=MagicMock(),
+        answer_cache=answer_cache,
+    )
+
+
+async def _execute_twice(pipeline: RAGPipeline, generation: GenerationResult) -> dict[str, Any]:
+    with (
+        patch.object(pipeline, "route_query") as mock_route,
+        patch.object(pipeline, "prepare_context") as mock_prepare,
+        patch.object(pipeline, "retrieve_documents") as mock_retrieve,
+        patch.object(pipeline, "rerank_documents") as mock_rerank,
+        patch.object(pipeline, "generate_answer") as mock_generate,
+        patch.object(pipeline, "self_rag_verify") as mock_self_rag,
+        patch.object(pipeline, "format_sources") as mock_format,
+    ):
+        mock_route.return_value = RouteDecision(should_continue=True, metadata={})
+        mock_prepare.return_value = PreparedContext(
+            session_context=None,
+            expanded_query="환불 규정",
+            original_query="환불 규정",
+            expanded_queries=["환불 규정"],
+            query_weights=[1.0],
+        )
+        mock_retrieve.return_value = RetrievalResults(documents=DOCS, count=1)
+        mock_rerank.return_value = RerankResults(documents=DOCS, count=1, reranked=True)
+        mock_generate.return_value = generation
+        mock_self_rag.return_value = generation
+        mock_format.return_value = FormattedSources(sources=[{"title": "faq.pdf"}], count=1)
+
+        first = await pipeline.execute("환불 규정?", "s1")
+        second = await pipeline.execute("환불 규정", "s2")
+
+    return {
+        "first": first,
+        "second": second,
+        "generate_calls": mock_generate.call_count,
+        "rerank_calls": mock_rerank.call_count,
+    }
+
+
+@pytest.mark.unit
+class TestRAGPipelineAnswerCache:
+    """RAGPipeline.execute 답변 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_served_from_cache(self, pipeline: RAGPipeline) -> None:
+        outcome = await _execute_twice(pipeline, _generation())
+
+        assert outcome["generate_calls"] == 1
+        assert outcome["rerank_calls"] == 1
+        second = outcome["second"]
+        assert second["answer"] == outcome["first"]["answer"] == "7일 이내 환불됩니다."
+        assert second["sources"] == [{"title": "faq.pdf"}]
+        assert second["tokens_used"] == 0
+        assert second["answer_cache"]["hit"] is True
+        assert "answer_cache" not in outcome["first"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_answer_not_cached(
+        self, pipeline: RAGPipeline, answer_cache: AnswerCache
+    ) -> None:
+        outcome = await _execute_twice(pipeline, _generation("장애 안내", provider="fallback"))
+
+        assert outcome["generate_calls"] == 2
+        assert answer_cache.get_stats()["stores"] == 0
+
+    @pytest.mark.asyncio
+    async def test_debug_trace_bypasses_cache(
+        self, pipeline: RAGPipeline, answer_cache: AnswerCache
+    ) -> None:
+        lookup = await pipeline._lookup_answer_cache(
+            "환불 규정",
+            PreparedContext(session_context=None, expanded_query="q", original_query="q"),
+            RetrievalResults(documents=DOCS, count=1),
+            None,
+            {"enable_debug_trace": True},
+        )
+
+        assert lookup is None
+        assert answer_cache.get_stats()["bypassed"] == 1
+
+
+@pytest.mark.unit
+class TestChatServiceAnswerCache:
+    """ChatService 스트리밍 재생 / 통계 테스트"""
+
+    @pytest.fixture
+    def service(self, answer_cache: AnswerCache) -> ChatService:
+        session = MagicMock()
+        session.get_session = AsyncMock(return_value={"is_valid": True})
+        session.get_context_string = AsyncMock(return_value="")
+
+        generation = MagicMock()
+        generation.get_prompt_version = AsyncMock(return_value="v1")
+        generation.stream_calls = 0
+
+        async def stream_answer(*args, **kwargs):
+            generation.stream_calls += 1
+            for part in ("7일 ", "이내 ", "환불됩니다."):
+                yield part
+
+        generation.stream_answer = stream_answer
+
+        retrieval = MagicMock()
+        retrieval.search = AsyncMock(return_value=DOCS)
+
+        modules = {
+            "session": session,
+            "generation": generation,
+            "retrieval": retrieval,
+            "answer_cache": answer_cache,
+        }
+        return ChatService(modules, {"privacy": {"enabled": False}})
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_cached_answer(self, service: ChatService) -> None:
+        first = [e async for e in service.stream_rag_pipeline("환불 규정", "s1")]
+        second = [e async for e in service.stream_rag_pipeline("환불 규정?", "s2")]
+
+        assert service.modules["generation"].stream_calls == 1
+        first_text = "".join(e["data"] for e in first if e["event"] == "chunk")
+        second_text = "".join(e["data"] for e in second if e["event"] == "chunk")
+        assert first_text == second_text == "7일 이내 환불됩니다."
+
+        metadata, done = second[0], second[-1]
+        assert metadata["data"]["answer_cache"]["hit"] is True
+        assert done["event"] == "done"
+        assert done["data"]["total_chunks"] == len(second) - 2
+
+    @pytest.mark.asyncio
+    async def test_get_stats_includes_answer_cache(self, service: ChatService) -> None:
+        for session_id in ("s1", "s2"):
+            [e async for e in service.stream_rag_pipeline("환불 규정", session_id)]
+
+        stats = service.get_stats()
+
+        assert stats["answer_cache"]["hits"] == 1
+        assert stats["answer_cache"]["hit_rate"] == 0.5
+        assert stats["total_chats"] == 0
+
+
+@pytest.mark.unit
+class TestStreamOriginIsolation:
+    """스트리밍 답변(Self-RAG 미검증)의 /chat 재사용 차단 테스트"""
+
+    @staticmethod
+    def _stream_service(answer_cache: AnswerCache) -> ChatService:
+        session = MagicMock()
+        session.get_session = AsyncMock(return_value={"is_valid": True})
+        session.get_context_string = AsyncMock(return_value="")
+
+        generation = MagicMock()
+        generation.get_prompt_version = AsyncMock(return_value="v1")
+
+        async def stream_answer(*args, **kwargs):
+            yield "검증되지 않은 답변"
+
+        generation.stream_answer = stream_answer
+        retrieval = MagicMock()
+        retrieval.search = AsyncMock(return_value=DOCS)
+
+        modules = {
+            "session": session,
+            "generation": generation,
+            "retrieval": retrieval,
+            "answer_cache": answer_cache,
+        }
+        return ChatService(modules, {"privacy": {"enabled": False}})
+
+    @pytest.mark.asyncio
+    async def test_stream_entry_not_served_to_chat_with_self_rag(
+        self, pipeline: RAGPipeline, answer_cache: AnswerCache
+    ) -> None:
+        service = self._stream_service(answer_cache)
+        [e async for e in service.stream_rag_pipeline("환불 규정", "s0")]
+        assert answer_cache.get_stats()["stores"] == 1
+
+        pipeline.config["self_rag"] = {"enabled": True}
+        outcome = await _execute_twice(pipeline, _generation())
+
+        assert outcome["generate_calls"] == 1
+        assert outcome["first"]["answer"] == "7일 이내 환불됩니다."
+        assert "answer_cache" not in outcome["first"]
+        assert outcome["second"]["answer_cache"]["hit"] is True
+        assert answer_cache.get_stats()["origin_rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_entry_served_to_chat_without_self_rag(
+        self, pipeline: RAGPipeline, answer_cache: AnswerCache
+    ) -> None:
+        service = self._stream_service(answer_cache)
+        [e async for e in service.stream_rag_pipeline("환불 규정", "s0")]
+
+        outcome = await _execute_twice(pipeline, _generation())
+
+        assert outcome["generate_calls"] == 0
+        assert outcome["first"]["answer"] == "검증되지 않은 답변"
@@ -40,12 +40,13 @@ class TestDIContainerStructure:
 
         container = AppContainer()
 
-        # Provider 수 계산
-        provider_count = 0
+        # Provider 수 계산 (하위 호환 별칭은 같은 provider이므로 한 번만 셈)
+        providers_seen: set[int] = set()
         for name in dir(container):
             attr = getattr(container, name, None)
             if isinstance(attr, di_providers.Provider):
-                provider_count += 1
+                providers_seen.add(id(attr))
+        provider_count = len(providers_seen)
 
         # Provider가 너무 많으면 경고 (50개 이상은 분리 검토 필요)
         assert provider_count <= 60, (
@@ -0,0 +1,259 @@
+"""
+답변 캐시 테스트
+
+테스트 범위:
+1. 정규화된 질문 + 문서 지문 + 프롬프트 버전 키 (정확 일치)
+2. 같은 그룹 안에서만 시맨틱 매칭, 임베딩은 후보가 있을 때만 계산
+3. 원본 문서 재적재 시 무효화, TTL 만료, LRU
+4. 스트리밍 재생 청크 분할
+5. 생성 경로(origin)별 조회 제외
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.core.generation.answer_cache import (
+    AnswerCache,
+    AnswerCacheConfig,
+    normalize_query,
+    split_for_replay,
+)
+
+
+def _doc(doc_id: str, content: str, source_file: str = "faq.pdf") -> SimpleNamespace:
+    return SimpleNamespace(id=doc_id, content=content, metadata={"source_file": source_file})
+
+
+class FakeEmbedder:
+    """질문 → 고정 벡터 (호출 횟수 기록)"""
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.vectors = vectors
+        self.calls: list[str] = []
+
+    async def aembed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self.vectors[text]
+
+
+def _cache(embedder: FakeEmbedder | None = None, **config) -> AnswerCache:
+    return AnswerCache(AnswerCacheConfig(enabled=True, **config), embedder=embedder)
+
+
+async def _store(cache: AnswerCache, query: str, docs: list, answer: str, version="v1") -> None:
+    lookup = await cache.lookup(query, docs, version)
+    assert not lookup.hit
+    await cache.store(lookup, answer, {"tokens_used": 500})
+
+
+@pytest.mark.unit
+class TestExactMatch:
+    """정확 일치 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_normalized_repeat_hits(self) -> None:
+        cache = _cache()
+        docs = [_doc("d1", "환불은 7일 이내"), _doc("d2", "배송비 안내")]
+        await _store(cache, "환불 규정 알려주세요?", docs, "7일 이내 환불됩니다.")
+
+        lookup = await cache.lookup("  환불  규정 알려주세요 ", list(reversed(docs)), "v1")
+
+        assert lookup.hit and lookup.match == "exact"
+        assert lookup.entry.answer == "7일 이내 환불됩니다."
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["tokens_saved"]) == (1, 1, 500)
+
+    @pytest.mark.asyncio
+    async def test_changed_document_or_prompt_misses(self) -> None:
+        cache = _cache()
+        await _store(cache, "환불 규정", [_doc("d1", "환불은 7일 이내")], "7일")
+
+        assert not (await cache.lookup("환불 규정", [_doc("d1", "환불은 14일 이내")], "v1")).hit
+        assert not (await cache.lookup("환불 규정", [_doc("d1", "환불은 7일 이내")], "v2")).hit
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_never_stores(self) -> None:
+        cache = AnswerCache(AnswerCacheConfig(enabled=False))
+        lookup = await cache.lookup("질문", [_doc("d1", "본문")], "v1")
+        await cache.store(lookup, "답변", {})
+
+        assert cache.get_stats()["current_size"] == 0
+        assert cache.bypass_reason([_doc("d1", "본문")], None) == "disabled"
+
+    def test_bypass_reasons(self) -> None:
+        cache = _cache()
+
+        assert cache.bypass_reason([], None) == "no_documents"
+        assert cache.bypass_reason([_doc("d1", "본문")], "User: 이전 질문") == "session_context"
+        assert cache.bypass_reason([_doc("d1", "본문")], None) is None
+
+    def test_normalize_query(self) -> None:
+        assert normalize_query("ＡＢＣ  환불\n되나요?!") == "abc 환불 되나요"
+
+
+@pytest.mark.unit
+class TestSemanticMatch:
+    """시맨틱 매칭 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_similar_question_with_same_documents_hits(self) -> None:
+        embedder = FakeEmbedder({"환불 규정": [1.0, 0.0], "환불 정책 알려줘": [0.99, 0.05]})
+        cache = _cache(embedder, similarity_threshold=0.95)
+        docs = [_doc("d1", "환불은 7일 이내")]
+        await _store(cache, "환불 규정", docs, "7일")
+        assert embedder.calls == []  # 그룹에 후보가 없으면 임베딩하지 않음
+
+        lookup = await cache.lookup("환불 정책 알려줘", docs, "v1")
+
+        assert lookup.hit and lookup.match == "semantic"
+        assert lookup.similarity == pytest.approx(0.9987, abs=1e-3)
+        assert sorted(embedder.calls) == ["환불 규정", "환불 정책 알려줘"]
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_question_misses_and_reuses_embedding(self) -> None:
+        embedder = FakeEmbedder({"환불 규정": [1.0, 0.0], "배송 기간": [0.0, 1.0]})
+        cache = _cache(embedder)
+        docs = [_doc("d1", "환불/배송 안내")]
+        await _store(cache, "환불 규정", docs, "7일")
+
+        lookup = await cache.lookup("배송 기간", docs, "v1")
+        await cache.store(lookup, "3일", {})
+
+        assert not lookup.hit
+        assert lookup.embedding is not None  # 조회 때 계산한 임베딩을 저장에 재사용
+        assert (await cache.lookup("배송 기간", docs, "v1")).match == "exact"
+
+    @pytest.mark.asyncio
+    async def test_semantic_match_limited_to_same_documents(self) -> None:
+        embedder = FakeEmbedder({"환불 규정": [1.0, 0.0], "환불 정책": [1.0, 0.0]})
+        cache = _cache(embedder)
+        await _store(cache, "환불 규정", [_doc("d1", "환불은 7일 이내")], "7일")
+
+        lookup = await cache.lookup("환불 정책", [_doc("d9", "다른 문서")], "v1")
+
+        assert not lookup.hit
+        assert embedder.calls == []
+
+
+@pytest.mark.unit
+class TestOrigin:
+    """생성 경로(origin) 제외 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_excluded_origin_is_not_served(self) -> None:
+        embedder = FakeEmbedder({"환불 규정": [1.0, 0.0], "환불 정책": [1.0, 0.0]})
+        cache = _cache(embedder)
+        docs = [_doc("d1", "환불은 7일 이내")]
+        lookup = await cache.lookup("환불 규정", docs, "v1")
+        await cache.store(lookup, "스트리밍 답변", {}, origin="stream")
+
+        exact = await cache.lookup("환불 규정", docs, "v1", exclude_origins={"stream"})
+        semantic = await cache.lookup("환불 정책", docs, "v1", exclude_origins={"stream"})
+
+        assert not exact.hit and not semantic.hit
+        assert cache.get_stats()["origin_rejected"] == 1
+        assert (await cache.lookup("환불 규정", docs, "v1")).hit
+
+    @pytest.mark.asyncio
+    async def test_verified_answer_replaces_excluded_entry(self) -> None:
+        cache = _cache()
+        docs = [_doc("d1", "환불은 7일 이내")]
+        lookup = await cache.lookup("환불 규정", docs, "v1")
+        await cache.store(lookup, "스트리밍 답변", {}, origin="stream")
+
+        lookup = await cache.lookup("환불 규정", docs, "v1", exclude_origins={"stream"})
+        await cache.store(lookup, "검증된 답변", {})
+
+        hit = await cache.lookup("환불 규정", docs, "v1", exclude_origins={"stream"})
+        assert hit.entry is not None and hit.entry.answer == "검증된 답변"
+
+
+@pytest.mark.unit
+class TestInvalidation:
+    """무효화 / 만료 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reingested_source_invalidates_referencing_answers(self) -> None:
+        cache = _cache()
+        await _store(cache, "환불", [_doc("d1", "환불", source_file="refund.pdf")], "a")
+        await _store(cache, "배송", [_doc("d2", "배송", source_file="shipping.pdf")], "b")
+
+        assert cache.invalidate_sources({"refund.pdf"}) == 1
+
+        assert not (await cache.lookup("환불", [_doc("d1", "환불", "refund.pdf")], "v1")).hit
+        assert (await cache.lookup("배송", [_doc("d2", "배송", "shipping.pdf")], "v1")).hit
+        assert cache.invalidate_sources({"d2"}) == 1  # 문서 ID로도 무효화
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_misses(self) -> None:
+        cache = _cache(ttl_seconds=60)
+        docs = [_doc("d1", "본문")]
+        await _store(cache, "질문", docs, "답변")
+        next(iter(cache._entries.values())).created_at = time.time() - 120
+
+        assert not (await cache.lookup("질문", docs, "v1")).hit
+        assert cache.get_stats()["expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        cache = _cache(max_entries=2)
+        docs = [_doc("d1", "본문")]
+        for query in ("q1", "q2"):
+            await _store(cache, query, docs, query)
+        await cache.lookup("q1", docs, "v1")  # q1 최근 사용
+        await _store(cache, "q3", docs, "q3")
+
+        assert (await cache.lookup("q1", docs, "v1")).hit
+        assert not (await cache.lookup("q2", docs, "v1")).hit
+        assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+class TestReplay:
+    """스트리밍 재생 테스트"""
+
+    def test_split_preserves_text(self) -> None:
+        text = "환불은 구매일로부터 7일 이내에 가능합니다.\n자세한 내용은 고객센터로 문의하세요."
+
+        chunks = split_for_replay(text, 10)
+
+        assert "".join(chunks) == text
+        assert len(chunks) > 1
+
+    @pytest.mark.asyncio
+    async def test_replay_yields_chunks(self) -> None:
+        cache = _cache(replay_chunk_chars=5)
+
+        chunks = [chunk async for chunk in cache.replay("하나 둘 셋 넷 다섯 여섯")]
+
+        assert "".join(chunks) == "하나 둘 셋 넷 다섯 여섯"
+        assert len(chunks) >= 3
+
+
+@pytest.mark.unit
+class TestContainerWiring:
+    """DI 컨테이너 공유 인스턴스 테스트"""
+
+    def test_ingestion_shares_cache_without_building_generation(self) -> None:
+        from unittest.mock import MagicMock
+
+        from dependency_injector import providers
+
+        from app.core.di_container import AppContainer
+
+        container = AppContainer()
+        container.config.from_dict({"answer_cache": {"enabled": True}})
+        container.document_processor.override(providers.Object(MagicMock(embedder=None)))
+        container.vector_store.override(providers.Object(MagicMock()))
+        container.metadata_store.override(providers.Object(MagicMock()))
+        container.notion_client.override(providers.Object(MagicMock()))
+        generation = MagicMock(side_effect=AssertionError("generation must not be built"))
+        container.generation.override(providers.Callable(generation))
+
+        service = container.ingestion_service()
+
+        assert service.answer_cache is container.answer_cache()
+        assert service.answer_cache.config.enabled
+        generation.assert_not_called()
@@ -0,0 +1,222 @@
+"""
+토큰 예산 기반 컨텍스트 패킹 테스트
+
+테스트 범위:
+1. 청크 해시별 토큰 수 캐시 (LRU)
+2. 토큰 예산 / 최대 문서 수 준수
+3. 출처 다양성 (MMR) 선택
+4. 문장 경계 자르기
+5. 모델별 예산 설정 및 GenerationModule 통계 연동
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.modules.core.generation import context_packer
+from app.modules.core.generation.context_packer import (
+    ContextPacker,
+    TokenCounter,
+    estimate_tokens,
+)
+from app.modules.core.generation.generator import GenerationModule
+from app.modules.core.retrieval.interfaces import SearchResult
+
+
+class WordTokenCounter(TokenCounter):
+    """공백 단위 토큰 카운터 (tiktoken 인코딩 파일 없이 결정적인 테스트용)"""
+
+    def _encode_len(self, text: str) -> int:
+        return len(text.split())
+
+
+def _doc(doc_id: str, content: str, source: str | None = None) -> SearchResult:
+    metadata = {"source_file": source} if source else {}
+    return SearchResult(id=doc_id, content=content, score=0.5, metadata=metadata)
+
+
+def _words(count: int, word: str = "word") -> str:
+    return " ".join([word] * count)
+
+
+@pytest.mark.unit
+class TestTokenCounter:
+    """토큰 카운터 캐시 테스트"""
+
+    def test_counts_cached_per_chunk_hash(self) -> None:
+        counter = WordTokenCounter(cache_size=2)
+
+        assert counter.count("a b c") == 3
+        assert counter.count("a b c") == 3
+        counter.count("d")
+        counter.count("e f")  # 캐시 크기 2 → "a b c" 제거
+
+        assert (counter.hits, counter.misses) == (1, 3)
+        assert counter.get_stats()["cached_chunks"] == 2
+
+    def test_estimate_used_when_encoding_unavailable(self, monkeypatch) -> None:
+        monkeypatch.setattr(context_packer, "_load_encoding", lambda name: None)
+        counter = TokenCounter()
+
+        assert counter.count("abcdefgh 안녕") == estimate_tokens("abcdefgh 안녕") == 5
+        assert counter.get_stats()["tokenizer"] == "estimate"
+
+
+@pytest.mark.unit
+class TestContextPacker:
+    """컨텍스트 패커 테스트"""
+
+    def test_fills_budget_beyond_five_short_documents(self) -> None:
+        """짧은 청크는 5개 제한 없이 예산까지 채움"""
+        packer = ContextPacker(WordTokenCounter(), default_budget_tokens=100, max_documents=20)
+        docs = [_doc(f"d{i}", _words(10), source=f"s{i}") for i in range(12)]
+
+        packed = packer.pack(docs)
+
+        assert len(packed.documents) == 8  # 문서당 본문 10 + 헤더 2 토큰
+        assert packed.tokens_before == 120
+        assert packed.tokens_after <= 100
+        assert packed.text.startswith("[문서 1]\n")
+
+    def test_prefers_diverse_sources(self) -> None:
+        """같은 출처 청크보다 다른 출처 청크를 우선 선택"""
+        packer = ContextPacker(
+            WordTokenCounter(), default_budget_tokens=1000, max_documents=2, diversity_lambda=0.4
+        )
+        docs = [
+            _doc("a1", "first chunk", source="a.pdf"),
+            _doc("a2", "second chunk", source="a.pdf"),
+            _doc("a3", "third chunk", source="a.pdf"),
+            _doc("b1", "other chunk", source="b.pdf"),
+        ]
+
+        packed = packer.pack(docs)
+
+        assert [d.id for d in packed.documents] == ["a1", "b1"]
+
+    def test_rank_order_kept_without_diversity_weight(self) -> None:
+        packer = ContextPacker(
+            WordTokenCounter(), default_budget_tokens=1000, max_documents=2, diversity_lambda=1.0
+        )
+        docs = [_doc("a1", "x", "a.pdf"), _doc("a2", "y", "a.pdf"), _doc("b1", "z", "b.pdf")]
+
+        assert [d.id for d in packer.pack(docs).documents] == ["a1", "a2"]
+
+    def test_overlong_chunk_trimmed_at_sentence_boundary(self) -> None:
+        packer = ContextPacker(
+            WordTokenCounter(), default_budget_tokens=1000, max_chunk_tokens=12, min_chunk_tokens=2
+        )
+        content = "One two three four. Five six seven eight. Nine ten eleven twelve thirteen."
+
+        packed = packer.pack([_doc("d1", content)])
+
+        assert packed.trimmed_count == 1
+        assert packed.text == "[문서 1]\nOne two three four. Five six seven eight.\n"
+
+    def test_chunk_below_min_tokens_skipped_for_shorter_candidate(self) -> None:
+        """남은 예산이 작으면 긴 청크는 건너뛰고 들어갈 수 있는 청크를 선택"""
+        packer = ContextPacker(WordTokenCounter(), default_budget_tokens=30, min_chunk_tokens=20)
+        docs = [_doc("d1", _words(20)), _doc("d2", _words(40)), _doc("d3", _words(3))]
+
+        packed = packer.pack(docs)
+
+        assert [d.id for d in packed.documents] == ["d1", "d3"]
+        assert packed.trimmed_count == 0
+
+    def test_model_budget_from_config(self) -> None:
+        packer = ContextPacker.from_config(
+            {"default_budget_tokens": 500},
+            {"m-large": {"context_budget_tokens": 9000}, "m-small": {"max_tokens": 10}},
+        )
+
+        assert packer.budget_for("m-large") == 9000
+        assert packer.budget_for("m-small") == 500
+        assert packer.budget_for(None) == 500
+
+
+@pytest.mark.unit
+class TestGenerationModuleContextPacking:
+    """GenerationModule._build_context 연동 테스트"""
+
+    def _generator(self, packing: dict) -> GenerationModule:
+        config = {"generation": {"context_packing": packing, "models": {}}}
+        generator = GenerationModule(config=config, prompt_manager=MagicMock())
+        generator.context_packer.token_counter = WordTokenCounter()
+        return generator
+
+    def test_packing_reports_tokens_before_and_after(self) -> None:
+        generator = self._generator({"default_budget_tokens": 40})
+        docs = [_doc(f"d{i}", _words(15), source=f"s{i}") for i in range(6)]
+
+        context = generator._build_context(docs, "any-model")
+
+        assert context.count("[문서") == 2
+        assert generator.stats["context_tokens_before"] == 90
+        assert 0 < generator.stats["context_tokens_after"] <= 40
+
+    @pytest.mark.asyncio
+    async def test_stats_include_packing_summary(self) -> None:
+        generator = self._generator({"default_budget_tokens": 40})
+        generator._build_context([_doc("d1", _words(80))], "any-model")
+
+        stats = (await generator.get_stats())["context_packing"]
+
+        assert stats["enabled"] is True
+        assert stats["default_budget_tokens"] == 40
+        assert 0 < stats["token_savings_ratio"] < 1
+
+    def test_disabled_keeps_top_five_documents(self) -> None:
+        generator = self._generator({"enabled": False})
+        docs = [_doc(f"d{i}", _words(500)) for i in range(8)]
+
+        context = generator._build_context(docs)
+
+        assert context.count("[문서") == 5
+        assert generator.stats["context_tokens_before"] == 0
+
+
+@pytest.mark.unit
+class TestEncodingPreload:
+    """인코딩 사전 로드 테스트 (요청 경로에서는 로드하지 않음)"""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_encodings(self, monkeypatch) -> None:
+        monkeypatch.setattr(context_packer, "_encodings", {})
+
+    def test_count_does_not_load_encoding(self, monkeypatch) -> None:
+        fetch = MagicMock()
+        monkeypatch.setattr(context_packer, "_fetch_encoding", fetch)
+
+        assert TokenCounter().count("abcdefgh 안녕") == 5  # 문자 수 추정
+
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_preload_times_out_without_blocking(self, monkeypatch) -> None:
+        import threading
+
+        release = threading.Event()
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text, disallowed_special=(): text.split()
+
+        def slow_fetch(name: str):
+            release.wait(5)
+            context_packer._encodings[name] = encoding
+            return encoding
+
+        monkeypatch.setattr(context_packer, "_fetch_encoding", slow_fetch)
+        counter = TokenCounter(load_timeout=0.05)
+
+        assert await counter.preload() is False
+        assert counter.count("a b c d e f g h") == estimate_tokens("a b c d e f g h")
+
+        release.set()
+        for _ in range(100):
+            if context_packer._load_encoding(counter.encoding_name) is not None:
+                break
+            await asyncio.sleep(0.01)
+
+        # 늦게 끝난 로드는 이후 요청부터 사용 (추정치 캐시와 섞이지 않음)
+        assert counter.count("a b c d e f g h") == 8
+        assert counter.get_stats()["tokenizer"] == "tiktoken"
@@ -0,0 +1,173 @@
+"""
+GenerationModule 사용량 집계 테스트
+
+테스트 범위:
+1. 비스트리밍 응답 usage → 라우트 × 모델 집계
+2. 스트리밍: stream_options.include_usage 요청, 마지막 청크 usage 수신
+3. 스트리밍 usage 미보고 시 추정치 기록
+4. ChatService 스트리밍 done 이벤트 토큰 수 / 단계 지연 기록
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.services.chat_service import ChatService
+from app.lib.usage_accounting import UsageAccountant, UsageRecord
+from app.modules.core.generation.generator import GenerationModule
+
+
+def _chunk(content: str | None = None, usage: SimpleNamespace | None = None) -> SimpleNamespace:
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+@pytest.fixture
+def generator() -> GenerationModule:
+    config = {"generation": {"default_provider": "openrouter", "auto_fallback": False}}
+    prompt_manager = MagicMock()
+    prompt_manager.get_prompt_content = AsyncMock(return_value="시스템 프롬프트")
+    generator = GenerationModule(config=config, prompt_manager=prompt_manager)
+    generator.client = MagicMock()
+    return generator
+
+
+def _models(generator: GenerationModule) -> dict:
+    return generator.usage.snapshot()["models"]["by_route"]
+
+
+@pytest.mark.unit
+class TestNonStreamingUsage:
+    """비스트리밍 사용량 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_response_usage_recorded_per_route(self, generator: GenerationModule) -> None:
+        usage = SimpleNamespace(total_tokens=1200, prompt_tokens=1100, completion_tokens=100)
+        generator.client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="답변"))], usage=usage
+        )
+
+        await generator.generate_answer(
+            "질문", [{"content": "문서"}], {"model": "openai/gpt-4o", "usage_route": "chat"}
+        )
+
+        entry = _models(generator)["chat"]["openai/gpt-4o"]
+        assert (entry["prompt_tokens"], entry["completion_tokens"]) == (1100, 100)
+        assert entry["cost_usd"] == pytest.approx((1100 * 2.5 + 100 * 10.0) / 1_000_000)
+
+
+@pytest.mark.unit
+class TestStreamingUsage:
+    """스트리밍 사용량 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_final_usage_chunk_captured(self, generator: GenerationModule) -> None:
+        usage = SimpleNamespace(
+            prompt_tokens=900,
+            completion_tokens=42,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=800),
+        )
+        generator.client.chat.completions.create.return_value = iter(
+            [_chunk("안녕"), _chunk("하세요"), _chunk(usage=usage)]
+        )
+        records: list[UsageRecord] = []
+
+        chunks = [
+            chunk
+            async for chunk in generator.stream_answer(
+                "질문",
+                [{"content": "문서"}],
+                {
+                    "model": "anthropic/claude-sonnet-4-5",
+                    "usage_route": "chat_stream",
+                    "on_usage": records.append,
+                },
+            )
+        ]
+
+        assert chunks == ["안녕", "하세요"]
+        params = generator.client.chat.completions.create.call_args.kwargs
+        assert params["stream_options"] == {"include_usage": True}
+        assert len(records) == 1 and not records[0].estimated
+        assert records[0].total_tokens == 942
+        entry = _models(generator)["chat_stream"]["anthropic/claude-sonnet-4-5"]
+        assert (entry["cached_tokens"], entry["estimated_requests"]) == (800, 0)
+        assert (await generator.get_stats())["total_tokens"] == 942
+
+    @pytest.mark.asyncio
+    async def test_missing_usage_falls_back_to_estimate(self, generator: GenerationModule) -> None:
+        generator.client.chat.completions.create.return_value = iter([_chunk("a"), _chunk("b")])
+        records: list[UsageRecord] = []
+
+        _ = [
+            chunk
+            async for chunk in generator.stream_answer(
+                "질문", [{"content": "문서"}], {"on_usage": records.append}
+            )
+        ]
+
+        record = records[0]
+        assert record.estimated
+        assert record.completion_tokens == 10  # 청크당 5토큰 추정
+        assert record.prompt_tokens > 0
+        assert _models(generator)["generation"][generator.default_model]["estimated_requests"] == 1
+
+
+@pytest.mark.unit
+class TestChatServiceStreamUsage:
+    """ChatService 스트리밍 사용량 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_done_event_reports_tokens_and_stages(self) -> None:
+        accountant = UsageAccountant()
+        session = MagicMock()
+        session.get_session = AsyncMock(return_value={"is_valid": True})
+        session.get_context_string = AsyncMock(return_value="")
+        retrieval = MagicMock()
+        retrieval.search = AsyncMock(return_value=[])
+        generation = MagicMock()
+
+        async def stream_answer(query, context_documents, options=None):
+            yield "답변"
+            options["on_usage"](UsageRecord(model="m", prompt_tokens=30, completion_tokens=12))
+
+        generation.stream_answer = stream_answer
+        modules = {
+            "session": session,
+            "retrieval": retrieval,
+            "generation": generation,
+            "usage_accountant": accountant,
+        }
+        service = ChatService(modules, {})
+
+        events = [e async for e in service.stream_rag_pipeline("질문", "s1")]
+
+        done = events[-1]["data"]
+        assert (done["tokens_used"], done["tokens_estimated"]) == (42, False)
+        stages = accountant.snapshot()["stages"]["chat_stream"]
+        assert set(stages) == {"retrieve_documents", "rerank_documents", "generate_answer"}
+
+
+@pytest.mark.unit
+class TestContainerWiring:
+    """DI 컨테이너 공유 인스턴스 테스트"""
+
+    def test_generation_uses_shared_accountant(self) -> None:
+        from dependency_injector import providers
+
+        from app.core.di_container import AppContainer
+
+        container = AppContainer()
+        container.config.from_dict(
+            {"generation": {"default_provider": "openrouter", "usage_accounting": {"enabled": True}}}
+        )
+        container.prompt_manager.override(providers.Object(MagicMock()))
+        container.privacy_masker.override(providers.Object(None))
+        container.answer_cache.override(providers.Object(None))
+
+        accountant = container.usage_accountant()
+
+        assert isinstance(accountant, UsageAccountant)
+        assert container.usage_accountant() is accountant
+        assert container.generation().usage is accountant
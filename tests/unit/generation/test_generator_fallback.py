@@ -6,12 +6,13 @@ Generation Module 폴백 체인 테스트
 2. 모든 모델 실패 시 GenerationError 발생
 3. 폴백 체인 순서 검증 (claude → gemini → gpt → haiku)
 """
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.lib.errors import ErrorCode, GenerationError
-from app.modules.core.generation.generator import GenerationModule
+from app.modules.core.generation.generator import GenerationModule, GenerationResult
 
 
 @pytest.mark.unit
@@ -92,3 +93,68 @@ class TestGeneratorFallback:
             assert "해결 방법" in error_msg
             assert "API 키를 확인" in error_msg
             assert mock_gen.call_count == 4  # 4개 모델 모두 시도
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_with_next_model(self, generator):
+        """
+        요청 모델이 헤지 대기 시간 안에 응답하지 않으면 다음 모델을 병렬 시작
+
+        Given: claude-sonnet-4-5 응답이 매우 느림 (헤지 대기 0.05초)
+        When: generate_answer() 호출
+        Then: gemini-2.5-flash 결과를 사용하고 헤지 통계에 승리로 기록
+        """
+        generator.latency_tracker.policy.enabled = True
+        generator.latency_tracker.policy.default_delay = 0.05
+        generator.latency_tracker.policy.min_delay = 0.01
+
+        async def fake_generate(model, **kwargs):
+            if model == "claude-sonnet-4-5":
+                await asyncio.sleep(5)
+            return MagicMock(answer=f"answer-{model}", model_used=model, tokens_used=10)
+
+        with patch.object(generator, "_generate_with_model", side_effect=fake_generate):
+            result = await generator.generate_answer(
+                query="테스트 쿼리", context_documents=[], options={"model": "claude-sonnet-4-5"}
+            )
+
+        assert result.model_used == "gemini-2.5-flash"
+        hedging = (await generator.get_stats())["hedging"]["models"]
+        assert hedging["gemini-2.5-flash"]["hedge_wins"] == 1
+        assert generator.stats["fallback_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_counts_only_winner(self, generator):
+        """
+        헤지로 두 모델이 실행되어도 컨텍스트는 1회만 구성하고 통계는 승자 결과만 누적
+
+        Given: 요청 모델이 느려 다음 모델이 헤지로 시작됨
+        When: generate_answer() 호출
+        Then: _pack_context 1회, prompt_tokens/cached_prompt_tokens는 승자 값
+        """
+        generator.latency_tracker.policy.enabled = True
+        generator.latency_tracker.policy.default_delay = 0.05
+        generator.latency_tracker.policy.min_delay = 0.01
+        contexts: list[str] = []
+
+        async def fake_generate(model, context_text=None, **kwargs):
+            contexts.append(context_text)
+            if model == "claude-sonnet-4-5":
+                await asyncio.sleep(5)
+            return GenerationResult(
+                answer="ok", text="ok", tokens_used=30, model_used=model, provider="openrouter",
+                generation_time=0, cached_tokens=5, prompt_tokens=20,
+            )
+
+        with (
+            patch.object(generator, "_pack_context", wraps=generator._pack_context) as pack,
+            patch.object(generator, "_generate_with_model", side_effect=fake_generate),
+        ):
+            await generator.generate_answer(
+                query="테스트 쿼리", context_documents=[], options={"model": "claude-sonnet-4-5"}
+            )
+
+        assert pack.call_count == 1
+        assert contexts == ["", ""]
+        assert generator.stats["prompt_tokens"] == 20
+        assert generator.stats["cached_prompt_tokens"] == 5
+        assert generator.stats["total_tokens"] == 30
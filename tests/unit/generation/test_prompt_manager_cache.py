@@ -0,0 +1,191 @@
+"""
+PromptManager 조회 캐시 / write-behind 테스트
+
+테스트 범위:
+1. 반복 조회는 메모리 캐시에서 처리 (저장소 호출 없음)
+2. 버전 스탬프 변경(다른 워커) 및 로컬 변경 시 캐시 무효화
+3. JSON write-behind: 연속 변경을 1회 원자적 쓰기로 합침
+4. JSON 파일 외부 변경 감지 후 다시 로드
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models.prompts import PromptCreate, PromptResponse, PromptUpdate
+from app.modules.core.generation.prompt_manager import PromptManager
+
+
+def _prompt(content: str) -> PromptResponse:
+    now = datetime.now()
+    return PromptResponse(
+        id="p1", name="system", content=content, is_active=True, created_at=now, updated_at=now
+    )
+
+
+@pytest.fixture
+def db_manager(tmp_path) -> PromptManager:
+    repository = AsyncMock()
+    repository.get_by_name.return_value = _prompt("v1")
+    repository.get_version.return_value = "1:a"
+    return PromptManager(
+        storage_path=str(tmp_path),
+        repository=repository,
+        use_database=True,
+        version_poll_interval=0,
+        write_behind_delay=0,
+    )
+
+
+@pytest.mark.unit
+class TestPromptCache:
+    """조회 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_served_from_memory(self, db_manager: PromptManager) -> None:
+        for _ in range(3):
+            assert await db_manager.get_prompt_content("system") == "v1"
+
+        assert db_manager.repository.get_by_name.await_count == 1
+        stats = db_manager.get_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_version_change_from_other_worker_invalidates(
+        self, db_manager: PromptManager
+    ) -> None:
+        await db_manager.get_prompt_content("system")
+
+        db_manager.repository.get_by_name.return_value = _prompt("v2")
+        db_manager.repository.get_version.return_value = "1:b"
+
+        assert await db_manager.get_prompt_content("system") == "v2"
+        assert db_manager.get_cache_stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_version_not_polled_within_interval(self, db_manager: PromptManager) -> None:
+        db_manager.version_poll_interval = 60
+        await db_manager.get_prompt_content("system")
+        db_manager.repository.get_version.return_value = "1:b"
+
+        await db_manager.get_prompt_content("system")
+
+        assert db_manager.repository.get_version.await_count == 1
+        assert db_manager.get_cache_stats()["staleness_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_local_update_invalidates_immediately(self, db_manager: PromptManager) -> None:
+        db_manager.version_poll_interval = 60
+        await db_manager.get_prompt_content("system")
+        db_manager.repository.update.return_value = _prompt("v2")
+        db_manager.repository.get_by_name.return_value = _prompt("v2")
+
+        await db_manager.update_prompt("p1", PromptUpdate(content="v2"))
+
+        assert await db_manager.get_prompt_content("system") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_missing_prompt_cached(self, db_manager: PromptManager) -> None:
+        db_manager.repository.get_by_name.return_value = None
+
+        assert await db_manager.get_prompt(name="concise") is None
+        assert await db_manager.get_prompt(name="concise") is None
+        assert db_manager.repository.get_by_name.await_count == 1
+
+
+@pytest.mark.unit
+class TestJsonWriteBehind:
+    """JSON write-behind 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_mutations_coalesced_into_single_atomic_write(self, tmp_path) -> None:
+        manager = PromptManager(
+            storage_path=str(tmp_path), use_database=False, write_behind_delay=0.05
+        )
+        writes_before = manager.get_cache_stats()["write_behind"]["writes"]
+
+        for i in range(5):
+            await manager.create_prompt(PromptCreate(name=f"p{i}", content=f"c{i}"))
+
+        assert manager.get_cache_stats()["write_behind"]["pending"] is True
+        await asyncio.sleep(0.2)
+
+        stats = manager.get_cache_stats()["write_behind"]
+        assert stats["writes"] - writes_before == 1
+        assert stats["pending"] is False
+        saved = json.loads((tmp_path / "prompts.json").read_text(encoding="utf-8"))
+        assert {p["name"] for p in saved["prompts"].values()} >= {f"p{i}" for i in range(5)}
+        assert not [f for f in os.listdir(tmp_path) if f.endswith(".tmp")]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_changes(self, tmp_path) -> None:
+        manager = PromptManager(
+            storage_path=str(tmp_path), use_database=False, write_behind_delay=60
+        )
+        await manager.create_prompt(PromptCreate(name="flushed", content="c"))
+
+        await manager.flush()
+
+        saved = json.loads((tmp_path / "prompts.json").read_text(encoding="utf-8"))
+        assert "flushed" in {p["name"] for p in saved["prompts"].values()}
+
+    @pytest.mark.asyncio
+    async def test_failed_write_rescheduled_with_backoff(self, tmp_path) -> None:
+        manager = PromptManager(
+            storage_path=str(tmp_path), use_database=False, write_behind_delay=0.02
+        )
+        original = manager._write_prompts_file
+        attempts: list[int] = []
+
+        def flaky_write(payload: str) -> None:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("디스크 가득 참")
+            original(payload)
+
+        manager._write_prompts_file = flaky_write  # type: ignore[method-assign]
+        await manager.create_prompt(PromptCreate(name="retried", content="c"))
+        await asyncio.sleep(0.2)
+
+        stats = manager.get_cache_stats()["write_behind"]
+        assert len(attempts) == 2
+        assert stats["pending"] is False
+        assert stats["consecutive_failures"] == 0
+        saved = json.loads((tmp_path / "prompts.json").read_text(encoding="utf-8"))
+        assert "retried" in {p["name"] for p in saved["prompts"].values()}
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flush_failure_raised(self, tmp_path) -> None:
+        manager = PromptManager(
+            storage_path=str(tmp_path), use_database=False, write_behind_delay=60
+        )
+        await manager.create_prompt(PromptCreate(name="lost", content="c"))
+
+        def failing_write(payload: str) -> None:
+            raise OSError("읽기 전용 파일 시스템")
+
+        manager._write_prompts_file = failing_write  # type: ignore[method-assign]
+
+        with pytest.raises(OSError):
+            await manager.flush()
+        assert manager.get_cache_stats()["write_behind"]["pending"] is True
+
+    @pytest.mark.asyncio
+    async def test_external_file_change_reloaded(self, tmp_path) -> None:
+        manager = PromptManager(
+            storage_path=str(tmp_path), use_database=False, version_poll_interval=0
+        )
+        await manager.flush()  # 기본 프롬프트 기록
+        assert await manager.get_prompt_content("external", default="없음") == "없음"
+
+        data = json.loads((tmp_path / "prompts.json").read_text(encoding="utf-8"))
+        data["prompts"]["ext"] = {**next(iter(data["prompts"].values()))}
+        data["prompts"]["ext"].update(id="ext", name="external", content="외부", is_active=True)
+        (tmp_path / "prompts.json").write_text(json.dumps(data), encoding="utf-8")
+        os.utime(tmp_path / "prompts.json", ns=(1, 1))
+
+        assert await manager.get_prompt_content("external") == "외부"
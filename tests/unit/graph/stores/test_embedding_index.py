@@ -0,0 +1,91 @@
+"""
+EntityEmbeddingIndex 단위 테스트
+
+대상 모듈: app/modules/core/graph/stores/embedding_index.py
+테스트 범위: 증분 추가/갱신/삭제, 용량 확장, 타입 마스크, 브루트포스 결과와의 일치
+"""
+import numpy as np
+import pytest
+
+from app.modules.core.graph.stores.embedding_index import EntityEmbeddingIndex
+
+
+def _brute_force(
+    vectors: dict[str, np.ndarray], types: dict[str, str], query: np.ndarray,
+    top_k: int, entity_types: list[str] | None = None,
+) -> list[str]:
+    scored = []
+    for entity_id, vec in vectors.items():
+        if entity_types and types[entity_id] not in entity_types:
+            continue
+        sim = float(vec @ query / (np.linalg.norm(vec) * np.linalg.norm(query)))
+        if sim > 0:
+            scored.append((entity_id, sim))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [entity_id for entity_id, _ in scored[:top_k]]
+
+
+class TestEntityEmbeddingIndex:
+    """임베딩 행렬 인덱스 테스트"""
+
+    def test_search_matches_brute_force_with_growth(self) -> None:
+        """용량 확장을 거친 뒤에도 브루트포스 코사인 결과와 동일"""
+        rng = np.random.default_rng(0)
+        index = EntityEmbeddingIndex(initial_capacity=4)
+        vectors = {f"e{i}": rng.normal(size=16) for i in range(50)}
+        types = {entity_id: ("A" if i % 3 else "B") for i, entity_id in enumerate(vectors)}
+        for entity_id, vec in vectors.items():
+            assert index.upsert(entity_id, types[entity_id], vec.tolist())
+
+        query = rng.normal(size=16)
+        assert len(index) == 50
+        assert [i for i, _ in index.search(query.tolist(), top_k=7)] == _brute_force(
+            vectors, types, query, 7
+        )
+        assert [i for i, _ in index.search(query.tolist(), 5, entity_types=["B"])] == (
+            _brute_force(vectors, types, query, 5, ["B"])
+        )
+
+    def test_update_and_remove_keep_rows_consistent(self) -> None:
+        """갱신(타입 변경 포함)과 삭제 후에도 매핑/마스크 일관성 유지"""
+        index = EntityEmbeddingIndex(initial_capacity=2)
+        index.upsert("a", "Person", [1.0, 0.0])
+        index.upsert("b", "Org", [0.0, 1.0])
+        index.upsert("c", "Org", [1.0, 1.0])
+
+        index.remove("a")  # 마지막 행(c)이 a 자리로 이동
+        index.upsert("b", "Person", [1.0, 0.1])
+
+        assert "a" not in index
+        assert len(index) == 2
+        assert [i for i, _ in index.search([1.0, 0.0], 5, entity_types=["Org"])] == ["c"]
+        assert [i for i, _ in index.search([1.0, 0.0], 5, entity_types=["Person"])] == ["b"]
+
+    def test_only_positive_scores_returned(self) -> None:
+        index = EntityEmbeddingIndex()
+        index.upsert("pos", "T", [1.0, 0.0])
+        index.upsert("neg", "T", [-1.0, 0.0])
+
+        results = index.search([2.0, 0.0], top_k=10)
+
+        assert results == [("pos", pytest.approx(1.0))]
+
+    def test_invalid_vectors_are_not_indexed(self) -> None:
+        """영벡터/차원 불일치는 인덱싱하지 않고 기존 행 제거"""
+        index = EntityEmbeddingIndex()
+        index.upsert("a", "T", [1.0, 0.0])
+
+        assert index.upsert("b", "T", [0.0, 0.0]) is False
+        assert index.upsert("a", "T", [1.0, 0.0, 0.0]) is False
+        assert len(index) == 0
+        assert index.search([1.0, 0.0], 5) == []
+
+    def test_clear(self) -> None:
+        index = EntityEmbeddingIndex()
+        index.upsert("a", "T", [1.0, 0.0])
+        index.clear()
+
+        assert len(index) == 0
+        assert index.dimension is None
+        # 차원이 달라도 다시 사용 가능
+        assert index.upsert("b", "T", [1.0, 0.0, 0.0])
@@ -0,0 +1,166 @@
+"""
+NetworkXGraphStore 스냅샷 / WAL 영속화 단위 테스트
+
+대상 모듈: app/modules/core/graph/stores/snapshot.py, networkx_store.py
+테스트 범위: 스냅샷 왕복, WAL 재생, 스냅샷 후 WAL 정리, 손상 라인 무시, 지연 로드
+"""
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.modules.core.graph.models import Entity, Relation
+from app.modules.core.graph.stores.networkx_store import NetworkXGraphStore
+from app.modules.core.graph.stores.snapshot import GraphSnapshotStore
+
+_VECTORS = {"A 업체": [1.0, 0.0], "김 담당자": [0.0, 1.0]}
+
+
+def _embedder() -> MagicMock:
+    """텍스트별 고정 벡터 임베더"""
+    embedder = MagicMock()
+    embedder.embed_query = AsyncMock(side_effect=lambda text: _VECTORS.get(text, [0.1, 0.1]))
+    embedder.embed_documents = AsyncMock(
+        side_effect=lambda texts: [_VECTORS.get(t, [0.1, 0.1]) for t in texts]
+    )
+    return embedder
+
+
+async def _populate(store: NetworkXGraphStore) -> None:
+    await store.add_entities_bulk(
+        [
+            Entity(id="a", name="A 업체", type="company", properties={"rating": 4.5}),
+            Entity(id="b", name="김 담당자", type="person"),
+        ]
+    )
+    await store.add_relation(
+        Relation(source_id="b", target_id="a", type="works_at", weight=0.7, properties={"y": 1})
+    )
+    await store.add_relation(Relation(source_id="a", target_id="c", type="supplies"))
+
+
+async def _assert_restored(store: NetworkXGraphStore) -> None:
+    entity = await store.get_entity("a")
+    assert entity is not None and entity.properties == {"rating": 4.5}
+    assert (await store.get_entity("c")).type == "unknown"  # placeholder 유지
+
+    neighbors = await store.get_neighbors("b")
+    assert [(r.target_id, r.type, r.weight, r.properties) for r in neighbors.relations] == [
+        ("a", "works_at", 0.7, {"y": 1})
+    ]
+    stats = store.get_stats()
+    assert (stats["node_count"], stats["edge_count"], stats["indexed_embeddings"]) == (3, 2, 3)
+
+
+class TestNetworkXGraphStorePersistence:
+    """스냅샷 + WAL 복구 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_wal_only_recovery(self, tmp_path: Path) -> None:
+        """스냅샷 없이 WAL 재생만으로 복구 (비정상 종료 시나리오)"""
+        store = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        store.set_embedder(_embedder())
+        await _populate(store)
+
+        restored = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+
+        await _assert_restored(restored)
+        assert restored.get_stats()["persistence"]["replayed"] == 4
+        assert not (tmp_path / GraphSnapshotStore.SNAPSHOT_FILE).exists()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_snapshot_and_truncates_wal(self, tmp_path: Path) -> None:
+        """종료 시 스냅샷 저장 → WAL 비움 → 재시작 시 스냅샷만으로 복구"""
+        store = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        store.set_embedder(_embedder())
+        await _populate(store)
+        await store.close()
+
+        assert (tmp_path / GraphSnapshotStore.SNAPSHOT_FILE).exists()
+        assert not (tmp_path / GraphSnapshotStore.WAL_FILE).exists()
+
+        restored = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        restored.set_embedder(_embedder())
+        await _assert_restored(restored)
+        assert restored.get_stats()["persistence"]["replayed"] == 0
+
+        # 복구된 임베딩 행렬로 벡터 검색 가능
+        result = await restored.search("A 업체", top_k=1)
+        assert result.entities[0].id == "a"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_plus_wal_tail(self, tmp_path: Path) -> None:
+        """스냅샷 이후 변경(삭제 포함)은 WAL에서 재생"""
+        store = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        await _populate(store)
+        await store.save_snapshot()
+        await store.clear()
+        await store.add_entity(Entity(id="z", name="Z", type="company"))
+
+        restored = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+
+        assert await restored.get_entity("a") is None
+        assert (await restored.get_entity("z")).name == "Z"
+        assert restored.get_stats()["persistence"]["replayed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_wal_threshold_triggers_background_snapshot(self, tmp_path: Path) -> None:
+        """WAL 항목이 max_wal_entries에 도달하면 백그라운드 스냅샷"""
+        store = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path), max_wal_entries=3)
+        await _populate(store)
+        await store._snapshot_task
+
+        stats = store.get_stats()["persistence"]
+        assert stats["snapshots_written"] == 1
+        assert stats["last_snapshot_bytes"] > 0
+        assert stats["wal_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_corrupt_tail_and_prev_wal_replayed(self, tmp_path: Path) -> None:
+        """스냅샷 실패로 남은 이전 WAL도 재생, 부분 기록된 마지막 줄은 무시"""
+        store = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        await store.add_entity(Entity(id="a", name="A", type="t"))
+        store._persistence.rotate_wal()  # 스냅샷 중단 상황
+        await store.add_entity(Entity(id="b", name="B", type="t"))
+        with open(tmp_path / GraphSnapshotStore.WAL_FILE, "a", encoding="utf-8") as f:
+            f.write('{"op": "entities", "items": [{"id": "x"')
+
+        restored = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+
+        assert await restored.get_entity("a") is not None
+        assert await restored.get_entity("b") is not None
+        assert restored.get_stats()["node_count"] == 2
+
+    def test_snapshot_arrays_are_compact(self, tmp_path: Path) -> None:
+        """스냅샷은 pickle 없이 노드/엣지 배열 + float32 임베딩 행렬로 저장"""
+        from app.modules.core.graph.stores.snapshot import GraphSnapshot
+
+        snapshots = GraphSnapshotStore(tmp_path)
+        snapshots.write_snapshot(
+            GraphSnapshot(
+                entities=[Entity(id="a", name="A", type="t"), Entity(id="b", name="B", type="t")],
+                relations=[Relation(source_id="a", target_id="b", type="r")],
+                embeddings={"b": [0.5, 0.25], "a": None},
+            )
+        )
+
+        with np.load(tmp_path / GraphSnapshotStore.SNAPSHOT_FILE, allow_pickle=False) as data:
+            assert data["node_ids"].tolist() == ["a", "b"]
+            assert data["embeddings"].dtype == np.float32
+            assert data["embeddings"].shape == (1, 2)
+            assert data["embedding_rows"].tolist() == [1]
+
+    @pytest.mark.asyncio
+    async def test_lazy_load_on_first_use(self, tmp_path: Path) -> None:
+        """생성 시점에는 디스크를 읽지 않고 첫 사용 시 로드"""
+        store = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        await store.add_entity(Entity(id="a", name="A", type="t"))
+
+        restored = NetworkXGraphStore(persistence=GraphSnapshotStore(tmp_path))
+        assert restored.get_stats()["persistence"]["loaded"] is False
+
+        await restored.load()
+
+        assert restored.get_stats()["persistence"]["loaded"] is True
+        assert restored.get_stats()["node_count"] == 1
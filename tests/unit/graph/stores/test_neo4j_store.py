@@ -1094,3 +1094,329 @@ class TestNeo4jGraphStoreGracefulShutdown:
 
         # Then - 정상 종료
         assert mock_neo4j_store._closed is True
+
+
+class TestNeo4jGraphStoreBulkWrite:
+    """Neo4jGraphStore UNWIND 일괄 쓰기 테스트"""
+
+    @pytest.fixture
+    def mock_neo4j_store(self) -> Any:
+        """관리형 트랜잭션(execute_write)을 흉내내는 Mock 세션이 주입된 store"""
+        config = {
+            "uri": "bolt://localhost:7687",
+            "user": "neo4j",
+            "password": "testpassword",
+            "database": "neo4j",
+            "retry_delay": 0.01,
+            "write_batch_size": 2,
+        }
+
+        with patch("neo4j.AsyncGraphDatabase.driver") as mock_driver:
+            mock_tx = AsyncMock()
+            mock_tx.run = AsyncMock(return_value=AsyncMock())
+
+            async def execute_write(fn: Any, *args: Any) -> Any:
+                return await fn(mock_tx, *args)
+
+            mock_session = AsyncMock()
+            mock_session.execute_write = AsyncMock(side_effect=execute_write)
+            mock_context = AsyncMock()
+            mock_context.__aenter__.return_value = mock_session
+            mock_context.__aexit__.return_value = None
+            mock_driver.return_value.session.return_value = mock_context
+
+            from app.modules.core.graph.stores.neo4j_store import Neo4jGraphStore
+
+            store = Neo4jGraphStore(config)
+            store._driver = mock_driver.return_value
+            store._mock_session = mock_session
+            store._mock_tx = mock_tx
+            return store
+
+    @pytest.mark.asyncio
+    async def test_entities_written_in_unwind_batches(self, mock_neo4j_store: Any) -> None:
+        """write_batch_size 단위로 UNWIND 쿼리 1회씩 실행 (세션 1개 재사용)"""
+        entities = [Entity(id=f"e{i}", name=f"업체{i}", type="company") for i in range(5)]
+
+        await mock_neo4j_store.add_entities_bulk(entities)
+
+        calls = mock_neo4j_store._mock_tx.run.call_args_list
+        assert [len(call.kwargs["rows"]) for call in calls] == [2, 2, 1]
+        assert all("UNWIND $rows AS row" in call.args[0] for call in calls)
+        assert calls[0].kwargs["rows"][0] == {
+            "id": "e0", "name": "업체0", "type": "company", "properties": {}, "embedding": None
+        }
+        assert mock_neo4j_store._driver.session.call_count == 3  # 인덱스 조회 1 + 스키마 1 + 쓰기 1
+
+    @pytest.mark.asyncio
+    async def test_schema_created_once_before_first_write(self, mock_neo4j_store: Any) -> None:
+        """제약조건 / 타입 인덱스 / 전문 검색 인덱스는 최초 1회만 생성"""
+        relations = [Relation(source_id="a", target_id="b", type="supply", weight=0.5)]
+
+        await mock_neo4j_store.add_relations_bulk(relations)
+        await mock_neo4j_store.add_relations_bulk(relations)
+
+        statements = [call.args[0] for call in mock_neo4j_store._mock_session.run.call_args_list]
+        assert len(statements) == 4
+        assert "SHOW INDEXES" in statements[0]
+        assert "REQUIRE e.id IS UNIQUE" in statements[1]
+        assert "ON (e.type)" in statements[2]
+        assert "CREATE FULLTEXT INDEX entity_name_fulltext" in statements[3]
+        assert "`fulltext.analyzer`: 'cjk'" in statements[3]
+        rows = mock_neo4j_store._mock_tx.run.call_args.kwargs["rows"]
+        assert rows == [{"source_id": "a", "target_id": "b", "type": "supply", "weight": 0.5}]
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retries_batch(self, mock_neo4j_store: Any) -> None:
+        """배치 트랜잭션의 일시 오류는 재시도"""
+        session = mock_neo4j_store._mock_session
+        original = session.execute_write.side_effect
+        attempts: list[int] = []
+
+        async def flaky(fn: Any, *args: Any) -> Any:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise TransientError("잠금 충돌")
+            return await original(fn, *args)
+
+        session.execute_write.side_effect = flaky
+
+        await mock_neo4j_store.add_entities_bulk([Entity(id="e1", name="n", type="t")])
+
+        assert len(attempts) == 2
+        assert mock_neo4j_store.get_stats()["writes"]["rows_written"] == 1
+
+    @pytest.mark.asyncio
+    async def test_schema_failure_does_not_block_writes(self, mock_neo4j_store: Any) -> None:
+        """스키마 생성 실패 시에도 쓰기는 진행"""
+        mock_neo4j_store._mock_session.run = AsyncMock(side_effect=Exception("권한 없음"))
+
+        await mock_neo4j_store.add_entities_bulk([Entity(id="e1", name="n", type="t")])
+
+        assert mock_neo4j_store._mock_tx.run.call_count == 1
+        assert mock_neo4j_store._schema_ready is False
+
+    @pytest.mark.asyncio
+    async def test_throughput_reported_in_stats_and_health_check(
+        self, mock_neo4j_store: Any
+    ) -> None:
+        """누적 쓰기 처리량이 get_stats/health_check에 포함"""
+        entities = [Entity(id=f"e{i}", name="n", type="t") for i in range(3)]
+
+        await mock_neo4j_store.add_entities_bulk(entities)
+        await mock_neo4j_store.add_entities_bulk([])
+        health = await mock_neo4j_store.health_check()
+
+        writes = mock_neo4j_store.get_stats()["writes"]
+        assert writes["rows_written"] == 3
+        assert writes["write_batches"] == 2
+        assert writes["write_batch_size"] == 2
+        assert writes["rows_per_second"] > 0
+        assert health["writes"] == writes
+
+
+class TestNeo4jGraphStoreIndexSearch:
+    """Neo4jGraphStore 전문 검색/벡터 인덱스 검색 테스트"""
+
+    @pytest.fixture
+    def mock_neo4j_store(self) -> Any:
+        """Mock Neo4j 드라이버가 주입된 store"""
+        config = {
+            "uri": "bolt://localhost:7687",
+            "user": "neo4j",
+            "password": "testpassword",
+            "database": "neo4j",
+            "search_overfetch": 3,
+        }
+
+        with patch("neo4j.AsyncGraphDatabase.driver") as mock_driver:
+            mock_result = AsyncMock()
+            mock_result.data = AsyncMock(
+                return_value=[
+                    {
+                        "entity": {"id": "e1", "name": "강남 맛집", "type": "company"},
+                        "score": 0.03,
+                        "relations": [],
+                    }
+                ]
+            )
+            mock_session = AsyncMock()
+            mock_session.run = AsyncMock(return_value=mock_result)
+            mock_context = AsyncMock()
+            mock_context.__aenter__.return_value = mock_session
+            mock_context.__aexit__.return_value = None
+            mock_driver.return_value.session.return_value = mock_context
+
+            from app.modules.core.graph.stores.neo4j_store import Neo4jGraphStore
+
+            store = Neo4jGraphStore(config)
+            store._driver = mock_driver.return_value
+            store._mock_session = mock_session
+            return store
+
+    @pytest.mark.asyncio
+    async def test_fulltext_search_with_parameterized_types(self, mock_neo4j_store: Any) -> None:
+        """타입 필터는 쿼리 문자열이 아닌 파라미터로 전달, 필터 시 over-fetch"""
+        result = await mock_neo4j_store.search("강남", entity_types=["company'"], top_k=5)
+
+        call = mock_neo4j_store._mock_session.run.call_args
+        assert "db.index.fulltext.queryNodes" in call.args[0]
+        assert "db.index.vector.queryNodes" not in call.args[0]
+        assert "company" not in call.args[0]
+        assert call.kwargs["entity_types"] == ["company'"]
+        assert call.kwargs["fetch_k"] == 15
+        assert call.kwargs["fulltext_query"] == "강남"
+        assert [e.id for e in result.entities] == ["e1"]
+        assert mock_neo4j_store.get_stats()["search"]["index_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_vector_branch_fused_when_embedder_set(self, mock_neo4j_store: Any) -> None:
+        """임베더 + 벡터 인덱스가 있으면 전문/벡터 분기를 UNION 후 RRF 병합"""
+        embedder = MagicMock()
+        embedder.embed_query = AsyncMock(return_value=[0.1, 0.2])
+        mock_neo4j_store.set_embedder(embedder)
+        mock_neo4j_store._vector_index_ready = True
+
+        await mock_neo4j_store.search("강남 맛집", top_k=5)
+
+        call = mock_neo4j_store._mock_session.run.call_args
+        assert "db.index.vector.queryNodes" in call.args[0]
+        assert "UNION ALL" in call.args[0]
+        assert call.kwargs["embedding"] == [0.1, 0.2]
+        assert call.kwargs["entity_types"] is None
+        assert call.kwargs["fetch_k"] == 5
+
+    @pytest.mark.asyncio
+    async def test_existing_vector_index_detected_without_schema_creation(
+        self, mock_neo4j_store: Any
+    ) -> None:
+        """재시작/읽기 전용 워커도 기존 벡터 인덱스를 감지해 벡터 분기 사용"""
+        mock_neo4j_store._create_schema = False
+        index_result = AsyncMock()
+        index_result.data = AsyncMock(return_value=[{"name": "entity_embedding_index"}])
+        search_result = mock_neo4j_store._mock_session.run.return_value
+        mock_neo4j_store._mock_session.run = AsyncMock(side_effect=[index_result, search_result])
+        embedder = MagicMock()
+        embedder.embed_query = AsyncMock(return_value=[0.1, 0.2])
+        mock_neo4j_store.set_embedder(embedder)
+
+        await mock_neo4j_store.search("강남 맛집", top_k=5)
+
+        calls = mock_neo4j_store._mock_session.run.call_args_list
+        assert "SHOW INDEXES" in calls[0].args[0]
+        assert "db.index.vector.queryNodes" in calls[1].args[0]
+        assert mock_neo4j_store._vector_index_ready is True
+        assert mock_neo4j_store._schema_ready is False
+
+    @pytest.mark.asyncio
+    async def test_sync_embedder_used_for_entities_and_queries(self, mock_neo4j_store: Any) -> None:
+        """DI 임베더처럼 embed_query가 동기 메서드여도 임베딩 저장/벡터 검색이 동작"""
+
+        class SyncEmbedder:
+            def __init__(self) -> None:
+                self.calls: list[str] = []
+
+            def embed_query(self, text: str) -> list[float]:
+                self.calls.append(text)
+                return [0.5, 0.5]
+
+        embedder = SyncEmbedder()
+        mock_neo4j_store.set_embedder(embedder)
+
+        await mock_neo4j_store.add_entity(Entity(id="e1", name="강남 맛집", type="company"))
+        entity_call = mock_neo4j_store._mock_session.run.call_args
+        assert entity_call.kwargs["embedding"] == [0.5, 0.5]
+        assert mock_neo4j_store._vector_index_ready is True
+
+        await mock_neo4j_store.search("강남", top_k=5)
+
+        search_call = mock_neo4j_store._mock_session.run.call_args
+        assert "db.index.vector.queryNodes" in search_call.args[0]
+        assert search_call.kwargs["embedding"] == [0.5, 0.5]
+        assert embedder.calls == ["강남 맛집", "강남"]
+
+    @pytest.mark.asyncio
+    async def test_aembed_query_preferred_when_available(self, mock_neo4j_store: Any) -> None:
+        """aembed_query가 있으면 스레드 대신 비동기 메서드 사용"""
+        embedder = MagicMock(spec=["embed_query", "aembed_query"])
+        embedder.aembed_query = AsyncMock(return_value=[0.3, 0.4])
+        mock_neo4j_store.set_embedder(embedder)
+        mock_neo4j_store._vector_index_ready = True
+
+        await mock_neo4j_store.search("강남", top_k=5)
+
+        embedder.aembed_query.assert_awaited_once_with("강남")
+        embedder.embed_query.assert_not_called()
+        assert mock_neo4j_store._mock_session.run.call_args.kwargs["embedding"] == [0.3, 0.4]
+
+    @pytest.mark.asyncio
+    async def test_client_error_falls_back_to_contains(self, mock_neo4j_store: Any) -> None:
+        """인덱스 쿼리가 ClientError면 CONTAINS 경로로 대체하고 이후에도 유지"""
+        from neo4j.exceptions import ClientError
+
+        session = mock_neo4j_store._mock_session
+        ok_result = session.run.return_value
+
+        async def run(query: str, **kwargs: Any) -> Any:
+            if "queryNodes" in query:
+                raise ClientError("There is no such fulltext schema index")
+            return ok_result
+
+        session.run = AsyncMock(side_effect=run)
+
+        first = await mock_neo4j_store.search("강남", entity_types=["company"])
+        second = await mock_neo4j_store.search("강남")
+
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert sum("queryNodes" in q for q in queries) == 1
+        assert "CONTAINS" in queries[-1]
+        assert session.run.call_args.kwargs["entity_types"] is None
+        assert len(first.entities) == len(second.entities) == 1
+        stats = mock_neo4j_store.get_stats()["search"]
+        assert stats["contains_searches"] == 2
+        assert stats["index_search_enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_stores_embeddings_and_creates_vector_index(
+        self, mock_neo4j_store: Any
+    ) -> None:
+        """임베더가 있으면 embed_documents 1회 + 첫 임베딩 차원으로 벡터 인덱스 생성"""
+        embedder = MagicMock()
+        embedder.embed_documents = AsyncMock(return_value=[[1.0, 0.0, 0.0]])
+        mock_neo4j_store.set_embedder(embedder)
+        tx = AsyncMock()
+
+        async def execute_write(fn: Any, *args: Any) -> Any:
+            return await fn(tx, *args)
+
+        mock_neo4j_store._mock_session.execute_write = AsyncMock(side_effect=execute_write)
+
+        await mock_neo4j_store.add_entities_bulk(
+            [Entity(id="e1", name="강남 맛집", type="company"), Entity(id="e2", name="", type="x")]
+        )
+
+        embedder.embed_documents.assert_awaited_once_with(["강남 맛집"])
+        rows = tx.run.call_args.kwargs["rows"]
+        assert [row["embedding"] for row in rows] == [[1.0, 0.0, 0.0], None]
+        statements = [call.args[0] for call in mock_neo4j_store._mock_session.run.call_args_list]
+        assert any("`vector.dimensions`: 3" in s for s in statements)
+        assert mock_neo4j_store._vector_index_ready is True
+
+    def test_fulltext_query_escapes_lucene_syntax(self) -> None:
+        """Lucene 특수문자/연산자 키워드는 리터럴로 처리"""
+        from app.modules.core.graph.stores.neo4j_store import Neo4jGraphStore
+
+        assert Neo4jGraphStore._to_fulltext_query('AI OR "로봇" (k8s)*') == (
+            'AI or \\"로봇\\" \\(k8s\\)\\*'
+        )
+        assert Neo4jGraphStore._to_fulltext_query("   ") == ""
+
+    def test_invalid_analyzer_rejected(self) -> None:
+        """DDL에 들어가는 애널라이저 이름은 검증"""
+        with patch("neo4j.AsyncGraphDatabase.driver"):
+            from app.modules.core.graph.stores.neo4j_store import Neo4jGraphStore
+
+            with pytest.raises(ValueError, match="fulltext_analyzer"):
+                Neo4jGraphStore(
+                    {"uri": "bolt://localhost:7687", "fulltext_analyzer": "cjk'}) //"}
+                )
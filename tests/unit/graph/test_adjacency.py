@@ -0,0 +1,122 @@
+"""
+GraphAdjacency (CSR) 단위 테스트
+
+대상 모듈: app/modules/core/graph/adjacency.py
+테스트 범위: CSR 구성, k-hop 확산 / 홉 수, PPR (networkx.pagerank와 비교), 저장소 캐시
+"""
+import networkx as nx
+import numpy as np
+import pytest
+
+from app.modules.core.graph.adjacency import GraphAdjacency
+from app.modules.core.graph.models import Entity, Relation
+from app.modules.core.graph.stores.networkx_store import NetworkXGraphStore
+
+
+def _chain() -> GraphAdjacency:
+    """a - b - c - d 체인 + 고립 노드 e"""
+    return GraphAdjacency(
+        node_ids=["a", "b", "c", "d", "e"],
+        sources=["a", "b", "c"],
+        targets=["b", "c", "d"],
+        doc_ids=["doc-a", None, "doc-c", "doc-d", "doc-e"],
+    )
+
+
+class TestGraphAdjacency:
+    """CSR 인접 행렬 테스트"""
+
+    def test_csr_is_symmetric_and_row_normalized(self) -> None:
+        adjacency = _chain()
+
+        assert adjacency.degree.tolist() == [1, 2, 2, 1, 0]
+        assert adjacency.edge_count == 6
+        row_b = slice(adjacency.indptr[1], adjacency.indptr[2])
+        assert sorted(adjacency.indices[row_b].tolist()) == [0, 2]
+        assert adjacency.weights[row_b].tolist() == [0.5, 0.5]
+
+    def test_k_hop_scores_and_hops(self) -> None:
+        """홉마다 전이 확률 × decay로 전파, 최초 도달 홉 기록"""
+        result = _chain().k_hop({"a": 1.0}, max_hops=2, decay=0.5)
+
+        # hop1: b = 1.0 * 1.0 * 0.5 / hop2: a, c = 0.5 * 0.5 * 0.5
+        assert result.scores.tolist() == pytest.approx([1.125, 0.5, 0.125, 0.0, 0.0])
+        assert result.hops.tolist() == [0, 1, 2, -1, -1]
+
+    def test_k_hop_matches_dense_matrix_power(self) -> None:
+        """프런티어 기반 전파가 밀집 전이 행렬 계산과 일치"""
+        rng = np.random.default_rng(0)
+        n = 40
+        pairs = rng.integers(0, n, size=(120, 2))
+        weights = rng.random(120)
+        node_ids = [f"n{i}" for i in range(n)]
+        adjacency = GraphAdjacency(
+            node_ids,
+            [node_ids[s] for s, _ in pairs],
+            [node_ids[t] for _, t in pairs],
+            weights.tolist(),
+        )
+
+        dense = np.zeros((n, n))
+        for (s, t), w in zip(pairs, weights, strict=True):
+            dense[s, t] += w
+            dense[t, s] += w
+        row_sums = dense.sum(axis=1, keepdims=True)
+        transition = np.divide(dense, row_sums, out=np.zeros_like(dense), where=row_sums > 0)
+
+        seed = np.zeros(n)
+        seed[[3, 7]] = [1.0, 0.5]
+        expected, frontier = seed.copy(), seed.copy()
+        for _ in range(3):
+            frontier = 0.6 * transition.T @ frontier
+            expected += frontier
+
+        result = adjacency.k_hop({"n3": 1.0, "n7": 0.5}, max_hops=3, decay=0.6)
+
+        assert result.scores == pytest.approx(expected)
+
+    def test_personalized_pagerank_matches_networkx(self) -> None:
+        graph = nx.karate_club_graph()
+        node_ids = [str(n) for n in graph.nodes]
+        adjacency = GraphAdjacency(
+            node_ids, [str(u) for u, _ in graph.edges], [str(v) for _, v in graph.edges]
+        )
+
+        result = adjacency.personalized_pagerank(
+            {"0": 1.0, "33": 1.0}, alpha=0.15, iterations=200, tolerance=1e-12
+        )
+        expected = nx.pagerank(
+            graph, alpha=0.85, personalization={0: 1, 33: 1}, tol=1e-12, weight=None
+        )
+
+        assert result.scores == pytest.approx([expected[int(n)] for n in node_ids], abs=1e-8)
+
+    def test_unknown_seeds_and_edges_ignored(self) -> None:
+        adjacency = GraphAdjacency(["a", "b"], ["a", "x"], ["b", "b"])
+
+        assert adjacency.edge_count == 2
+        assert adjacency.k_hop({"missing": 1.0}).scores.tolist() == [0.0, 0.0]
+        assert adjacency.personalized_pagerank({"missing": 1.0}).scores.sum() == 0.0
+
+
+class TestNetworkXGraphStoreAdjacency:
+    """NetworkXGraphStore.get_adjacency 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_adjacency_cached_until_graph_changes(self) -> None:
+        store = NetworkXGraphStore()
+        await store.add_entity(
+            Entity(id="a", name="A", type="company", properties={"doc_id": "doc-1"})
+        )
+        await store.add_relation(Relation(source_id="a", target_id="b", type="r", weight=0.5))
+
+        first = await store.get_adjacency()
+        assert await store.get_adjacency() is first
+        assert first.doc_ids == ["doc-1", None]
+        assert first.types == ["company", "unknown"]
+
+        await store.add_relation(Relation(source_id="b", target_id="c", type="r"))
+        second = await store.get_adjacency()
+
+        assert second is not first
+        assert len(second) == 3
@@ -95,3 +95,82 @@ class TestKnowledgeGraphBuilderBuild:
         assert result["documents_processed"] == 2
         # 각 문서마다 2 엔티티 × 2 문서 = 4 호출
         assert mock_components["store"].add_entity.call_count == 4
+
+
+class TestKnowledgeGraphBuilderBulk:
+    """일괄 빌드 경로 테스트 (동시 추출 + 일괄 저장 + 진행 상황)"""
+
+    class BulkStore:
+        """add_entities_bulk/add_relations_bulk를 구현한 테스트용 저장소"""
+
+        def __init__(self) -> None:
+            self.entity_batches: list[list[str]] = []
+            self.relation_batches: list[int] = []
+
+        async def add_entity(self, entity):
+            raise AssertionError("개별 저장이 호출되면 안 됨")
+
+        async def add_relation(self, relation):
+            raise AssertionError("개별 저장이 호출되면 안 됨")
+
+        async def add_entities_bulk(self, entities):
+            self.entity_batches.append([e.id for e in entities])
+
+        async def add_relations_bulk(self, relations):
+            self.relation_batches.append(len(relations))
+
+    @pytest.mark.asyncio
+    async def test_build_from_documents_uses_bulk_writes_per_batch(self):
+        import asyncio
+
+        from app.modules.core.graph.builder import KnowledgeGraphBuilder
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def extract(text):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if text == "실패":
+                raise RuntimeError("LLM 오류")
+            return [Entity(id=f"{text}-e", name=text, type="doc")]
+
+        entity_extractor = MagicMock()
+        entity_extractor.extract = AsyncMock(side_effect=extract)
+        relation_extractor = MagicMock()
+        relation_extractor.extract = AsyncMock(
+            side_effect=lambda text, entities: [
+                Relation(source_id=entities[0].id, target_id="shared", type="mentions")
+            ]
+        )
+        store = self.BulkStore()
+        builder = KnowledgeGraphBuilder(
+            graph_store=store,
+            entity_extractor=entity_extractor,
+            relation_extractor=relation_extractor,
+            max_concurrency=2,
+            write_batch_size=3,
+        )
+        progress_updates = []
+
+        documents = [{"content": c} for c in ["d1", "d2", "실패", "d4", ""]]
+        result = await builder.build_from_documents(
+            documents,
+            progress_callback=lambda p: progress_updates.append(
+                (p.documents_done, p.documents_failed, p.entities)
+            ),
+        )
+
+        assert max_in_flight == 2
+        assert store.entity_batches == [["d1-e", "d2-e"], ["d4-e"]]
+        assert store.relation_batches == [2, 1]
+        assert progress_updates == [(3, 1, 2), (4, 1, 3)]
+        assert result["documents_processed"] == 5
+        assert result["documents_failed"] == 1
+        assert result["total_entities"] == 3
+        assert result["total_relations"] == 3
+        assert result["elapsed_seconds"] > 0
+        assert result["documents_per_second"] > 0
@@ -0,0 +1,236 @@
+"""
+지식 그래프 추출 결과 캐시 단위 테스트
+
+대상 모듈: app/modules/core/graph/extraction_cache.py, builder.py
+테스트 범위: 캐시 키 구성, 파일/Redis 백엔드 왕복, 재구축 시 변경 청크만 LLM 호출,
+           실패 결과 미캐시, 프롬프트 버전 변경 시 무효화
+"""
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.modules.core.graph.builder import KnowledgeGraphBuilder
+from app.modules.core.graph.extraction_cache import (
+    FileExtractionCache,
+    RedisExtractionCache,
+    decode_extraction,
+    encode_extraction,
+    make_cache_key,
+)
+from app.modules.core.graph.extractors import LLMEntityExtractor, LLMRelationExtractor
+from app.modules.core.graph.models import Entity, Relation
+
+
+class FakeLLM:
+    """프롬프트 종류별 고정 JSON 응답 + 호출 기록"""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.fail = False
+
+    async def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError("LLM 오류")
+        if "관계를 추출" in prompt:
+            return json.dumps([{"source": "A 업체", "target": "서울", "type": "located_in"}])
+        return json.dumps(
+            [{"name": "A 업체", "type": "company"}, {"name": "서울", "type": "location"}]
+        )
+
+
+class RecordingStore:
+    """일괄 저장 호출만 기록하는 저장소"""
+
+    def __init__(self) -> None:
+        self.entities: list[Entity] = []
+        self.relations: list[Relation] = []
+
+    async def add_entities_bulk(self, entities: list[Entity]) -> None:
+        self.entities.extend(entities)
+
+    async def add_relations_bulk(self, relations: list[Relation]) -> None:
+        self.relations.extend(relations)
+
+
+def _builder(llm: FakeLLM, cache_dir: Path, **extractor_config) -> tuple:
+    store = RecordingStore()
+    builder = KnowledgeGraphBuilder(
+        graph_store=store,
+        entity_extractor=LLMEntityExtractor(llm, config=extractor_config or None),
+        relation_extractor=LLMRelationExtractor(llm),
+        extraction_cache=FileExtractionCache(cache_dir),
+    )
+    return builder, store
+
+
+class TestExtractionCacheKey:
+    def test_key_depends_on_content_prompt_version_and_model(self) -> None:
+        base = make_cache_key("청크", "v1", "model-a")
+
+        assert make_cache_key("청크", "v1", "model-a") == base
+        assert make_cache_key("청크!", "v1", "model-a") != base
+        assert make_cache_key("청크", "v2", "model-a") != base
+        assert make_cache_key("청크", "v1", "model-b") != base
+
+    def test_prompt_version_tracks_extraction_limits(self) -> None:
+        llm = FakeLLM()
+
+        assert LLMEntityExtractor(llm).prompt_version == LLMEntityExtractor(llm).prompt_version
+        assert (
+            LLMEntityExtractor(llm, {"max_entities": 5}).prompt_version
+            != LLMEntityExtractor(llm).prompt_version
+        )
+
+    def test_encode_decode_roundtrip(self) -> None:
+        entities = [Entity(id="e1", name="A", type="company", properties={"rating": 4.5})]
+        relations = [Relation(source_id="e1", target_id="e2", type="r", weight=0.3)]
+
+        assert decode_extraction(encode_extraction(entities, relations)) == (entities, relations)
+
+
+class TestExtractionCacheBackends:
+    @pytest.mark.asyncio
+    async def test_file_cache_roundtrip_and_corrupt_entry(self, tmp_path: Path) -> None:
+        cache = FileExtractionCache(tmp_path)
+        key = make_cache_key("청크", "v1", "m")
+
+        assert await cache.get(key) is None
+        await cache.set(key, {"entities": [], "relations": []})
+        assert await cache.get(key) == {"entities": [], "relations": []}
+
+        (tmp_path / key[:2] / f"{key}.json").write_text("{broken", encoding="utf-8")
+        assert await cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_cache_uses_prefix_and_ttl(self) -> None:
+        redis = AsyncMock()
+        redis.get.return_value = json.dumps({"entities": [], "relations": []})
+        cache = RedisExtractionCache(redis, key_prefix="kg:", ttl_seconds=60)
+
+        await cache.set("abc", {"entities": [], "relations": []})
+        value = await cache.get("abc")
+
+        redis.set.assert_awaited_once_with("kg:abc", '{"entities": [], "relations": []}', ex=60)
+        redis.get.assert_awaited_once_with("kg:abc")
+        assert value == {"entities": [], "relations": []}
+
+    @pytest.mark.asyncio
+    async def test_redis_cache_closed_on_shutdown(self, monkeypatch) -> None:
+        """Redis 추출 캐시 클라이언트는 cleanup_resources에서 종료"""
+        from app.core import di_container
+
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        monkeypatch.setattr(di_container, "_shutdown_callbacks", [])
+        cache = di_container._create_extraction_cache({"enabled": True, "backend": "redis"})
+        cache._redis = AsyncMock()
+
+        container = MagicMock()
+        for name in (
+            "session",
+            "document_processor",
+            "graph_store",
+            "retrieval_orchestrator",
+            "vector_store",
+            "metadata_store",
+            "prompt_manager",
+            "generation",
+        ):
+            getattr(container, name).return_value = None
+
+        await di_container.cleanup_resources(container)
+
+        cache._redis.aclose.assert_awaited_once()
+        assert di_container._shutdown_callbacks == []
+
+
+class TestKnowledgeGraphBuilderExtractionCache:
+    @pytest.mark.asyncio
+    async def test_rebuild_only_extracts_changed_chunks(self, tmp_path: Path) -> None:
+        llm = FakeLLM()
+        builder, store = _builder(llm, tmp_path)
+        documents = [{"content": "청크 1"}, {"content": "청크 2"}]
+
+        first = await builder.build_from_documents(documents)
+        assert (first["cache_hits"], first["cache_misses"]) == (0, 2)
+        assert len(llm.prompts) == 4  # 문서당 엔티티 + 관계
+
+        llm.prompts.clear()
+        second = await builder.build_from_documents(
+            [{"content": "청크 1"}, {"content": "청크 2 (수정)"}]
+        )
+
+        assert (second["cache_hits"], second["cache_misses"]) == (1, 1)
+        assert len(llm.prompts) == 2
+        assert second["total_entities"] == 4
+
+        # 캐시 히트 시 엔티티 ID가 재사용되어 관계가 같은 노드를 가리킴
+        hit_entities = store.entities[4:6]
+        assert {e.id for e in hit_entities} == {e.id for e in store.entities[:2]}
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_is_not_cached(self, tmp_path: Path) -> None:
+        llm = FakeLLM()
+        builder, _ = _builder(llm, tmp_path)
+
+        llm.fail = True
+        failed = await builder.build_from_documents([{"content": "청크"}])
+        assert failed["documents_failed"] == 1
+        assert failed["cache_misses"] == 0  # 실패는 documents_failed로만 집계
+
+        llm.fail = False
+        retried = await builder.build_from_documents([{"content": "청크"}])
+        assert retried["documents_failed"] == 0
+        assert retried["cache_misses"] == 1
+        assert retried["total_relations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prompt_change_invalidates_cache(self, tmp_path: Path) -> None:
+        await _builder(FakeLLM(), tmp_path)[0].build_from_documents([{"content": "청크"}])
+
+        llm = FakeLLM()
+        builder, _ = _builder(llm, tmp_path, max_entities=5)
+        result = await builder.build_from_documents([{"content": "청크"}])
+
+        assert result["cache_misses"] == 1
+        assert len(llm.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_single_build_uses_cache(self, tmp_path: Path) -> None:
+        llm = FakeLLM()
+        builder, _ = _builder(llm, tmp_path)
+
+        assert (await builder.build("청크"))["cache_hit"] is False
+        assert (await builder.build("청크"))["cache_hit"] is True
+        assert len(llm.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_single_build_failure_degrades_to_empty(self, tmp_path: Path) -> None:
+        """캐시 사용 시에도 단일 빌드는 추출 실패로 중단되지 않고, 실패 결과는 캐시하지 않음"""
+        llm = FakeLLM()
+        builder, store = _builder(llm, tmp_path)
+
+        llm.fail = True
+        failed = await builder.build("청크")
+        assert failed == {"entities_count": 0, "relations_count": 0, "cache_hit": False}
+        assert store.entities == []
+
+        llm.fail = False
+        retried = await builder.build("청크")
+        assert retried["cache_hit"] is False
+        assert retried["entities_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_without_cache_reports_zero_counts(self) -> None:
+        llm = FakeLLM()
+        builder = KnowledgeGraphBuilder(
+            graph_store=RecordingStore(),
+            entity_extractor=LLMEntityExtractor(llm),
+            relation_extractor=LLMRelationExtractor(llm),
+        )
+
+        result = await builder.build_from_documents([{"content": "청크"}])
+
+        assert (result["cache_hits"], result["cache_misses"]) == (0, 0)
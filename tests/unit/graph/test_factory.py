@@ -75,6 +75,30 @@ class TestGraphRAGFactoryCreate:
         assert store is not None
         assert store.__class__.__name__ == "NetworkXGraphStore"
 
+    def test_create_networkx_store_with_persistence(self, tmp_path):
+        """persistence 설정 시 스냅샷/WAL 저장소 연결 (지연 로드)"""
+        from app.modules.core.graph.factory import GraphRAGFactory
+
+        config = {
+            "graph_rag": {
+                "enabled": True,
+                "provider": "networkx",
+                "networkx": {
+                    "persistence": {
+                        "enabled": True,
+                        "directory": str(tmp_path / "graph"),
+                        "max_wal_entries": 50,
+                    }
+                },
+            }
+        }
+        store = GraphRAGFactory.create(config)
+
+        stats = store.get_stats()["persistence"]
+        assert stats["directory"] == str(tmp_path / "graph")
+        assert stats["loaded"] is False
+        assert store._max_wal_entries == 50
+
     def test_create_with_defaults(self):
         """기본값으로 저장소 생성"""
         from app.modules.core.graph.factory import GraphRAGFactory
@@ -303,6 +327,29 @@ class TestGraphRAGFactoryNeo4j:
             assert store._max_retries == 5
             assert store._retry_delay == 2.0
 
+    def test_create_neo4j_with_write_config(self, monkeypatch):
+        """Factory가 일괄 쓰기/스키마 설정을 전달하는지 확인"""
+        from unittest.mock import MagicMock, patch
+
+        from app.modules.core.graph.factory import GraphRAGFactory
+
+        monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
+
+        config = {
+            "graph_rag": {
+                "enabled": True,
+                "provider": "neo4j",
+                "neo4j": {"write": {"batch_size": 500}, "create_schema": False},
+            }
+        }
+
+        with patch("neo4j.AsyncGraphDatabase.driver") as mock_driver:
+            mock_driver.return_value = MagicMock()
+            store = GraphRAGFactory.create(config)
+
+            assert store._write_batch_size == 500
+            assert store._create_schema is False
+
     def test_create_neo4j_with_default_pool_config(self, monkeypatch):
         """연결 풀 설정이 없으면 기본값 사용"""
         from unittest.mock import MagicMock, patch
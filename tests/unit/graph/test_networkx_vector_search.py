@@ -52,3 +52,74 @@ async def test_networkx_graph_vector_search():
     assert result.entities[0].name == "삼성전자"
     # score 필드가 GraphSearchResult에 있으므로 점수 확인 가능
     assert result.score > 0.5
+
+
+class CountingEmbedder(MockEmbedder):
+    def __init__(self):
+        self.query_calls = 0
+        self.document_calls: list[int] = []
+
+    async def embed_query(self, text: str):
+        self.query_calls += 1
+        return await super().embed_query(text)
+
+    async def embed_documents(self, texts: list[str]):
+        self.document_calls.append(len(texts))
+        return [await MockEmbedder.embed_query(self, t) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_add_entities_bulk_embeds_once():
+    """일괄 추가는 embed_documents 1회로 임베딩하고 검색 인덱스에 반영"""
+    from app.modules.core.graph.models import Relation
+
+    store = NetworkXGraphStore()
+    embedder = CountingEmbedder()
+    store.set_embedder(embedder)
+
+    await store.add_entities_bulk([
+        Entity(id="corp_1", name="삼성전자", type="Organization"),
+        Entity(id="corp_2", name="애플", type="Organization"),
+        Entity(id="corp_1", name="삼성전자", type="Organization"),  # 중복 ID
+    ])
+    await store.add_relations_bulk([
+        Relation(source_id="corp_1", target_id="new_node", type="competes"),
+    ])
+
+    # 엔티티 2개 + placeholder 1개 → embed_documents 2회 (배치별 1회), embed_query 없음
+    assert embedder.document_calls == [2, 1]
+    assert embedder.query_calls == 0
+    stats = store.get_stats()
+    assert stats["node_count"] == 3
+    assert stats["edge_count"] == 1
+
+    result = await store.search(query="SAMSUNG", top_k=1)
+    assert result.entities[0].id == "corp_1"
+
+
+class SyncEmbedder:
+    """DI 임베더(IEmbedder)처럼 동기 embed_query만 제공"""
+
+    def embed_query(self, text: str):
+        vec = np.zeros(768)
+        if "삼성" in text or "SAMSUNG" in text:
+            vec[0] = 1.0
+        elif "애플" in text or "iPhone" in text:
+            vec[0] = -1.0
+        return vec.tolist()
+
+
+@pytest.mark.asyncio
+async def test_sync_embedder_used_for_entities_and_queries():
+    """동기 임베더도 엔티티 임베딩 인덱스와 벡터 검색에 사용된다 (이름 매칭 폴백 아님)"""
+    store = NetworkXGraphStore()
+    store.set_embedder(SyncEmbedder())
+
+    await store.add_entity(Entity(id="corp_1", name="삼성전자", type="Organization"))
+    await store.add_entity(Entity(id="corp_2", name="애플", type="Organization"))
+
+    result = await store.search(query="SAMSUNG", top_k=1)
+
+    assert store.get_stats()["indexed_embeddings"] == 2
+    assert [e.id for e in result.entities] == ["corp_1"]
+    assert result.score > 0.5
@@ -197,6 +197,40 @@ class TestChromaVectorStoreSearch:
             category = result.get("category") or result.get("metadata", {}).get("category")
             assert category == "A"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("native_ids", [True, False])
+    async def test_search_with_ids_filter(
+        self, native_ids: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ids 필터는 문서 ID로 검색 대상을 제한 (구버전 chromadb는 후처리)"""
+        from app.infrastructure.storage.vector import chroma_store
+        from app.infrastructure.storage.vector.chroma_store import ChromaVectorStore
+
+        monkeypatch.setattr(chroma_store, "_QUERY_SUPPORTS_IDS", native_ids)
+        store = ChromaVectorStore()
+        documents: list[dict[str, Any]] = [
+            {"id": "doc1", "vector": [1.0, 0.0, 0.0], "metadata": {"category": "A"}},
+            {"id": "doc2", "vector": [0.9, 0.1, 0.0], "metadata": {"category": "B"}},
+            {"id": "doc3", "vector": [0.8, 0.2, 0.0], "metadata": {"category": "A"}},
+        ]
+        await store.add_documents(collection="ids_filter_collection", documents=documents)
+
+        results = await store.search(
+            collection="ids_filter_collection",
+            query_vector=[1.0, 0.0, 0.0],
+            top_k=1,
+            filters={"ids": ["doc2", "doc3"]},
+        )
+        filtered = await store.search(
+            collection="ids_filter_collection",
+            query_vector=[1.0, 0.0, 0.0],
+            top_k=10,
+            filters={"ids": ["doc1", "doc2"], "category": "B"},
+        )
+
+        assert [r["_id"] for r in results] == ["doc2"]
+        assert [r["_id"] for r in filtered] == ["doc2"]
+
     @pytest.mark.asyncio
     async def test_search_empty_collection_returns_empty_list(self) -> None:
         """빈 컬렉션 검색 시 빈 리스트 반환"""
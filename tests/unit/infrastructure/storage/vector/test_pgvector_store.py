@@ -213,6 +213,79 @@ class TestPgVectorStoreSearch:
 
         assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_search_with_selective_filter_uses_exact_scan(self, mock_connection):
+        """매칭 문서가 적은 필터는 부분집합을 구체화한 뒤 전수 탐색"""
+        from app.infrastructure.storage.vector.pgvector_store import PgVectorStore
+
+        cursor = mock_connection.cursor.return_value
+        cursor.fetchone.return_value = (2,)  # 매칭 문서 수
+        store = PgVectorStore(_connection=mock_connection)
+
+        await store.search("documents", [0.1] * 1024, top_k=5, filters={"year": {"$gte": 2024}})
+        await store.search("documents", [0.1] * 1024, top_k=5, filters={"year": {"$gte": 2024}})
+
+        queries = [call.args[0] for call in cursor.execute.call_args_list]
+        # 카운트 쿼리는 캐시되어 1회만 실행
+        assert sum("count(*)" in query for query in queries) == 1
+        assert "AS MATERIALIZED" in queries[-1]
+        assert "(metadata->>'year')::numeric >= %s" in queries[-1]
+
+    def test_build_filter_clause_operators(self):
+        """필터 AST → JSONB 조건식 변환"""
+        from app.infrastructure.storage.vector.pgvector_store import PgVectorStore
+
+        clause, params = PgVectorStore._build_filter_clause(
+            {"lang": ["ko", "en"], "$or": [{"pinned": True}, {"status": {"$ne": "draft"}}]}
+        )
+
+        assert clause == (
+            "WHERE (metadata->>'lang' = ANY(%s) AND "
+            "(metadata->>'pinned' = %s OR metadata->>'status' IS DISTINCT FROM %s))"
+        )
+        assert params == [["ko", "en"], "true", "draft"]
+
+    def test_build_filter_clause_exists(self):
+        """$exists는 JSONB 키 존재 검사"""
+        from app.infrastructure.storage.vector.pgvector_store import PgVectorStore
+
+        clause, params = PgVectorStore._build_filter_clause({"tag": {"$exists": False}})
+
+        assert clause == "WHERE NOT (metadata ? %s)"
+        assert params == ["tag"]
+
+    def test_build_filter_clause_ids_use_id_column(self):
+        """id, ids는 메타데이터가 아닌 id 컬럼 조건"""
+        from app.infrastructure.storage.vector.pgvector_store import PgVectorStore
+
+        clause, params = PgVectorStore._build_filter_clause(
+            {"ids": ["a", "b"], "file_type": "PDF"}
+        )
+
+        assert clause == "WHERE id = ANY(%s) AND metadata->>'file_type' = %s"
+        assert params == [["a", "b"], "PDF"]
+
+    @pytest.mark.asyncio
+    async def test_search_with_ids_filter(self, mock_connection):
+        """ids 필터 검색은 id 컬럼으로 제한된 쿼리를 실행하고 매칭 문서를 반환"""
+        from app.infrastructure.storage.vector.pgvector_store import PgVectorStore
+
+        mock_cursor = mock_connection.cursor.return_value
+        mock_cursor.fetchall.return_value = [
+            ("a", "문서 A", 0.9, {"file_type": "PDF"}),
+            ("b", "문서 B", 0.8, {"file_type": "PDF"}),
+        ]
+        store = PgVectorStore(_connection=mock_connection)
+
+        results = await store.search(
+            "documents", [0.1] * 1024, top_k=5, filters={"ids": ["a", "b"]}
+        )
+
+        assert [r["_id"] for r in results] == ["a", "b"]
+        query, params = mock_cursor.execute.call_args.args
+        assert "WHERE id = ANY(%s)" in query
+        assert ["a", "b"] in params
+
     @pytest.mark.asyncio
     async def test_search_updates_stats(self, mock_connection):
         """검색 통계 업데이트 테스트"""
@@ -224,6 +297,25 @@ class TestPgVectorStoreSearch:
 
         assert store.stats["searches"] == 1
 
+    @pytest.mark.asyncio
+    async def test_search_many_single_query_grouped_by_ordinality(self, mock_connection):
+        """다중 벡터 일괄 검색은 SQL 1회 실행 후 ord별로 결과 분배"""
+        from app.infrastructure.storage.vector.pgvector_store import PgVectorStore
+
+        cursor = mock_connection.cursor.return_value
+        cursor.fetchall.return_value = [
+            (1, 12345, "테스트 문서 1", 0.95, {"source": "test.pdf"}),
+            (2, 67890, "테스트 문서 2", 0.85, {"source": "manual.json"}),
+            (2, 12345, "테스트 문서 1", 0.80, {"source": "test.pdf"}),
+        ]
+        store = PgVectorStore(_connection=mock_connection)
+
+        results = await store.search_many("documents", [[0.1] * 1024, [0.2] * 1024], top_k=5)
+
+        assert [[r["_id"] for r in rows] for rows in results] == [["12345"], ["67890", "12345"]]
+        cursor.execute.assert_called_once()
+        assert store.stats["searches"] == 2
+
 
 # ============================================================
 # 삭제 테스트
@@ -204,6 +204,22 @@ class TestPineconeVectorStoreSearch:
         filter_param = call_args.kwargs.get("filter")
         assert filter_param == {"category": "tech"}
 
+    @pytest.mark.asyncio
+    async def test_search_with_exists_and_id_filters(self) -> None:
+        """$exists 연산자와 id 필터가 Pinecone filter로 그대로 전달됨"""
+        _, mock_index, store = create_mock_pinecone_store()
+        mock_index.query.return_value = MagicMock(matches=[])
+
+        await store.search(
+            collection="test_namespace",
+            query_vector=[0.1, 0.2, 0.3],
+            top_k=5,
+            filters={"tag": {"$exists": True}, "id": "doc-1"},
+        )
+
+        filter_param = mock_index.query.call_args.kwargs.get("filter")
+        assert filter_param == {"$and": [{"tag": {"$exists": True}}, {"id": "doc-1"}]}
+
     @pytest.mark.asyncio
     async def test_hybrid_search_with_sparse_vector(self) -> None:
         """Sparse Vector를 사용한 하이브리드 검색 테스트"""
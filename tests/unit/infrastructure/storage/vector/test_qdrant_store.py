@@ -218,6 +218,25 @@ class TestQdrantVectorStoreSearch:
         call_args = mock_qdrant_client.search.call_args
         assert call_args.kwargs.get("query_filter") is not None
 
+    def test_convert_filters_exists(self, mock_qdrant_client):
+        """$exists는 IsEmptyCondition으로 변환 (True면 must_not)"""
+        from qdrant_client.models import IsEmptyCondition
+
+        from app.infrastructure.storage.vector.qdrant_store import QdrantVectorStore
+
+        store = QdrantVectorStore(_client=mock_qdrant_client)
+
+        present = store._convert_filters({"tag": {"$exists": True}})
+        missing = store._convert_filters({"tag": {"$exists": False}})
+
+        assert present.must is None
+        assert isinstance(present.must_not[0], IsEmptyCondition)
+        assert present.must_not[0].is_empty.key == "tag"
+        assert missing.must_not is None
+        assert isinstance(missing.must[0], IsEmptyCondition)
+        # ids는 포인트 ID 조건이므로 payload 필터에서 제외
+        assert store._convert_filters({"ids": ["doc1"]}) is None
+
     @pytest.mark.asyncio
     async def test_search_updates_stats(self, mock_qdrant_client):
         """검색 통계 업데이트 테스트"""
@@ -230,6 +249,47 @@ class TestQdrantVectorStoreSearch:
         assert store.stats["searches"] == 1
 
 
+    @pytest.mark.asyncio
+    async def test_search_many_uses_single_batch_request(self, mock_qdrant_client):
+        """다중 벡터 일괄 검색은 query_batch_points 1회로 처리 (qdrant-client 1.10+)"""
+        pytest.importorskip("qdrant_client.models", reason="qdrant-client 미설치")
+        from qdrant_client import models
+
+        if not hasattr(models, "QueryRequest"):
+            pytest.skip("QueryRequest는 qdrant-client 1.10+에서 제공")
+
+        from app.infrastructure.storage.vector.qdrant_store import QdrantVectorStore
+
+        hits = mock_qdrant_client.search.return_value
+        mock_qdrant_client.query_batch_points.return_value = [
+            MagicMock(points=hits),
+            MagicMock(points=hits[:1]),
+        ]
+        store = QdrantVectorStore(_client=mock_qdrant_client)
+
+        results = await store.search_many("documents", [[0.1] * 1024, [0.2] * 1024], top_k=5)
+
+        assert [len(r) for r in results] == [2, 1]
+        mock_qdrant_client.query_batch_points.assert_called_once()
+        assert len(mock_qdrant_client.query_batch_points.call_args.kwargs["requests"]) == 2
+        mock_qdrant_client.search.assert_not_called()
+        assert store.stats["searches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_search_many_falls_back_without_batch_api(self, mock_qdrant_client):
+        """query_batch_points가 없는 클라이언트는 쿼리별 search()로 처리"""
+        from app.infrastructure.storage.vector.qdrant_store import QdrantVectorStore
+
+        del mock_qdrant_client.query_batch_points
+        store = QdrantVectorStore(_client=mock_qdrant_client)
+
+        results = await store.search_many("documents", [[0.1] * 1024, [0.2] * 1024], top_k=5)
+
+        assert [len(r) for r in results] == [2, 2]
+        assert mock_qdrant_client.search.call_count == 2
+        assert store.stats["searches"] == 2
+
+
 # ============================================================
 # 삭제 테스트
 # ============================================================
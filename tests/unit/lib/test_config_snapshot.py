@@ -0,0 +1,154 @@
+"""
+설정 스냅샷 단위 테스트
+
+대상 모듈: app/lib/config_loader.py (get_config / reload_config / subscribe_config)
+테스트 범위: 1회 로드 메모이제이션, 불변성, 변경 시 원자적 교체, 구독자 통지/격리,
+로드 실패 시 기존 스냅샷 유지, 파일 감시자
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from app.lib import config_loader
+from app.lib.config_loader import (
+    ConfigWatcher,
+    get_config,
+    get_config_snapshot,
+    reload_config,
+    subscribe_config,
+    thaw_config,
+)
+
+
+class ConfigSource:
+    """임시 YAML 파일 기반 스냅샷 원본 (로드 횟수 기록)"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.loads = 0
+        self.write({"session": {"save_chat_to_mongodb": False}, "tags": ["a"]})
+
+    def load(self) -> dict[str, Any]:
+        self.loads += 1
+        data = yaml.safe_load(self.path.read_text())
+        if data is None:
+            raise ValueError("빈 설정")
+        return data
+
+    def write(self, data: Any) -> None:
+        self.path.write_text(yaml.safe_dump(data) if data is not None else "")
+        # mtime 해상도가 낮은 파일 시스템에서도 변경이 감지되도록 앞당김
+        stamp = time.time() + 5 * (self.loads + 1)
+        os.utime(self.path, (stamp, stamp))
+
+
+@pytest.fixture
+def source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ConfigSource:
+    """임시 설정 디렉토리를 스냅샷 원본으로 사용"""
+    config_source = ConfigSource(tmp_path / "base.yaml")
+    monkeypatch.setattr(config_loader, "_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_loader, "_load_snapshot_source", config_source.load)
+    monkeypatch.setattr(config_loader, "_snapshot", None)
+    monkeypatch.setattr(config_loader, "_subscribers", [])
+    return config_source
+
+
+class TestSnapshot:
+    """스냅샷 조회 테스트"""
+
+    def test_loaded_once_and_shared(self, source: ConfigSource) -> None:
+        first = get_config()
+        second = get_config()
+
+        assert first is second
+        assert source.loads == 1
+        assert get_config_snapshot().version == 1
+
+    def test_snapshot_is_read_only(self, source: ConfigSource) -> None:
+        config = get_config()
+
+        with pytest.raises(TypeError):
+            config["session"]["save_chat_to_mongodb"] = True  # type: ignore[index]
+        assert config["tags"] == ("a",)
+        assert thaw_config(config)["tags"] == ["a"]
+
+
+class TestReload:
+    """리로드 테스트"""
+
+    def test_unchanged_files_skip_reload(self, source: ConfigSource) -> None:
+        get_config()
+
+        assert reload_config() is False
+        assert source.loads == 1
+
+    def test_change_swaps_snapshot_and_notifies(self, source: ConfigSource) -> None:
+        old = get_config()
+        events: list[tuple[Any, Any]] = []
+        unsubscribe = subscribe_config(lambda before, after: events.append((before, after)))
+
+        source.write({"session": {"save_chat_to_mongodb": True}, "tags": ["a"]})
+
+        assert reload_config() is True
+        assert get_config()["session"]["save_chat_to_mongodb"] is True
+        assert old["session"]["save_chat_to_mongodb"] is False  # 기존 참조는 그대로
+        assert events == [(old, get_config())]
+        assert get_config_snapshot().version == 2
+
+        unsubscribe()
+        source.write({"session": {}, "tags": []})
+        assert reload_config() is True
+        assert len(events) == 1
+
+    def test_failing_subscriber_isolated(self, source: ConfigSource) -> None:
+        get_config()
+        calls: list[str] = []
+
+        def broken(before: Any, after: Any) -> None:
+            raise RuntimeError("boom")
+
+        subscribe_config(broken)
+        subscribe_config(lambda before, after: calls.append("ok"))
+        source.write({"session": {"save_chat_to_mongodb": True}})
+
+        assert reload_config() is True
+        assert calls == ["ok"]
+
+    def test_invalid_file_keeps_previous_snapshot(self, source: ConfigSource) -> None:
+        old = get_config()
+        source.write(None)
+
+        assert reload_config() is False
+        assert get_config() is old
+        assert reload_config() is False  # 같은 파일 상태는 재시도하지 않음
+        assert source.loads == 2
+
+    def test_force_reload_without_content_change(self, source: ConfigSource) -> None:
+        old = get_config()
+
+        assert reload_config(force=True) is False
+        assert get_config() is old
+
+
+class TestWatcher:
+    """파일 감시자 테스트"""
+
+    def test_watcher_picks_up_change(self, source: ConfigSource) -> None:
+        get_config()
+        watcher = ConfigWatcher(interval_seconds=0.01)
+        watcher.start()
+        try:
+            source.write({"session": {"save_chat_to_mongodb": True}})
+            deadline = time.monotonic() + 2
+            while get_config_snapshot().version == 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+
+        assert get_config()["session"]["save_chat_to_mongodb"] is True
+        assert not watcher.running
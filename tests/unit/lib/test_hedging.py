@@ -0,0 +1,144 @@
+"""
+Hedged Requests / 지연 시간 추적 단위 테스트
+
+대상 모듈: app/lib/hedging.py
+테스트 범위: 관측 p90 기반 헤지 발사, 승패 기록, 실패 시 즉시 폴백, 상태 기반 순서 재정렬
+"""
+
+import asyncio
+
+import pytest
+
+from app.lib.hedging import (
+    AllCandidatesFailedError,
+    HedgingPolicy,
+    LatencyTracker,
+    hedged_call,
+)
+
+
+def _tracker(**policy: float) -> LatencyTracker:
+    defaults = {"enabled": True, "min_samples": 3, "min_delay": 0.01}
+    return LatencyTracker(HedgingPolicy(**{**defaults, **policy}))
+
+
+def _fake_calls(delays: dict[str, float], failing: tuple[str, ...] = ()):
+    """후보별 지연 시간을 흉내 내는 호출 + 시작/취소 기록"""
+    started: list[str] = []
+    cancelled: list[str] = []
+
+    async def call(key: str) -> str:
+        started.append(key)
+        try:
+            await asyncio.sleep(delays[key])
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+        if key in failing:
+            raise RuntimeError(f"{key} 실패")
+        return f"answer-{key}"
+
+    return call, started, cancelled
+
+
+class TestHedgedCall:
+    """hedged_call 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_hedge(self) -> None:
+        tracker = _tracker(default_delay=1.0)
+        call, started, _ = _fake_calls({"a": 0.01, "b": 0.01})
+
+        result, winner = await hedged_call(["a", "b"], call, tracker)
+
+        assert (result, winner) == ("answer-a", "a")
+        assert started == ["a"]
+        assert tracker.get_stats()["a"]["hedges_fired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_and_loser_cancelled(self) -> None:
+        tracker = _tracker(default_delay=0.05)
+        call, started, cancelled = _fake_calls({"a": 5.0, "b": 0.01})
+
+        result, winner = await hedged_call(["a", "b"], call, tracker)
+
+        assert winner == "b"
+        assert started == ["a", "b"]
+        assert cancelled == ["a"]
+        stats = tracker.get_stats()
+        assert (stats["b"]["hedges_fired"], stats["b"]["hedge_wins"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_follows_observed_p90(self) -> None:
+        tracker = _tracker(default_delay=10.0)
+        for _ in range(3):
+            tracker.record_success("a", 0.05)
+        call, started, _ = _fake_calls({"a": 5.0, "b": 0.01})
+
+        loop = asyncio.get_running_loop()
+        begin = loop.time()
+        _, winner = await hedged_call(["a", "b"], call, tracker)
+
+        assert winner == "b"
+        assert loop.time() - begin < 1.0  # default_delay(10초)가 아닌 관측 p90 후 헤지
+
+    @pytest.mark.asyncio
+    async def test_failure_falls_back_immediately(self) -> None:
+        tracker = _tracker(default_delay=10.0)
+        call, started, _ = _fake_calls({"a": 0.01, "b": 0.01}, failing=("a",))
+
+        result, winner = await hedged_call(["a", "b"], call, tracker)
+
+        assert winner == "b"
+        assert tracker.error_rate("a") == 1.0
+        assert tracker.get_stats()["b"]["hedges_fired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_all_fail_raises_with_last_error(self) -> None:
+        tracker = _tracker()
+        call, _, _ = _fake_calls({"a": 0.01, "b": 0.01}, failing=("a", "b"))
+
+        with pytest.raises(AllCandidatesFailedError) as exc_info:
+            await hedged_call(["a", "b"], call, tracker)
+
+        assert "b 실패" in str(exc_info.value.last_error)
+
+    @pytest.mark.asyncio
+    async def test_disabled_policy_is_sequential(self) -> None:
+        tracker = _tracker(default_delay=0.01, enabled=False)
+        call, started, _ = _fake_calls({"a": 0.1, "b": 0.01})
+
+        _, winner = await hedged_call(["a", "b"], call, tracker)
+
+        assert winner == "a"
+        assert started == ["a"]
+
+
+class TestLatencyTracker:
+    """순서 재정렬 테스트"""
+
+    def test_order_prefers_healthy_and_fast(self) -> None:
+        tracker = _tracker()
+        for _ in range(3):
+            tracker.record_success("slow", 2.0)
+            tracker.record_success("fast", 0.2)
+            tracker.record_failure("broken")
+
+        assert tracker.order(["broken", "slow", "unknown", "fast"]) == [
+            "fast",
+            "slow",
+            "unknown",
+            "broken",
+        ]
+        assert tracker.order(["broken", "slow", "fast"], pin_first=True) == [
+            "broken",
+            "fast",
+            "slow",
+        ]
+
+    def test_percentile_requires_min_samples(self) -> None:
+        tracker = _tracker(default_delay=7.0)
+        tracker.record_success("a", 1.0)
+
+        assert tracker.percentile("a", 0.9) is None
+        assert tracker.hedge_delay("a") == 7.0
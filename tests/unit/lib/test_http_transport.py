@@ -0,0 +1,163 @@
+"""
+공유 HTTP 전송 레지스트리 단위 테스트
+
+대상 모듈: app/lib/http_transport.py
+테스트 범위: 호스트별 클라이언트 공유, 커넥션 재사용 / 핸드셰이크 통계, 설정 적용, 종료
+"""
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from app.lib import http_transport as http_transport_module
+from app.lib.http_transport import HTTPTransportRegistry, HTTPTransportSettings
+
+
+@pytest.fixture
+async def local_server() -> AsyncIterator[str]:
+    """keep-alive를 지원하는 최소 HTTP/1.1 서버 (응답: "ok")"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
+
+
+class TestHTTPTransportRegistry:
+    """호스트별 공유 AsyncClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_per_origin(self) -> None:
+        registry = HTTPTransportRegistry()
+
+        client = registry.get_client("https://api.jina.ai/v1/rerank")
+
+        assert registry.get_client("https://api.jina.ai/v1/other?x=1") is client
+        assert registry.get_client("https://api.cohere.ai/v1/rerank") is not client
+        assert registry.get_client("https://api.jina.ai:8443/v1/rerank") is not client
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_connections_reused_across_requests(self, local_server: str) -> None:
+        """순차 요청은 커넥션 1개를 재사용 (요청마다 새 클라이언트를 만들지 않음)"""
+        registry = HTTPTransportRegistry()
+
+        for _ in range(5):
+            response = await registry.get_client(local_server).get(f"{local_server}/ping")
+            assert response.text == "ok"
+
+        host = registry.get_stats()["hosts"][local_server]
+        assert host["requests"] == 5
+        assert host["connections_opened"] == 1
+        assert host["tls_handshakes"] == 0
+        assert host["reused_requests"] == 4
+        assert host["reuse_ratio"] == pytest.approx(0.8)
+        assert host["clients_created"] == 1
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients_and_keeps_stats(self, local_server: str) -> None:
+        registry = HTTPTransportRegistry()
+        client = registry.get_client(local_server)
+        await client.get(local_server)
+
+        await registry.aclose()
+
+        assert client.is_closed
+        assert registry.get_stats()["active_clients"] == 0
+        assert registry.get_client(local_server) is not client
+        assert registry.get_stats()["totals"]["clients_created"] == 2
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_clients_kept_per_event_loop(self) -> None:
+        """다른 루프의 클라이언트를 교체(누수)하지 않고, 종료 시 그 루프에 aclose 예약"""
+        registry = HTTPTransportRegistry()
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+
+            async def get_on_other_loop() -> httpx.AsyncClient:
+                return registry.get_client("https://api.jina.ai")
+
+            other = asyncio.run_coroutine_threadsafe(get_on_other_loop(), other_loop).result(5)
+            client = registry.get_client("https://api.jina.ai")
+
+            assert client is not other
+            assert registry.get_client("https://api.jina.ai") is client
+            assert asyncio.run_coroutine_threadsafe(get_on_other_loop(), other_loop).result(5) is other
+            assert registry.get_stats()["active_clients"] == 2
+
+            await registry.aclose()
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other_loop)
+            )
+
+            assert client.is_closed
+            assert other.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_reset_stats(self, local_server: str) -> None:
+        registry = HTTPTransportRegistry()
+        await registry.get_client(local_server).get(local_server)
+
+        registry.reset_stats()
+
+        assert registry.get_stats()["totals"]["requests"] == 0
+        await registry.aclose()
+
+    def test_url_without_host_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            HTTPTransportRegistry().get_client("/relative/path")
+
+
+class TestHTTPTransportSettings:
+    """설정 적용 테스트"""
+
+    def test_from_dict_ignores_unknown_and_none(self) -> None:
+        settings = HTTPTransportSettings.from_dict(
+            {"max_connections": 7, "keepalive_expiry": None, "unknown": 1}
+        )
+
+        assert settings.max_connections == 7
+        assert settings.keepalive_expiry == HTTPTransportSettings.keepalive_expiry
+
+    @pytest.mark.asyncio
+    async def test_configure_applies_limits_and_timeouts(self) -> None:
+        registry = HTTPTransportRegistry()
+        registry.configure({"max_connections": 3, "read_timeout": 12.5})
+
+        client = registry.get_client("https://example.com")
+
+        assert client.timeout.read == 12.5
+        assert client._transport._inner._pool._max_connections == 3
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """h2 패키지가 없으면 HTTP/1.1로 대체"""
+        monkeypatch.setattr(http_transport_module, "is_http2_available", lambda: False)
+        registry = HTTPTransportRegistry(HTTPTransportSettings(http2=True))
+
+        client = registry.get_client("https://example.com")
+
+        assert client._transport._inner._pool._http2 is False
+        assert registry.get_stats()["http2_enabled"] is False
+        await registry.aclose()
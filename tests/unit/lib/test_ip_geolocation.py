@@ -188,7 +188,7 @@ class TestGetLocation:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("app.lib.ip_geolocation.httpx.AsyncClient", return_value=mock_client):
+        with patch("app.lib.ip_geolocation.get_http_client", return_value=mock_client):
             result = await module.get_location(ip)
 
         # 만료 캐시가 삭제되고 새 데이터로 교체되었는지 확인
@@ -227,7 +227,7 @@ class TestGetLocation:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("app.lib.ip_geolocation.httpx.AsyncClient", return_value=mock_client):
+        with patch("app.lib.ip_geolocation.get_http_client", return_value=mock_client):
             result = await module.get_location("1.2.3.4")
 
         # "nil" → None, "126.978" → 126.978
@@ -246,7 +246,7 @@ class TestGetLocation:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("app.lib.ip_geolocation.httpx.AsyncClient", return_value=mock_client):
+        with patch("app.lib.ip_geolocation.get_http_client", return_value=mock_client):
             result = await module.get_location("8.8.8.8")
 
         assert result["country"] == "Unknown"
@@ -271,7 +271,7 @@ class TestGetLocation:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("app.lib.ip_geolocation.httpx.AsyncClient", return_value=mock_client):
+        with patch("app.lib.ip_geolocation.get_http_client", return_value=mock_client):
             result = await module.get_location("8.8.8.8")
 
         assert result["country"] == "Unknown"
@@ -287,7 +287,7 @@ class TestGetLocation:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("app.lib.ip_geolocation.httpx.AsyncClient", return_value=mock_client):
+        with patch("app.lib.ip_geolocation.get_http_client", return_value=mock_client):
             result = await module.get_location("8.8.8.8")
 
         assert result["country"] == "Unknown"
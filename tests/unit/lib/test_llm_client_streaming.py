@@ -1,8 +1,8 @@
 """
 LLM Client 스트리밍 기능 테스트
 
-BaseLLMClient와 GoogleLLMClient, OpenAILLMClient, AnthropicLLMClient의
-스트리밍 인터페이스를 검증합니다.
+BaseLLMClient와 GoogleLLMClient, OpenAILLMClient, AnthropicLLMClient,
+OpenRouterLLMClient의 스트리밍 인터페이스를 검증합니다.
 TDD 방식: 테스트 먼저 작성 → 실패 확인 → 구현 → 통과 확인
 """
 
@@ -15,6 +15,7 @@ from app.lib.llm_client import (
     BaseLLMClient,
     GoogleLLMClient,
     OpenAILLMClient,
+    OpenRouterLLMClient,
 )
 
 
@@ -474,3 +475,58 @@ class TestAnthropicLLMClientStreaming:
             with pytest.raises(Exception, match="API 오류"):
                 async for _ in client.stream_text("테스트"):
                     pass
+
+
+class TestOpenRouterLLMClientStreaming:
+    """OpenRouter LLM Client 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_text_yields_chunks(self):
+        """OpenRouter stream_text가 OpenAI 호환 스트림 청크를 yield하는지 확인"""
+        config = {
+            "model": "anthropic/claude-sonnet-4",
+            "api_key": "test-key",
+            "temperature": 0.2,
+        }
+
+        with patch("app.lib.llm_client.OpenAI") as mock_openai:
+            mock_chunk1 = MagicMock()
+            mock_chunk1.choices = [MagicMock(delta=MagicMock(content="안녕"))]
+            mock_chunk2 = MagicMock()
+            mock_chunk2.choices = [MagicMock(delta=MagicMock(content=None))]  # 빈 청크
+            mock_chunk3 = MagicMock()
+            mock_chunk3.choices = [MagicMock(delta=MagicMock(content="하세요"))]
+
+            mock_stream = MagicMock()
+            mock_stream.__iter__ = lambda self: iter([mock_chunk1, mock_chunk2, mock_chunk3])
+
+            mock_client = MagicMock()
+            mock_client.chat.completions.create.return_value = mock_stream
+            mock_openai.return_value = mock_client
+
+            client = OpenRouterLLMClient(config)
+
+            chunks = []
+            async for chunk in client.stream_text("테스트", system_prompt="시스템"):
+                chunks.append(chunk)
+
+            assert chunks == ["안녕", "하세요"]
+            call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+            assert call_kwargs["stream"] is True
+            assert call_kwargs["temperature"] == 0.2
+            assert call_kwargs["messages"][0] == {"role": "system", "content": "시스템"}
+            mock_stream.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_text_handles_exception(self):
+        """스트림 열기 실패 시 예외가 전달되는지 확인"""
+        with patch("app.lib.llm_client.OpenAI") as mock_openai:
+            mock_client = MagicMock()
+            mock_client.chat.completions.create.side_effect = Exception("API 오류")
+            mock_openai.return_value = mock_client
+
+            client = OpenRouterLLMClient({"model": "openai/gpt-4o", "api_key": "test-key"})
+
+            with pytest.raises(Exception, match="API 오류"):
+                async for _ in client.stream_text("테스트"):
+                    pass
@@ -0,0 +1,231 @@
+"""
+메타데이터 필터 AST / Pushdown Planner 단위 테스트
+
+대상 모듈: app/lib/metadata_filter.py
+테스트 범위: dict 필터 파싱, MongoDB 스타일 변환, 전략 선택, 카디널리티 캐시
+"""
+
+import pytest
+
+from app.lib.metadata_filter import (
+    RESERVED_FILTER_KEYS,
+    And,
+    CardinalityCache,
+    Condition,
+    FilterOp,
+    FilterPlanner,
+    FilterStrategy,
+    Or,
+    filter_fields,
+    filter_ops,
+    parse_filters,
+    split_id_filter,
+    to_mongo_query,
+)
+
+# ============================================================
+# parse_filters() 테스트
+# ============================================================
+
+
+class TestParseFilters:
+    """dict 필터 → AST 변환 테스트"""
+
+    def test_empty_filters_return_none(self) -> None:
+        """필터가 없거나 제외할 예약 키만 있으면 None"""
+        assert parse_filters(None) is None
+        assert parse_filters({}) is None
+        assert parse_filters({"ids": ["a", "b"]}, RESERVED_FILTER_KEYS) is None
+
+    def test_id_kept_unless_reserved(self) -> None:
+        """id 필터는 검색에서 유지되고 삭제 경로(reserved_keys)에서만 제외"""
+        assert parse_filters({"id": "doc-1"}) == Condition("id", FilterOp.EQ, "doc-1")
+        assert parse_filters(
+            {"id": "doc-1", "$or": [{"ids": ["a"]}, {"lang": "ko"}]}, RESERVED_FILTER_KEYS
+        ) == Condition("lang", FilterOp.EQ, "ko")
+
+    def test_split_id_filter(self) -> None:
+        """최상위 id/ids는 문서 ID 목록으로 분리 (둘 다 있으면 교집합)"""
+        assert split_id_filter(None) == (None, None)
+        assert split_id_filter({"lang": "ko"}) == (None, {"lang": "ko"})
+        assert split_id_filter({"ids": ["a", "b"], "lang": "ko"}) == (["a", "b"], {"lang": "ko"})
+        assert split_id_filter({"id": "b", "ids": ["a", "b"]}) == (["b"], None)
+
+    def test_exists_operator(self) -> None:
+        """$exists는 bool 값만 허용"""
+        expr = parse_filters({"tag": {"$exists": True}})
+
+        assert expr == Condition("tag", FilterOp.EXISTS, True)
+        assert filter_ops(expr) == {FilterOp.EXISTS}
+        assert to_mongo_query(expr, "metadata.") == {"metadata.tag": {"$exists": True}}
+        with pytest.raises(ValueError):
+            parse_filters({"tag": {"$exists": "yes"}})
+
+    def test_scalar_and_list_values(self) -> None:
+        """스칼라는 Eq, 리스트는 In 조건으로 변환"""
+        expr = parse_filters({"file_type": "PDF", "lang": ["ko", "en"]})
+
+        assert expr == And(
+            (
+                Condition("file_type", FilterOp.EQ, "PDF"),
+                Condition("lang", FilterOp.IN, ("ko", "en")),
+            )
+        )
+
+    def test_operator_dict_and_or(self) -> None:
+        """연산자 딕셔너리와 $or 조합"""
+        expr = parse_filters(
+            {"year": {"$gte": 2023, "$lt": 2025}, "$or": [{"a": 1}, {"b": {"$ne": 2}}]}
+        )
+
+        assert isinstance(expr, And)
+        assert expr.children[:2] == (
+            Condition("year", FilterOp.GTE, 2023),
+            Condition("year", FilterOp.LT, 2025),
+        )
+        assert expr.children[2] == Or(
+            (Condition("a", FilterOp.EQ, 1), Condition("b", FilterOp.NE, 2))
+        )
+        assert filter_fields(expr) == {"year", "a", "b"}
+
+    def test_expression_passthrough(self) -> None:
+        """이미 AST면 그대로 반환"""
+        expr = Condition("a", FilterOp.EQ, 1)
+        assert parse_filters(expr) is expr
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"$not": {"a": 1}},
+            {"a": {"$regex": "x"}},
+            {"a'; DROP TABLE x; --": 1},
+            {"a\n": 1},
+            {"부서 명": 1},
+        ],
+    )
+    def test_invalid_filters_raise(self, filters: dict) -> None:
+        """지원하지 않는 연산자 / 허용되지 않는 필드 이름은 ValueError"""
+        with pytest.raises(ValueError):
+            parse_filters(filters)
+
+    def test_non_ascii_field_names_allowed(self) -> None:
+        """한글 메타데이터 키도 필터 필드로 사용 가능"""
+        expr = parse_filters({"부서": "인사팀", "문서.분류_2": {"$in": ["규정"]}})
+        assert filter_fields(expr) == {"부서", "문서.분류_2"}
+
+
+# ============================================================
+# to_mongo_query() 테스트
+# ============================================================
+
+
+class TestToMongoQuery:
+    """AST → MongoDB 스타일 쿼리 변환 테스트"""
+
+    def test_single_eq_keeps_shorthand(self) -> None:
+        """단일 Eq 조건은 기존 {"field": value} 형태 유지"""
+        assert to_mongo_query(parse_filters({"category": "tech"})) == {"category": "tech"}
+
+    def test_nested_expression_with_prefix(self) -> None:
+        """중첩 조건과 필드 접두사"""
+        expr = parse_filters({"lang": ["ko"], "$or": [{"year": {"$gt": 2020}}, {"pinned": True}]})
+
+        assert to_mongo_query(expr, "metadata.metadata.") == {
+            "$and": [
+                {"metadata.metadata.lang": {"$in": ["ko"]}},
+                {
+                    "$or": [
+                        {"metadata.metadata.year": {"$gt": 2020}},
+                        {"metadata.metadata.pinned": True},
+                    ]
+                },
+            ]
+        }
+
+
+# ============================================================
+# FilterPlanner 테스트
+# ============================================================
+
+
+class TestFilterPlanner:
+    """필터 적용 전략 선택 테스트"""
+
+    def test_small_subset_uses_exact_scan(self) -> None:
+        """네이티브 필터 + 매칭 문서가 임계값 이하 → 전수 탐색"""
+        plan = FilterPlanner(exact_scan_threshold=100).plan(10, matching=50, total=10_000)
+
+        assert plan.strategy is FilterStrategy.EXACT_SCAN
+        assert plan.fetch_k == 10
+        assert plan.selectivity == pytest.approx(0.005)
+
+    def test_large_subset_uses_prefilter(self) -> None:
+        """네이티브 필터 + 매칭 문서가 많으면 ANN 중 필터"""
+        plan = FilterPlanner(exact_scan_threshold=100).plan(10, matching=5_000, total=10_000)
+
+        assert plan.strategy is FilterStrategy.PRE_FILTER
+        assert plan.fetch_k == 10
+
+    def test_unknown_cardinality_uses_prefilter(self) -> None:
+        """카디널리티를 모르면 기본 pre-filter"""
+        assert FilterPlanner().plan(10).strategy is FilterStrategy.PRE_FILTER
+
+    def test_postfilter_overfetch_scales_with_selectivity(self) -> None:
+        """post-filter는 선택도가 낮을수록 더 많이 가져옴 (min/max 범위 내)"""
+        planner = FilterPlanner(min_overfetch=2, max_overfetch=20, safety_factor=1.5)
+
+        wide = planner.plan(10, matching=900, total=1_000, supports_prefilter=False)
+        mid = planner.plan(10, matching=100, total=1_000, supports_prefilter=False)
+        narrow = planner.plan(10, matching=1, total=1_000, supports_prefilter=False)
+
+        assert wide.strategy is FilterStrategy.POST_FILTER
+        assert wide.fetch_k == 20  # ceil(1.5 / 0.9) = 2
+        assert mid.fetch_k == 150  # ceil(1.5 / 0.1) = 15
+        assert narrow.fetch_k == 200  # max_overfetch
+
+    def test_postfilter_default_and_cap(self) -> None:
+        """선택도를 모르면 기본 배수, fetch_k는 max_fetch_k로 제한"""
+        planner = FilterPlanner(default_overfetch=4, max_fetch_k=300)
+
+        assert planner.plan(10, supports_prefilter=False).fetch_k == 40
+        assert planner.plan(100, supports_prefilter=False).fetch_k == 300
+
+
+# ============================================================
+# CardinalityCache 테스트
+# ============================================================
+
+
+class TestCardinalityCache:
+    """카디널리티 캐시 테스트"""
+
+    def test_get_set_and_clear(self) -> None:
+        cache = CardinalityCache()
+        cache.set("k", 42)
+
+        assert cache.get("k") == 42
+        cache.clear()
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self) -> None:
+        """max_size 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = CardinalityCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """TTL 경과 항목은 조회되지 않음"""
+        now = [1000.0]
+        monkeypatch.setattr("app.lib.metadata_filter.time.monotonic", lambda: now[0])
+        cache = CardinalityCache(ttl_seconds=10)
+        cache.set("k", 5)
+
+        now[0] += 11
+
+        assert cache.get("k") is None
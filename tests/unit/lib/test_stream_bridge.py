@@ -0,0 +1,115 @@
+"""
+동기 스트림 → 비동기 이터레이터 브리지 테스트
+
+대상 모듈: app/lib/stream_bridge.py
+테스트 범위: 순서 보존, 예외 전달, 제한된 버퍼, 조기 중단 시 스트림 닫기, 이벤트 루프 비차단
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.lib.stream_bridge import aiterate, iterate_in_thread
+
+
+class TestIterateInThread:
+    """iterate_in_thread 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_in_order(self):
+        items = [item async for item in iterate_in_thread(lambda: iter(range(100)), max_buffer=4)]
+
+        assert items == list(range(100))
+
+    @pytest.mark.asyncio
+    async def test_reraises_producer_exception(self):
+        def failing():
+            yield "첫번째"
+            raise RuntimeError("SDK 오류")
+
+        received = []
+        with pytest.raises(RuntimeError, match="SDK 오류"):
+            async for item in iterate_in_thread(failing):
+                received.append(item)
+
+        assert received == ["첫번째"]
+
+    @pytest.mark.asyncio
+    async def test_buffer_bounds_producer(self):
+        """소비자가 멈춰 있으면 생산자는 max_buffer개(+전달 중 1개)까지만 진행"""
+        produced = 0
+
+        def counting():
+            nonlocal produced
+            for i in range(1000):
+                produced += 1
+                yield i
+
+        stream = iterate_in_thread(counting, max_buffer=3)
+        assert await anext(stream) == 0
+        await asyncio.sleep(0.2)
+
+        assert produced <= 1 + 3 + 1
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_early_close_stops_and_closes_source(self):
+        """소비자가 중단하면 원본 제너레이터의 finally(HTTP 스트림 닫기)가 실행됨"""
+        closed = threading.Event()
+
+        def endless():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        async for item in iterate_in_thread(endless, max_buffer=2):
+            if item == 5:
+                break
+
+        assert await asyncio.to_thread(closed.wait, 2.0)
+
+    @pytest.mark.asyncio
+    async def test_blocking_source_does_not_block_event_loop(self):
+        """토큰 대기(time.sleep) 중에도 다른 코루틴이 계속 실행됨"""
+
+        def slow():
+            for i in range(3):
+                time.sleep(0.05)
+                yield i
+
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(heartbeat())
+        items = [item async for item in iterate_in_thread(slow)]
+        task.cancel()
+
+        assert items == [0, 1, 2]
+        assert ticks >= 10
+
+
+class TestAiterate:
+    """aiterate 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_passthrough(self):
+        async def source():
+            yield "a"
+            yield "b"
+
+        assert [item async for item in aiterate(source())] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_sync_iterable_bridged(self):
+        assert [item async for item in aiterate(["a", "b"])] == ["a", "b"]
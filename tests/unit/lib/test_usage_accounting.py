@@ -0,0 +1,239 @@
+"""
+토큰/비용 사용량 집계 단위 테스트
+
+대상 모듈: app/lib/usage_accounting.py
+테스트 범위: 단가 계산, 라우트 × 모델/단계 집계, 플러시 델타 교체와 실패 재시도,
+워커 간 합산 (메모리/Redis 저장소)
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.lib.usage_accounting import (
+    MemoryUsageStore,
+    RedisUsageStore,
+    UsageAccountant,
+    UsageAccountingConfig,
+    UsageRecord,
+    estimate_cost,
+    provider_for_model,
+)
+
+
+class FakeRedis:
+    """WATCH/MULTI 파이프라인과 HINCRBYFLOAT / HSET / HGETALL / SET만 흉내 내는 Redis"""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.values: dict[str, str] = {}
+        self.lose_reply = False  # EXEC 반영 후 응답 유실 (1회)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        assert transaction
+        return FakePipeline(self)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, str, str, Any]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.commands = []
+
+    async def watch(self, *keys: str) -> None:
+        pass
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.redis.values)
+
+    def multi(self) -> None:
+        pass
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.commands.append(("put", key, "", value))
+
+    def hincrbyfloat(self, key: str, field: str, amount: float) -> None:
+        self.commands.append(("incr", key, field, amount))
+
+    def hset(self, key: str, field: str, value: Any) -> None:
+        self.commands.append(("set", key, field, value))
+
+    async def execute(self) -> None:
+        for op, key, field, value in self.commands:
+            if op == "put":
+                self.redis.values[key] = value
+                continue
+            bucket = self.redis.hashes.setdefault(key, {})
+            if op == "incr":
+                bucket[field] = str(float(bucket.get(field, 0)) + value)
+            else:
+                bucket[field] = str(value)
+        if self.redis.lose_reply:
+            self.redis.lose_reply = False
+            raise ConnectionError("connection reset after EXEC")
+
+
+class FailingStore(MemoryUsageStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fail = True
+
+    async def merge(self, worker_id, models, stages, batch_id) -> None:
+        if self.fail:
+            raise ConnectionError("store down")
+        await super().merge(worker_id, models, stages, batch_id)
+
+
+def _record(route: str = "chat", model: str = "google/gemini-2.5-flash", **kwargs) -> UsageRecord:
+    values = {"prompt_tokens": 1000, "completion_tokens": 200, "latency_ms": 100.0}
+    values.update(kwargs)
+    return UsageRecord(model=model, route=route, **values)
+
+
+class TestCost:
+    """단가 계산 테스트"""
+
+    def test_provider_from_model_prefix(self) -> None:
+        assert provider_for_model("anthropic/claude-sonnet-4-5") == "anthropic"
+        assert provider_for_model("gemini-2.0-flash", provider="google") == "google"
+        assert provider_for_model("mistral/large", provider="openrouter") is None
+
+    def test_cached_input_discounted(self) -> None:
+        full = estimate_cost("openai/gpt-4o", 1_000_000, 0)
+        cached = estimate_cost("openai/gpt-4o", 1_000_000, 0, cached_tokens=1_000_000)
+
+        assert full == pytest.approx(2.5)
+        assert cached == pytest.approx(1.25)
+        assert estimate_cost("unknown/model", 1000, 1000) == 0.0
+
+
+class TestAccountant:
+    """워커 로컬 집계 테스트"""
+
+    def test_breakdown_by_route_and_model(self) -> None:
+        accountant = UsageAccountant()
+        accountant.record(_record())
+        accountant.record(_record(latency_ms=300.0))
+        accountant.record(_record(route="chat_stream", completion_tokens=50, estimated=True))
+        accountant.record_stages("chat", {"retrieve_documents": 80.0, "generate_answer": 900.0})
+        accountant.record_stages("chat", {"retrieve_documents": 120.0})
+
+        snapshot = accountant.snapshot()
+
+        chat = snapshot["models"]["by_route"]["chat"]["google/gemini-2.5-flash"]
+        assert (chat["requests"], chat["prompt_tokens"], chat["completion_tokens"]) == (
+            2,
+            2000,
+            400,
+        )
+        assert chat["avg_latency_ms"] == 200.0
+        assert chat["cost_usd"] > 0
+        stream = snapshot["models"]["by_route"]["chat_stream"]["google/gemini-2.5-flash"]
+        assert stream["estimated_requests"] == 1
+        assert snapshot["models"]["totals"]["requests"] == 3
+        assert snapshot["stages"]["chat"]["retrieve_documents"] == {
+            "count": 2,
+            "total_latency_ms": 200.0,
+            "avg_latency_ms": 100.0,
+        }
+
+    def test_disabled_accountant_still_prices_record(self) -> None:
+        accountant = UsageAccountant(UsageAccountingConfig(enabled=False))
+
+        record = accountant.record(_record())
+
+        assert record.cost_usd > 0
+        assert accountant.snapshot()["models"]["totals"]["requests"] == 0
+
+
+class TestFlush:
+    """공유 저장소 플러시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_workers_merged_in_shared_store(self) -> None:
+        store = MemoryUsageStore()
+        workers = [UsageAccountant(store=store, worker_id=f"w{i}") for i in range(2)]
+        for accountant in workers:
+            accountant.record(_record())
+            accountant.record_stages("chat", {"generate_answer": 500.0})
+            assert await accountant.flush()
+
+        report = await workers[0].get_report()
+
+        shared = report["shared"]
+        assert shared["models"]["totals"]["requests"] == 2
+        assert shared["stages"]["chat"]["generate_answer"]["count"] == 2
+        assert set(shared["workers"]) == {"w0", "w1"}
+        assert report["worker"]["models"]["totals"]["requests"] == 1
+        assert await workers[0].flush() is False  # 보낼 델타 없음
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_delta_for_retry(self) -> None:
+        store = FailingStore()
+        accountant = UsageAccountant(store=store, worker_id="w0")
+        accountant.record(_record())
+
+        assert await accountant.flush() is False
+        accountant.record(_record())
+        store.fail = False
+        assert await accountant.flush() is True
+
+        models, _, _ = await store.load()
+        assert models[("chat", "google/gemini-2.5-flash")]["requests"] == 2
+        assert (await accountant.get_report())["flush"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_store_round_trip(self) -> None:
+        redis = FakeRedis()
+        accountant = UsageAccountant(store=RedisUsageStore(redis, key_prefix="t:"), worker_id="w0")
+        accountant.record(_record(model="anthropic/claude-sonnet-4-5", cached_tokens=500))
+        accountant.record_stages("chat_stream", {"rerank_documents": 40.0})
+
+        await accountant.flush()
+        report = await accountant.get_report()
+
+        entry = report["shared"]["models"]["by_route"]["chat"]["anthropic/claude-sonnet-4-5"]
+        assert (entry["prompt_tokens"], entry["cached_tokens"]) == (1000, 500)
+        assert report["shared"]["stages"]["chat_stream"]["rerank_documents"]["count"] == 1
+        assert "w0" in redis.hashes["t:workers"]
+
+    @pytest.mark.asyncio
+    async def test_redis_retry_after_lost_reply_not_double_counted(self) -> None:
+        """EXEC 반영 후 응답만 유실되면 같은 배치 재시도는 건너뛰고 새 델타만 더함"""
+        redis = FakeRedis()
+        accountant = UsageAccountant(store=RedisUsageStore(redis, key_prefix="t:"), worker_id="w0")
+        accountant.record(_record())
+
+        redis.lose_reply = True
+        assert await accountant.flush() is False
+        accountant.record(_record())
+        assert await accountant.flush() is True
+
+        models, _, _ = await accountant.store.load()
+        assert models[("chat", "google/gemini-2.5-flash")]["requests"] == 2
+        assert (await accountant.get_report())["flush"]["pending"] is False
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush_and_final_flush_on_stop(self) -> None:
+        store = MemoryUsageStore()
+        accountant = UsageAccountant(
+            UsageAccountingConfig(flush_interval_seconds=0.01), store=store, worker_id="w0"
+        )
+        accountant.start()
+        accountant.record(_record())
+        await asyncio.sleep(0.05)
+        assert store.models[("chat", "google/gemini-2.5-flash")]["requests"] == 1
+
+        accountant.record(_record())
+        await accountant.stop()
+
+        assert store.models[("chat", "google/gemini-2.5-flash")]["requests"] == 2
@@ -0,0 +1,150 @@
+"""
+순수 ASGI 미들웨어 단위 테스트
+
+대상 모듈: app/lib/auth.py (APIKeyAuthMiddleware), app/middleware/error_logger.py,
+app/middleware/request_logger.py, app/middleware/compression.py
+테스트 범위: 인증 거부/통과, 예외 로깅 후 전파, 요청 로그, SSE 압축 제외
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.lib.auth import APIKeyAuth, APIKeyAuthMiddleware
+from app.middleware.compression import StreamingSafeGZipMiddleware
+from app.middleware.error_logger import ErrorLoggingMiddleware
+from app.middleware.request_logger import RequestLoggingMiddleware
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/data")
+    async def data() -> dict[str, str]:
+        return {"payload": "가" * 2000}
+
+    @app.get("/api/stream")
+    async def stream() -> StreamingResponse:
+        async def events() -> AsyncIterator[str]:
+            for i in range(3):
+                yield f"data: {i}\n\n"
+                await asyncio.sleep(0)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/api/boom")
+    async def boom() -> None:
+        raise ValueError("boom")
+
+    return app
+
+
+async def _get(app: FastAPI, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, **kwargs)
+
+
+class TestAPIKeyAuthMiddleware:
+    """API Key 인증 미들웨어 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_key_and_passes_valid_key(self) -> None:
+        app = _app()
+        app.add_middleware(APIKeyAuthMiddleware, auth=APIKeyAuth(api_key="secret"))
+
+        denied = await _get(app, "/api/data")
+        allowed = await _get(app, "/api/data", headers={"X-API-Key": "secret"})
+
+        assert denied.status_code == 401
+        assert denied.json()["detail"]["message"] == "API Key가 필요합니다"
+        assert allowed.status_code == 200
+
+
+class TestErrorLoggingMiddleware:
+    """에러 로깅 미들웨어 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_logs_and_propagates_exception(self) -> None:
+        app = _app()
+        app.add_middleware(ErrorLoggingMiddleware)
+
+        with patch("app.middleware.error_logger.logger") as mock_logger:
+            response = await _get(app, "/api/boom")
+
+        assert response.status_code == 500
+        kwargs = mock_logger.error.call_args.kwargs
+        assert mock_logger.error.call_args.args[0] == "unhandled_exception_caught"
+        assert (kwargs["path"], kwargs["error_type"]) == ("/api/boom", "ValueError")
+
+
+class TestRequestLoggingMiddleware:
+    """요청 로깅 미들웨어 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_logs_status_and_timing(self) -> None:
+        app = _app()
+        app.add_middleware(RequestLoggingMiddleware)
+
+        with patch("app.middleware.request_logger.logger") as mock_logger:
+            await _get(app, "/api/stream")
+
+        extra = mock_logger.info.call_args.kwargs["extra"]
+        assert (extra["path"], extra["status_code"]) == ("/api/stream", 200)
+        assert extra["total_time"] >= extra["process_time"]
+
+
+class TestStreamingSafeGZipMiddleware:
+    """SSE 압축 제외 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_json_compressed_event_stream_untouched(self) -> None:
+        app = _app()
+        app.add_middleware(StreamingSafeGZipMiddleware, minimum_size=1000)
+        headers = {"Accept-Encoding": "gzip"}
+
+        data = await _get(app, "/api/data", headers=headers)
+        stream = await _get(app, "/api/stream", headers=headers)
+
+        assert data.headers["content-encoding"] == "gzip"
+        assert data.json()["payload"] == "가" * 2000
+        assert "content-encoding" not in stream.headers
+        assert stream.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+    @pytest.mark.asyncio
+    async def test_event_stream_chunks_forwarded_individually(self) -> None:
+        app = _app()
+        middleware = StreamingSafeGZipMiddleware(app, minimum_size=1)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/stream",
+            "raw_path": b"/api/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"accept-encoding", b"gzip")],
+            "server": ("test", 80),
+            "client": ("test", 1234),
+        }
+        sent: list[dict] = []
+
+        async def receive() -> dict:
+            await asyncio.sleep(0.1)
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        await middleware(scope, receive, send)
+
+        bodies = [m["body"] for m in sent if m["type"] == "http.response.body" and m.get("body")]
+        assert bodies == [b"data: 0\n\n", b"data: 1\n\n", b"data: 2\n\n"]
+
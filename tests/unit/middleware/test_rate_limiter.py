@@ -0,0 +1,170 @@
+"""
+GCRA Rate Limiter 단위 테스트
+
+대상 모듈: app/middleware/rate_limiter.py
+테스트 범위: 버스트/회복, IP→Session 우선순위, LRU 제거, 만료 정리,
+Redis 공유 한도와 장애 시 로컬 대체, 미들웨어 응답 헤더와 session_id 추출
+"""
+
+import time
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from app.middleware.rate_limiter import (
+    GCRA_LUA_SCRIPT,
+    LocalGCRAStore,
+    RateLimiter,
+    RateLimitMiddleware,
+    gcra,
+)
+
+
+class FakeRedis:
+    """register_script로 GCRA_LUA_SCRIPT를 파이썬 gcra()로 흉내 내는 Redis"""
+
+    def __init__(self) -> None:
+        self.values: dict[str, float] = {}
+        self.calls: list[tuple[list[str], list[Any]]] = []
+        self.fail = False
+
+    def register_script(self, script: str) -> Any:
+        assert script == GCRA_LUA_SCRIPT
+
+        async def run(keys: list[str], args: list[Any]) -> list[Any]:
+            if self.fail:
+                raise ConnectionError("redis down")
+            self.calls.append((keys, args))
+            now = time.time()
+            allowed, value = gcra(self.values.get(keys[0]), now, float(args[0]), float(args[1]))
+            if not allowed:
+                return [0, str(value)]
+            self.values[keys[0]] = value
+            return [1, str(value - now)]
+
+        return run
+
+
+class TestGCRA:
+    """GCRA 판정 테스트"""
+
+    def test_burst_then_recovery(self) -> None:
+        store = LocalGCRAStore(max_keys=10)
+        interval, window = 60 / 3, 60.0
+
+        results = [store.check("ip", 1000.0, interval, window)[0] for _ in range(4)]
+        allowed, retry_after = store.check("ip", 1000.0, interval, window)
+
+        assert results == [True, True, True, False]
+        assert not allowed and retry_after == pytest.approx(20.0)
+        assert store.check("ip", 1020.0, interval, window)[0] is True
+
+    def test_lru_evicts_least_recent_key(self) -> None:
+        store = LocalGCRAStore(max_keys=2)
+        for key in ("a", "b", "a", "c"):
+            store.check(key, 0.0, 1.0, 10.0)
+
+        assert len(store) == 2
+        assert store.evictions == 1
+        assert store.purge_expired(100.0) == 2
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_ip_limit_and_remaining(self) -> None:
+        limiter = RateLimiter(ip_limit=3, session_limit=1, window_seconds=60)
+
+        results = [await limiter.check_rate_limit(ip="1.1.1.1", session_id="s") for _ in range(4)]
+
+        assert results == [(True, "ip", 2), (True, "ip", 1), (True, "ip", 0), (False, "ip", 0)]
+        decision = await limiter.check(ip="1.1.1.1")
+        assert decision.retry_after == pytest.approx(20.0, abs=0.5)
+
+    @pytest.mark.asyncio
+    async def test_session_fallback_and_no_key(self) -> None:
+        limiter = RateLimiter(ip_limit=3, session_limit=1, window_seconds=60)
+
+        assert await limiter.check_rate_limit(session_id="s1") == (True, "session", 0)
+        assert await limiter.check_rate_limit(session_id="s1") == (False, "session", 0)
+        assert await limiter.check_rate_limit() == (True, "none", -1)
+
+    @pytest.mark.asyncio
+    async def test_redis_shared_between_workers(self) -> None:
+        redis = FakeRedis()
+        workers = [RateLimiter(ip_limit=2, redis_client=redis) for _ in range(2)]
+
+        results = [(await w.check(ip="9.9.9.9")).allowed for w in workers + workers]
+
+        assert results == [True, True, False, False]
+        assert redis.calls[0] == (["ratelimit:ip:9.9.9.9"], [30.0, 60.0])
+        assert len(workers[0].ip_store) == 0  # 로컬 상태 미사용
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_local(self) -> None:
+        redis = FakeRedis()
+        redis.fail = True
+        limiter = RateLimiter(ip_limit=1, redis_client=redis, redis_retry_seconds=60)
+
+        first = await limiter.check(ip="2.2.2.2")
+        second = await limiter.check(ip="2.2.2.2")
+
+        assert (first.allowed, second.allowed) == (True, False)
+        stats = await limiter.get_stats()
+        assert stats["redis_errors"] == 1  # 재시도 대기 중에는 Redis 호출 생략
+        assert stats["local_fallbacks"] == 2
+
+
+class TestRateLimitMiddleware:
+    """미들웨어 응답 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_headers_and_retry_after(self) -> None:
+        app = FastAPI()
+
+        @app.get("/api/ping")
+        async def ping() -> dict[str, str]:
+            return {"status": "ok"}
+
+        app.add_middleware(
+            RateLimitMiddleware, rate_limiter=RateLimiter(ip_limit=2, window_seconds=60)
+        )
+        transport = httpx.ASGITransport(app=app)
+        headers = {"X-Forwarded-For": "3.3.3.3"}
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [await client.get("/api/ping", headers=headers) for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[0].headers["X-RateLimit-Remaining"] == "1"
+        assert responses[2].headers["Retry-After"] == "30"
+        assert responses[2].json()["retry_after"] == 30
+
+    @pytest.mark.asyncio
+    async def test_session_from_query_and_body_peek(self) -> None:
+        app = FastAPI()
+        received: list[bytes] = []
+
+        @app.post("/api/feedback")
+        async def feedback(request: Request) -> dict[str, str]:
+            received.append(await request.body())
+            return {"status": "ok"}
+
+        limiter = RateLimiter(session_limit=1, window_seconds=60)
+        app.add_middleware(
+            RateLimitMiddleware, rate_limiter=limiter, body_peek_paths=["/api/feedback"]
+        )
+        body = b'{"session_id": "s-1", "text": "' + b"x" * 10_000 + b'"}'
+
+        # 클라이언트 주소가 없는 ASGI 요청 (IP 미확인 → session 기반)
+        transport = httpx.ASGITransport(app=app, client=None)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.post("/api/feedback", content=body)
+            second = await client.post("/api/feedback?session_id=s-1", content=b"{}")
+
+        assert first.headers["X-RateLimit-Type"] == "session"
+        assert received == [body]  # 본문은 잘리지 않고 그대로 전달
+        assert second.status_code == 429
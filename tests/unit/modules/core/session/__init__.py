@@ -0,0 +1 @@
+# Session 모듈 테스트 패키지
@@ -0,0 +1,144 @@
+"""
+백그라운드 증분 대화 요약 단위 테스트
+
+대상 모듈: app/modules/core/session/services/memory_service.py
+테스트 범위: 요청 경로에서 요약 대기 없음, 밀려난 메시지만 기존 요약에 반영,
+실행 중 추가된 대기 메시지 이어서 처리, 실패 시 대기열 유지
+"""
+
+import asyncio
+
+import pytest
+
+from app.modules.core.session.facade import EnhancedSessionModule
+from app.modules.core.session.services.memory_service import MemoryService
+from app.modules.core.session.store import MemorySessionStore
+
+
+class FakeSummarizer:
+    """_summarize_conversations 대체 (gate가 열릴 때까지 LLM 호출이 걸려 있는 것처럼 동작)"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], str | None]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def __call__(self, messages: list, previous_summary: str | None = None) -> str:
+        self.calls.append(([m.content for m in messages], previous_summary))
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return f"요약{len(self.calls)}"
+
+
+@pytest.fixture
+def summarizer() -> FakeSummarizer:
+    return FakeSummarizer()
+
+
+@pytest.fixture
+def module(summarizer: FakeSummarizer) -> EnhancedSessionModule:
+    config = {
+        "session": {
+            "ttl": 3600,
+            "conversation_summary": {"enabled": True, "trigger_count": 2},
+        }
+    }
+    memory_service = MemoryService(max_exchanges=2, config=config, store=MemorySessionStore())
+    memory_service._summarize_conversations = summarizer  # type: ignore[method-assign]
+    return EnhancedSessionModule(config, memory_service)
+
+
+async def _add(module: EnhancedSessionModule, session_id: str, *turns: int) -> None:
+    for turn in turns:
+        await module.add_conversation(session_id, f"질문{turn}", f"답변{turn}")
+
+
+async def _drain(module: EnhancedSessionModule) -> None:
+    await asyncio.gather(*module.memory_service._summary_tasks.values())
+
+
+@pytest.mark.unit
+class TestBackgroundSummary:
+    """백그라운드 증분 요약 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_context_served_without_waiting_for_summary(
+        self, module: EnhancedSessionModule, summarizer: FakeSummarizer
+    ) -> None:
+        summarizer.gate.clear()
+        session_id = (await module.create_session())["session_id"]
+
+        await _add(module, session_id, 0, 1, 2)  # 교환 0이 윈도우(2교환)에서 밀려남
+        await asyncio.sleep(0)
+        context = await module.get_context_string(session_id)
+
+        assert len(summarizer.calls) == 1  # 백그라운드에서 LLM 대기 중
+        assert "[이전 대화 요약]" not in context
+        assert "사용자: 질문0" in context  # 아직 접지 않은 메시지는 원문 유지
+        assert "AI: 답변2" in context
+
+        summarizer.gate.set()
+        await _drain(module)
+        context = await module.get_context_string(session_id)
+
+        assert "[이전 대화 요약]\n요약1" in context
+        assert "질문0" not in context
+
+    @pytest.mark.asyncio
+    async def test_only_aged_out_messages_folded_into_previous_summary(
+        self, module: EnhancedSessionModule, summarizer: FakeSummarizer
+    ) -> None:
+        session_id = (await module.create_session())["session_id"]
+
+        await _add(module, session_id, 0, 1, 2)
+        await _drain(module)
+        await _add(module, session_id, 3)
+        await _drain(module)
+
+        assert summarizer.calls == [
+            (["질문0", "답변0"], None),
+            (["질문1", "답변1"], "요약1"),
+        ]
+        state = await module.memory_service.store.load_summary(session_id)
+        assert (state["text"], state["folded_upto"], state["pending"]) == ("요약2", 4, [])
+
+    @pytest.mark.asyncio
+    async def test_messages_aged_during_fold_picked_up_by_same_task(
+        self, module: EnhancedSessionModule, summarizer: FakeSummarizer
+    ) -> None:
+        summarizer.gate.clear()
+        session_id = (await module.create_session())["session_id"]
+
+        await _add(module, session_id, 0, 1, 2)
+        await asyncio.sleep(0)
+        await _add(module, session_id, 3, 4)  # 실행 중: 새 작업을 만들지 않고 대기열에만 추가
+        assert len(module.memory_service._summary_tasks) == 1
+
+        summarizer.gate.set()
+        await _drain(module)
+
+        assert summarizer.calls[1] == (["질문1", "답변1", "질문2", "답변2"], "요약1")
+        assert module.memory_service.get_summary_stats()["folded_messages"] == 6
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_pending_for_retry(
+        self, module: EnhancedSessionModule, summarizer: FakeSummarizer
+    ) -> None:
+        summarizer.fail = True
+        session_id = (await module.create_session())["session_id"]
+
+        await _add(module, session_id, 0, 1, 2)
+        await _drain(module)
+        context = await module.get_context_string(session_id)
+
+        assert module.memory_service.get_summary_stats()["failures"] == 1
+        assert "사용자: 질문0" in context
+
+        summarizer.fail = False
+        await _add(module, session_id, 3)
+        await _drain(module)
+
+        assert summarizer.calls[-1] == (["질문0", "답변0", "질문1", "답변1"], None)
+        assert "[이전 대화 요약]" in await module.get_context_string(session_id)
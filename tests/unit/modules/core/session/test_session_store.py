@@ -0,0 +1,382 @@
+"""
+세션 저장소 단위 테스트
+
+대상 모듈: app/modules/core/session/store.py
+테스트 범위: SQLite/Redis 저장소 round trip (datetime 보존, capped list, 만료),
+워커 간 히스토리 공유 (지연 로드 + 버전 확인), 워커별 LRU 상한, 만료 시 Lock 회수,
+요약 상태 CAS (세션 문서 저장과 독립, Redis WATCH 재시도)
+"""
+
+import asyncio
+import fnmatch
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from redis.exceptions import WatchError
+
+from app.modules.core.session.facade import EnhancedSessionModule
+from app.modules.core.session.services.memory_service import MemoryService
+from app.modules.core.session.store import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SQLiteSessionStore,
+)
+
+
+class FakeRedis:
+    """세션 저장소가 쓰는 명령만 흉내 내는 Redis (TTL 무시)"""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self.revisions: dict[str, int] = {}
+        self.before_exec: Any = None  # WATCH 이후 EXEC 직전에 끼어들 쓰기 (1회)
+
+    def touch(self, key: str) -> None:
+        self.revisions[key] = self.revisions.get(key, 0) + 1
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def delete(self, *keys: str) -> int:
+        for key in keys:
+            self.touch(key)
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        return list(self.values.get(key, []))
+
+    async def scan_iter(self, match: str, count: int = 10):
+        for key in list(self.values):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakePipeline:
+    """명령을 모았다가 execute에서 실행 (WATCH한 키가 바뀌었으면 WatchError)"""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.ops: list[Any] = []
+        self.watched: dict[str, int] = {}
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.ops, self.watched = [], {}
+
+    async def watch(self, *keys: str) -> None:
+        self.watched = {key: self.redis.revisions.get(key, 0) for key in keys}
+
+    async def get(self, key: str) -> str | None:
+        return self.redis.values.get(key)
+
+    def multi(self) -> None:
+        pass
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        def op() -> bool:
+            self.redis.values[key] = value
+            self.redis.touch(key)
+            return True
+
+        self.ops.append(op)
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.ops.append(lambda: key in self.redis.values)
+
+    def rpush(self, key: str, *items: str) -> None:
+        def op() -> int:
+            self.redis.values.setdefault(key, []).extend(items)
+            return len(self.redis.values[key])
+
+        self.ops.append(op)
+
+    def ltrim(self, key: str, start: int, end: int) -> None:
+        def op() -> bool:
+            self.redis.values[key] = self.redis.values[key][start : end + 1 or None]
+            return True
+
+        self.ops.append(op)
+
+    def incrby(self, key: str, amount: int) -> None:
+        def op() -> int:
+            self.redis.values[key] = int(self.redis.values.get(key, 0)) + amount
+            return int(self.redis.values[key])
+
+        self.ops.append(op)
+
+    async def execute(self) -> list[Any]:
+        if self.watched and self.redis.before_exec is not None:
+            interleave, self.redis.before_exec = self.redis.before_exec, None
+            await interleave()
+        if any(self.redis.revisions.get(k, 0) != v for k, v in self.watched.items()):
+            raise WatchError("watched key changed")
+        ops, self.ops = self.ops, []
+        return [op() for op in ops]
+
+
+class FakeSummarizer:
+    """_summarize_conversations 대체 (gate가 열릴 때까지 LLM 호출이 걸려 있는 것처럼 동작)"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], str | None]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, messages: list, previous_summary: str | None = None) -> str:
+        self.calls.append(([m.content for m in messages], previous_summary))
+        await self.gate.wait()
+        return f"요약{len(self.calls)}"
+
+
+def _session(session_id: str) -> dict[str, Any]:
+    now = datetime.now(UTC)
+    return {
+        "session_id": session_id,
+        "created_at": now,
+        "last_accessed": now,
+        "metadata": {"ip_address": "127.0.0.1"},
+        "topics": ["환불"],
+        "messages_metadata": [],
+    }
+
+
+def _exchange(n: int) -> list[dict[str, str]]:
+    return [{"role": "human", "content": f"질문{n}"}, {"role": "ai", "content": f"답변{n}"}]
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> Any:
+    if request.param == "sqlite":
+        return SQLiteSessionStore(tmp_path / "sessions.db", ttl_seconds=3600)
+    return RedisSessionStore(FakeRedis(), ttl_seconds=3600, key_prefix="t:")
+
+
+def _module(
+    store: Any, cache_size: int = 1000, summarizer: FakeSummarizer | None = None
+) -> EnhancedSessionModule:
+    config: dict[str, Any] = {
+        "session": {"ttl": 3600, "max_exchanges": 2, "history_cache_size": cache_size}
+    }
+    if summarizer is not None:
+        config["session"]["conversation_summary"] = {"enabled": True, "trigger_count": 2}
+    memory_service = MemoryService(max_exchanges=2, config=config, store=store)
+    if summarizer is not None:
+        memory_service._summarize_conversations = summarizer  # type: ignore[method-assign]
+    return EnhancedSessionModule(config, memory_service)
+
+
+class TestStoreRoundTrip:
+    """외부 저장소 기본 동작 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_session_document_preserves_datetimes(self, store: Any) -> None:
+        session = _session("s1")
+        await store.save("s1", session)
+
+        loaded = await store.load("s1")
+
+        assert loaded == session
+        assert isinstance(loaded["last_accessed"], datetime)
+        assert set(await store.scan()) == {"s1"}
+        assert await store.load("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_history_is_capped_and_versioned(self, store: Any) -> None:
+        versions = [
+            await store.append_messages("s1", _exchange(n), max_messages=4) for n in range(3)
+        ]
+
+        messages = await store.load_messages("s1")
+
+        assert [m["content"] for m in messages] == ["질문1", "답변1", "질문2", "답변2"]
+        assert versions == sorted(versions) and len(set(versions)) == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "sqlite", "redis"])
+    async def test_zero_cap_keeps_no_history(self, backend: str, tmp_path: Path) -> None:
+        store = {
+            "memory": lambda: MemorySessionStore(),
+            "sqlite": lambda: SQLiteSessionStore(tmp_path / "sessions.db", ttl_seconds=3600),
+            "redis": lambda: RedisSessionStore(FakeRedis(), ttl_seconds=3600, key_prefix="t:"),
+        }[backend]()
+
+        await store.append_messages("s1", _exchange(0), max_messages=0)
+
+        assert await store.load_messages("s1") == []
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_document_and_history(self, store: Any) -> None:
+        await store.save("s1", _session("s1"))
+        await store.append_messages("s1", _exchange(0), max_messages=4)
+
+        assert await store.delete("s1") is True
+        assert await store.load("s1") is None
+        assert await store.load_messages("s1") == []
+        assert await store.delete("s1") is False
+
+    @pytest.mark.asyncio
+    async def test_sqlite_expired_rows_purged_on_scan(self, tmp_path: Path) -> None:
+        store = SQLiteSessionStore(tmp_path / "sessions.db", ttl_seconds=-120)
+        await store.save("s1", _session("s1"))
+        await store.append_messages("s1", _exchange(0), max_messages=4)
+
+        assert await store.load("s1") is None
+        assert await store.scan() == {}
+        assert await store.load_messages("s1") == []
+
+
+class TestSharedHistory:
+    """워커 간 히스토리 공유 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_workers_share_sessions_and_history(self, store: Any) -> None:
+        worker_a, worker_b = _module(store), _module(store)
+        session_id = (await worker_a.create_session({"user_agent": "test"}))["session_id"]
+
+        await worker_a.add_conversation(session_id, "저는 홍길동입니다", "안녕하세요")
+        context_b = await worker_b.get_context_string(session_id)
+        await worker_b.add_conversation(session_id, "환불 기간은?", "7일입니다")
+        history_a = await worker_a.get_chat_history(session_id)
+
+        assert "사용자 이름: 홍길동" in context_b
+        assert "AI: 안녕하세요" in context_b
+        assert [m["content"] for m in history_a["messages"]][-2:] == ["환불 기간은?", "7일입니다"]
+        assert worker_a.sessions == {}  # 공유 저장소는 워커 로컬 사본 없음
+
+    @pytest.mark.asyncio
+    async def test_stale_version_in_document_resynced_on_append(self, store: Any) -> None:
+        worker_a, worker_b = _module(store), _module(store)
+        session_id = (await worker_a.create_session())["session_id"]
+        await worker_b.get_context_string(session_id)  # B 캐시 적재 (version 0)
+
+        await worker_a.add_conversation(session_id, "질문A", "답변A")
+        # 동시 저장 경합으로 세션 문서의 history_version이 이전 값으로 덮어써진 상황
+        session = await store.load(session_id)
+        session["history_version"] = 0
+        await store.save(session_id, session)
+
+        await worker_b.add_conversation(session_id, "질문B", "답변B")
+        history_b = await worker_b.get_chat_history(session_id)
+
+        assert [m["content"] for m in history_b["messages"]] == ["질문A", "답변A", "질문B", "답변B"]
+        assert worker_b.memory_service.get_cache_stats()["resyncs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_history_cache_and_locks_bounded(self, tmp_path: Path) -> None:
+        module = _module(SQLiteSessionStore(tmp_path / "s.db", ttl_seconds=3600), cache_size=2)
+        session_ids = [(await module.create_session())["session_id"] for _ in range(4)]
+        for session_id in session_ids:
+            await module.add_conversation(session_id, "질문", "답변")
+
+        stats = (await module.get_stats())["history_cache"]
+
+        assert stats["size"] == 2 and stats["locks"] <= 2
+        assert stats["evictions"] >= 2
+        # 축출된 세션은 저장소에서 다시 읽음
+        history = await module.get_chat_history(session_ids[0])
+        assert history["message_count"] == 2
+
+
+class TestSummaryState:
+    """대화 요약 상태 원자적 갱신 테스트 (세션 문서와 별도 키)"""
+
+    @pytest.mark.asyncio
+    async def test_commit_is_compare_and_set_on_folded_upto(self, store: Any) -> None:
+        await store.queue_summary("s1", _exchange(0) + _exchange(1), max_pending=4)
+
+        assert await store.commit_summary("s1", 0, "요약", 2) is True
+        assert await store.commit_summary("s1", 0, "늦은 요약", 4) is False  # 이미 2까지 반영
+        state = await store.load_summary("s1")
+
+        assert (state["text"], state["folded_upto"], state["aged"]) == ("요약", 2, 4)
+        assert [item["seq"] for item in state["pending"]] == [3, 4]
+        assert await store.commit_summary("missing", 0, "요약", 2) is False
+
+    @pytest.mark.asyncio
+    async def test_pending_queue_is_capped(self, store: Any) -> None:
+        capped = await store.queue_summary("s1", _exchange(0) + _exchange(1), max_pending=3)
+        empty = await store.queue_summary("s2", _exchange(0), max_pending=0)
+
+        assert [m["content"] for m in capped["pending"]] == ["답변0", "질문1", "답변1"]
+        assert empty["pending"] == []
+
+    @pytest.mark.asyncio
+    async def test_stale_session_save_does_not_revert_summary(self, store: Any) -> None:
+        summarizer = FakeSummarizer()
+        summarizer.gate.clear()
+        module = _module(store, summarizer=summarizer)
+        session_id = (await module.create_session())["session_id"]
+
+        for turn in range(3):  # 교환 0이 윈도우(2교환)에서 밀려나 요약 시작
+            await module.add_conversation(session_id, f"질문{turn}", f"답변{turn}")
+        await asyncio.sleep(0)
+        # 요청이 읽어 둔 세션 문서 사본 (요약 완료 후 이 사본이 저장되는 상황)
+        stale = await store.load(session_id)
+        await module.add_conversation(session_id, "질문3", "답변3")  # 요약 중 대기열 추가
+
+        summarizer.gate.set()
+        await asyncio.gather(*module.memory_service._summary_tasks.values())
+        await store.save(session_id, stale)
+        state = await store.load_summary(session_id)
+        context = await module.get_context_string(session_id)
+
+        assert summarizer.calls == [(["질문0", "답변0"], None), (["질문1", "답변1"], "요약1")]
+        assert (state["text"], state["folded_upto"], state["pending"]) == ("요약2", 4, [])
+        assert "[이전 대화 요약]\n요약2" in context
+        assert "질문1" not in context
+
+    @pytest.mark.asyncio
+    async def test_redis_update_retries_on_watch_conflict(self) -> None:
+        redis = FakeRedis()
+        store = RedisSessionStore(redis, ttl_seconds=3600, key_prefix="t:")
+        await store.queue_summary("s1", _exchange(0), max_pending=8)
+
+        async def concurrent_queue() -> None:
+            other = RedisSessionStore(redis, ttl_seconds=3600, key_prefix="t:")
+            await other.queue_summary("s1", _exchange(1), max_pending=8)
+
+        redis.before_exec = concurrent_queue
+        state = await store.queue_summary("s1", _exchange(2), max_pending=8)
+
+        assert [item["content"] for item in state["pending"]] == [
+            "질문0",
+            "답변0",
+            "질문1",
+            "답변1",
+            "질문2",
+            "답변2",
+        ]
+        assert [item["seq"] for item in state["pending"]] == [1, 2, 3, 4, 5, 6]
+
+
+class TestLockReclaim:
+    """메모리 저장소 Lock 회수 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_expired_session_releases_memory_and_lock(self) -> None:
+        store = MemorySessionStore()
+        module = _module(store)
+        session_id = (await module.create_session())["session_id"]
+        await module.add_conversation(session_id, "질문", "답변")
+        assert session_id in module.memory_service.session_locks
+
+        store.sessions[session_id]["last_accessed"] = datetime.now(UTC) - timedelta(hours=2)
+        result = await module.get_session(session_id)
+
+        assert result["reason"] == "session_expired"
+        assert session_id not in module.memory_service.session_locks
+        assert session_id not in module.memories
+        assert module.sessions is store.sessions and session_id not in module.sessions
@@ -21,7 +21,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.modules.core.graph.interfaces import Entity, GraphSearchResult
+from app.modules.core.graph.interfaces import Entity, GraphSearchResult, IGraphStore
 from app.modules.core.retrieval.hybrid_search.interfaces import (
     HybridSearchResult,
     IHybridSearchStrategy,
@@ -36,7 +36,7 @@ class TestVectorGraphHybridSearchInit:
         """유효한 컴포넌트로 초기화 성공"""
         # Given - Mock 객체 생성
         mock_retriever = MagicMock(spec=IRetriever)
-        mock_graph_store = MagicMock()  # IGraphStore를 모방
+        mock_graph_store = MagicMock(spec=IGraphStore)  # IGraphStore를 모방 (인접 행렬 미지원)
         config: dict[str, Any] = {
             "vector_weight": 0.6,
             "graph_weight": 0.4,
@@ -86,7 +86,7 @@ class TestVectorGraphHybridSearchInit:
         """기본 가중치로 초기화 (설정 없는 경우)"""
         # Given
         mock_retriever = MagicMock(spec=IRetriever)
-        mock_graph_store = MagicMock()
+        mock_graph_store = MagicMock(spec=IGraphStore)
         config: dict[str, Any] = {}  # 빈 설정
 
         # When
@@ -140,7 +140,7 @@ class TestVectorGraphHybridSearchSearch:
     @pytest.fixture
     def mock_graph_store(self) -> AsyncMock:
         """Mock GraphStore 생성"""
-        mock = AsyncMock()
+        mock = AsyncMock(spec=IGraphStore)
         # 2. 그래프 검색 결과 Mock
         mock.search.return_value = GraphSearchResult(
             entities=[
@@ -324,7 +324,7 @@ class TestVectorGraphHybridSearchSearch:
     ) -> None:
         """그래프 검색 결과가 비어있어도 정상 동작"""
         # Given - 빈 그래프 검색 결과
-        empty_graph_store = AsyncMock()
+        empty_graph_store = AsyncMock(spec=IGraphStore)
         empty_graph_store.search.return_value = GraphSearchResult(
             entities=[],
             relations=[],
@@ -362,7 +362,7 @@ class TestVectorGraphHybridSearchRRF:
     def hybrid_search_for_rrf(self) -> Any:
         """RRF 테스트용 하이브리드 검색 인스턴스"""
         mock_retriever = AsyncMock(spec=IRetriever)
-        mock_graph_store = AsyncMock()
+        mock_graph_store = AsyncMock(spec=IGraphStore)
 
         from app.modules.core.retrieval.hybrid_search.vector_graph_search import (
             VectorGraphHybridSearch,
@@ -560,7 +560,7 @@ class TestVectorGraphHybridSearchConfig:
         """get_config에 그래프 활성화 상태 포함"""
         # Given
         mock_retriever = MagicMock(spec=IRetriever)
-        mock_graph_store = MagicMock()
+        mock_graph_store = MagicMock(spec=IGraphStore)
 
         from app.modules.core.retrieval.hybrid_search.vector_graph_search import (
             VectorGraphHybridSearch,
@@ -662,3 +662,95 @@ class TestVectorGraphHybridSearchEdgeCases:
         # 내부적으로 가중치가 저장되었는지 확인
         assert "vector_weight" in result_config
         assert "graph_weight" in result_config
+
+
+class TestVectorGraphHybridSearchExpansion:
+    """CSR 인접 행렬 기반 그래프 확장 테스트 (실제 NetworkXGraphStore 사용)"""
+
+    @pytest.fixture
+    async def graph_store(self) -> Any:
+        """A 업체(doc-a) - 김 담당자(doc 없음) - B 업체(doc-b) 체인"""
+        from app.modules.core.graph.models import Relation
+        from app.modules.core.graph.stores.networkx_store import NetworkXGraphStore
+
+        store = NetworkXGraphStore()
+        await store.add_entities_bulk(
+            [
+                Entity(id="a", name="A 업체", type="company", properties={"doc_id": "doc-a"}),
+                Entity(id="p", name="김 담당자", type="person"),
+                Entity(id="b", name="B 업체", type="company", properties={"doc_id": "doc-b"}),
+            ]
+        )
+        await store.add_relation(Relation(source_id="p", target_id="a", type="works_at"))
+        await store.add_relation(Relation(source_id="p", target_id="b", type="contacts"))
+        return store
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["khop", "ppr"])
+    async def test_expansion_recalls_multi_hop_documents(
+        self, graph_store: Any, method: str
+    ) -> None:
+        """시드(A 업체)에서 doc_id 없는 브리지 노드를 거쳐 B 업체 문서까지 회수"""
+        from app.modules.core.retrieval.hybrid_search.vector_graph_search import (
+            VectorGraphHybridSearch,
+        )
+
+        hybrid_search = VectorGraphHybridSearch(
+            retriever=AsyncMock(spec=IRetriever),
+            graph_store=graph_store,
+            config={"graph_expansion": {"method": method}},
+        )
+
+        results = await hybrid_search._graph_search("A 업체", top_k=5)
+
+        assert [r.id for r in results] == ["doc-a", "doc-b"]
+        assert [r.metadata["graph_hops"] for r in results] == (
+            [0, 2] if method == "khop" else [0, 1]
+        )
+        assert results[0].score > results[1].score
+        assert hybrid_search.get_config()["graph_expansion"] == method
+
+    @pytest.mark.asyncio
+    async def test_expansion_disabled_keeps_direct_matches_only(self, graph_store: Any) -> None:
+        from app.modules.core.retrieval.hybrid_search.vector_graph_search import (
+            VectorGraphHybridSearch,
+        )
+
+        hybrid_search = VectorGraphHybridSearch(
+            retriever=AsyncMock(spec=IRetriever),
+            graph_store=graph_store,
+            config={"graph_expansion": {"enabled": False}},
+        )
+
+        results = await hybrid_search._graph_search("A 업체", top_k=5)
+
+        assert [r.id for r in results] == ["doc-a"]
+        assert hybrid_search.get_config()["graph_expansion"] is None
+
+    def test_expansion_requires_adjacency_provider(self, graph_store: Any) -> None:
+        """IGraphAdjacencyProvider를 구현한 저장소에서만 확장 사용"""
+        from app.modules.core.graph.interfaces import IGraphAdjacencyProvider
+        from app.modules.core.retrieval.hybrid_search.vector_graph_search import (
+            VectorGraphHybridSearch,
+        )
+
+        plain_store = MagicMock(spec=IGraphStore)
+        hybrid_search = VectorGraphHybridSearch(
+            retriever=MagicMock(spec=IRetriever), graph_store=plain_store, config={}
+        )
+
+        assert isinstance(graph_store, IGraphAdjacencyProvider)
+        assert not isinstance(plain_store, IGraphAdjacencyProvider)
+        assert hybrid_search.get_config()["graph_expansion"] is None
+
+    def test_invalid_expansion_method_raises(self) -> None:
+        from app.modules.core.retrieval.hybrid_search.vector_graph_search import (
+            VectorGraphHybridSearch,
+        )
+
+        with pytest.raises(ValueError):
+            VectorGraphHybridSearch(
+                retriever=MagicMock(spec=IRetriever),
+                graph_store=None,
+                config={"graph_expansion": {"method": "random_walk"}},
+            )
@@ -13,6 +13,9 @@ import pytest
 
 from app.modules.core.retrieval.interfaces import SearchResult
 
+# 리랭커 모듈이 사용하는 공유 HTTP 클라이언트 조회 함수
+_GET_HTTP_CLIENT = "app.modules.core.retrieval.rerankers.cohere_reranker.get_http_client"
+
 
 class TestCohereRerankerInitialization:
     """Cohere 리랭커 초기화 테스트"""
@@ -147,8 +150,8 @@ class TestCohereRerankerReranking:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch(_GET_HTTP_CLIENT) as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -201,8 +204,8 @@ class TestCohereRerankerReranking:
         }
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch(_GET_HTTP_CLIENT) as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -248,8 +251,8 @@ class TestCohereRerankerErrorHandling:
 
         reranker = CohereReranker(api_key="test-key")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch(_GET_HTTP_CLIENT) as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=Exception("API Error")
             )
 
@@ -274,7 +277,7 @@ class TestCohereRerankerErrorHandling:
 
         from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # HTTP 500 에러 시뮬레이션
             mock_response = MagicMock()
             mock_response.status_code = 500
@@ -289,7 +292,7 @@ class TestCohereRerankerErrorHandling:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key")
             results = await reranker.rerank(query="test", results=sample_results)
@@ -311,14 +314,14 @@ class TestCohereRerankerErrorHandling:
 
         from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # 타임아웃 시뮬레이션
             async def mock_post(*args: Any, **kwargs: Any) -> None:
                 raise httpx.TimeoutException("Request timeout")
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key", timeout=1.0)
             results = await reranker.rerank(query="test", results=sample_results)
@@ -376,7 +379,7 @@ class TestCohereRerankerUtilities:
             SearchResult(id="test-doc", content="test", score=0.5, metadata={}),
         ]
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -386,7 +389,7 @@ class TestCohereRerankerUtilities:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key")
             await reranker.rerank(query="test", results=sample_results)
@@ -413,14 +416,14 @@ class TestCohereRerankerUtilities:
             SearchResult(id="test-doc", content="test", score=0.5, metadata={}),
         ]
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # 타임아웃 시뮬레이션
             async def mock_post(*args: Any, **kwargs: Any) -> None:
                 raise httpx.TimeoutException("Timeout")
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key")
             await reranker.rerank(query="test", results=sample_results)
@@ -12,6 +12,9 @@ import pytest
 
 from app.modules.core.retrieval.interfaces import SearchResult
 
+# 리랭커 모듈이 사용하는 공유 HTTP 클라이언트 조회 함수
+_GET_HTTP_CLIENT = "app.modules.core.retrieval.rerankers.jina_reranker.get_http_client"
+
 
 class TestJinaRerankerInitialization:
     """Jina 리랭커 초기화 테스트"""
@@ -152,7 +155,7 @@ class TestJinaRerankerReranking:
         """
         from app.modules.core.retrieval.rerankers.jina_reranker import JinaReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # Mock HTTP 응답
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -164,10 +167,10 @@ class TestJinaRerankerReranking:
                 ]
             }
 
-            # Mock AsyncClient context manager
+            # Mock 공유 AsyncClient
             mock_client_instance = MagicMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key")
             results = await reranker.rerank(
@@ -193,7 +196,7 @@ class TestJinaRerankerReranking:
         """
         from app.modules.core.retrieval.rerankers.jina_reranker import JinaReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -205,7 +208,7 @@ class TestJinaRerankerReranking:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key")
             results = await reranker.rerank(
@@ -264,7 +267,7 @@ class TestJinaRerankerErrorHandling:
 
         from app.modules.core.retrieval.rerankers.jina_reranker import JinaReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # HTTP 500 에러 시뮬레이션
             mock_response = MagicMock()
             mock_response.status_code = 500
@@ -279,7 +282,7 @@ class TestJinaRerankerErrorHandling:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key")
             results = await reranker.rerank(query="test", results=sample_results)
@@ -301,14 +304,14 @@ class TestJinaRerankerErrorHandling:
 
         from app.modules.core.retrieval.rerankers.jina_reranker import JinaReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # 타임아웃 시뮬레이션
             async def mock_post(*args: Any, **kwargs: Any) -> None:
                 raise httpx.TimeoutException("Request timeout")
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key", timeout=1.0)
             results = await reranker.rerank(query="test", results=sample_results)
@@ -329,14 +332,14 @@ class TestJinaRerankerErrorHandling:
         """
         from app.modules.core.retrieval.rerankers.jina_reranker import JinaReranker
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # 일반 예외 시뮬레이션
             async def mock_post(*args: Any, **kwargs: Any) -> None:
                 raise ValueError("Invalid response format")
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key")
             results = await reranker.rerank(query="test", results=sample_results)
@@ -397,7 +400,7 @@ class TestJinaRerankerUtilities:
             SearchResult(id="test-doc", content="test", score=0.5, metadata={}),
         ]
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -406,7 +409,7 @@ class TestJinaRerankerUtilities:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key")
             await reranker.rerank(query="test", results=sample_results)
@@ -435,14 +438,14 @@ class TestJinaRerankerUtilities:
             SearchResult(id="test-doc", content="test", score=0.5, metadata={}),
         ]
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch(_GET_HTTP_CLIENT) as mock_client_class:
             # 타임아웃 시뮬레이션
             async def mock_post(*args: Any, **kwargs: Any) -> None:
                 raise httpx.TimeoutException("Timeout")
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = JinaReranker(api_key="test-api-key")
             await reranker.rerank(query="test", results=sample_results)
@@ -806,3 +806,146 @@ class TestMongoDBRetrieverFallback:
 
             # 검증
             assert results == []
+
+
+class TestMongoDBRetrieverFilterPushdown:
+    """$vectorSearch 메타데이터 필터 pushdown 테스트"""
+
+    def _retriever(
+        self, matching: int, total: int, prefilter_fields: list[str] | None = None
+    ) -> Any:
+        from app.modules.core.retrieval.retrievers.mongodb_retriever import (
+            MongoDBRetriever,
+        )
+
+        retriever = MongoDBRetriever(
+            embedder=MagicMock(),
+            mongodb_client=MagicMock(),
+            prefilter_fields=prefilter_fields,
+        )
+        retriever.collection = MagicMock()
+        retriever.collection.count_documents.return_value = matching
+        retriever.collection.estimated_document_count.return_value = total
+        return retriever
+
+    @pytest.mark.asyncio
+    async def test_no_filter_pipeline(self) -> None:
+        """필터가 없으면 카디널리티 조회 없이 기본 파이프라인"""
+        retriever = self._retriever(matching=0, total=0)
+
+        pipeline = await retriever._build_vector_pipeline([0.1], top_k=5)
+
+        assert [next(iter(stage)) for stage in pipeline] == ["$vectorSearch", "$project"]
+        assert pipeline[0]["$vectorSearch"]["limit"] == 5
+        retriever.collection.count_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_indexed_filter_pushed_into_vector_search(self) -> None:
+        """filter 인덱스 필드만 사용하면 $vectorSearch.filter로 pushdown"""
+        retriever = self._retriever(matching=50_000, total=100_000, prefilter_fields=["file_type"])
+
+        pipeline = await retriever._build_vector_pipeline(
+            [0.1], top_k=5, filters={"file_type": "PDF"}
+        )
+
+        stage = pipeline[0]["$vectorSearch"]
+        assert stage["filter"] == {"metadata.metadata.file_type": "PDF"}
+        assert stage["limit"] == 5
+        assert len(pipeline) == 2
+        assert retriever.stats["prefiltered_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_small_indexed_subset_uses_exact_search(self) -> None:
+        """매칭 문서가 적으면 exact=True 전수 탐색 (numCandidates 없음)"""
+        retriever = self._retriever(matching=30, total=100_000, prefilter_fields=["file_type"])
+
+        pipeline = await retriever._build_vector_pipeline(
+            [0.1], top_k=5, filters={"file_type": "PDF"}
+        )
+
+        stage = pipeline[0]["$vectorSearch"]
+        assert stage["exact"] is True
+        assert "numCandidates" not in stage
+        assert stage["filter"] == {"metadata.metadata.file_type": "PDF"}
+        assert retriever.stats["exact_scan_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unindexed_filter_overfetches_then_matches(self) -> None:
+        """인덱스 외 필드는 선택도 기반으로 더 가져온 뒤 $match → $limit"""
+        retriever = self._retriever(matching=1_000, total=100_000)
+
+        pipeline = await retriever._build_vector_pipeline(
+            [0.1], top_k=5, filters={"source_file": "a.pdf"}
+        )
+
+        assert [next(iter(stage)) for stage in pipeline] == [
+            "$vectorSearch",
+            "$match",
+            "$limit",
+            "$project",
+        ]
+        # 선택도 1% → 최대 배수(20)로 over-fetch
+        assert pipeline[0]["$vectorSearch"]["limit"] == 100
+        assert pipeline[0]["$vectorSearch"]["numCandidates"] == 1_000
+        assert pipeline[1] == {"$match": {"metadata.metadata.source_file": "a.pdf"}}
+        assert pipeline[2] == {"$limit": 5}
+        assert retriever.stats["postfiltered_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exists_and_id_filters_post_filtered(self) -> None:
+        """$exists는 $vectorSearch.filter 대신 $match로, id 필터는 그대로 유지"""
+        retriever = self._retriever(matching=50_000, total=100_000, prefilter_fields=["tag", "id"])
+
+        pipeline = await retriever._build_vector_pipeline(
+            [0.1], top_k=5, filters={"tag": {"$exists": True}, "id": "doc-1"}
+        )
+
+        assert "filter" not in pipeline[0]["$vectorSearch"]
+        assert pipeline[1] == {
+            "$match": {
+                "$and": [
+                    {"metadata.metadata.tag": {"$exists": True}},
+                    {"metadata.metadata.id": "doc-1"},
+                ]
+            }
+        }
+        assert retriever.stats["postfiltered_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cardinality_is_cached(self) -> None:
+        """같은 필터의 카디널리티는 캐시에서 재사용"""
+        retriever = self._retriever(matching=1_000, total=100_000)
+
+        for _ in range(3):
+            await retriever._build_vector_pipeline([0.1], top_k=5, filters={"lang": "ko"})
+
+        assert retriever.collection.count_documents.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cardinality_count_capped_at_threshold(self) -> None:
+        """매칭 수는 exact_scan_threshold + 1에서 세기를 멈춤"""
+        retriever = self._retriever(matching=1_001, total=100_000, prefilter_fields=["lang"])
+
+        pipeline = await retriever._build_vector_pipeline([0.1], top_k=5, filters={"lang": "ko"})
+
+        threshold = retriever._filter_planner.exact_scan_threshold
+        assert retriever.collection.count_documents.call_args.kwargs == {"limit": threshold + 1}
+        assert "exact" not in pipeline[0]["$vectorSearch"]
+        assert retriever.stats["prefiltered_searches"] == 1
+
+    def test_prefilter_fields_loaded_from_config(self) -> None:
+        """prefilter_fields 미지정 시 mongodb.vector_search 설정 사용"""
+        from app.modules.core.retrieval.retrievers.mongodb_retriever import (
+            MongoDBRetriever,
+        )
+
+        client = MagicMock()
+        client.config = {"vector_search": {"prefilter_fields": ["source_file", "file_type"]}}
+
+        assert MongoDBRetriever(MagicMock(), client).prefilter_fields == {
+            "source_file",
+            "file_type",
+        }
+        assert MongoDBRetriever(MagicMock(), client, prefilter_fields=[]).prefilter_fields == set()
+        client.config = {}
+        assert MongoDBRetriever(MagicMock(), client).prefilter_fields == set()
@@ -378,3 +378,93 @@ class TestPgVectorRetrieverResultConversion:
         results = retriever._convert_to_search_results([])
 
         assert len(results) == 0
+
+
+# ============================================================
+# 일괄 검색 (search_many) 테스트
+# ============================================================
+
+
+class BatchMockEmbedder(MockEmbedder):
+    """embed_queries(배치 API)를 지원하는 Mock 임베딩 모델"""
+
+    def __init__(self) -> None:
+        self.batch_calls: list[list[str]] = []
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """쿼리 리스트를 한 번에 벡터화"""
+        self.batch_calls.append(list(texts))
+        return [[float(i)] * 1024 for i in range(len(texts))]
+
+
+class BatchMockVectorStore(MockVectorStore):
+    """search_many를 지원하는 Mock pgvector Store"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.search_many_calls = 0
+
+    async def search_many(
+        self,
+        collection: str,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Mock 일괄 검색 (쿼리 i에는 결과 i+1개 반환)"""
+        self.search_many_calls += 1
+        return [self.search_results[: i + 1] for i in range(len(query_vectors))]
+
+
+class TestPgVectorRetrieverSearchMany:
+    """다중 쿼리 일괄 검색 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_search_many_batches_embedding_and_store_call(self) -> None:
+        """임베딩 1회 + Store 요청 1회로 쿼리별 결과 반환"""
+        from app.modules.core.retrieval.interfaces import IBatchRetriever
+        from app.modules.core.retrieval.retrievers.pgvector_retriever import (
+            PgVectorRetriever,
+        )
+
+        embedder = BatchMockEmbedder()
+        store = BatchMockVectorStore()
+        retriever = PgVectorRetriever(embedder=embedder, store=store)
+
+        results = await retriever.search_many(["쿼리 1", "쿼리 2"], top_k=5)
+
+        assert isinstance(retriever, IBatchRetriever)
+        assert [len(r) for r in results] == [1, 2]
+        assert results[1][1].id == "doc-2"
+        assert embedder.batch_calls == [["쿼리 1", "쿼리 2"]]
+        assert store.search_many_calls == 1
+        assert retriever.stats["total_searches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_search_many_without_batch_embedder(self) -> None:
+        """embed_queries가 없는 임베딩 모델은 embed_query 반복으로 폴백"""
+        from app.modules.core.retrieval.retrievers.pgvector_retriever import (
+            PgVectorRetriever,
+        )
+
+        retriever = PgVectorRetriever(embedder=MockEmbedder(), store=BatchMockVectorStore())
+
+        results = await retriever.search_many(["쿼리 1", "쿼리 2", "쿼리 3"])
+
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_search_many_error_propagates(self) -> None:
+        """Store 실패 시 에러 카운트 증가 후 예외 전파"""
+        from app.modules.core.retrieval.retrievers.pgvector_retriever import (
+            PgVectorRetriever,
+        )
+
+        store = BatchMockVectorStore()
+        store.search_many = AsyncMock(side_effect=RuntimeError("DB error"))  # type: ignore[method-assign]
+        retriever = PgVectorRetriever(embedder=MockEmbedder(), store=store)
+
+        with pytest.raises(RuntimeError):
+            await retriever.search_many(["쿼리 1", "쿼리 2"])
+
+        assert retriever.stats["errors"] == 1
@@ -1040,3 +1040,125 @@ class TestWeaviateRetrieverAdditionalCollections:
         # 검증: 메인 컬렉션만 초기화됨
         assert retriever.collection is not None
         assert "FailCollection" not in retriever._additional_collection_objects
+
+
+class TestWeaviateRetrieverLightweightSearch:
+    """경량 검색(search_hits) + 지연 본문 로딩(hydrate) 테스트"""
+
+    @staticmethod
+    def _obj(uuid: str, score: float | None, properties: dict | None = None) -> MagicMock:
+        obj = MagicMock()
+        obj.uuid = uuid
+        obj.properties = properties or {}
+        obj.metadata = MagicMock()
+        obj.metadata.score = score
+        return obj
+
+    def _retriever(self, collection: MagicMock) -> Any:
+        from app.modules.core.retrieval.retrievers.weaviate_retriever import (
+            WeaviateRetriever,
+        )
+
+        embedder = MagicMock()
+        embedder.embed_query = MagicMock(return_value=[0.1] * 8)
+        retriever = WeaviateRetriever(
+            embedder=embedder,
+            weaviate_client=MagicMock(),
+            collection_name="Documents",
+        )
+        retriever.collection = collection
+        return retriever
+
+    @pytest.mark.asyncio
+    async def test_search_hits_requests_no_properties(self) -> None:
+        """search_hits는 프로퍼티 없이 UUID/점수/컬렉션만 반환"""
+        from app.modules.core.retrieval.interfaces import SearchHit
+
+        collection = MagicMock()
+        collection.query.hybrid.return_value.objects = [
+            self._obj("uuid-1", 0.9),
+            self._obj("uuid-2", None),
+        ]
+        retriever = self._retriever(collection)
+
+        hits = await retriever.search_hits("쿼리", top_k=5)
+
+        assert hits == [
+            SearchHit(id="uuid-1", score=0.9, metadata={"_collection": "Documents"}),
+            SearchHit(id="uuid-2", score=0.0, metadata={"_collection": "Documents"}),
+        ]
+        assert collection.query.hybrid.call_args.kwargs["return_properties"] is False
+        assert retriever.stats["lightweight_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_hits_arguments_match_installed_client(self) -> None:
+        """경량 hybrid 호출 인자가 설치된 weaviate-client 시그니처에 바인딩되는지 확인"""
+        import inspect
+
+        from weaviate.collections.queries.hybrid.query.executor import _HybridQueryExecutor
+
+        from app.modules.core.retrieval.retrievers.weaviate_retriever import (
+            HYBRID_SUPPORTS_NO_PROPERTIES,
+        )
+
+        collection = MagicMock()
+        collection.query.hybrid.return_value.objects = []
+        retriever = self._retriever(collection)
+        retriever.lightweight_hits_enabled = True
+
+        await retriever.search_hits("쿼리", top_k=5)
+
+        kwargs = collection.query.hybrid.call_args.kwargs
+        signature = inspect.signature(_HybridQueryExecutor.hybrid)
+        signature.bind(None, **kwargs)  # 알 수 없는 인자면 TypeError
+        assert HYBRID_SUPPORTS_NO_PROPERTIES is True
+        assert "bool" in str(signature.parameters["return_properties"].annotation)
+        assert kwargs["include_vector"] is False
+
+    @pytest.mark.asyncio
+    async def test_search_hits_falls_back_to_search_when_unsupported(self) -> None:
+        """클라이언트가 프로퍼티 없는 조회를 지원하지 않으면 search() 결과를 SearchHit로 변환"""
+        from app.modules.core.retrieval.interfaces import SearchHit
+
+        collection = MagicMock()
+        collection.query.hybrid.return_value.objects = [
+            self._obj("uuid-1", 0.7, {"content": "본문"}),
+        ]
+        retriever = self._retriever(collection)
+        retriever.lightweight_hits_enabled = False
+
+        hits = await retriever.search_hits("쿼리", top_k=5)
+
+        assert hits == [SearchHit(id="uuid-1", score=0.7, metadata={"_collection": "Documents"})]
+        assert "return_properties" not in collection.query.hybrid.call_args.kwargs
+        assert retriever.stats["lightweight_searches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hydrate_fetches_once_and_keeps_hit_order(self) -> None:
+        """hydrate는 컬렉션별 1회 조회, hit 순서/점수/메타데이터 유지, 누락 문서 제외"""
+        from app.modules.core.retrieval.interfaces import SearchHit
+
+        collection = MagicMock()
+        collection.query.fetch_objects_by_ids.return_value.objects = [
+            self._obj("uuid-1", None, {"content": "본문 1", "file_type": "PDF"}),
+            self._obj("uuid-2", None, {"content": "본문 2"}),
+        ]
+        retriever = self._retriever(collection)
+        hits = [
+            SearchHit(id="uuid-2", score=0.3, metadata={"_collection": "Documents", "rrf_score": 0.3}),
+            SearchHit(id="deleted", score=0.2, metadata={"_collection": "Documents"}),
+            SearchHit(id="uuid-1", score=0.1, metadata={"_collection": "Documents"}),
+        ]
+
+        results = await retriever.hydrate(hits)
+
+        collection.query.fetch_objects_by_ids.assert_called_once_with(
+            ["uuid-2", "deleted", "uuid-1"], limit=3
+        )
+        assert [(r.id, r.content, r.score) for r in results] == [
+            ("uuid-2", "본문 2", 0.3),
+            ("uuid-1", "본문 1", 0.1),
+        ]
+        assert results[0].metadata["rrf_score"] == 0.3
+        assert results[1].file_type == "PDF"
+        assert retriever.stats["hydrated_documents"] == 2
@@ -30,6 +30,9 @@ from app.modules.core.retrieval.rerankers.colbert_reranker import (
     JinaColBERTReranker,
 )
 
+# 리랭커 모듈이 사용하는 공유 HTTP 클라이언트 조회 함수
+_GET_HTTP_CLIENT = "app.modules.core.retrieval.rerankers.colbert_reranker.get_http_client"
+
 # ========================================
 # 테스트 픽스처
 # ========================================
@@ -103,11 +106,11 @@ class TestColBERTRerankerBasicOperations:
         mock_successful_response: dict[str, Any],
     ) -> None:
         """리랭킹 후 점수순으로 정렬된 결과 반환"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_successful_response
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -129,11 +132,11 @@ class TestColBERTRerankerBasicOperations:
         mock_successful_response: dict[str, Any],
     ) -> None:
         """API 응답의 점수로 SearchResult 점수 업데이트"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_successful_response
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -156,11 +159,11 @@ class TestColBERTRerankerBasicOperations:
         mock_successful_response: dict[str, Any],
     ) -> None:
         """리랭킹 후 원본 메타데이터 보존"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_successful_response
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -194,7 +197,7 @@ class TestAPICall:
         sample_search_results: list[SearchResult],
     ) -> None:
         """올바른 API 요청 형식 확인"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_post = AsyncMock()
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -206,7 +209,7 @@ class TestAPICall:
                 ]
             }
             mock_post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             reranker = JinaColBERTReranker(config=default_config)
             await reranker.rerank(
@@ -246,13 +249,11 @@ class TestAPICall:
             max_documents=20,
         )
 
-        # colbert_reranker 모듈에서 import한 httpx를 패치
-        with patch(
-            "app.modules.core.retrieval.rerankers.colbert_reranker.httpx.AsyncClient"
-        ) as mock_client:
-            # AsyncClient context manager mock 설정
+        # colbert_reranker 모듈에서 import한 get_http_client를 패치
+        with patch(_GET_HTTP_CLIENT) as mock_client:
+            # 공유 AsyncClient mock 설정
             mock_client_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -299,11 +300,11 @@ class TestErrorHandling:
         sample_search_results: list[SearchResult],
     ) -> None:
         """API 오류 시 원본 결과 반환 (Graceful Fallback)"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -325,8 +326,8 @@ class TestErrorHandling:
         sample_search_results: list[SearchResult],
     ) -> None:
         """타임아웃 시 원본 결과 반환"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch(_GET_HTTP_CLIENT) as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Request timed out")
             )
 
@@ -347,8 +348,8 @@ class TestErrorHandling:
         sample_search_results: list[SearchResult],
     ) -> None:
         """네트워크 연결 오류 시 원본 결과 반환"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch(_GET_HTTP_CLIENT) as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.ConnectError("Connection failed")
             )
 
@@ -368,11 +369,11 @@ class TestErrorHandling:
         sample_search_results: list[SearchResult],
     ) -> None:
         """잘못된 JSON 응답 시 원본 결과 반환"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.side_effect = ValueError("Invalid JSON")
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -423,9 +424,9 @@ class TestEmptyInputHandling:
             )
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_post = AsyncMock()
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             reranker = JinaColBERTReranker(config=default_config)
             result = await reranker.rerank(
@@ -456,11 +457,11 @@ class TestTopNLimit:
         mock_successful_response: dict[str, Any],
     ) -> None:
         """top_n 지정 시 상위 n개만 반환"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_successful_response
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -481,11 +482,11 @@ class TestTopNLimit:
         mock_successful_response: dict[str, Any],
     ) -> None:
         """top_n이 None이면 전체 반환"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_successful_response
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -532,11 +533,11 @@ class TestStatistics:
         mock_successful_response: dict[str, Any],
     ) -> None:
         """호출 통계 추적"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_successful_response
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -557,10 +558,10 @@ class TestStatistics:
         sample_search_results: list[SearchResult],
     ) -> None:
         """실패 통계 추적"""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 500
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -660,9 +661,9 @@ class TestDisabledState:
             max_documents=20,
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch(_GET_HTTP_CLIENT) as mock_client:
             mock_post = AsyncMock()
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             reranker = JinaColBERTReranker(config=config)
             result = await reranker.rerank(
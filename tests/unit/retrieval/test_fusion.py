@@ -0,0 +1,181 @@
+"""
+Fusion 커널 단위 테스트
+
+공용 병합 모듈(app.modules.core.retrieval.fusion)의 RRF/볼록 결합/중복 제거와
+argpartition 기반 Top-K 선택을 검증합니다.
+
+테스트 항목:
+  - 가중 RRF 점수가 기존 dict 루프 구현과 일치
+  - rank_start / 명시적 ranks 지원
+  - Top-K 동점 처리 (첫 등장 순서 유지)
+  - 볼록 결합 (min-max, RRFScoreNormalizer.normalize_array)
+  - first_seen_fuse 중복 제거
+"""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from app.lib.score_normalizer import RRFScoreNormalizer
+from app.modules.core.retrieval.fusion import (
+    DocIdInterner,
+    convex_fuse,
+    first_seen_fuse,
+    minmax_normalize,
+    rrf_fuse,
+    top_k_indices,
+)
+
+
+def _reference_rrf(
+    ranked_ids: list[list[str]], weights: list[float], k: int, rank_start: int
+) -> list[tuple[str, float]]:
+    """기존 구현과 동일한 dict 루프 RRF (비교 기준)"""
+    scores: dict[str, float] = {}
+    for ids, weight in zip(ranked_ids, weights, strict=True):
+        for rank, doc_id in enumerate(ids, start=rank_start):
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class TestDocIdInterner:
+    """문서 ID 인터닝 테스트"""
+
+    def test_assigns_indices_in_first_seen_order(self) -> None:
+        interner = DocIdInterner()
+
+        indices = interner.intern_many(["b", "a", "b", "c"])
+
+        assert indices.tolist() == [0, 1, 0, 2]
+        assert interner.ids == ["b", "a", "c"]
+        assert len(interner) == 3
+        assert "a" in interner
+        assert interner.index_of("z") is None
+
+
+class TestRRFFuse:
+    """가중 RRF 테스트"""
+
+    @pytest.mark.parametrize("rank_start", [0, 1])
+    def test_matches_reference_implementation(self, rank_start: int) -> None:
+        """무작위 입력에서 기존 dict 루프 구현과 점수/순서가 일치한다."""
+        rng = random.Random(42)
+        pool = [f"doc-{i}" for i in range(300)]
+        ranked_ids = [rng.sample(pool, 50) for _ in range(5)]
+        weights = [1.0, 0.8, 0.6, 0.4, 0.2]
+
+        fused = rrf_fuse(ranked_ids, weights=weights, k=60, rank_start=rank_start)
+        expected = _reference_rrf(ranked_ids, weights, 60, rank_start)
+
+        actual = fused.top_k(20)
+        assert [doc_id for doc_id, _ in actual] == [doc_id for doc_id, _ in expected[:20]]
+        for (_, actual_score), (_, expected_score) in zip(actual, expected, strict=False):
+            assert actual_score == pytest.approx(expected_score, rel=1e-12)
+
+    def test_counts_appearances(self) -> None:
+        fused = rrf_fuse([["a", "b"], ["b", "c"], ["b"]])
+
+        appearances = dict(zip(fused.ids, fused.appearances.tolist(), strict=True))
+        assert appearances == {"a": 1, "b": 3, "c": 1}
+
+    def test_explicit_ranks(self) -> None:
+        """명시적 ranks가 주어지면 리스트 위치 대신 사용한다."""
+        fused = rrf_fuse([["a", "b"]], k=60, ranks=[[1, 10]])
+
+        scores = fused.as_dict()
+        assert scores["a"] == pytest.approx(1.0 / 61)
+        assert scores["b"] == pytest.approx(1.0 / 70)
+
+    def test_missing_weights_padded_with_one(self) -> None:
+        fused = rrf_fuse([["a"], ["b"]], weights=[0.5], k=0, rank_start=1)
+
+        assert fused.as_dict() == {"a": pytest.approx(0.5), "b": pytest.approx(1.0)}
+
+    def test_empty_input(self) -> None:
+        fused = rrf_fuse([[], []])
+
+        assert len(fused) == 0
+        assert fused.top_k(10) == []
+
+    def test_shared_interner_keeps_ids_stable(self) -> None:
+        """인터너를 재사용하면 이전 호출의 인덱스가 유지된다."""
+        interner = DocIdInterner()
+        rrf_fuse([["a", "b"]], interner=interner)
+
+        fused = rrf_fuse([["c", "a"]], interner=interner)
+
+        assert fused.ids == ["a", "b", "c"]
+        assert fused.appearances.tolist() == [1, 0, 1]
+
+
+class TestTopKIndices:
+    """argpartition 기반 Top-K 테스트"""
+
+    def test_descending_order(self) -> None:
+        scores = np.array([0.1, 0.9, 0.5, 0.7])
+
+        assert top_k_indices(scores, 2).tolist() == [1, 3]
+
+    def test_ties_keep_first_seen_order(self) -> None:
+        """경계값 동점도 안정 정렬과 동일하게 앞선 인덱스를 선택한다."""
+        scores = np.array([0.5, 0.9, 0.5, 0.5, 0.1])
+
+        assert top_k_indices(scores, 3).tolist() == [1, 0, 2]
+
+    def test_k_larger_than_size(self) -> None:
+        scores = np.array([0.2, 0.4])
+
+        assert top_k_indices(scores, 10).tolist() == [1, 0]
+
+    def test_non_positive_k(self) -> None:
+        assert top_k_indices(np.array([1.0]), 0).tolist() == []
+
+
+class TestConvexFuse:
+    """정규화 점수 볼록 결합 테스트"""
+
+    def test_minmax_convex_combination(self) -> None:
+        fused = convex_fuse(
+            [["a", "b", "c"], ["c", "a"]],
+            [[0.9, 0.5, 0.1], [20.0, 10.0]],
+            weights=[0.7, 0.3],
+        )
+
+        scores = fused.as_dict()
+        assert scores["a"] == pytest.approx(0.7 * 1.0 + 0.3 * 0.0)
+        assert scores["b"] == pytest.approx(0.7 * 0.5)
+        assert scores["c"] == pytest.approx(0.7 * 0.0 + 0.3 * 1.0)
+
+    def test_uses_score_normalizer_output(self) -> None:
+        normalizer = RRFScoreNormalizer()
+
+        fused = convex_fuse(
+            [["a", "b"]],
+            [[0.0283, 0.0147]],
+            normalizer=normalizer.normalize_array,
+        )
+
+        assert fused.as_dict() == {
+            "a": pytest.approx(normalizer.normalize(0.0283)),
+            "b": pytest.approx(normalizer.normalize(0.0147)),
+        }
+
+    def test_length_mismatch_raises(self) -> None:
+        with pytest.raises(ValueError):
+            convex_fuse([["a", "b"]], [[0.1]])
+
+    def test_minmax_constant_scores(self) -> None:
+        assert minmax_normalize(np.array([3.0, 3.0])).tolist() == [1.0, 1.0]
+
+
+class TestFirstSeenFuse:
+    """중복 제거 병합 테스트"""
+
+    def test_keeps_first_occurrence_score(self) -> None:
+        fused = first_seen_fuse([["a", "b"], ["b", "c"]], [[0.5, 0.4], [0.9, 0.8]])
+
+        assert fused.as_dict() == {"a": 0.5, "b": 0.4, "c": 0.8}
+        assert [doc_id for doc_id, _ in fused.top_k(2)] == ["c", "a"]
@@ -0,0 +1,90 @@
+"""
+Retrieval Orchestrator 일괄 검색(search_many) 테스트
+
+테스트 범위:
+1. IBatchRetriever 구현 시 Multi-Query 검색을 search_many 1회로 처리
+2. search_many 실패 시 쿼리별 search() 병렬 호출로 폴백
+3. 단일 쿼리는 기존 search() 경로 유지
+"""
+from typing import Any
+
+import pytest
+
+from app.modules.core.retrieval.interfaces import SearchResult
+from app.modules.core.retrieval.orchestrator import RetrievalOrchestrator
+
+
+class FakeBatchRetriever:
+    """search + search_many를 구현한 테스트용 Retriever"""
+
+    def __init__(self, fail_batch: bool = False) -> None:
+        self.fail_batch = fail_batch
+        self.search_calls: list[str] = []
+        self.search_many_calls: list[list[str]] = []
+
+    async def search(
+        self, query: str, top_k: int = 10, filters: dict[str, Any] | None = None
+    ) -> list[SearchResult]:
+        self.search_calls.append(query)
+        return self._results(query)
+
+    async def search_many(
+        self, queries: list[str], top_k: int = 10, filters: dict[str, Any] | None = None
+    ) -> list[list[SearchResult]]:
+        self.search_many_calls.append(list(queries))
+        if self.fail_batch:
+            raise RuntimeError("batch 미지원")
+        return [self._results(query) for query in queries]
+
+    async def health_check(self) -> bool:
+        return True
+
+    @staticmethod
+    def _results(query: str) -> list[SearchResult]:
+        return [
+            SearchResult(id="shared", content="공통 문서", score=0.9, metadata={}),
+            SearchResult(id=f"only-{query}", content=query, score=0.5, metadata={}),
+        ]
+
+
+def _orchestrator(retriever: FakeBatchRetriever) -> RetrievalOrchestrator:
+    return RetrievalOrchestrator(retriever=retriever, reranker=None, cache=None, config={})
+
+
+@pytest.mark.unit
+class TestOrchestratorBatchSearch:
+    """일괄 검색 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_multi_query_uses_search_many(self):
+        retriever = FakeBatchRetriever()
+        orchestrator = _orchestrator(retriever)
+
+        results = await orchestrator._search_and_merge(["q1", "q2", "q3"], top_k=5)
+
+        assert retriever.search_many_calls == [["q1", "q2", "q3"]]
+        assert retriever.search_calls == []
+        assert results[0].id == "shared"
+        assert results[0].metadata["query_appearances"] == 3
+        assert orchestrator.get_stats()["orchestrator"]["batch_search_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_per_query_search(self):
+        retriever = FakeBatchRetriever(fail_batch=True)
+        orchestrator = _orchestrator(retriever)
+
+        results = await orchestrator._search_and_merge(["q1", "q2"], top_k=5)
+
+        assert sorted(retriever.search_calls) == ["q1", "q2"]
+        assert {r.id for r in results} == {"shared", "only-q1", "only-q2"}
+        assert orchestrator.get_stats()["orchestrator"]["batch_search_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_single_query_keeps_search_path(self):
+        retriever = FakeBatchRetriever()
+        orchestrator = _orchestrator(retriever)
+
+        await orchestrator._search_and_merge(["q1"], top_k=5)
+
+        assert retriever.search_many_calls == []
+        assert retriever.search_calls == ["q1"]
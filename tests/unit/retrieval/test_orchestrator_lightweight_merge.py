@@ -0,0 +1,153 @@
+"""
+Retrieval Orchestrator 경량 병합(SearchHit + 지연 본문 로딩) 테스트
+
+테스트 범위:
+1. ILightweightRetriever 구현 시 Multi-Query 결과를 SearchHit로 병합하고 top_k만 hydrate
+2. 경량 검색 실패 시 기존 search() 경로로 폴백
+3. 파일 타입 가중치가 켜져 있으면 경량 경로를 사용하지 않음
+4. 추측 실행(Speculative) 확장 경로에서도 경량 병합 사용
+"""
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.modules.core.retrieval.interfaces import SearchHit, SearchResult
+from app.modules.core.retrieval.orchestrator import RetrievalOrchestrator
+from app.modules.core.retrieval.query_expansion.interface import (
+    ExpandedQuery,
+    QueryComplexity,
+    SearchIntent,
+)
+
+
+class FakeLightweightRetriever:
+    """search + search_hits + hydrate를 구현한 테스트용 Retriever"""
+
+    def __init__(self, fail_hits: bool = False) -> None:
+        self.fail_hits = fail_hits
+        self.search_calls: list[str] = []
+        self.hit_calls: list[str] = []
+        self.hydrated: list[list[str]] = []
+
+    async def search(
+        self, query: str, top_k: int = 10, filters: dict[str, Any] | None = None
+    ) -> list[SearchResult]:
+        self.search_calls.append(query)
+        return [
+            SearchResult(id=hit.id, content=f"본문 {hit.id}", score=hit.score, metadata={})
+            for hit in self._hits(query)
+        ]
+
+    async def search_hits(
+        self, query: str, top_k: int = 10, filters: dict[str, Any] | None = None
+    ) -> list[SearchHit]:
+        self.hit_calls.append(query)
+        if self.fail_hits:
+            raise RuntimeError("경량 검색 미지원")
+        return self._hits(query)
+
+    async def hydrate(self, hits: list[SearchHit]) -> list[SearchResult]:
+        self.hydrated.append([hit.id for hit in hits])
+        return [
+            SearchResult(id=hit.id, content=f"본문 {hit.id}", score=hit.score, metadata=hit.metadata)
+            for hit in hits
+        ]
+
+    async def health_check(self) -> bool:
+        return True
+
+    @staticmethod
+    def _hits(query: str) -> list[SearchHit]:
+        return [
+            SearchHit(id="shared", score=0.9),
+            *(SearchHit(id=f"{query}-{i}", score=0.5 - i / 100) for i in range(5)),
+        ]
+
+
+def _orchestrator(
+    retriever: FakeLightweightRetriever, config: dict | None = None, **kwargs: Any
+) -> RetrievalOrchestrator:
+    return RetrievalOrchestrator(
+        retriever=retriever, reranker=None, cache=None, config=config or {}, **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestOrchestratorLightweightMerge:
+    """경량 병합 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_multi_query_hydrates_only_top_k(self):
+        retriever = FakeLightweightRetriever()
+        orchestrator = _orchestrator(retriever)
+
+        results = await orchestrator._search_and_merge(["q1", "q2", "q3"], top_k=3)
+
+        assert retriever.search_calls == []
+        assert sorted(retriever.hit_calls) == ["q1", "q2", "q3"]
+        # 16개 후보 중 top_k(3)개만 본문 로딩 (1회)
+        assert len(retriever.hydrated) == 1
+        assert len(retriever.hydrated[0]) == 3
+        assert results[0].id == "shared"
+        assert results[0].content == "본문 shared"
+        assert results[0].metadata["query_appearances"] == 3
+        assert orchestrator.get_stats()["orchestrator"]["lightweight_merge_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hit_failure_falls_back_to_full_search(self):
+        retriever = FakeLightweightRetriever(fail_hits=True)
+        orchestrator = _orchestrator(retriever)
+
+        results = await orchestrator._search_and_merge(["q1", "q2"], top_k=3)
+
+        assert sorted(retriever.search_calls) == ["q1", "q2"]
+        assert results[0].id == "shared"
+        assert orchestrator.get_stats()["orchestrator"]["lightweight_merge_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_file_type_weighting_disables_lightweight_path(self):
+        retriever = FakeLightweightRetriever()
+        orchestrator = _orchestrator(
+            retriever, {"scoring": {"file_type_weight_enabled": True}}
+        )
+
+        await orchestrator._search_and_merge(["q1", "q2"], top_k=3)
+
+        assert retriever.hit_calls == []
+        assert sorted(retriever.search_calls) == ["q1", "q2"]
+
+    @pytest.mark.asyncio
+    async def test_mock_retriever_does_not_use_lightweight_path(self):
+        """Protocol 검사를 통과하는 Mock은 경량 경로 대상이 아님"""
+        retriever = MagicMock()
+        retriever.search = AsyncMock(return_value=[])
+        orchestrator = RetrievalOrchestrator(retriever=retriever, config={})
+
+        assert orchestrator._lightweight_enabled() is False
+
+    @pytest.mark.asyncio
+    async def test_speculative_expansion_uses_lightweight_merge(self):
+        retriever = FakeLightweightRetriever()
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(
+            return_value=ExpandedQuery(
+                original="원본",
+                expansions=["확장"],
+                complexity=QueryComplexity.MEDIUM,
+                intent=SearchIntent.FACTUAL,
+                metadata={},
+            )
+        )
+        orchestrator = _orchestrator(
+            retriever,
+            {"query_expansion": {"enabled": True, "speculative": {"enabled": True}}},
+            query_expansion=query_expansion,
+        )
+
+        results = await orchestrator.search_and_rerank("원본", top_k=2, rerank_enabled=False)
+
+        assert retriever.search_calls == []
+        assert sorted(retriever.hit_calls) == ["원본", "확장"]
+        assert retriever.hydrated == [["shared", "원본-0"]]
+        assert [r.id for r in results] == ["shared", "원본-0"]
@@ -0,0 +1,211 @@
+"""
+Retrieval Orchestrator 추측 실행(Speculative) 쿼리 확장 테스트
+
+테스트 범위:
+1. 원본 쿼리 검색이 쿼리 확장 완료를 기다리지 않고 시작됨
+2. 확장 성공 시 원본 + 확장 쿼리 결과 RRF 병합
+3. 확장 타임아웃/실패 시 원본 결과만 반환, 타임아웃 후 늦은 확장 쿼리 검색 취소
+4. speculative.enabled=false 시 기존 순차 동작 유지
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.modules.core.retrieval.interfaces import SearchResult
+from app.modules.core.retrieval.orchestrator import RetrievalOrchestrator
+from app.modules.core.retrieval.query_expansion.interface import (
+    ExpandedQuery,
+    QueryComplexity,
+    SearchIntent,
+)
+
+
+def _result(doc_id: str, score: float) -> SearchResult:
+    return SearchResult(id=doc_id, content=f"문서 {doc_id}", score=score, metadata={})
+
+
+def _expanded(query: str, expansions: list[str]) -> ExpandedQuery:
+    return ExpandedQuery(
+        original=query,
+        expansions=expansions,
+        complexity=QueryComplexity.MEDIUM,
+        intent=SearchIntent.FACTUAL,
+        metadata={},
+    )
+
+
+def _orchestrator(
+    retriever: MagicMock, query_expansion: MagicMock, speculative: dict
+) -> RetrievalOrchestrator:
+    return RetrievalOrchestrator(
+        retriever=retriever,
+        reranker=None,
+        cache=None,
+        query_expansion=query_expansion,
+        config={"query_expansion": {"enabled": True, "speculative": speculative}},
+    )
+
+
+@pytest.mark.unit
+class TestSpeculativeExpansion:
+    """추측 실행 쿼리 확장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_original_search_starts_before_expansion_finishes(self):
+        """
+        원본 검색과 쿼리 확장이 겹쳐서 실행된다.
+
+        Given: 확장이 원본 검색이 시작되어야만 끝나는 구조
+        When: search_and_rerank() 호출
+        Then: 교착 없이 원본 + 확장 결과가 병합되어 반환
+        """
+        original_started = asyncio.Event()
+
+        async def search(query, top_k, filters=None):
+            if query == "원본":
+                original_started.set()
+                return [_result("a", 0.9), _result("b", 0.8)]
+            return [_result("c", 0.9), _result("a", 0.7)]
+
+        async def expand(query):
+            # 원본 검색이 먼저 시작되지 않으면 타임아웃으로 끝남
+            await asyncio.wait_for(original_started.wait(), timeout=1.0)
+            return _expanded(query, ["확장"])
+
+        retriever = MagicMock()
+        retriever.search = AsyncMock(side_effect=search)
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(side_effect=expand)
+        orchestrator = _orchestrator(retriever, query_expansion, {"enabled": True, "timeout": 2.0})
+
+        results = await orchestrator.search_and_rerank("원본", top_k=3, rerank_enabled=False)
+
+        assert [r.id for r in results] == ["a", "c", "b"]
+        assert results[0].metadata["query_appearances"] == 2
+        stats = orchestrator.get_stats()["orchestrator"]
+        assert stats["speculative_expansion_count"] == 1
+        assert stats["query_expansion_count"] == 1
+        assert stats["expansion_timeouts"] == 0
+        assert stats["retrieval_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_falls_back_to_original_results(self):
+        """확장이 타임아웃을 넘기면 취소하고 원본 결과만 반환한다."""
+        expansion_cancelled = False
+
+        async def expand(query):
+            nonlocal expansion_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                expansion_cancelled = True
+                raise
+
+        retriever = MagicMock()
+        retriever.search = AsyncMock(return_value=[_result(str(i), 1.0 - i / 10) for i in range(6)])
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(side_effect=expand)
+        orchestrator = _orchestrator(retriever, query_expansion, {"enabled": True, "timeout": 0.05})
+
+        results = await orchestrator.search_and_rerank("원본", top_k=3, rerank_enabled=False)
+        await asyncio.sleep(0)
+
+        assert [r.id for r in results] == ["0", "1", "2"]
+        assert expansion_cancelled
+        retriever.search.assert_called_once_with("원본", 6, None)
+        stats = orchestrator.get_stats()["orchestrator"]
+        assert stats["expansion_timeouts"] == 1
+        assert stats["query_expansion_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expansion_failure_falls_back_to_original_results(self):
+        """확장 실패 시 원본 결과만 반환한다."""
+        retriever = MagicMock()
+        retriever.search = AsyncMock(return_value=[_result("a", 0.9)])
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(side_effect=RuntimeError("LLM 오류"))
+        orchestrator = _orchestrator(retriever, query_expansion, {"enabled": True})
+
+        results = await orchestrator.search_and_rerank("원본", top_k=3, rerank_enabled=False)
+
+        assert [r.id for r in results] == ["a"]
+        assert retriever.search.call_count == 1
+        assert orchestrator.get_stats()["orchestrator"]["expansion_timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_keeps_sequential_expansion(self):
+        """speculative.enabled=false면 확장 완료 후 Multi-Query 검색을 수행한다."""
+        retriever = MagicMock()
+        retriever.search = AsyncMock(return_value=[_result("a", 0.9)])
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(return_value=_expanded("원본", ["확장"]))
+        orchestrator = _orchestrator(retriever, query_expansion, {"enabled": False})
+
+        await orchestrator.search_and_rerank("원본", top_k=3, rerank_enabled=False)
+
+        assert retriever.search.call_count == 2
+        assert orchestrator.get_stats()["orchestrator"]["speculative_expansion_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_late_expanded_search_dropped_after_deadline(self):
+        """타임아웃이 지나면 도착한 확장 쿼리 결과만 병합하고 늦은 검색은 취소한다."""
+        slow_cancelled = False
+
+        async def search(query, top_k, filters=None):
+            nonlocal slow_cancelled
+            if query == "느린 확장":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    slow_cancelled = True
+                    raise
+            if query == "원본":
+                return [_result("a", 0.9)]
+            return [_result("c", 0.9), _result("a", 0.7)]
+
+        retriever = MagicMock(spec=["search"])
+        retriever.search = AsyncMock(side_effect=search)
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(return_value=_expanded("원본", ["빠른 확장", "느린 확장"]))
+        orchestrator = _orchestrator(retriever, query_expansion, {"enabled": True, "timeout": 0.05})
+
+        results = await orchestrator.search_and_rerank("원본", top_k=3, rerank_enabled=False)
+        await asyncio.sleep(0)
+
+        assert [r.id for r in results] == ["a", "c"]
+        assert slow_cancelled
+        stats = orchestrator.get_stats()["orchestrator"]
+        assert stats["late_expansion_searches"] == 1
+        assert stats["expansion_timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_cancels_background_tasks(self):
+        """호출자가 취소되면 원본 검색과 확장 작업도 취소된다."""
+        cancelled: list[str] = []
+
+        async def hang(name: str):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        async def search(query, top_k, filters=None):
+            await hang("search")
+
+        async def expand(query):
+            await hang("expand")
+
+        retriever = MagicMock(spec=["search"])
+        retriever.search = AsyncMock(side_effect=search)
+        query_expansion = MagicMock()
+        query_expansion.expand = AsyncMock(side_effect=expand)
+        orchestrator = _orchestrator(retriever, query_expansion, {"enabled": True, "timeout": 5.0})
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(
+                orchestrator.search_and_rerank("원본", top_k=3, rerank_enabled=False), 0.05
+            )
+
+        assert sorted(cancelled) == ["expand", "search"]